@@ -109,7 +109,25 @@ autodoc_default_options = {
 }
 
 templates_path = ["_templates"]
-exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+exclude_patterns = ["_build", "_generated", "Thumbs.db", ".DS_Store"]
+
+
+# GENERATED TABLES
+# ***********************************************************************
+# the flag catalog table is built from the catalog shipped with the package,
+# with flags as literals (a bare "-" would be read as a bullet list)
+import csv
+
+FLAGS_FILE = os.path.abspath("../src/flare/data/flags.csv")
+FLAGS_TABLE = os.path.abspath("_generated/flags.csv")
+
+os.makedirs(os.path.dirname(FLAGS_TABLE), exist_ok=True)
+with open(FLAGS_FILE, newline="", encoding="utf-8") as f_src:
+    ls_rows = list(csv.reader(f_src, delimiter=";"))
+with open(FLAGS_TABLE, "w", newline="", encoding="utf-8") as f_dst:
+    writer = csv.writer(f_dst, delimiter=";")
+    writer.writerow([column.capitalize() for column in ls_rows[0]])
+    writer.writerows([f"``{row[0]}``"] + row[1:] for row in ls_rows[1:])
 
 
 # HTML AND THEMES
@@ -36,6 +36,22 @@ Print a message
 
 
 """
+
 # EXPOSE MODULES FROM PACKAGE
 # ***********************************************************************
 from . import module
+from . import numflare
+from . import relabel
+from . import parallel
+from . import timeflare
+from . import labels
+from . import crawler
+from . import catalog
+from . import extents
+from . import versions
+from . import tracker
+from . import validator
+from . import flags
+from . import vocabulary
+from . import fields
+from . import templates
@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Command line interface of ``flare``.
+
+Overview
+--------
+
+Run ``python -m flare {command} --help`` for details on each command.
+
+ - ``encode``: stream a ``csv`` or ``parquet`` file and encode numeric columns into Flare labels
+ - ``crawl``: scan a directory tree and write a catalog of parsed Flare filenames
+
+Examples
+--------
+
+.. code-block:: bash
+
+    python -m flare encode numbers.csv numbers_labels.csv -c v1 v3 --decimals 2 --workers 4
+
+    python -m flare crawl /archive catalog.parquet --scheme dataset --extensions tif
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import argparse
+import sys
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+# import {module}
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare import crawler, labels, relabel
+
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def make_parser():
+    """
+    Makes the command line parser.
+
+    :return: The argument parser.
+    :rtype: :class:`argparse.ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m flare",
+        description="A text-based system for creating and managing standardized labels.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # encode command
+    # -------------------------------------------------------------------
+    encode = subparsers.add_parser(
+        "encode",
+        help="encode numeric columns of a csv or parquet file into Flare labels",
+        description="Stream a csv or parquet file in chunks and encode numeric columns into Flare labels.",
+    )
+    encode.add_argument("src", help="input csv or parquet file")
+    encode.add_argument("dst", help="output csv or parquet file")
+    encode.add_argument(
+        "-c", "--columns", nargs="+", required=True, help="columns to encode"
+    )
+    encode.add_argument(
+        "--longitude",
+        nargs="+",
+        default=[],
+        metavar="COLUMN",
+        help="columns encoded as longitudes (w/e signs); others are latitudes (s/n signs)",
+    )
+    encode.add_argument("--decimals", type=int, default=0, help="decimal places")
+    encode.add_argument(
+        "--len-min", type=int, default=1, help="minimum length of the integer part"
+    )
+    encode.add_argument(
+        "--collapse-magnitude",
+        action="store_true",
+        help="collapse numbers into a magnitude suffix (d, c, k, m, b)",
+    )
+    encode.add_argument(
+        "--sep", default=relabel.SEPARATOR, help="csv field separator (default ';')"
+    )
+    encode.add_argument(
+        "--chunk-size",
+        type=int,
+        default=relabel.CHUNK_SIZE,
+        help="number of rows per chunk",
+    )
+    encode.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: all CPUs)",
+    )
+
+    # crawl command
+    # -------------------------------------------------------------------
+    crawl = subparsers.add_parser(
+        "crawl",
+        help="scan a directory tree and catalog Flare-labeled files",
+        description="Scan a directory tree and write parsed Flare filenames to a csv or parquet file.",
+    )
+    crawl.add_argument("root", help="root directory")
+    crawl.add_argument("dst", help="output csv or parquet file")
+    crawl.add_argument(
+        "--scheme",
+        choices=list(labels.SCHEMES),
+        default=None,
+        help="labeling scheme (default: detected per file)",
+    )
+    crawl.add_argument(
+        "--extensions",
+        nargs="+",
+        default=None,
+        metavar="EXTENSION",
+        help="file extensions to keep (default: all files)",
+    )
+    crawl.add_argument(
+        "--no-stat",
+        action="store_true",
+        help="skip file sizes and modification times",
+    )
+    crawl.add_argument(
+        "--sep", default=relabel.SEPARATOR, help="csv field separator (default ';')"
+    )
+    crawl.add_argument(
+        "--batch-size",
+        type=int,
+        default=crawler.BATCH_SIZE,
+        help="number of files per batch",
+    )
+    crawl.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of scanning threads",
+    )
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs the command line interface.
+
+    :param argv: The command line arguments. If None, ``sys.argv`` is used.
+    :type argv: list or None
+    :return: The exit status.
+    :rtype: int
+    """
+    args = make_parser().parse_args(argv)
+    if args.command == "encode":
+        n_rows = relabel.encode_file(
+            src=args.src,
+            dst=args.dst,
+            columns=args.columns,
+            decimals=args.decimals,
+            len_min=args.len_min,
+            longitude_columns=args.longitude,
+            collapse_magnitude=args.collapse_magnitude,
+            sep=args.sep,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        )
+        print(f"flare: {n_rows} rows encoded to {args.dst}")
+    elif args.command == "crawl":
+        n_files = crawler.crawl_file(
+            root=args.root,
+            dst=args.dst,
+            scheme=args.scheme,
+            extensions=args.extensions,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            stat=not args.no_stat,
+            sep=args.sep,
+        )
+        print(f"flare: {n_files} files cataloged to {args.dst}")
+    return 0
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    sys.exit(main())
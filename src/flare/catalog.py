@@ -0,0 +1,521 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Persistent catalog of parsed Flare labels, stored in SQLite with indexed domain,
+extent and time columns.
+
+Features
+--------
+ - Store parsed labels of the ``generic``, ``reference`` and ``dataset`` schemes
+ - Numeric extents and timestamps stored as indexed numeric columns
+ - Bulk inserts with ``executemany`` in a single transaction
+ - Incremental sync of directory trees, parsing only new and changed files
+ - Query by domains, bounding box and time range
+
+Overview
+--------
+
+Records follow the columns of ``labels.parse_many`` plus the file ``path`` (the
+primary key), ``size`` and ``mtime``. Extents are stored as ``REAL`` bounds and
+timestamps as ``INTEGER`` nanoseconds since the Unix epoch (UTC). Query results
+convert them back to ``datetime64`` columns.
+
+Extents and epochs are ranges. Their lower bounds are indexed and the catalog keeps
+the longest span of each range, so a range query searches the index over the query
+range widened by that span (as ``timeflare.EpochIndex`` does) and then filters the
+upper bounds.
+
+``Catalog.sync`` scans a directory tree with ``crawler.scan`` and compares the size
+and modification time of each file with the catalog. Only new or changed files are
+parsed; files that are gone are removed.
+
+Examples
+--------
+
+Build a catalog and keep it up to date
+
+.. code-block:: python
+
+    with Catalog("archive.db") as catalog:
+        counts = catalog.sync("/archive", scheme="dataset", extensions=["tif"])
+        print(counts)
+        # Output: {'added': 1250000, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+Query all COPERNICUS items within a lat/lon box for 2011
+
+.. code-block:: python
+
+    df = catalog.query(
+        source="COPERNICUS",
+        bbox=(-35, -55, -25, -45),
+        start="2011",
+        stop="2012",
+    )
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import sqlite3
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.crawler import BATCH_SIZE, scan, _make_batch
+from flare.labels import SCHEMES, TYPED_FIELDS
+from flare.timeflare import TIMESTAMP_PATTERN, decode_timestamp, _to_datetime64
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+TABLE = "labels"
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# column types (text by default)
+COLUMN_TYPES = {
+    "path": "TEXT PRIMARY KEY",
+    "year": "INTEGER",
+    "version_major": "INTEGER",
+    "version_minor": "INTEGER",
+    "version_patch": "INTEGER",
+    "version_timestamp": "INTEGER",
+    "extent_ymin": "REAL",
+    "extent_xmin": "REAL",
+    "extent_ymax": "REAL",
+    "extent_xmax": "REAL",
+    "datetime_start": "INTEGER",
+    "datetime_stop": "INTEGER",
+    "size": "INTEGER",
+    "mtime": "INTEGER",
+}
+# columns of all schemes, in the order of labels.parse_many
+COLUMNS = (
+    ["path", "scheme"]
+    + list(dict.fromkeys(d for ls_domains in SCHEMES.values() for d in ls_domains))
+    + ["extension"]
+    + [field for ls_fields in TYPED_FIELDS.values() for field in ls_fields]
+    + ["size", "mtime"]
+)
+# timestamp columns stored as nanoseconds
+TIME_COLUMNS = ["version_timestamp", "datetime_start", "datetime_stop", "mtime"]
+# indexed columns (one index per entry)
+INDEXES = [
+    ("source", "collection"),
+    ("item",),
+    ("type", "project"),
+    ("year",),
+    ("extent_ymin",),
+    ("extent_xmin",),
+    ("datetime_start",),
+    ("version_timestamp",),
+]
+# ranges indexed by their lower bound, with the column of the upper bound
+RANGES = {
+    "extent_y": ("extent_ymin", "extent_ymax"),
+    "extent_x": ("extent_xmin", "extent_xmax"),
+    "datetime": ("datetime_start", "datetime_stop"),
+}
+# page cache of the connection in KiB
+CACHE_SIZE = 65_536
+# fraction of changed rows that triggers an update of the planner statistics
+ANALYZE_FRACTION = 0.1
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _to_rows(df):
+    # convert a table of records into rows of native values (None for missing)
+    ls_columns = []
+    for column in COLUMNS:
+        if column not in df.columns:
+            ls_columns.append([None] * len(df))
+            continue
+        series = df[column]
+        if column in TIME_COLUMNS:
+            values = series.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            is_missing = series.isna().to_numpy()
+        elif COLUMN_TYPES.get(column) in ("INTEGER", "REAL"):
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            is_missing = np.isnan(values)
+            if COLUMN_TYPES[column] == "INTEGER":
+                values = np.where(is_missing, 0, values).astype(np.int64)
+        else:
+            values = series.to_numpy(dtype=object)
+            is_missing = series.isna().to_numpy()
+        ls_values = values.tolist()
+        for i in np.flatnonzero(is_missing).tolist():
+            ls_values[i] = None
+        ls_columns.append(ls_values)
+    return list(zip(*ls_columns))
+
+
+def _get_spans(df):
+    # longest span of each range in a table of records
+    dc_spans = {}
+    for name, (lower, upper) in RANGES.items():
+        if lower not in df.columns or upper not in df.columns:
+            continue
+        if lower in TIME_COLUMNS:
+            spans = (df[upper] - df[lower]).dt.total_seconds() * 1e9
+        else:
+            spans = df[upper] - df[lower]
+        span = spans.max()
+        if pd.notna(span):
+            dc_spans[name] = float(span)
+    return dc_spans
+
+
+def _to_nanoseconds(timestamp):
+    # nanoseconds since the epoch of a timestamp (Flare or ISO text, or datetime)
+    if isinstance(timestamp, str) and TIMESTAMP_PATTERN.fullmatch(timestamp):
+        ts = decode_timestamp(timestamp)
+    else:
+        ts = pd.Timestamp(timestamp)
+    return int(_to_datetime64(ts, "ns").view(np.int64))
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class Catalog:
+    """
+    A SQLite catalog of parsed Flare labels.
+
+    Use it as a context manager to close the connection at the end.
+    """
+
+    def __init__(self, path=":memory:"):
+        """
+        Initialize the catalog, creating the table and indexes if needed.
+
+        :param path: Path to the database file. Default value = ``:memory:``
+        :type path: str or :class:`pathlib.Path`
+        """
+        self.path = path if path == ":memory:" else os.fspath(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE}")
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            ls_columns = [f"{c} {COLUMN_TYPES.get(c, 'TEXT')}" for c in COLUMNS]
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {TABLE} ({', '.join(ls_columns)})"
+            )
+            # longest span of each range (see Catalog.query)
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {TABLE}_spans (name TEXT PRIMARY KEY, span REAL)"
+            )
+            for ls_index in INDEXES:
+                name = f"idx_{TABLE}_{'_'.join(ls_index)}"
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {TABLE} ({', '.join(ls_index)})"
+                )
+
+    def insert(self, df, analyze=True):
+        """
+        Insert or replace records, in a single transaction.
+
+        :param df: The records, with a ``path`` column and the columns of ``labels.parse_many``.
+        :type df: :class:`pandas.DataFrame`
+        :param analyze: If True, update the planner statistics after large inserts. Default value = True
+        :type analyze: bool
+        :return: The number of records inserted.
+        :rtype: int
+        """
+        if "path" not in df.columns:
+            raise ValueError("records need a 'path' column")
+        placeholders = ", ".join("?" * len(COLUMNS))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {TABLE} ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                _to_rows(df),
+            )
+            self.conn.executemany(
+                f"INSERT INTO {TABLE}_spans VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET span = MAX(span, excluded.span)",
+                _get_spans(df).items(),
+            )
+        if analyze:
+            self._analyze_changes(len(df))
+        return len(df)
+
+    def remove(self, paths):
+        """
+        Remove records by path, in a single transaction.
+
+        :param paths: The file paths.
+        :type paths: list
+        :return: The number of records removed.
+        :rtype: int
+        """
+        with self.conn:
+            cursor = self.conn.executemany(
+                f"DELETE FROM {TABLE} WHERE path = ?", [(p,) for p in paths]
+            )
+        return cursor.rowcount
+
+    def sync(
+        self,
+        root,
+        scheme=None,
+        extensions=None,
+        workers=None,
+        batch_size=BATCH_SIZE,
+    ):
+        """
+        Sync the catalog with a directory tree, parsing only new and changed files.
+
+        Files are compared by size and modification time. Records of files under
+        ``root`` that are gone are removed (with ``extensions``, only records of files
+        with those extensions). Invalid labels are kept with missing fields.
+
+        :param root: The root directory.
+        :type root: str or :class:`pathlib.Path`
+        :param scheme: The labeling scheme (see ``labels.SCHEMES``). If None, it is detected per file.
+        :type scheme: str or None
+        :param extensions: The file extensions to keep (case-insensitive, without dot). If None, all files are kept.
+        :type extensions: list or None
+        :param workers: The number of scanning threads. If None, the ``ThreadPoolExecutor`` default is used.
+        :type workers: int or None
+        :param batch_size: The number of files parsed and inserted per transaction. Default value = 100000
+        :type batch_size: int
+        :return: The counts of ``added``, ``updated``, ``removed`` and ``unchanged`` files.
+        :rtype: dict
+        """
+        root = os.fspath(root)
+        prefix = os.path.join(root, "")
+        # only files the scan can see are candidates for removal
+        suffixes = (
+            None
+            if extensions is None
+            else tuple("." + e.lstrip(".").lower() for e in extensions)
+        )
+        dc_known = {
+            path: (size, mtime)
+            for path, size, mtime in self.conn.execute(
+                f"SELECT path, size, mtime FROM {TABLE}"
+            )
+            if path.startswith(prefix)
+            and (suffixes is None or path.lower().endswith(suffixes))
+        }
+        counts = dict(added=0, updated=0, removed=0, unchanged=0)
+        ls_changed = []
+        for entries in scan(root, extensions=extensions, workers=workers):
+            for entry in entries:
+                path, _, size, mtime = entry
+                known = dc_known.pop(path, None)
+                if known == (size, mtime):
+                    counts["unchanged"] += 1
+                    continue
+                counts["added" if known is None else "updated"] += 1
+                ls_changed.append(entry)
+            while len(ls_changed) >= batch_size:
+                self.insert(
+                    _make_batch(ls_changed[:batch_size], scheme, True, "coerce")
+                )
+                del ls_changed[:batch_size]
+        if ls_changed:
+            self.insert(_make_batch(ls_changed, scheme, True, "coerce"))
+        counts["removed"] = self.remove(list(dc_known))
+        return counts
+
+    def query(
+        self,
+        scheme=None,
+        bbox=None,
+        start=None,
+        stop=None,
+        year=None,
+        **domains,
+    ):
+        """
+        Query records by domains, bounding box and time range.
+
+        :param scheme: The labeling scheme.
+        :type scheme: str or None
+        :param bbox: The bounds ``(ymin, xmin, ymax, xmax)``; records with extents intersecting it are kept.
+        :type bbox: tuple or None
+        :param start: The start of the time range (inclusive); records with ``datetime`` overlapping the range are kept.
+        :type start: str, :class:`pandas.Timestamp` or None
+        :param stop: The stop of the time range (exclusive).
+        :type stop: str, :class:`pandas.Timestamp` or None
+        :param year: The year of ``reference`` labels.
+        :type year: int or None
+        :param domains: Exact values of text domains, e.g. ``source="COPERNICUS"``. Lists match any value.
+        :type domains: dict
+        :return: The matching records, sorted by path.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        sql, ls_params = self._make_query(scheme, bbox, start, stop, year, **domains)
+        df = pd.read_sql_query(sql, self.conn, params=ls_params)
+        # sorted here, so that the plan is not driven by the order
+        df = df.sort_values("path", ignore_index=True)
+        for column, column_type in COLUMN_TYPES.items():
+            if column in TIME_COLUMNS:
+                df[column] = pd.to_datetime(df[column], unit="ns")
+            elif column_type == "REAL":
+                df[column] = df[column].astype("float64")
+            elif column_type == "INTEGER":
+                df[column] = df[column].astype("Int64")
+        return df
+
+    def explain(self, **kwargs):
+        """
+        Get the SQLite query plan of a query (to check the use of indexes).
+
+        :param kwargs: The arguments of ``Catalog.query``.
+        :type kwargs: dict
+        :return: The lines of the query plan.
+        :rtype: list
+        """
+        sql, ls_params = self._make_query(**kwargs)
+        rows = self.conn.execute("EXPLAIN QUERY PLAN " + sql, ls_params).fetchall()
+        return [row[-1] for row in rows]
+
+    def close(self):
+        """
+        Close the database connection, updating the statistics of the query planner.
+
+        :return: None
+        :rtype: None
+        """
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+        return None
+
+    def analyze(self):
+        """
+        Update the statistics used by the query planner to choose indexes.
+
+        :return: None
+        :rtype: None
+        """
+        self.conn.execute(f"ANALYZE {TABLE}")
+        self.conn.commit()
+        return None
+
+    def _analyze_changes(self, n_changed):
+        # update the planner statistics once enough rows changed
+        if n_changed and n_changed >= ANALYZE_FRACTION * len(self):
+            self.analyze()
+
+    def _make_query(
+        self, scheme=None, bbox=None, start=None, stop=None, year=None, **domains
+    ):
+        # build the SQL and parameters of a query
+        ls_where = []
+        ls_params = []
+        domains = dict(domains, scheme=scheme, year=year)
+        for column, value in domains.items():
+            if value is None:
+                continue
+            if column not in COLUMNS:
+                raise ValueError(f"unknown column: {column!r}")
+            values = value if isinstance(value, (list, tuple)) else [value]
+            ls_where.append(f"{column} IN ({', '.join('?' * len(values))})")
+            # numpy scalars would be bound as blobs
+            ls_params += [v.item() if isinstance(v, np.generic) else v for v in values]
+        # ranges are searched by their lower bound (indexed) within the query
+        # widened by the longest span, then filtered by their upper bound
+        dc_spans = dict(self.conn.execute(f"SELECT name, span FROM {TABLE}_spans"))
+        dc_bounds = {}
+        if bbox is not None:
+            ymin, xmin, ymax, xmax = [float(b) for b in bbox]
+            dc_bounds["extent_y"] = (ymin, ymax, True)
+            dc_bounds["extent_x"] = (xmin, xmax, True)
+        if start is not None or stop is not None:
+            lower = None if start is None else _to_nanoseconds(start)
+            upper = None if stop is None else _to_nanoseconds(stop)
+            dc_bounds["datetime"] = (lower, upper, False)
+        for name, (lower, upper, is_closed) in dc_bounds.items():
+            column_lower, column_upper = RANGES[name]
+            if upper is not None:
+                ls_where.append(f"{column_lower} {'<=' if is_closed else '<'} ?")
+                ls_params.append(upper)
+            if lower is None:
+                continue
+            ls_where.append(f"{column_lower} >= ?")
+            ls_params.append(lower - dc_spans.get(name, 0))
+            if is_closed:
+                ls_where.append(f"COALESCE({column_upper}, {column_lower}) >= ?")
+            else:
+                # timestamps without a stop last an instant
+                ls_where.append(f"COALESCE({column_upper}, {column_lower} + 1) > ?")
+            ls_params.append(lower)
+
+        sql = f"SELECT * FROM {TABLE}"
+        if ls_where:
+            sql += " WHERE " + " AND ".join(ls_where)
+        return sql, ls_params
+
+    def __len__(self):
+        return self.conn.execute(f"SELECT COUNT(*) FROM {TABLE}").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    with Catalog() as catalog:
+        print(catalog.sync("."))
+    # ... {develop}
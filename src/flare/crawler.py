@@ -0,0 +1,418 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Filesystem crawler that catalogs Flare-labeled files, scanning directories with
+``os.scandir`` over a pool of threads.
+
+Features
+--------
+ - Scan directory trees with ``os.scandir`` across a thread pool
+ - Filter files by extension
+ - Parse filenames in batches with the ``labels`` bulk parser
+ - Stream records as table batches, or write them to a ``csv`` or ``parquet`` file
+ - Watch a directory tree for added, updated and removed files by polling
+
+Overview
+--------
+
+Each directory is scanned by one task. Subdirectories found by a task are submitted
+as new tasks, so large trees are scanned by all threads at once (``os.scandir`` and
+``stat`` calls release the GIL). File types come from the directory entries, so
+only the files that are kept need a ``stat`` call.
+
+Files are gathered into batches of ``batch_size`` rows and parsed with
+``labels.parse_many``. Each batch is a :class:`pandas.DataFrame` with the columns:
+
+ - ``path``: the file path
+ - the parsed fields of ``labels.parse_many`` (``scheme`` is missing for invalid labels)
+ - ``size`` and ``mtime``: the file size in bytes and modification time (if ``stat=True``)
+
+Directories are scanned in no particular order, so rows are not sorted.
+
+:class:`Watcher` polls a directory tree without filesystem notifications (no
+``inotify`` dependency): each poll scans the tree and diffs the snapshot of file sizes
+and modification times against the previous one, as ``catalog.Catalog.sync`` does.
+
+Examples
+--------
+
+Stream batches of records
+
+.. code-block:: python
+
+    for df in crawl("/archive", scheme="dataset", extensions=["tif"]):
+        print(df[["item", "extent_ymin", "datetime_start"]])
+
+Write a catalog table
+
+.. code-block:: python
+
+    n_files = crawl_file("/archive", "catalog.parquet", scheme="dataset", workers=16)
+
+Watch a directory tree
+
+.. code-block:: python
+
+    watcher = Watcher("/archive", extensions=["tif"], interval=5.0)
+    for changes in watcher.watch():
+        print(changes["added"], changes["updated"], changes["removed"])
+
+Same from the terminal
+
+.. code-block:: bash
+
+    python -m flare crawl /archive catalog.parquet --scheme dataset --workers 16
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import parse_many
+from flare.relabel import SEPARATOR, ChunkWriter
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+BATCH_SIZE = 100_000
+# seconds between polls of a watcher
+POLL_INTERVAL = 1.0
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def crawl(
+    root,
+    scheme=None,
+    extensions=None,
+    workers=None,
+    batch_size=BATCH_SIZE,
+    stat=True,
+    errors="coerce",
+):
+    """
+    Crawls a directory tree and parses filenames into batches of records.
+
+    :param root: The root directory.
+    :type root: str or :class:`pathlib.Path`
+    :param scheme: The labeling scheme (see ``labels.SCHEMES``). If None, it is detected per file.
+    :type scheme: str or None
+    :param extensions: The file extensions to keep (case-insensitive, without dot). If None, all files are kept.
+    :type extensions: list or None
+    :param workers: The number of scanning threads. If None, the ``ThreadPoolExecutor`` default is used.
+    :type workers: int or None
+    :param batch_size: The number of files per batch. Default value = 100000
+    :type batch_size: int
+    :param stat: If True, include file sizes and modification times. Default value = True
+    :type stat: bool
+    :param errors: If ``raise``, invalid labels raise errors; if ``coerce``, they are kept with missing fields.
+    :type errors: str
+    :return: Generator of record batches.
+    :rtype: generator
+    """
+    ls_files = []
+    for entries in scan(root, extensions=extensions, workers=workers, stat=stat):
+        ls_files.extend(entries)
+        while len(ls_files) >= batch_size:
+            yield _make_batch(ls_files[:batch_size], scheme, stat, errors)
+            del ls_files[:batch_size]
+    if ls_files:
+        yield _make_batch(ls_files, scheme, stat, errors)
+
+
+def crawl_file(
+    root,
+    dst,
+    scheme=None,
+    extensions=None,
+    workers=None,
+    batch_size=BATCH_SIZE,
+    stat=True,
+    errors="coerce",
+    sep=SEPARATOR,
+):
+    """
+    Crawls a directory tree and writes the records to a ``csv`` or ``parquet`` file.
+
+    :param root: The root directory.
+    :type root: str or :class:`pathlib.Path`
+    :param dst: Path to the output ``csv`` or ``parquet`` file.
+    :type dst: str or :class:`pathlib.Path`
+    :param scheme: The labeling scheme (see ``labels.SCHEMES``). If None, it is detected per file.
+    :type scheme: str or None
+    :param extensions: The file extensions to keep (case-insensitive, without dot). If None, all files are kept.
+    :type extensions: list or None
+    :param workers: The number of scanning threads. If None, the ``ThreadPoolExecutor`` default is used.
+    :type workers: int or None
+    :param batch_size: The number of files per batch. Default value = 100000
+    :type batch_size: int
+    :param stat: If True, include file sizes and modification times. Default value = True
+    :type stat: bool
+    :param errors: If ``raise``, invalid labels raise errors; if ``coerce``, they are kept with missing fields.
+    :type errors: str
+    :param sep: The ``csv`` field separator. Default value = ``;``
+    :type sep: str
+    :return: The number of files written.
+    :rtype: int
+    """
+    n_files = 0
+    batches = crawl(
+        root,
+        scheme=scheme,
+        extensions=extensions,
+        workers=workers,
+        batch_size=batch_size,
+        stat=stat,
+        errors=errors,
+    )
+    with ChunkWriter(dst=dst, sep=sep) as writer:
+        for df in batches:
+            writer.write(df)
+            n_files += len(df)
+    return n_files
+
+
+def scan(root, extensions=None, workers=None, stat=True, follow_symlinks=False):
+    """
+    Scans a directory tree with ``os.scandir`` over a thread pool.
+
+    :param root: The root directory.
+    :type root: str or :class:`pathlib.Path`
+    :param extensions: The file extensions to keep (case-insensitive, without dot). If None, all files are kept.
+    :type extensions: list or None
+    :param workers: The number of scanning threads. If None, the ``ThreadPoolExecutor`` default is used.
+    :type workers: int or None
+    :param stat: If True, include file sizes and modification times. Default value = True
+    :type stat: bool
+    :param follow_symlinks: If True, follow symbolic links to directories and files. Default value = False
+    :type follow_symlinks: bool
+    :return: Generator of lists of ``(path, name, size, mtime_ns)`` tuples, one list per directory.
+    :rtype: generator
+    """
+    root = os.fspath(root)
+    if not os.path.isdir(root):
+        raise NotADirectoryError(f"not a directory: {root!r}")
+    if extensions is not None:
+        extensions = tuple("." + e.lstrip(".").lower() for e in extensions)
+    options = dict(extensions=extensions, stat=stat, follow_symlinks=follow_symlinks)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = {executor.submit(_scan_directory, root, **options)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ls_files, ls_dirs = future.result()
+                for path in ls_dirs:
+                    pending.add(executor.submit(_scan_directory, path, **options))
+                if ls_files:
+                    yield ls_files
+    finally:
+        # drop queued directories if the generator is closed early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _scan_directory(path, extensions, stat, follow_symlinks):
+    # list the files (filtered) and subdirectories of a directory
+    ls_files = []
+    ls_dirs = []
+    try:
+        iterator = os.scandir(path)
+    except (PermissionError, FileNotFoundError):
+        return ls_files, ls_dirs
+    with iterator:
+        for entry in iterator:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    ls_dirs.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=follow_symlinks):
+                    continue
+                if extensions is not None and not entry.name.lower().endswith(
+                    extensions
+                ):
+                    continue
+                if stat:
+                    st = entry.stat(follow_symlinks=follow_symlinks)
+                    ls_files.append(
+                        (entry.path, entry.name, st.st_size, st.st_mtime_ns)
+                    )
+                else:
+                    ls_files.append((entry.path, entry.name, -1, 0))
+            except OSError:
+                # entries removed while scanning
+                continue
+    return ls_files, ls_dirs
+
+
+def _make_batch(ls_files, scheme, stat, errors):
+    # parse a batch of scanned files into a table
+    paths, names, sizes, mtimes = zip(*ls_files)
+    df = parse_many(np.array(names), scheme=scheme, errors=errors)
+    df.insert(0, "path", np.array(paths))
+    # text columns take one dtype, so batches of other schemes (or of invalid
+    # names only) keep the schema of the first batch in parquet files
+    for column in df.columns:
+        if df[column].dtype == object or pd.api.types.is_string_dtype(df[column]):
+            df[column] = df[column].astype("string")
+    if stat:
+        df["size"] = np.array(sizes, dtype=np.int64)
+        df["mtime"] = pd.to_datetime(np.array(mtimes, dtype=np.int64), unit="ns")
+    return df
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class Watcher:
+    """
+    A polling watcher of a directory tree, diffing ``os.scandir`` snapshots of file sizes and modification times.
+    """
+
+    def __init__(
+        self, root, extensions=None, workers=None, interval=POLL_INTERVAL, snapshot=None
+    ):
+        """
+        Initialize the watcher. The first poll reports all files as added, unless a snapshot is given.
+
+        :param root: The root directory.
+        :type root: str or :class:`pathlib.Path`
+        :param extensions: The file extensions to keep (case-insensitive, without dot). If None, all files are kept.
+        :type extensions: list or None
+        :param workers: The number of scanning threads. If None, the ``ThreadPoolExecutor`` default is used.
+        :type workers: int or None
+        :param interval: The seconds between polls of ``watch``. Default value = 1.0
+        :type interval: float
+        :param snapshot: A previous snapshot (see ``Watcher.scan``). If None, it starts empty.
+        :type snapshot: dict or None
+        """
+        self.root = os.fspath(root)
+        self.extensions = extensions
+        self.workers = workers
+        self.interval = interval
+        self.snapshot = {} if snapshot is None else dict(snapshot)
+
+    def scan(self):
+        """
+        Scan the directory tree.
+
+        :return: The snapshot of the tree: ``(size, mtime_ns)`` by file path.
+        :rtype: dict
+        """
+        return {
+            path: (size, mtime)
+            for entries in scan(
+                self.root, extensions=self.extensions, workers=self.workers
+            )
+            for path, _, size, mtime in entries
+        }
+
+    def poll(self):
+        """
+        Scan the directory tree once and diff it against the previous snapshot.
+
+        :return: Sorted lists of ``added``, ``updated`` and ``removed`` file paths.
+        :rtype: dict
+        """
+        snapshot = self.scan()
+        changes = dict(added=[], updated=[], removed=[])
+        for path, stat in snapshot.items():
+            known = self.snapshot.pop(path, None)
+            if known is None:
+                changes["added"].append(path)
+            elif known != stat:
+                changes["updated"].append(path)
+        changes["removed"] = list(self.snapshot)
+        self.snapshot = snapshot
+        return {key: sorted(ls_paths) for key, ls_paths in changes.items()}
+
+    def watch(self, max_polls=None):
+        """
+        Poll the directory tree every ``interval`` seconds and yield the changes.
+
+        :param max_polls: The number of polls. If None, it polls forever.
+        :type max_polls: int or None
+        :return: Generator of changes (see ``Watcher.poll``), only for polls with changes.
+        :rtype: generator
+        """
+        n_polls = 0
+        while max_polls is None or n_polls < max_polls:
+            if n_polls:
+                time.sleep(self.interval)
+            changes = self.poll()
+            n_polls += 1
+            if any(changes.values()):
+                yield changes
+
+    def __len__(self):
+        return len(self.snapshot)
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    for df in crawl("."):
+        print(df.head())
+    # ... {develop}
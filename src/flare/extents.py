@@ -0,0 +1,429 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Codecs and a spatial index for extent domains, made of signed latitudes and
+longitudes encoded as Flare numbers (e.g. ``S030W051``).
+
+Features
+--------
+ - Decode extents into bounds ``(ymin, xmin, ymax, xmax)``
+ - Decode extents in bulk into NumPy coordinate arrays
+ - Index bounding boxes in a packed R-tree (Sort-Tile-Recursive)
+ - Query boxes intersecting a bounding box, or covering a point, in milliseconds
+
+Overview
+--------
+
+An extent is a sequence of ``numflare`` numbers with sign flags: numbers with
+latitude signs (``n/s``) set the ``y`` bounds and numbers with longitude signs
+(``e/w``) set the ``x`` bounds. A single pair (as in tile names) is a point.
+
+The bulk decoder splits extents into numbers on matrices of code points and decodes
+all numbers at once with ``numflare.decode_numbers``. Texts that are not extents
+(e.g. region names), replacers and missing values are decoded to ``NaN``.
+
+:class:`ExtentIndex` is a static R-tree packed with the Sort-Tile-Recursive method:
+boxes are sorted into vertical slices by ``x`` and by ``y`` within each slice, then
+grouped in nodes of ``node_size`` boxes, level by level up to the root. A query
+walks the levels from the root, keeping only nodes intersecting the query box.
+
+Examples
+--------
+
+Decode extents in bulk
+
+.. code-block:: python
+
+    ymin, xmin, ymax, xmax = decode_extents(["S030W051", "n10e20s5w3", "brazil"])
+
+Find tiles intersecting a bounding box
+
+.. code-block:: python
+
+    index = ExtentIndex.from_labels(df["extent"])
+    positions = index.intersects((-35, -55, -25, -45))
+    df_tiles = df.iloc[positions]
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import math
+import re
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.flags import CLASSES, get_registry, lookup
+from flare.numflare import SIGN, DECIMAL, MAGNITUDES, decode_number, decode_numbers
+from flare.numflare import _to_str_array
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# number of elements processed at once by the bulk decoder
+CHUNK_SIZE = 500_000
+# number of children of each node of the R-tree
+NODE_SIZE = 16
+
+# grammar of extents: a sequence of signed numbers
+LATITUDE_SIGNS = "".join(SIGN["latitude"].values())
+LONGITUDE_SIGNS = "".join(SIGN["longitude"].values())
+EXTENT_NUMBER_PATTERN = "[{signs}][0-9]+(?:{p}[0-9]*)?[{magnitudes}]?".format(
+    signs=re.escape(LATITUDE_SIGNS + LONGITUDE_SIGNS),
+    p=re.escape(DECIMAL),
+    magnitudes=re.escape("".join(MAGNITUDES)),
+)
+EXTENT_PATTERN = re.compile(
+    f"(?:{EXTENT_NUMBER_PATTERN})+", flags=re.IGNORECASE | re.ASCII
+)
+EXTENT_NUMBER = re.compile(EXTENT_NUMBER_PATTERN, flags=re.IGNORECASE | re.ASCII)
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def decode_extent(encoded_extent):
+    """
+    Decodes an extent made of signed numbers into bounds.
+
+    Numbers with latitude signs (``n/s``) set the ``y`` bounds and numbers with
+    longitude signs (``e/w``) set the ``x`` bounds. A single pair is a point.
+
+    :param encoded_extent: The encoded extent.
+    :type encoded_extent: str
+    :return: The bounds ``(ymin, xmin, ymax, xmax)``.
+    :rtype: tuple
+
+    **Examples**
+
+    >>> decode_extent("S030W051")
+    (-30.0, -51.0, -30.0, -51.0)
+
+    >>> decode_extent("s30w51n20w40")
+    (-30.0, -51.0, 20.0, -40.0)
+
+    """
+    if EXTENT_PATTERN.fullmatch(encoded_extent) is None:
+        raise ValueError(f"invalid extent: {encoded_extent!r}")
+    ys, xs = [], []
+    for token in EXTENT_NUMBER.findall(encoded_extent):
+        if token[0].lower() in LATITUDE_SIGNS:
+            ys.append(decode_number(token))
+        else:
+            xs.append(decode_number(token))
+    if not ys or not xs:
+        raise ValueError(f"extent needs latitudes and longitudes: {encoded_extent!r}")
+    return min(ys), min(xs), max(ys), max(xs)
+
+
+def decode_extents(encoded_extents):
+    """
+    Decodes an array of extents in bulk, following the same rules of ``decode_extent``.
+
+    Texts that are not extents, replacers and missing values are decoded to ``NaN``.
+
+    :param encoded_extents: The encoded extents.
+    :type encoded_extents: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :return: The arrays of bounds ``(ymin, xmin, ymax, xmax)``.
+    :rtype: tuple
+
+    **Examples**
+
+    >>> ymin, xmin, ymax, xmax = decode_extents(["S030W051", "n10e20s5w3", "brazil"])
+    >>> ymin.tolist(), xmax.tolist()
+    ([-30.0, -5.0, nan], [-51.0, 20.0, nan])
+
+    """
+    labels = _to_str_array(encoded_extents).ravel()
+    bounds = np.full((4, labels.size), np.nan)
+    for start in range(0, labels.size, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, labels.size)
+        bounds[:, start:stop] = _decode_chunk(labels[start:stop])
+    return tuple(bounds)
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _decode_chunk(labels):
+    # decode a chunk of extents into a (4, size) array of bounds
+    size = labels.size
+    bounds = np.full((4, size), np.nan)
+    if size == 0 or labels.dtype.itemsize == 0:
+        return bounds
+    width = labels.dtype.itemsize // 4
+    codes = labels.view(np.uint32).reshape(size, width)
+    # character classes in the lookup table of the registry (case-insensitive)
+    classes = lookup(get_registry().classes, codes)
+    lengths = np.char.str_len(labels)
+
+    # --------------- check layout ---------------
+    is_char = np.arange(width) < lengths[:, None]
+    is_latitude = (classes == CLASSES.index("latitude")) & is_char
+    is_sign = is_latitude | ((classes == CLASSES.index("longitude")) & is_char)
+    is_digit = classes == CLASSES.index("digit")
+    is_valid = ((classes != CLASSES.index("other")) | ~is_char).all(axis=1)
+    is_valid &= is_sign[:, 0]
+    # signs are followed by digits
+    is_valid &= ~(is_sign[:, :-1] & ~is_digit[:, 1:]).any(axis=1)
+    is_valid &= ~is_sign[np.arange(size), lengths - 1]
+    # magnitudes end numbers
+    is_magnitude = (classes == CLASSES.index("magnitude")) & is_char
+    is_valid &= ~(is_magnitude[:, :-1] & is_char[:, 1:] & ~is_sign[:, 1:]).any(axis=1)
+    # one decimal separator per number
+    p_rows, p_cols = np.nonzero((classes == CLASSES.index("decimal")) & is_char)
+    p_numbers = np.cumsum(is_sign, axis=1)[p_rows, p_cols]
+    is_repeated = (p_rows[1:] == p_rows[:-1]) & (p_numbers[1:] == p_numbers[:-1])
+    is_valid[p_rows[1:][is_repeated]] = False
+    # latitudes and longitudes
+    n_latitudes = is_latitude.sum(axis=1)
+    is_valid &= (n_latitudes > 0) & (is_sign.sum(axis=1) > n_latitudes)
+    rows = np.flatnonzero(is_valid)
+    if rows.size == 0:
+        return bounds
+
+    # --------------- decode numbers ---------------
+    token_rows, token_starts = np.nonzero(is_sign[rows])
+    token_rows = rows[token_rows]
+    token_stops = np.empty_like(token_starts)
+    is_same_row = token_rows[1:] == token_rows[:-1]
+    token_stops[:-1] = np.where(is_same_row, token_starts[1:], lengths[token_rows[:-1]])
+    token_stops[-1] = lengths[token_rows[-1]]
+    tokens = _gather(codes, token_rows, token_starts, token_stops)
+    try:
+        values = decode_numbers(tokens)
+    except ValueError:
+        # malformed numbers make their extents invalid
+        values = np.array([_decode_or_nan(t) for t in tokens.tolist()])
+    token_is_latitude = is_latitude[token_rows, token_starts]
+
+    # --------------- reduce bounds ---------------
+    lower = np.full((2, size), np.inf)
+    upper = np.full((2, size), -np.inf)
+    axes = np.where(token_is_latitude, 0, 1)
+    np.minimum.at(lower, (axes, token_rows), values)
+    np.maximum.at(upper, (axes, token_rows), values)
+    is_bad = np.zeros(size, dtype=bool)
+    is_bad[token_rows[np.isnan(values)]] = True
+    rows = rows[~is_bad[rows]]
+    bounds[0, rows], bounds[1, rows] = lower[0, rows], lower[1, rows]
+    bounds[2, rows], bounds[3, rows] = upper[0, rows], upper[1, rows]
+    return bounds
+
+
+def _gather(codes, rows, starts, stops):
+    # gather substrings [start, stop) of rows into a fixed-width array
+    n = max(int((stops - starts).max(initial=0)), 1)
+    index = starts[:, None] + np.arange(n)
+    taken = codes[rows[:, None], np.minimum(index, codes.shape[1] - 1)]
+    taken = np.where(index < stops[:, None], taken, 0).astype(np.uint32)
+    return taken.view(f"<U{n}").reshape(rows.size)
+
+
+def _decode_or_nan(token):
+    # decode a number, or NaN if invalid
+    try:
+        return decode_number(token)
+    except ValueError:
+        return np.nan
+
+
+def _expand_ranges(starts, counts):
+    # concatenate the ranges [start, start + count)
+    total = int(counts.sum())
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(total)
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class ExtentIndex:
+    """
+    A static R-tree of bounding boxes for fast intersection queries.
+
+    Boxes are packed with the Sort-Tile-Recursive method in nodes of ``node_size``
+    children. Queries walk the levels from the root and only visit nodes intersecting
+    the query box. Bounds are inclusive, so boxes touching the query box (and points)
+    match. Boxes with missing bounds are not indexed.
+
+    Queries return the sorted positions of the matching boxes in the input arrays.
+    """
+
+    def __init__(self, ymin, xmin, ymax, xmax, node_size=NODE_SIZE):
+        """
+        Initialize the index from arrays of bounds.
+
+        :param ymin: The lower latitudes.
+        :type ymin: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param xmin: The lower longitudes.
+        :type xmin: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param ymax: The upper latitudes.
+        :type ymax: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param xmax: The upper longitudes.
+        :type xmax: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param node_size: The number of children of each node. Default value = 16
+        :type node_size: int
+        """
+        boxes = np.array(
+            [np.asarray(b, dtype=np.float64).ravel() for b in (ymin, xmin, ymax, xmax)]
+        )
+        if node_size < 2:
+            raise ValueError(f"node_size must be at least 2: {node_size}")
+        self.node_size = int(node_size)
+        self.size = boxes.shape[1]
+        is_valid = np.isfinite(boxes).all(axis=0)
+        is_valid &= (boxes[0] <= boxes[2]) & (boxes[1] <= boxes[3])
+        ids = np.flatnonzero(is_valid)
+
+        # --------------- sort tiles ---------------
+        n = ids.size
+        n_leaves = math.ceil(n / self.node_size)
+        n_slices = max(math.ceil(math.sqrt(n_leaves)), 1)
+        centers_x = boxes[1, ids] + boxes[3, ids]
+        centers_y = boxes[0, ids] + boxes[2, ids]
+        order = np.argsort(centers_x, kind="stable")
+        slices = np.arange(n) // (n_slices * self.node_size)
+        order = order[np.lexsort((centers_y[order], slices))]
+        self.ids = ids[order]
+
+        # --------------- pack levels ---------------
+        self._levels = [boxes[:, self.ids]]
+        while self._levels[-1].shape[1] > self.node_size:
+            children = self._levels[-1]
+            starts = np.arange(0, children.shape[1], self.node_size)
+            self._levels.append(
+                np.array(
+                    [
+                        np.minimum.reduceat(children[0], starts),
+                        np.minimum.reduceat(children[1], starts),
+                        np.maximum.reduceat(children[2], starts),
+                        np.maximum.reduceat(children[3], starts),
+                    ]
+                )
+            )
+
+    @classmethod
+    def from_labels(cls, encoded_extents, node_size=NODE_SIZE):
+        """
+        Make an index from encoded extents.
+
+        :param encoded_extents: The encoded extents.
+        :type encoded_extents: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param node_size: The number of children of each node. Default value = 16
+        :type node_size: int
+        :return: The extent index.
+        :rtype: :class:`ExtentIndex`
+
+        **Examples**
+
+        >>> index = ExtentIndex.from_labels(["S030W051", "S031W051", "n10e20s5w3", "x"])
+        >>> index.intersects((-30.5, -52, -29, -50)).tolist()
+        [0]
+
+        >>> index.covers(0, 0).tolist()
+        [2]
+
+        """
+        return cls(*decode_extents(encoded_extents), node_size=node_size)
+
+    def intersects(self, bbox):
+        """
+        Find the boxes intersecting a bounding box.
+
+        :param bbox: The bounds ``(ymin, xmin, ymax, xmax)`` of the query.
+        :type bbox: tuple
+        :return: The sorted positions of the matching boxes.
+        :rtype: :class:`numpy.ndarray`
+        """
+        ymin, xmin, ymax, xmax = [float(b) for b in bbox]
+        nodes = np.arange(self._levels[-1].shape[1])
+        for level in range(len(self._levels) - 1, -1, -1):
+            boxes = self._levels[level][:, nodes]
+            is_hit = (boxes[0] <= ymax) & (boxes[2] >= ymin)
+            is_hit &= (boxes[1] <= xmax) & (boxes[3] >= xmin)
+            nodes = nodes[is_hit]
+            if level == 0:
+                break
+            # children of the nodes hit
+            n_children = self._levels[level - 1].shape[1]
+            starts = nodes * self.node_size
+            counts = np.minimum(starts + self.node_size, n_children) - starts
+            nodes = _expand_ranges(starts, counts)
+        return np.sort(self.ids[nodes])
+
+    def covers(self, y, x):
+        """
+        Find the boxes covering a point.
+
+        :param y: The latitude of the point.
+        :type y: float
+        :param x: The longitude of the point.
+        :type x: float
+        :return: The sorted positions of the matching boxes.
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self.intersects((y, x, y, x))
+
+    def __len__(self):
+        return self.size
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    index = ExtentIndex.from_labels(["S030W051", "S031W051", "n10e20s5w3"])
+    print(index.intersects((-30.5, -52, -29, -50)))
+    # ... {develop}
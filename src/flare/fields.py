@@ -0,0 +1,294 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Normalizer of table headers into Flare field labels: ASCII letters and digits in
+domains separated by ``_``, with no hyphens.
+
+Features
+--------
+ - Transliterate accents, ligatures and common symbols into ASCII
+ - Split camel case and collapse any other character into single ``_`` separators
+ - Encode decimal and negative numbers with ``numflare``
+ - Substitute headers by standard names of the vocabulary
+ - Resolve collisions with zero-filled numeric suffixes
+ - Normalize whole ``pandas.Index`` objects with vectorized string methods
+
+Overview
+--------
+
+Headers go through the following steps, each one a vectorized string method over
+all the headers of a table:
+
+.. list-table::
+   :header-rows: 1
+
+   * - Step
+     - Example
+   * - Substitute standard names (names and titles of ``vocabulary``)
+     - ``Standard Deviation`` to ``sd``
+   * - Transliterate (``TRANSLITERATIONS`` and Unicode decomposition)
+     - ``Précip. (µm)`` to ``Precip. (um)``
+   * - Split camel case
+     - ``maxTemp`` to ``max_Temp``
+   * - Encode numbers with a fraction or a minus sign
+     - ``depth -2.5`` to ``depth s2p5``
+   * - Collapse separators and lowercase
+     - ``Precip. (um)`` to ``precip_um``
+   * - Resolve collisions
+     - ``a``, ``a``, ``a`` to ``a``, ``a_1``, ``a_2``
+
+Positive numbers are unsigned, since the sign is positive by default in Flare
+numbers; negative numbers take the negative latitude flag. Headers left empty are
+replaced by the null replacer (``x``).
+
+Examples
+--------
+
+Normalize the headers of a table
+
+.. code-block:: python
+
+    df = normalize_frame(df)
+
+Normalize headers
+
+.. code-block:: python
+
+    normalize_columns(pd.Index(["Temp (°C)", "Depth -2.5", "Average", "temp C"]))
+    # Output: Index(['temp_c', 'depth_s2p5', 'average', 'temp_c_1'], dtype='object')
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import functools
+import re
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import DOMAIN_SEPARATOR
+from flare.numflare import REPLACERS, encode_number, encode_numbers
+from flare.vocabulary import get_vocabulary
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# characters without an ASCII decomposition
+TRANSLITERATIONS = str.maketrans(
+    {
+        "ß": "ss",
+        "æ": "ae",
+        "Æ": "AE",
+        "œ": "oe",
+        "Œ": "OE",
+        "ø": "o",
+        "Ø": "O",
+        "ł": "l",
+        "Ł": "L",
+        "đ": "d",
+        "Đ": "D",
+        "þ": "th",
+        "Þ": "TH",
+        "µ": "u",
+        "μ": "u",
+        "%": " percent ",
+        "&": " and ",
+        "#": " number ",
+    }
+)
+
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# kinds of vocabulary matches substituted by default (aliases are often ambiguous)
+MATCHES = ("name", "title")
+# boundaries of camel case words
+CAMEL_PATTERN = re.compile("(?<=[a-z][a-z0-9])(?=[A-Z])|(?<=[A-Z0-9])(?=[A-Z][a-z])")
+# numbers with a fraction or a minus sign (hyphens after words are separators)
+NUMBER_PATTERN = re.compile(
+    "(?:(?<![A-Za-z0-9.,-])(?P<sign>-))?"
+    "(?<![A-Za-z0-9.,])(?P<integer>[0-9]+)(?:[.,](?P<fraction>[0-9]+))?"
+    "(?![0-9])"
+)
+# anything but ASCII letters and digits
+SEPARATOR_PATTERN = re.compile("[^A-Za-z0-9]+")
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def normalize_columns(columns, standard_names=True, matches=MATCHES, cutoff=None):
+    """
+    Normalizes headers into unique field labels.
+
+    :param columns: The headers.
+    :type columns: :class:`pandas.Index` or list
+    :param standard_names: If True, substitute headers by standard names. Default value = True
+    :type standard_names: bool
+    :param matches: The kinds of vocabulary matches to substitute (see ``vocabulary.MATCHES``). Default value = ``("name", "title")``
+    :type matches: tuple
+    :param cutoff: The smallest similarity of fuzzy substitutions, or None to substitute exact matches only. Default value = None
+    :type cutoff: float
+    :return: The field labels, in the order of the headers.
+    :rtype: :class:`pandas.Index`
+
+    **Examples**
+
+    >>> normalize_columns(["Temp (°C)", "Depth -2.5", "Standard Deviation", "temp C"]).tolist()
+    ['temp_c', 'depth_s2p5', 'sd', 'temp_c_1']
+
+    >>> normalize_columns(["maxTemp", "Précip. [µm]", "", "Área 2"]).tolist()
+    ['max_temp', 'precip_um', 'x', 'area_2']
+
+    >>> normalize_columns([1, 2.5, None]).tolist()
+    ['1p0', '2p5', 'x']
+
+    """
+    columns = pd.Index(columns)
+    # missing headers have no text (not "nan"), so they get the null replacer
+    columns = columns.where(columns.notna(), "").astype(str)
+    codes, uniques = pd.factorize(columns)
+    if codes.size == 0:
+        return pd.Index([], dtype=object)
+    # normalize distinct headers only (repeated headers are frequent in wide tables)
+    headers = pd.Series(uniques, dtype=object)
+
+    # --------------- standard names ---------------
+    if standard_names:
+        df = get_vocabulary().resolve_many(
+            headers, fuzzy=cutoff is not None, cutoff=cutoff or 1.0
+        )
+        is_standard = df["match"].isin(list(matches) + (["fuzzy"] if cutoff else []))
+        headers = headers.where(~is_standard.to_numpy(), df["name"])
+
+    # --------------- ASCII ---------------
+    labels = headers.str.translate(TRANSLITERATIONS)
+    if not labels.map(str.isascii).all():
+        labels = labels.str.normalize("NFKD").str.encode("ascii", "ignore")
+        labels = labels.str.decode("ascii")
+
+    # --------------- words and numbers ---------------
+    labels = labels.str.replace(CAMEL_PATTERN, DOMAIN_SEPARATOR, regex=True)
+    labels = labels.str.replace(NUMBER_PATTERN, _encode_match, regex=True)
+    labels = labels.str.replace(SEPARATOR_PATTERN, DOMAIN_SEPARATOR, regex=True)
+    labels = labels.str.strip(DOMAIN_SEPARATOR).str.lower()
+    labels = labels.where(labels != "", REPLACERS["null"])
+
+    labels = pd.Series(labels.to_numpy(dtype=object)[codes], dtype=object)
+    return pd.Index(_resolve_collisions(labels).to_numpy(dtype=object), dtype=object)
+
+
+def normalize_frame(df, **kwargs):
+    """
+    Normalizes the headers of a table into unique field labels (see ``normalize_columns``).
+
+    :param df: The table.
+    :type df: :class:`pandas.DataFrame`
+    :param kwargs: The options of ``normalize_columns``.
+    :return: A table with the normalized headers (the data is not copied).
+    :rtype: :class:`pandas.DataFrame`
+
+    **Examples**
+
+    >>> df = pd.DataFrame({"Temp (°C)": [20.5], "Flow-Rate": [1.2], "Sample Size": [10]})
+    >>> normalize_frame(df).columns.tolist()
+    ['temp_c', 'flow_rate', 'size']
+
+    """
+    return df.set_axis(normalize_columns(df.columns, **kwargs), axis=1)
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _encode_match(match):
+    # encode a matched number (positive numbers are unsigned)
+    return _encode_number(*match.group("sign", "integer", "fraction"))
+
+
+@functools.lru_cache(maxsize=4_096)
+def _encode_number(sign, integer, fraction):
+    # cached encodings of numbers, plain integers are kept as they are
+    if not sign and fraction is None:
+        return integer
+    number = float(f"{sign or ''}{integer}.{fraction or 0}")
+    decimals = len(fraction or "")
+    encoded = encode_number(number, decimals=decimals, len_min=len(integer))
+    return encoded if sign and number < 0 else encoded[1:]
+
+
+def _resolve_collisions(labels):
+    # append zero-filled counters to repeated labels, skipping counters of labels
+    # already taken (labels without counters keep their names)
+    labels = labels.reset_index(drop=True)
+    counters = np.array(labels.groupby(labels).cumcount())
+    while True:
+        has_counter = counters > 0
+        width = len(str(counters.max()))
+        # the sign flag of counters is dropped (unsigned numbers)
+        suffixes = pd.Series(encode_numbers(counters, len_min=width)).str[1:]
+        candidates = labels.where(~has_counter, labels + DOMAIN_SEPARATOR + suffixes)
+        # repeated candidates, with labels without counters first
+        order = np.argsort(has_counter, kind="stable")
+        is_repeated = np.empty(labels.size, dtype=bool)
+        is_repeated[order] = candidates.iloc[order].duplicated().to_numpy()
+        if not is_repeated.any():
+            return candidates
+        counters[is_repeated] += 1
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    print(normalize_columns(["Temp (°C)", "Depth -2.5", "Average", "temp C"]))
+    # ... {develop}
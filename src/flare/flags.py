@@ -0,0 +1,295 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Registry of the Flare literal flags, loaded once from the catalog shipped with the
+package (``flare/data/flags.csv``).
+
+Features
+--------
+ - Load the catalog of flags lazily, once per process
+ - Get the flags of each domain (separators, replacers, numbers, datetimes, versions)
+ - Lookup tables of ASCII code points for character classes, signs and magnitudes
+ - Classify matrices of code points in bulk with a single indexing
+
+Overview
+--------
+
+The catalog is the single source of truth of flags: the codecs (``numflare``,
+``timeflare``, ``extents``, ``versions`` and ``labels``) build their constants and
+grammars from :func:`get_registry` instead of literal dictionaries. Besides the
+columns of the documentation (``flag``, ``domain``, ``subdomain`` and ``abstract``),
+the catalog has a ``key`` naming each flag within its domain (e.g. ``latitude`` for
+``n`` and ``s``) and a numeric ``value`` (the factor of signs and magnitudes).
+
+The registry precomputes tables of ``129`` entries: one per ASCII code point and a
+last one for any other character, so a matrix of code points is classified with
+``table[np.minimum(codes, 128)]`` (see :func:`lookup`). Flags are case-insensitive:
+upper and lower cases have the same entries.
+
+.. list-table::
+   :header-rows: 1
+
+   * - Table
+     - Entries
+   * - ``classes``
+     - Index of the character class in ``CLASSES`` (``0`` for other characters)
+   * - ``sign_factors``
+     - ``-1`` for negative signs, ``1`` for positive signs and ``0`` otherwise
+   * - ``magnitude_factors``
+     - The factor of magnitude suffixes and ``0`` otherwise
+
+Examples
+--------
+
+Get the flags of numbers
+
+.. code-block:: python
+
+    registry = get_registry()
+    print(registry.signs["latitude"])
+    # Output: {'positive': 'n', 'negative': 's'}
+    print(registry.magnitudes["k"])
+    # Output: 1000
+
+Find sign flags in a matrix of code points
+
+.. code-block:: python
+
+    codes = np.array(["s030", "W051"]).view(np.uint32).reshape(2, -1)
+    factors = lookup(registry.sign_factors, codes[:, 0])
+    # Output: [-1 -1]
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import csv
+import functools
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+# import {module}
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# catalog of flags shipped with the package
+FLAGS_FILE = Path(__file__).parent / "data" / "flags.csv"
+
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SEPARATOR = ";"
+COLUMNS = ("flag", "domain", "subdomain", "key", "value", "abstract")
+# null entries of the catalog
+NULL = "x"
+# character classes of the lookup tables
+CLASSES = ("other", "digit", "latitude", "longitude", "decimal", "magnitude")
+# entries of lookup tables: ASCII code points and any other character
+TABLE_SIZE = 129
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+@functools.cache
+def get_registry():
+    """
+    Gets the registry of flags, loading the catalog on the first call only.
+
+    :return: The shared registry.
+    :rtype: :class:`FlagRegistry`
+
+    **Examples**
+
+    >>> get_registry() is get_registry()
+    True
+
+    >>> get_registry().decimal
+    'p'
+
+    """
+    return FlagRegistry(FLAGS_FILE)
+
+
+def lookup(table, codes):
+    """
+    Looks up code points in a table of the registry (non-ASCII code points get the last entry).
+
+    :param table: A lookup table of ``TABLE_SIZE`` entries.
+    :type table: :class:`numpy.ndarray`
+    :param codes: The code points, of any shape.
+    :type codes: :class:`numpy.ndarray`
+    :return: The entries of the code points, with the shape of ``codes``.
+    :rtype: :class:`numpy.ndarray`
+
+    **Examples**
+
+    >>> codes = np.array([ord(c) for c in "n1K"])
+    >>> lookup(get_registry().magnitude_factors, codes).tolist()
+    [0, 0, 1000]
+
+    """
+    return table[np.minimum(codes, TABLE_SIZE - 1)]
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _read_catalog(file_path):
+    # read the records of a catalog of flags
+    with open(file_path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f, delimiter=SEPARATOR)
+        ls_missing = [c for c in COLUMNS if c not in (reader.fieldnames or [])]
+        if ls_missing:
+            raise ValueError(f"missing columns in the catalog of flags: {ls_missing}")
+        return [{c: row[c].strip() for c in COLUMNS} for row in reader]
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class FlagRegistry:
+    """
+    The catalog of flags with precomputed lookup tables. Use :func:`get_registry`
+    to share a single registry.
+    """
+
+    def __init__(self, file_path=FLAGS_FILE):
+        """
+        Load a catalog of flags.
+
+        :param file_path: The ``;``-separated catalog. Default value = ``FLAGS_FILE``
+        :type file_path: str or :class:`pathlib.Path`
+        """
+        self.file_path = Path(file_path)
+        self.records = _read_catalog(self.file_path)
+
+        # flags of each domain
+        self.separators = self._keys("Separator")
+        self.replacers = self._keys("Replacer")
+        self.decimal = self._keys("Number", "Fraction")["decimal"]
+        dc_signs = {}
+        for record in self.select("Number", "Sign"):
+            dc_signs[(record["key"], int(record["value"]))] = record["flag"]
+        self.signs = {
+            axis: {"positive": dc_signs[(axis, 1)], "negative": dc_signs[(axis, -1)]}
+            for axis in ("latitude", "longitude")
+        }
+        self.magnitudes = {
+            record["flag"]: int(record["value"])
+            for record in self.select("Number", "Magnitude")
+        }
+        self.datetime_flags = self._keys("Datetime")
+        self.version = self._keys("Version")["version"]
+
+        # lookup tables of code points (case-insensitive)
+        self.classes = np.zeros(TABLE_SIZE, dtype=np.uint8)
+        self.classes[ord("0") : ord("9") + 1] = CLASSES.index("digit")
+        self.sign_factors = np.zeros(TABLE_SIZE, dtype=np.int8)
+        self.magnitude_factors = np.zeros(TABLE_SIZE, dtype=np.int64)
+        for axis, dc_axis in self.signs.items():
+            for sign, flag in dc_axis.items():
+                self._set(self.classes, flag, CLASSES.index(axis))
+                self._set(self.sign_factors, flag, -1 if sign == "negative" else 1)
+        self._set(self.classes, self.decimal, CLASSES.index("decimal"))
+        for flag, factor in self.magnitudes.items():
+            self._set(self.classes, flag, CLASSES.index("magnitude"))
+            self._set(self.magnitude_factors, flag, factor)
+        for table in (self.classes, self.sign_factors, self.magnitude_factors):
+            table.flags.writeable = False
+
+    def select(self, domain, subdomain=None):
+        """
+        Select the records of a domain, in the order of the catalog.
+
+        :param domain: The domain (e.g. ``Number``).
+        :type domain: str
+        :param subdomain: The subdomain (e.g. ``Sign``), or None for all subdomains. Default value = None
+        :type subdomain: str
+        :return: The records, as dictionaries of the catalog columns.
+        :rtype: list
+        """
+        return [
+            record
+            for record in self.records
+            if record["domain"] == domain
+            and (subdomain is None or record["subdomain"] == subdomain)
+        ]
+
+    def _keys(self, domain, subdomain=None):
+        # flags of a domain by key
+        return {
+            record["key"]: record["flag"]
+            for record in self.select(domain, subdomain)
+            if record["key"] != NULL
+        }
+
+    @staticmethod
+    def _set(table, flag, entry):
+        # set the entries of both cases of a single-character flag
+        for char in {flag.lower(), flag.upper()}:
+            table[ord(char)] = entry
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return f"FlagRegistry({str(self.file_path)!r}, {len(self)} flags)"
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    registry = get_registry()
+    print(registry)
+    print(registry.signs, registry.magnitudes)
+    # ... {develop}
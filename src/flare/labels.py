@@ -0,0 +1,587 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Parser of file labels in the Flare labeling schemes, splitting filenames into
+domains and decoding typed domains (versions, extents, timestamps and epochs).
+
+Features
+--------
+ - Parse filenames in the ``generic``, ``reference`` and ``dataset`` schemes
+ - Detect the scheme from the number of domains
+ - Grammars compiled once per scheme
+ - Decode versions, extents, years, timestamps and epochs into typed fields
+ - Recognize replacers (``x``, ``z``, ``na``, ``o``) in any domain
+ - Parse many filenames at once into a :class:`pandas.DataFrame`
+
+Overview
+--------
+
+The schemes are defined in the Flare documentation on **Files**:
+
+.. code-block:: none
+
+    generic    {type}_{project}_{item}_{version}_{suffix}
+    reference  {author}_{year}_{item}
+    dataset    {source}_{collection}_{item}_{specs}_{extent}_{datetime}
+
+Domains are separated by ``_`` and the file extension (if any) follows the first
+``.`` of the last domain. Parsed labels are flat records with the scheme, the domain
+texts (replacers become ``None``), the extension and the typed fields:
+
+.. list-table::
+   :header-rows: 1
+
+   * - Domain
+     - Typed fields
+   * - ``version``
+     - ``version_major``, ``version_minor``, ``version_patch`` (semantic and compact versions)
+       or ``version_timestamp`` (timestamp versions)
+   * - ``year``
+     - ``year`` as an integer
+   * - ``extent``
+     - ``extent_ymin``, ``extent_xmin``, ``extent_ymax``, ``extent_xmax`` from signed numbers
+       (``n/s`` for latitudes and ``e/w`` for longitudes, as in ``S030W051``)
+   * - ``datetime``
+     - ``datetime_start`` and ``datetime_stop`` (timestamps only have a start)
+
+Timestamps are naive UTC, as in ``timeflare.decode_timestamps``. Extents that are not
+made of signed numbers (e.g. region names) are kept as text, with missing bounds.
+
+Examples
+--------
+
+Parse a label
+
+.. code-block:: python
+
+    record = parse("COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.tif")
+    print(record["scheme"], record["extent_ymin"], record["datetime_start"])
+    # Output: dataset -30.0 2011-10-08 18:23:25
+
+Parse many labels
+
+.. code-block:: python
+
+    df = parse_many(["REPORT_A002_F005_V002_X.pdf", "Smith_2021_a.bib"])
+    print(df[["scheme", "item", "version_patch", "year"]])
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import itertools
+import os
+import re
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.flags import get_registry
+from flare.numflare import REPLACERS
+from flare.extents import decode_extent, decode_extents
+from flare.versions import decode_version
+from flare.timeflare import EPOCH_FLAG, HUMAN_SEPARATOR
+from flare.timeflare import decode_timestamp, decode_timestamps, decode_epochs
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# separators (see flags.get_registry)
+DOMAIN_SEPARATOR = get_registry().separators["domain"]
+SUBDOMAIN_SEPARATOR = get_registry().separators["subdomain"]
+EXTENSION_SEPARATOR = "."
+
+# domains of each labeling scheme
+SCHEMES = {
+    "generic": ["type", "project", "item", "version", "suffix"],
+    "reference": ["author", "year", "item"],
+    "dataset": ["source", "collection", "item", "specs", "extent", "datetime"],
+}
+
+# typed fields of typed domains
+TYPED_FIELDS = {
+    "version": ["version_major", "version_minor", "version_patch", "version_timestamp"],
+    "extent": ["extent_ymin", "extent_xmin", "extent_ymax", "extent_xmax"],
+    "datetime": ["datetime_start", "datetime_stop"],
+}
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# grammar of the text of domains (any text without separators, dots or spaces)
+DOMAIN_PATTERNS = {
+    "version": r"[^_\s]+",
+    "year": r"[0-9]{4}",
+}
+DOMAIN_PATTERN = r"[^_.\s]+"
+EXTENSION_PATTERN = r"[^._\s]+(?:\.[^._\s]+)*"
+
+# grammars compiled once per scheme
+GRAMMARS = {
+    scheme: re.compile(
+        re.escape(DOMAIN_SEPARATOR).join(
+            f"(?P<{domain}>{DOMAIN_PATTERNS.get(domain, DOMAIN_PATTERN)})"
+            for domain in ls_domains
+        )
+        + f"(?:{re.escape(EXTENSION_SEPARATOR)}(?P<extension>{EXTENSION_PATTERN}))?"
+    )
+    for scheme, ls_domains in SCHEMES.items()
+}
+# scheme by number of domains
+SCHEME_SIZES = {len(ls_domains): scheme for scheme, ls_domains in SCHEMES.items()}
+
+# replacers (case-insensitive)
+REPLACER_FLAGS = set(r.lower() for r in REPLACERS.values())
+REPLACER_CASES = sorted(
+    "".join(chars)
+    for flag in REPLACER_FLAGS
+    for chars in itertools.product(*[(c.lower(), c.upper()) for c in flag])
+)
+
+# code points of whitespace matched by '\s' in ASCII
+WHITESPACE_CODES = [9, 10, 11, 12, 13, 28, 29, 30, 31, 32]
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def parse(filename, scheme=None):
+    """
+    Parses a filename into its scheme, domains and typed fields.
+
+    :param filename: The filename or path. Directories are ignored.
+    :type filename: str or :class:`pathlib.Path`
+    :param scheme: The labeling scheme (see ``SCHEMES``). If None, it is detected from the number of domains.
+    :type scheme: str or None
+    :return: The parsed record.
+    :rtype: dict
+
+    **Examples**
+
+    >>> record = parse("REPORT_A002_F005_V002_X.pdf")
+    >>> record["scheme"], record["type"], record["suffix"], record["extension"]
+    ('generic', 'REPORT', None, 'pdf')
+
+    >>> record["version_major"], record["version_minor"], record["version_patch"]
+    (0, 0, 2)
+
+    >>> record = parse("INMET_AUTO_A001_T0-M_0_2000U2020.txt")
+    >>> record["specs"], record["datetime_start"], record["datetime_stop"]
+    ('T0-M', Timestamp('2000-01-01 00:00:00'), Timestamp('2020-01-01 00:00:00'))
+
+    """
+    name = os.path.basename(os.fspath(filename))
+    if scheme is None:
+        scheme = get_scheme(name)
+    elif scheme not in SCHEMES:
+        raise ValueError(f"scheme must be one of {list(SCHEMES)}: {scheme!r}")
+    match = GRAMMARS[scheme].fullmatch(name)
+    if match is None:
+        raise ValueError(f"invalid {scheme} label: {name!r}")
+
+    record = {"scheme": scheme}
+    for domain, text in match.groupdict().items():
+        if domain != "extension" and text.lower() in REPLACER_FLAGS:
+            text = None
+        record[domain] = text
+
+    # --------------- typed fields ---------------
+    for domain in SCHEMES[scheme]:
+        text = record[domain]
+        if domain == "year":
+            record[domain] = None if text is None else int(text)
+        elif domain == "version":
+            record.update(_version_record(text))
+        elif domain == "extent":
+            record.update(_extent_record(text))
+        elif domain == "datetime":
+            record.update(_datetime_record(text))
+    return record
+
+
+def parse_many(filenames, scheme=None, errors="raise", typed=True):
+    """
+    Parses many filenames at once, following the same rules of ``parse``.
+
+    Domains are split on matrices of code points and typed domains are decoded once per
+    unique text, so a million filenames are parsed in a few seconds.
+
+    :param filenames: The filenames or paths.
+    :type filenames: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param scheme: The labeling scheme (see ``SCHEMES``). If None, it is detected per filename.
+    :type scheme: str or None
+    :param errors: If ``raise``, invalid labels raise errors; if ``coerce``, they are left with missing fields.
+    :type errors: str
+    :param typed: If True, decode typed domains into typed fields; if False, only split domains. Default value = True
+    :type typed: bool
+    :return: The parsed records, one row per filename (with the same index for a Series input). Columns only depend on the scheme and ``typed``.
+    :rtype: :class:`pandas.DataFrame`
+
+    **Examples**
+
+    >>> df = parse_many(["Smith_2021_a.pdf", "NOAA_2005_b.pdf", "bad"], errors="coerce")
+    >>> df["author"].tolist()[:2], df["year"].tolist()
+    (['Smith', 'NOAA'], [2021, 2005, <NA>])
+
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': {errors!r}")
+    if scheme is not None and scheme not in SCHEMES:
+        raise ValueError(f"scheme must be one of {list(SCHEMES)}: {scheme!r}")
+    names = _to_names(filenames)
+    size = names.size
+    index = filenames.index if isinstance(filenames, pd.Series) else None
+
+    # --------------- detect schemes ---------------
+    n_domains = _count_codes(names, DOMAIN_SEPARATOR) + 1
+    # columns of all schemes are kept, so outputs have the same columns
+    ls_schemes = list(SCHEMES) if scheme is None else [scheme]
+    schemes = np.full(size, None, dtype=object)
+    is_parsed = np.zeros(size, dtype=bool)
+
+    # --------------- split domains ---------------
+    dc_parts = {}
+    for s in ls_schemes:
+        rows = np.flatnonzero(n_domains == len(SCHEMES[s]))
+        dc_split, is_valid = _split_labels(names[rows], s)
+        rows_valid = rows[is_valid]
+        schemes[rows_valid] = s
+        is_parsed[rows_valid] = True
+        for domain, (texts, is_present) in dc_split.items():
+            dc_parts.setdefault(domain, []).append(
+                (rows_valid, texts[is_valid], is_present[is_valid])
+            )
+    if not is_parsed.all():
+        bad = names[~is_parsed][0]
+        if errors == "raise":
+            # same error as the scalar parser
+            parse(bad, scheme=scheme)
+            raise ValueError(f"invalid label: {bad!r}")
+
+    # --------------- typed fields ---------------
+    df = pd.DataFrame({"scheme": schemes}, index=index)
+    ls_domains = list(dict.fromkeys(d for s in ls_schemes for d in SCHEMES[s]))
+    for domain in ls_domains + ["extension"]:
+        ls_parts = dc_parts.get(domain, [])
+        dtype = np.result_type("<U1", *[texts.dtype for _, texts, _ in ls_parts])
+        column = np.full(size, "" if dtype.kind == "U" else None, dtype=dtype)
+        is_present = np.zeros(size, dtype=bool)
+        for rows, texts, present in ls_parts:
+            column[rows] = texts
+            is_present[rows] = present
+        if domain != "extension":
+            is_present &= ~_is_replacer(column)
+        df[domain] = pd.Series(column, index=index).where(is_present)
+    if not typed:
+        return df
+    for domain in ls_domains:
+        if domain == "year":
+            df[domain] = pd.to_numeric(df[domain]).astype("Int64")
+        elif domain == "version":
+            fields = _map_unique(df[domain], _version_record, errors)
+            for field in TYPED_FIELDS[domain]:
+                df[field] = fields[field]
+        elif domain == "extent":
+            bounds = decode_extents(df[domain].to_numpy(dtype=object))
+            for field, values in zip(TYPED_FIELDS[domain], bounds):
+                df[field] = values
+        elif domain == "datetime":
+            starts, stops = _decode_datetimes(df[domain], errors)
+            df["datetime_start"] = starts
+            df["datetime_stop"] = stops
+    return df
+
+
+def get_scheme(filename):
+    """
+    Gets the labeling scheme of a filename from its number of domains.
+
+    :param filename: The filename or path. Directories are ignored.
+    :type filename: str or :class:`pathlib.Path`
+    :return: The scheme name (see ``SCHEMES``).
+    :rtype: str
+
+    **Examples**
+
+    >>> get_scheme("Smith_2021_a.pdf")
+    'reference'
+
+    """
+    name = os.path.basename(os.fspath(filename))
+    n_domains = name.count(DOMAIN_SEPARATOR) + 1
+    if n_domains not in SCHEME_SIZES:
+        raise ValueError(f"unknown labeling scheme with {n_domains} domains: {name!r}")
+    return SCHEME_SIZES[n_domains]
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _version_record(text):
+    # typed fields of a version domain
+    record = dict.fromkeys(TYPED_FIELDS["version"])
+    if text is None:
+        return record
+    version = decode_version(text)
+    if isinstance(version, tuple):
+        record["version_major"], record["version_minor"], record["version_patch"] = (
+            version
+        )
+    else:
+        record["version_timestamp"] = _to_naive(version)
+    return record
+
+
+def _extent_record(text):
+    # typed fields of an extent domain (texts that are not numbers have no bounds)
+    record = dict.fromkeys(TYPED_FIELDS["extent"], float("nan"))
+    if text is None:
+        return record
+    try:
+        bounds = decode_extent(text)
+    except ValueError:
+        return record
+    return dict(zip(TYPED_FIELDS["extent"], bounds))
+
+
+def _datetime_record(text):
+    # typed fields of a datetime domain (timestamp or epoch)
+    record = {"datetime_start": pd.NaT, "datetime_stop": pd.NaT}
+    if text is None:
+        return record
+    parts = text.lower().split(EPOCH_FLAG)
+    if len(parts) > 2:
+        raise ValueError(f"invalid epoch: {text!r}")
+    record["datetime_start"] = _to_naive(decode_timestamp(parts[0]))
+    if len(parts) == 2:
+        record["datetime_stop"] = _to_naive(decode_timestamp(parts[1]))
+    return record
+
+
+def _to_naive(ts):
+    # naive UTC timestamp in nanoseconds (out of bounds raise a ValueError)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.as_unit("ns")
+
+
+def _to_names(filenames):
+    # get a unicode array of basenames
+    if isinstance(filenames, pd.Series):
+        filenames = filenames.to_numpy(dtype=object)
+    names = np.asarray(filenames)
+    if names.dtype.kind == "O":
+        names = np.array([os.fspath(f) for f in names.ravel()])
+    names = names.astype(str).ravel()
+    if names.size and (
+        np.char.find(names, "/").max() >= 0 or np.char.find(names, "\\").max() >= 0
+    ):
+        names = np.array([os.path.basename(f) for f in names.tolist()])
+    if names.dtype.itemsize == 0:
+        names = names.astype("<U1")
+    return names
+
+
+def _count_codes(names, char):
+    # count a character in each string
+    if names.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    codes = names.view(np.uint32).reshape(names.size, -1)
+    return (codes == ord(char)).sum(axis=1)
+
+
+def _is_replacer(column):
+    # mask of replacer texts in any letter case
+    if column.dtype.kind != "U":
+        column = np.array(
+            [t if isinstance(t, str) and len(t) <= 2 else "" for t in column]
+        )
+    return np.isin(column, REPLACER_CASES)
+
+
+def _split_labels(names, scheme):
+    # split labels of a scheme on a matrix of code points
+    ls_domains = SCHEMES[scheme]
+    size = names.size
+    width = max(names.dtype.itemsize // 4, 1)
+    codes = names.view(np.uint32).reshape(size, width)
+    lengths = np.char.str_len(names)
+    rows = np.arange(size)
+
+    # --------------- find domains ---------------
+    n_sep = len(ls_domains) - 1
+    sep_positions = np.nonzero(codes == ord(DOMAIN_SEPARATOR))[1].reshape(size, n_sep)
+    starts = [np.zeros(size, dtype=np.int64)] + list(sep_positions.T + 1)
+    stops = list(sep_positions.T) + [lengths]
+    # running counts of dots and non-digits, to count them in any range
+    is_dot = codes == ord(EXTENSION_SEPARATOR)
+    dots = _running_count(is_dot)
+    # extension after the first dot of the last domain
+    last_dots = dots[rows, lengths] - dots[rows, starts[-1]]
+    has_extension = last_dots > 0
+    is_ext_dot = is_dot & (np.arange(width) >= starts[-1][:, None])
+    ext_starts = np.where(has_extension, is_ext_dot.argmax(axis=1) + 1, lengths)
+    stops[-1] = np.where(has_extension, ext_starts - 1, lengths)
+
+    # --------------- check grammar ---------------
+    # anything unusual (non-ASCII) is left to the scalar grammar
+    is_valid = ~(codes > 127).any(axis=1)
+    is_valid &= ~np.isin(codes, WHITESPACE_CODES).any(axis=1)
+    dc_split = {}
+    for domain, start, stop in zip(ls_domains, starts, stops):
+        is_valid &= stop > start
+        if domain != "version":
+            is_valid &= dots[rows, stop] == dots[rows, start]
+        if domain == "year":
+            is_digit = (codes >= ord("0")) & (codes <= ord("9"))
+            digits = _running_count(is_digit)
+            is_valid &= (stop - start == 4) & (
+                digits[rows, stop] - digits[rows, start] == 4
+            )
+        dc_split[domain] = [_gather(codes, start, stop), np.ones(size, dtype=bool)]
+    # extension parts are not empty
+    is_double_dot = is_dot[:, 1:] & is_dot[:, :-1]
+    is_valid &= ~(has_extension & is_double_dot.any(axis=1))
+    is_valid &= codes[rows, np.maximum(lengths - 1, 0)] != ord(EXTENSION_SEPARATOR)
+    dc_split["extension"] = [_gather(codes, ext_starts, lengths), has_extension]
+
+    # --------------- fall back to the grammar ---------------
+    rows_invalid = np.flatnonzero(~is_valid)
+    if rows_invalid.size:
+        for parts in dc_split.values():
+            parts[0] = parts[0].astype(object)
+    for i in rows_invalid:
+        match = GRAMMARS[scheme].fullmatch(str(names[i]))
+        if match is not None:
+            for domain, text in match.groupdict().items():
+                dc_split[domain][0][i] = text
+                dc_split[domain][1][i] = text is not None
+            is_valid[i] = True
+    return dc_split, is_valid
+
+
+def _running_count(mask):
+    # counts of True before each column (with a leading zero column)
+    counts = np.zeros((mask.shape[0], mask.shape[1] + 1), dtype=np.int32)
+    np.cumsum(mask, axis=1, out=counts[:, 1:])
+    return counts
+
+
+def _gather(codes, starts, stops):
+    # gather substrings [start, stop) of each row into a fixed-width array
+    size = codes.shape[0]
+    n = max(int((stops - starts).max(initial=0)), 1)
+    index = starts[:, None] + np.arange(n)
+    taken = np.take_along_axis(codes, np.minimum(index, codes.shape[1] - 1), axis=1)
+    taken = np.where(index < stops[:, None], taken, 0).astype(np.uint32)
+    return taken.view(f"<U{n}").reshape(size)
+
+
+def _map_unique(column, func, errors):
+    # apply a record function once per unique text and spread the fields
+    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+    ls_records = []
+    for text in uniques:
+        try:
+            ls_records.append(func(text))
+        except ValueError:
+            if errors == "raise":
+                raise
+            ls_records.append(func(None))
+    df = pd.DataFrame(ls_records + [func(None)], columns=list(func(None)))
+    df = df.iloc[codes].reset_index(drop=True)
+    df.index = column.index
+    for field in df.columns:
+        if field == "version_timestamp":
+            df[field] = df[field].astype("datetime64[ns]")
+        elif field.startswith("version_"):
+            df[field] = df[field].astype("Int64")
+    return df
+
+
+def _decode_datetimes(column, errors):
+    # decode timestamps and epochs in bulk into starts and stops
+    size = len(column)
+    starts = np.full(size, np.datetime64("NaT"), dtype="datetime64[ns]")
+    stops = np.full(size, np.datetime64("NaT"), dtype="datetime64[ns]")
+    is_text = column.notna().to_numpy()
+    if not is_text.any():
+        return starts, stops
+    texts = column.to_numpy(dtype=object)
+    lower = np.char.lower(texts[is_text].astype(str))
+    is_epoch = np.char.count(lower, EPOCH_FLAG) > 0
+    rows = np.flatnonzero(is_text)
+    try:
+        if is_epoch.any():
+            rows_epoch = rows[is_epoch]
+            starts[rows_epoch], stops[rows_epoch] = decode_epochs(lower[is_epoch])
+        if not is_epoch.all():
+            starts[rows[~is_epoch]] = decode_timestamps(lower[~is_epoch])
+    except ValueError:
+        if errors == "raise":
+            raise
+        # decode one by one, leaving invalid texts missing
+        for i in rows:
+            try:
+                record = _datetime_record(texts[i])
+            except ValueError:
+                continue
+            starts[i] = record["datetime_start"].to_datetime64()
+            stops[i] = record["datetime_stop"].to_datetime64()
+    return starts, stops
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    print(parse("COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.tif"))
+    # ... {develop}
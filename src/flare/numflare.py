@@ -13,6 +13,13 @@ Features
  - Decode previously encoded numbers back into floats
  - Handle latitude/longitude sign flags (`n`, `s`, `e`, `w`)
  - Optional magnitude suffixes (`d`, `c`, `k`, `m`, `b`)
+ - Encode and decode whole arrays (NumPy or pandas) in bulk
+ - Make encoders and decoders specialized for a fixed set of parameters
+ - Memoize codecs of repetitive labels in bounded, thread-safe LRU caches
+ - Encode and decode integers of a declared range with precomputed lookup tables
+ - Emit and consume fixed-width byte arrays (``S{n}`` dtype) for files and memory maps
+ - Store encoded and decoded columns on disk and open them as memory maps
+ - Map encoded numbers to order-preserving keys for sorting without decoding
 
 Overview
 --------
@@ -53,26 +60,71 @@ Magnitude feature
     print(encoded_mag)
     # Output: 'n25k'
 
+Bulk encoding and decoding
+
+.. code-block:: python
+
+    import numpy as np
+
+    # Encode a whole column at once (NaN is encoded with the null replacer)
+    encoded = encode_numbers(np.array([-12.3, 4.5, np.nan]), decimals=1, len_min=3)
+    print(encoded)
+    # Output: ['s012p3' 'n004p5' 'x']
+
+    # Decode it back (replacers are decoded to NaN)
+    decoded = decode_numbers(encoded)
+    print(decoded)
+    # Output: [-12.3   4.5   nan]
+
+Byte labels for files and memory maps
+
+.. code-block:: python
+
+    # One byte per character and no Python objects
+    encoded = encode_numbers(np.arange(1_000_000), len_min=6, as_bytes=True)
+    encoded.tofile("labels.bin")
+    labels = np.memmap("labels.bin", dtype=encoded.dtype, mode="r")
+    decoded = decode_numbers(labels)
+
+Cached codecs for repetitive labels
+
+.. code-block:: python
+
+    # Repeated values cost a dictionary lookup
+    codec = CachedCodec(max_size=10_000)
+    decoded = [codec.decode(s) for s in ["s030", "w051", "s030"]]
+    print(codec.stats()["decode"]["hits"])
+    # Output: 1
+
 
 """
+
 # IMPORTS
 # ***********************************************************************
 # import modules from other libs
 
 # Native imports
 # =======================================================================
+import functools
+import json
 import re
+import struct
+import threading
+from pathlib import Path
 
 # ... {develop}
 
 # External imports
 # =======================================================================
-# import {module}
+import numpy as np
+import pandas as pd
+
 # ... {develop}
 
 # Project-level imports
 # =======================================================================
-# import {module}
+from flare.flags import get_registry, lookup
+
 # ... {develop}
 
 
@@ -82,30 +134,68 @@ import re
 
 # CONSTANTS -- Project-level
 # =======================================================================
-SIGN = {
-    "latitude": {
-        "positive": "n",
-        "negative": "s",
-    },
-    "longitude": {
-        "positive": "e",
-        "negative": "w",
-    },
-}
+# flags of numbers and replacers (see flags.get_registry)
+SIGN = get_registry().signs
 
-DECIMAL = "p"
+DECIMAL = get_registry().decimal
 
-MAGNITUDES = {
-    "d": 10,
-    "c": 100,
-    "k": 1000,
-    "m": 1_000_000,
-    "b": 1_000_000_000,
-}
+MAGNITUDES = get_registry().magnitudes
+
+REPLACERS = get_registry().replacers
 # ... {develop}
 
 # CONSTANTS -- Module-level
 # =======================================================================
+# largest magnitude handled by the bulk fast path (exact integers in float64)
+EXACT_LIMIT = 2**53
+# largest number of digits handled by the bulk fast path
+DECIMALS_LIMIT = 15
+# number of elements processed at once by the bulk codecs
+CHUNK_SIZE = 500_000
+POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+# default number of entries kept by cached codecs
+CACHE_SIZE = 65_536
+# largest number of entries of integer lookup tables
+TABLE_SIZE_MAX = 10_000_000
+# longest labels packed into uint64 keys (7 bits per ASCII character)
+PACK_WIDTH_MAX = 9
+# multiplier of Fibonacci hashing (2**64 / golden ratio)
+HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# replacer flags (lowercase)
+REPLACER_FLAGS = frozenset(r.lower() for r in REPLACERS.values())
+# sort keys: sign bit of float64 and key of missing values (after all numbers)
+SORT_KEY_SIGN = np.uint64(1 << 63)
+SORT_KEY_NAN = (1 << 64) - 1
+
+# on-disk label stores: magic, format version and alignment of columns (bytes)
+STORE_MAGIC = b"FLARELBL"
+STORE_VERSION = 1
+STORE_ALIGNMENT = 64
+
+# precompiled grammar of canonical numbers: {sign}{integer}[p{fraction}]{magnitude}
+NUMBER_PATTERN = re.compile(
+    "([{signs}]?)([0-9]+)(?:{decimal}([0-9]*))?([{magnitudes}]?)".format(
+        signs=re.escape("".join(f for d in SIGN.values() for f in d.values())),
+        decimal=re.escape(DECIMAL),
+        magnitudes=re.escape("".join(MAGNITUDES)),
+    ),
+    flags=re.IGNORECASE | re.ASCII,
+)
+# factors of the matched sign and magnitude flags (case-insensitive)
+SIGN_FACTORS = {
+    flag: factor
+    for table in SIGN.values()
+    for key, factor in (("positive", 1), ("negative", -1))
+    for flag in (table[key].lower(), table[key].upper())
+}
+SIGN_FACTORS[""] = 1
+MAGNITUDE_FACTORS = {
+    flag: factor
+    for key, factor in MAGNITUDES.items()
+    for flag in (key.lower(), key.upper())
+}
+MAGNITUDE_FACTORS[""] = 1
 # ... {develop}
 
 
@@ -204,10 +294,462 @@ def decode_number(encoded_number):
     :type encoded_number: str
     :return: The decoded number.
     :rtype: float
+
+    **Examples**
+
+    >>> decode_number("s0012p3")
+    -12.3
+
+    >>> decode_number("W05P0M")
+    -5000000.0
+
+    """
+    # --------------- fast path ---------------
+    # a single pass of the precompiled grammar covers canonical numbers
+    if isinstance(encoded_number, str):
+        match = NUMBER_PATTERN.fullmatch(encoded_number)
+        if match is not None:
+            sign_flag, integer_part, rational_part, magnitude_flag = match.groups()
+            if rational_part is None:
+                number = float(integer_part)
+            elif len(integer_part) <= DECIMALS_LIMIT:
+                number = float(f"{integer_part}.{rational_part}")
+            else:
+                # integer part not exact in float64
+                return _decode_number_generic(encoded_number.lower())
+            return SIGN_FACTORS[sign_flag] * number * MAGNITUDE_FACTORS[magnitude_flag]
+
+    # --------------- generic path ---------------
+    return _decode_number_generic(encoded_number.lower())
+
+
+def encode_numbers(
+    numbers,
+    decimals=0,
+    len_min=1,
+    is_latitude=True,
+    collapse_magnitude=False,
+    replacer=REPLACERS["null"],
+    as_bytes=False,
+):
+    """
+    Encodes an array of numbers in bulk, following the same rules of ``encode_number``.
+
+    Missing values (``NaN``) are encoded with the ``replacer`` flag. With ``as_bytes``,
+    labels are returned as a fixed-width byte array (``S{n}`` dtype, one byte per
+    character), ready to be written to disk or memory-mapped.
+
+    :param numbers: The numbers to encode.
+    :type numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param decimals: The number of decimal places to include. Default value = 0
+    :type decimals: int
+    :param len_min: The minimum length of the integer part, padded with leading zeros if necessary. Default value = 1
+    :type len_min: int
+    :param is_latitude: If True, the numbers are treated as latitudes; otherwise, as longitudes. Default value = True
+    :type is_latitude: bool
+    :param collapse_magnitude: If True, collapse the numbers into a magnitude suffix (d, c, k, m, b)
+    :type collapse_magnitude: bool
+    :param replacer: The flag used for missing values. Default value = ``x``
+    :type replacer: str
+    :param as_bytes: If True, return a fixed-width byte array. Default value = False
+    :type as_bytes: bool
+    :return: The encoded number strings. A Series with the same index is returned for a Series input (unless ``as_bytes``).
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+
+    **Examples**
+
+    >>> encode_numbers([-12.3, 4.5, float("nan")], decimals=1, len_min=3).tolist()
+    ['s012p3', 'n004p5', 'x']
+
+    >>> encode_numbers([-12.3, 4.5], decimals=1, len_min=3, as_bytes=True)
+    array([b's012p3', b'n004p5'], dtype='|S6')
+
+    """
+    values = _to_float_array(numbers)
+    encoded = _encode_array(
+        values=values,
+        decimals=decimals,
+        len_min=len_min,
+        is_latitude=is_latitude,
+        collapse_magnitude=collapse_magnitude,
+        replacer=replacer,
+    )
+    if as_bytes:
+        return _to_bytes_array(encoded)
+    return _wrap_like(encoded, numbers)
+
+
+def decode_numbers(encoded_numbers):
+    """
+    Decodes an array of encoded number strings in bulk, following the same rules of ``decode_number``.
+
+    Replacer flags (``x``, ``z``, ``na``, ``o``) and missing values are decoded to ``NaN``.
+    Fixed-width byte arrays (``S{n}`` dtype, e.g. memory-mapped) are decoded without
+    making Python objects.
+
+    :param encoded_numbers: The encoded number strings.
+    :type encoded_numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :return: The decoded numbers. A Series with the same index is returned for a Series input.
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+
+    **Examples**
+
+    >>> decode_numbers(["s012p3", "N004P5", "x", "w05p0m"]).tolist()
+    [-12.3, 4.5, nan, -5000000.0]
+
+    >>> import numpy as np
+    >>> decode_numbers(np.array([b"s012p3", b"x"])).tolist()
+    [-12.3, nan]
+
+    """
+    labels = _to_str_array(encoded_numbers)
+    decoded = _decode_array(labels=labels)
+    return _wrap_like(decoded, encoded_numbers)
+
+
+def sort_key(encoded_number, as_bytes=False):
+    """
+    Maps an encoded number to an order-preserving key.
+
+    Keys are unsigned 64-bit integers that sort as the decoded numbers do, whatever
+    the sign flags, magnitudes and zero padding. Replacer flags and missing values
+    get the largest key (sorted last). Labels equal as numbers (e.g. ``n1`` and
+    ``n1p0``) get the same key.
+
+    :param encoded_number: The encoded number string.
+    :type encoded_number: str
+    :param as_bytes: If True, return the key as 8 big-endian bytes (sorting as the integer). Default value = False
+    :type as_bytes: bool
+    :return: The sort key.
+    :rtype: int or bytes
+
+    **Examples**
+
+    >>> sorted(["n2k", "s005", "n010", "w1p5m", "x"], key=sort_key)
+    ['w1p5m', 's005', 'n010', 'n2k', 'x']
+
+    """
+    if _is_missing(encoded_number):
+        key = SORT_KEY_NAN
+    else:
+        value = decode_number(encoded_number)
+        if value != value:
+            key = SORT_KEY_NAN
+        else:
+            # -0.0 + 0.0 is 0.0, so both zeros get the same key
+            (bits,) = struct.unpack("<Q", struct.pack("<d", value + 0.0))
+            key = bits ^ SORT_KEY_NAN if bits >> 63 else bits | (1 << 63)
+    if as_bytes:
+        return key.to_bytes(8, "big")
+    return key
+
+
+def sort_keys(encoded_numbers, as_bytes=False):
+    """
+    Maps an array of encoded numbers to order-preserving keys in bulk, as ``sort_key``.
+
+    Sorting, merging and range scans can run on the keys directly, e.g. with
+    ``numpy.argsort`` or ``numpy.searchsorted`` and bounds from ``sort_key``.
+
+    :param encoded_numbers: The encoded number strings.
+    :type encoded_numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param as_bytes: If True, return keys as 8 big-endian bytes (``S8`` dtype, whose elements drop trailing null bytes as any ``S`` array). Default value = False
+    :type as_bytes: bool
+    :return: The sort keys (``uint64`` or ``S8`` dtype). A Series with the same index is returned for a Series input (unless ``as_bytes``).
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+
+    **Examples**
+
+    >>> labels = ["n2k", "s005", "n010", "w1p5m", "x"]
+    >>> [labels[i] for i in sort_keys(labels).argsort()]
+    ['w1p5m', 's005', 'n010', 'n2k', 'x']
+
+    """
+    values = _decode_array(labels=_to_str_array(encoded_numbers))
+    keys = _float_sort_keys(values)
+    if as_bytes:
+        return keys.astype(">u8").view("S8").reshape(keys.shape)
+    return _wrap_like(keys, encoded_numbers)
+
+
+def make_encoder(
+    decimals=0,
+    len_min=1,
+    is_latitude=True,
+    collapse_magnitude=False,
+    replacer=REPLACERS["null"],
+):
+    """
+    Makes a number encoder specialized for a fixed set of parameters.
+
+    Flags, magnitude factors and format specs are resolved once, so the returned
+    function is suited for tight loops and ``pandas.Series.map``. It returns the same
+    strings as ``encode_number`` and encodes missing values (``NaN``) with the ``replacer`` flag.
+
+    :param decimals: The number of decimal places to include. Default value = 0
+    :type decimals: int
+    :param len_min: The minimum length of the integer part, padded with leading zeros if necessary. Default value = 1
+    :type len_min: int
+    :param is_latitude: If True, numbers are treated as latitudes; otherwise, as longitudes. Default value = True
+    :type is_latitude: bool
+    :param collapse_magnitude: If True, collapse numbers into a magnitude suffix (d, c, k, m, b)
+    :type collapse_magnitude: bool
+    :param replacer: The flag used for missing values. If None, missing values raise errors as in ``encode_number``. Default value = ``x``
+    :type replacer: str or None
+    :return: The encoder function, taking a number and returning the encoded string.
+    :rtype: callable
+
+    **Examples**
+
+    >>> encoder = make_encoder(decimals=1, len_min=3, is_latitude=False)
+    >>> encoder(-12.34)
+    'w012p3'
+
+    >>> import pandas as pd
+    >>> pd.Series([4.5, None]).map(encoder).tolist()
+    ['e004p5', 'x']
+
+    """
+    if is_latitude:
+        sign_table = SIGN["latitude"]
+    else:
+        sign_table = SIGN["longitude"]
+    positive_flag = sign_table["positive"].lower()
+    negative_flag = sign_table["negative"].lower()
+    decimal_flag = DECIMAL.lower()
+    # the zero padding of the format spec fills the integer part up to len_min
+    if decimals == 0:
+        number_spec = f"0{len_min}d"
+    else:
+        number_spec = f"0{len_min + 1 + decimals}.{decimals}f"
+    tp_magnitudes = tuple((factor, flag.lower()) for flag, factor in MAGNITUDES.items())
+    inf = float("inf")
+
+    def encode_other(number):
+        # missing and infinite values
+        if number != number and replacer is not None:
+            return replacer
+        return encode_number(
+            number=number,
+            decimals=decimals,
+            len_min=len_min,
+            is_latitude=is_latitude,
+            collapse_magnitude=collapse_magnitude,
+        )
+
+    def format_number(abs_number):
+        # format the absolute value
+        if decimals == 0:
+            return format(int(round(abs_number)), number_spec)
+        return format(abs_number, number_spec).replace(".", decimal_flag)
+
+    if decimals == 0 and not collapse_magnitude:
+
+        def encoder(number):
+            if not -inf < number < inf:
+                return encode_other(number)
+            sign_flag = negative_flag if number < 0 else positive_flag
+            return sign_flag + format(int(round(abs(number))), number_spec)
+
+    elif not collapse_magnitude:
+
+        def encoder(number):
+            if not -inf < number < inf:
+                return encode_other(number)
+            sign_flag = negative_flag if number < 0 else positive_flag
+            number_part = format(abs(number), number_spec)
+            return sign_flag + number_part.replace(".", decimal_flag)
+
+    else:
+
+        def encoder(number):
+            if not -inf < number < inf:
+                return encode_other(number)
+            sign_flag = negative_flag if number < 0 else positive_flag
+            abs_number = abs(number)
+            for factor, magnitude_flag in tp_magnitudes:
+                # the first factor reached wins, as in encode_number
+                if abs_number >= factor:
+                    number_part = format_number(abs_number / factor)
+                    return sign_flag + number_part + magnitude_flag
+            return sign_flag + format_number(abs_number)
+
+    return encoder
+
+
+def make_decoder(decimals=0, len_min=1, is_latitude=True, collapse_magnitude=False):
     """
-    # Convert the input to lowercase
-    encoded_number_lower = encoded_number.lower()
+    Makes a number decoder specialized for the parameters of ``make_encoder``.
+
+    Labels following the specialized layout are parsed by a dedicated precompiled
+    grammar. Any other label is handled by ``decode_number``, so results are always
+    the same. Replacer flags and missing values are decoded to ``NaN``.
+
+    :param decimals: The number of decimal places of encoded numbers. Default value = 0
+    :type decimals: int
+    :param len_min: The minimum length of the integer part of encoded numbers. Default value = 1
+    :type len_min: int
+    :param is_latitude: If True, numbers are encoded as latitudes; otherwise, as longitudes. Default value = True
+    :type is_latitude: bool
+    :param collapse_magnitude: If True, numbers are encoded with magnitude suffixes
+    :type collapse_magnitude: bool
+    :return: The decoder function, taking an encoded string and returning a float.
+    :rtype: callable
+
+    **Examples**
+
+    >>> decoder = make_decoder(decimals=1, len_min=3, is_latitude=False)
+    >>> decoder("w012p3")
+    -12.3
+
+    >>> decoder("x")
+    nan
+
+    """
+    if is_latitude:
+        sign_table = SIGN["latitude"]
+    else:
+        sign_table = SIGN["longitude"]
+    # the integer part is limited to exact float64 integers
+    pattern = "([{signs}])([0-9]{{{len_min},{len_max}}})".format(
+        signs=re.escape(sign_table["positive"] + sign_table["negative"]),
+        len_min=min(len_min, DECIMALS_LIMIT),
+        len_max=DECIMALS_LIMIT,
+    )
+    if decimals > 0:
+        pattern += "{decimal}([0-9]{{{decimals}}})".format(
+            decimal=re.escape(DECIMAL), decimals=decimals
+        )
+    else:
+        pattern += "()"
+    if collapse_magnitude:
+        pattern += "([{magnitudes}]?)".format(magnitudes=re.escape("".join(MAGNITUDES)))
+    else:
+        pattern += "()"
+    fullmatch = re.compile(pattern, flags=re.IGNORECASE | re.ASCII).fullmatch
+    replacers = REPLACER_FLAGS
+    nan = float("nan")
+
+    def decoder(encoded_number):
+        if not isinstance(encoded_number, str):
+            if encoded_number is None or encoded_number != encoded_number:
+                return nan
+            return decode_number(encoded_number)
+        match = fullmatch(encoded_number)
+        if match is None:
+            if encoded_number.lower() in replacers:
+                return nan
+            return decode_number(encoded_number)
+        sign_flag, integer_part, rational_part, magnitude_flag = match.groups()
+        if rational_part:
+            number = float(f"{integer_part}.{rational_part}")
+        else:
+            number = float(integer_part)
+        return SIGN_FACTORS[sign_flag] * number * MAGNITUDE_FACTORS[magnitude_flag]
+
+    return decoder
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _cache_stats(cached_function, evictions):
+    # counters of a function wrapped by functools.lru_cache
+    info = cached_function.cache_info()
+    n_lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "evictions": evictions,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_rate": info.hits / n_lookups if n_lookups else float("nan"),
+    }
 
+
+def _pack_labels(labels, width):
+    # pack ASCII labels of up to width characters into distinct uint64 keys
+    labels = np.ascontiguousarray(labels).ravel()
+    n_chars = labels.dtype.itemsize // 4
+    keys = np.zeros(labels.size, dtype=np.uint64)
+    if n_chars == 0:
+        return keys, np.ones(labels.size, dtype=bool)
+    codes = labels.view(np.uint32).reshape(labels.size, n_chars)
+    is_packed = (codes < 128).all(axis=1) & (codes[:, width:] == 0).all(axis=1)
+    for k in range(width):
+        keys <<= np.uint64(7)
+        if k < n_chars:
+            keys |= codes[:, k].astype(np.uint64)
+    return keys, is_packed
+
+
+def _hash_positions(keys, n_bits):
+    # Fibonacci hashing of uint64 keys into 2**n_bits slots
+    return (keys * HASH_MULTIPLIER >> np.uint64(64 - n_bits)).astype(np.int64)
+
+
+def _make_hash_table(keys):
+    # open addressing table (linear probing) of distinct keys, at most 1/4 full
+    n_bits = max(int(keys.size).bit_length() + 2, 4)
+    slots = np.full(1 << n_bits, -1, dtype=np.int64)
+    ids = np.arange(keys.size)
+    positions = _hash_positions(keys, n_bits)
+    while ids.size:
+        # the first key reaching a free slot takes it, the others probe the next slot
+        is_free = slots[positions] < 0
+        free_ids = np.flatnonzero(is_free)
+        _, first = np.unique(positions[free_ids], return_index=True)
+        taken = free_ids[first]
+        slots[positions[taken]] = ids[taken]
+        is_left = np.ones(ids.size, dtype=bool)
+        is_left[taken] = False
+        ids = ids[is_left]
+        positions = (positions[is_left] + 1) & (slots.size - 1)
+    return slots
+
+
+def _probe_hash_table(slots, table_keys, keys):
+    # positions of keys in the table, or -1 if missing
+    n_bits = slots.size.bit_length() - 1
+    found = np.full(keys.size, -1, dtype=np.int64)
+    active = np.arange(keys.size)
+    positions = _hash_positions(keys, n_bits)
+    while active.size:
+        ids = slots[positions]
+        is_empty = ids < 0
+        is_hit = ~is_empty & (table_keys[ids] == keys[active])
+        found[active[is_hit]] = ids[is_hit]
+        is_left = ~(is_hit | is_empty)
+        active = active[is_left]
+        positions = (positions[is_left] + 1) & (slots.size - 1)
+    return found
+
+
+def _align(offset, alignment=STORE_ALIGNMENT):
+    # next multiple of the alignment
+    return -(-offset // alignment) * alignment
+
+
+def _float_sort_keys(values):
+    # order-preserving uint64 keys of float64 values (flip negatives, set sign of positives)
+    bits = np.ascontiguousarray(values + 0.0, dtype=np.float64).view(np.uint64)
+    keys = np.where(bits >= SORT_KEY_SIGN, ~bits, bits | SORT_KEY_SIGN)
+    keys[np.isnan(values)] = SORT_KEY_NAN
+    return keys
+
+
+def _is_missing(encoded_number):
+    # missing values and replacer flags
+    if not isinstance(encoded_number, str):
+        return encoded_number is None or encoded_number != encoded_number
+    return encoded_number.lower() in REPLACER_FLAGS
+
+
+def _split_flags(encoded_number_lower):
+    # strip the magnitude suffix and the sign prefix flags
     # --------------- handle magnitude ---------------
     magnitude_multiplier = 1
     if encoded_number_lower[-1] in MAGNITUDES:
@@ -229,11 +771,22 @@ def decode_number(encoded_number):
         # Remove the sign flag for number processing (sign remains positive)
         encoded_number_lower = encoded_number_lower[1:]
 
+    return sign, encoded_number_lower, magnitude_multiplier
+
+
+def _decode_number_generic(encoded_number_lower):
+    # slow path of decode_number for non-canonical strings
+    sign, encoded_number_lower, magnitude_multiplier = _split_flags(
+        encoded_number_lower
+    )
+
     # --------------- handle decimal ---------------
     if DECIMAL in encoded_number_lower:
         # Replace 'p' with '.' for standard float conversion
         _ls = encoded_number_lower.split(DECIMAL)
-        integer_part = str(int(decode_number(encoded_number=_ls[0])))
+        # the integer part is decoded on its own and truncated
+        int_sign, int_part, int_multiplier = _split_flags(_ls[0])
+        integer_part = str(int(int_sign * float(int_part) * int_multiplier))
         rational_part = _ls[1]
         encoded_number_lower = integer_part + "." + rational_part
 
@@ -241,10 +794,258 @@ def decode_number(encoded_number):
     return sign * float(encoded_number_lower) * magnitude_multiplier
 
 
-# ... {develop}
+def _to_float_array(numbers):
+    # get a float64 array from arrays, Series or sequences
+    if isinstance(numbers, pd.Series):
+        return numbers.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(numbers, dtype=np.float64)
+
+
+def _to_str_array(encoded_numbers):
+    # get a unicode array from arrays, Series or sequences (nulls become replacers)
+    if isinstance(encoded_numbers, pd.Series):
+        labels = encoded_numbers.to_numpy(dtype=object)
+    else:
+        labels = np.asarray(encoded_numbers)
+    if labels.dtype.kind == "U":
+        return labels
+    if labels.dtype.kind == "S":
+        return _from_bytes_array(labels)
+    if labels.dtype.kind == "O":
+        labels = np.where(pd.isna(labels), REPLACERS["null"], labels)
+    return labels.astype(str)
+
+
+def _to_bytes_array(labels):
+    # fixed-width byte array of ASCII labels (code points narrowed, no Python objects)
+    width = labels.dtype.itemsize // 4
+    if width == 0:
+        return np.zeros(labels.shape, dtype="S1")
+    codes = np.ascontiguousarray(labels).view(np.uint32)
+    if (codes >= 128).any():
+        raise ValueError("byte labels must be ASCII")
+    return codes.astype(np.uint8).view(f"S{width}").reshape(labels.shape)
+
+
+def _from_bytes_array(labels):
+    # unicode array of byte labels (bytes widened to code points, no Python objects)
+    width = labels.dtype.itemsize
+    if width == 0:
+        return np.zeros(labels.shape, dtype="U1")
+    codes = np.ascontiguousarray(labels).view(np.uint8)
+    return codes.astype(np.uint32).view(f"<U{width}").reshape(labels.shape)
+
+
+def _wrap_like(result, reference):
+    # return a Series if the reference input is a Series
+    if isinstance(reference, pd.Series):
+        return pd.Series(result, index=reference.index, name=reference.name)
+    return result
+
+
+def _set_strings(target, mask, strings):
+    # assign strings under a mask, widening the fixed-width dtype if needed
+    width = max([len(e) for e in strings], default=0)
+    if width > target.dtype.itemsize // 4:
+        target = target.astype(f"<U{width}")
+    target[mask] = strings
+    return target
+
+
+def _encode_array(values, decimals, len_min, is_latitude, collapse_magnitude, replacer):
+    # vectorized counterpart of encode_number, processed in chunks
+    shape = values.shape
+    values = values.ravel()
+    ls_chunks = [
+        _encode_chunk(
+            values=values[i : i + CHUNK_SIZE],
+            decimals=decimals,
+            len_min=len_min,
+            is_latitude=is_latitude,
+            collapse_magnitude=collapse_magnitude,
+            replacer=replacer,
+        )
+        for i in range(0, max(values.size, 1), CHUNK_SIZE)
+    ]
+    return np.concatenate(ls_chunks).reshape(shape)
+
+
+def _encode_chunk(values, decimals, len_min, is_latitude, collapse_magnitude, replacer):
+    # write the encoded characters straight into a matrix of unicode code points
+    if is_latitude:
+        sign_table = SIGN["latitude"]
+    else:
+        sign_table = SIGN["longitude"]
+
+    size = values.size
+    rows = np.arange(size)
+    is_null = np.isnan(values)
+    abs_values = np.abs(values)
+
+    # --------------- handle magnitude ---------------
+    magnitude_codes = np.zeros(size, dtype=np.uint32)
+    if collapse_magnitude:
+        # the first factor reached wins, as in encode_number
+        pending = ~is_null
+        for flag, factor in MAGNITUDES.items():
+            hit = pending & (abs_values >= factor)
+            abs_values = np.where(hit, abs_values / factor, abs_values)
+            magnitude_codes[hit] = ord(flag.lower())
+            pending &= ~hit
+
+    # --------------- handle rounding ---------------
+    scale = 10**decimals
+    scaled = abs_values * scale
+    # huge, infinite or tied values fall back to the scalar formatter
+    fallback = ~is_null & ~(scaled < EXACT_LIMIT)
+    if decimals > DECIMALS_LIMIT:
+        fallback = ~is_null
+    elif decimals > 0:
+        fraction = scaled - np.floor(scaled)
+        fallback |= np.abs(fraction - 0.5) <= 2 * np.spacing(scaled)
+    fast = ~(is_null | fallback)
+    rounded = np.rint(np.where(fast, scaled, 0)).astype(np.int64)
+    if decimals > DECIMALS_LIMIT:
+        integer_part, fractional_part = rounded, rounded
+    else:
+        integer_part, fractional_part = np.divmod(rounded, scale)
+
+    # --------------- layout ---------------
+    # sign + zero-filled integer part [+ decimal flag + fraction] [+ magnitude]
+    n_digits = 1 + np.searchsorted(POWERS_OF_TEN[1:], integer_part, side="right")
+    n_integer = np.maximum(n_digits, len_min)
+    n_fraction = decimals + 1 if decimals > 0 else 0
+    lengths = 1 + n_integer + n_fraction + (magnitude_codes > 0)
+    width = max(int(lengths.max(initial=1)), len(replacer), 1)
+    codes = np.zeros((size, width), dtype=np.uint32)
+
+    # --------------- sign ---------------
+    codes[:, 0] = np.where(
+        values < 0,
+        ord(sign_table["negative"].lower()),
+        ord(sign_table["positive"].lower()),
+    )
+
+    # --------------- integer part ---------------
+    flat = codes.reshape(-1)
+    offsets = rows * width
+    for k in range(int(n_integer.max(initial=1))):
+        has_digit = k < n_integer
+        digit = (integer_part // POWERS_OF_TEN[min(k, 18)]) % 10
+        column = n_integer - k
+        flat[offsets[has_digit] + column[has_digit]] = ord("0") + digit[has_digit]
+
+    # --------------- fractional part ---------------
+    if decimals > 0:
+        column = n_integer + 1
+        flat[offsets + column] = ord(DECIMAL.lower())
+        for k in range(decimals):
+            digit = (fractional_part // 10 ** (decimals - 1 - k)) % 10
+            flat[offsets + column + 1 + k] = ord("0") + digit
+
+    # --------------- magnitude ---------------
+    has_magnitude = magnitude_codes > 0
+    position = offsets + lengths - 1
+    flat[position[has_magnitude]] = magnitude_codes[has_magnitude]
+
+    encoded = codes.view(f"<U{width}").reshape(size)
+
+    if fallback.any():
+        ls_fallback = [
+            encode_number(
+                number=n,
+                decimals=decimals,
+                len_min=len_min,
+                is_latitude=is_latitude,
+                collapse_magnitude=collapse_magnitude,
+            )
+            for n in values[fallback]
+        ]
+        encoded = _set_strings(encoded, fallback, ls_fallback)
+    encoded[is_null] = replacer
+    return encoded
+
+
+def _decode_array(labels):
+    # vectorized counterpart of decode_number, processed in chunks
+    shape = labels.shape
+    labels = np.ascontiguousarray(labels).ravel()
+    ls_chunks = [
+        _decode_chunk(labels=labels[i : i + CHUNK_SIZE])
+        for i in range(0, max(labels.size, 1), CHUNK_SIZE)
+    ]
+    return np.concatenate(ls_chunks).reshape(shape)
+
+
+def _decode_chunk(labels):
+    # parse the characters from a matrix of unicode code points
+    size = labels.size
+    width = max(labels.dtype.itemsize // 4, 1)
+    labels = labels.astype(f"<U{width}")
+    codes = labels.view(np.uint32).reshape(size, width)
+    # case-insensitive ASCII
+    codes = codes + 32 * ((codes >= ord("A")) & (codes <= ord("Z")))
+    rows = np.arange(size)
+    lengths = np.char.str_len(labels)
+
+    # --------------- handle replacers ---------------
+    is_null = np.zeros(size, dtype=bool)
+    for replacer in REPLACERS.values():
+        if len(replacer) > width:
+            continue
+        is_replacer = lengths == len(replacer)
+        for k, char in enumerate(replacer.lower()):
+            is_replacer &= codes[:, k] == ord(char)
+        is_null |= is_replacer
+
+    # --------------- handle magnitude ---------------
+    # factors of the last characters in the lookup table of the registry
+    last_codes = codes[rows, np.maximum(lengths - 1, 0)]
+    magnitude_factors = lookup(get_registry().magnitude_factors, last_codes)
+    has_magnitude = (magnitude_factors > 0) & (lengths > 0)
+    magnitude_multipliers = np.where(has_magnitude, magnitude_factors, 1.0)
+
+    # --------------- handle sign ---------------
+    sign_factors = lookup(get_registry().sign_factors, codes[:, 0])
+    is_signed = (sign_factors != 0) & (lengths > has_magnitude)
+    signs = np.where(is_signed & (sign_factors < 0), -1.0, 1.0)
+
+    # --------------- handle digits and decimal ---------------
+    # exact integer mantissa over an exact power of ten (correctly rounded)
+    start = is_signed.astype(np.int64)
+    stop = lengths - has_magnitude
+    is_invalid = np.zeros(size, dtype=bool)
+    mantissa = np.zeros(size, dtype=np.int64)
+    n_before = np.zeros(size, dtype=np.int64)
+    n_fraction = np.zeros(size, dtype=np.int64)
+    n_points = np.zeros(size, dtype=np.int64)
+    for k in range(width):
+        column = codes[:, k]
+        in_body = (start <= k) & (k < stop)
+        is_digit = in_body & (column >= ord("0")) & (column <= ord("9"))
+        is_point = in_body & (column == ord(DECIMAL.lower()))
+        is_invalid |= in_body & ~(is_digit | is_point)
+        mantissa = np.where(is_digit, 10 * mantissa + (column - ord("0")), mantissa)
+        n_before += is_digit & (n_points == 0)
+        n_fraction += is_digit & (n_points > 0)
+        n_points += is_point
+    divisors = POWERS_OF_TEN[np.minimum(n_fraction, 18)].astype(np.float64)
+    decoded = signs * (mantissa / divisors) * magnitude_multipliers
+
+    # anything unusual falls back to the scalar decoder (same result or error)
+    fast = (
+        ~is_invalid
+        & (n_points <= 1)
+        & (n_before >= 1)
+        & (n_before + n_fraction <= DECIMALS_LIMIT)
+    )
+    fallback = ~(fast | is_null)
+    if fallback.any():
+        decoded[fallback] = [decode_number(s) for s in labels[fallback]]
+    decoded[is_null] = np.nan
+    return decoded
+
 
-# FUNCTIONS -- Module-level
-# =======================================================================
 # ... {develop}
 
 
@@ -253,6 +1054,459 @@ def decode_number(encoded_number):
 
 # CLASSES -- Project-level
 # =======================================================================
+
+
+class CachedCodec:
+    """
+    A number codec memoizing ``encode_number`` and ``decode_number``.
+
+    Labels are very repetitive (the same grid coordinates and magnitudes across
+    thousands of files), so repeated values cost a dictionary lookup. Encoding
+    parameters are fixed per codec, as in ``make_encoder``.
+
+    Each direction has its own bounded cache of ``max_size`` entries
+    (``functools.lru_cache``, thread-safe): when a cache is full, the entry unused
+    for the longest time is evicted. Errors are raised as usual and never cached,
+    so results are always the same as the scalar codecs.
+
+    **Examples**
+
+    >>> codec = CachedCodec(decimals=1, len_min=3)
+    >>> [codec.decode(s) for s in ["s030p5", "s030p5", "n010"]]
+    [-30.5, -30.5, 10.0]
+
+    >>> codec.encode(-30.5)
+    's030p5'
+
+    >>> codec.stats()["decode"]["hits"]
+    1
+
+    """
+
+    def __init__(
+        self,
+        max_size=CACHE_SIZE,
+        decimals=0,
+        len_min=1,
+        is_latitude=True,
+        collapse_magnitude=False,
+    ):
+        """
+        Initialize the codec.
+
+        :param max_size: The maximal number of entries of each cache. Default value = 65536
+        :type max_size: int
+        :param decimals: The number of decimal places to include. Default value = 0
+        :type decimals: int
+        :param len_min: The minimum length of the integer part, padded with leading zeros if necessary. Default value = 1
+        :type len_min: int
+        :param is_latitude: If True, numbers are treated as latitudes; otherwise, as longitudes. Default value = True
+        :type is_latitude: bool
+        :param collapse_magnitude: If True, collapse numbers into a magnitude suffix (d, c, k, m, b)
+        :type collapse_magnitude: bool
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1: {max_size}")
+        self.max_size = int(max_size)
+        # same results (and errors) as encode_number
+        encoder = make_encoder(
+            decimals=decimals,
+            len_min=len_min,
+            is_latitude=is_latitude,
+            collapse_magnitude=collapse_magnitude,
+            replacer=None,
+        )
+        self._evictions = {"encode": 0, "decode": 0}
+        self._lock = threading.Lock()
+        self._encode = functools.lru_cache(maxsize=self.max_size)(
+            self._count_evictions(encoder, "encode")
+        )
+        self._decode = functools.lru_cache(maxsize=self.max_size)(
+            self._count_evictions(decode_number, "decode")
+        )
+
+    def encode(self, number):
+        """
+        Encodes a number, as ``encode_number`` with the codec parameters.
+
+        :param number: The number to encode.
+        :type number: float or int
+        :return: The encoded number string.
+        :rtype: str
+        """
+        return self._encode(number)
+
+    def decode(self, encoded_number):
+        """
+        Decodes an encoded number, as ``decode_number``.
+
+        :param encoded_number: The encoded number string.
+        :type encoded_number: str
+        :return: The decoded number.
+        :rtype: float
+        """
+        return self._decode(encoded_number)
+
+    def stats(self):
+        """
+        Get the counters of both caches.
+
+        Evictions are counted when a result is added to a full cache, so failed
+        calls never count. Two threads missing the same key at the same time add a
+        single entry but may both count an eviction.
+
+        :return: The ``hits``, ``misses``, ``evictions``, current ``size``, ``max_size``
+            and ``hit_rate`` (NaN before any lookup) of the ``encode`` and ``decode`` caches.
+        :rtype: dict
+        """
+        return {
+            "encode": _cache_stats(self._encode, self._evictions["encode"]),
+            "decode": _cache_stats(self._decode, self._evictions["decode"]),
+        }
+
+    def clear(self):
+        """
+        Remove all entries of both caches and reset the counters.
+        """
+        with self._lock:
+            self._encode.cache_clear()
+            self._decode.cache_clear()
+            self._evictions = {"encode": 0, "decode": 0}
+
+    def _count_evictions(self, function, direction):
+        # the wrapped function only runs on misses and its result is added to the
+        # cache right after it returns, evicting an entry if the cache is full
+        def counted(value):
+            result = function(value)
+            cached_function = getattr(self, f"_{direction}")
+            if cached_function.cache_info().currsize >= self.max_size:
+                with self._lock:
+                    self._evictions[direction] += 1
+            return result
+
+        return counted
+
+
+class IntegerTable:
+    """
+    A table-driven codec of integers in a declared range, for columns such as grid
+    indices, station numbers or tile ids.
+
+    The encoded strings of all integers in ``[vmin, vmax]`` are computed once with
+    ``encode_numbers``. Arrays are then encoded by fancy indexing into the table.
+    They are decoded through a hash table of labels packed into integer keys (7 bits
+    per character), or a binary search over the sorted labels if they are too long
+    to pack; scalars use a dictionary. Anything off the table (out of range, missing, non-canonical or
+    uppercase labels) is handled by ``encode_numbers`` and ``decode_numbers``, so
+    results are always the same.
+
+    **Examples**
+
+    >>> table = IntegerTable(-90, 90, len_min=2)
+    >>> table.encode([-30, 5, 91, float("nan")]).tolist()
+    ['s30', 'n05', 'n91', 'x']
+
+    >>> table.decode(["s30", "N05", "x"]).tolist()
+    [-30.0, 5.0, nan]
+
+    """
+
+    def __init__(
+        self, vmin, vmax, len_min=1, is_latitude=True, replacer=REPLACERS["null"]
+    ):
+        """
+        Initialize the table.
+
+        :param vmin: The lowest integer of the table.
+        :type vmin: int
+        :param vmax: The highest integer of the table.
+        :type vmax: int
+        :param len_min: The minimum length of the integer part, padded with leading zeros if necessary. Default value = 1
+        :type len_min: int
+        :param is_latitude: If True, numbers are treated as latitudes; otherwise, as longitudes. Default value = True
+        :type is_latitude: bool
+        :param replacer: The flag used for missing values. Default value = ``x``
+        :type replacer: str
+        """
+        self.vmin = int(vmin)
+        self.vmax = int(vmax)
+        size = self.vmax - self.vmin + 1
+        if not 0 < size <= TABLE_SIZE_MAX:
+            raise ValueError(
+                f"table size must be between 1 and {TABLE_SIZE_MAX}: {self.vmin}..{self.vmax}"
+            )
+        self.len_min = len_min
+        self.is_latitude = is_latitude
+        self.replacer = replacer
+        self.table = encode_numbers(
+            np.arange(self.vmin, self.vmax + 1),
+            len_min=len_min,
+            is_latitude=is_latitude,
+        )
+        # hash table of packed labels, or sorted labels if too long to pack
+        self._width = self.table.dtype.itemsize // 4
+        if self._width <= PACK_WIDTH_MAX:
+            self._keys, _ = _pack_labels(self.table, self._width)
+            self._slots = _make_hash_table(self._keys)
+        else:
+            self._order = np.argsort(self.table)
+            self._sorted = self.table[self._order]
+        # dictionary of scalar lookups, made on first use
+        self._lookup = None
+
+    def encode(self, numbers, as_bytes=False):
+        """
+        Encodes an array of numbers, as ``encode_numbers`` with ``decimals=0``.
+
+        :param numbers: The numbers to encode.
+        :type numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param as_bytes: If True, return a fixed-width byte array (``S{n}`` dtype). Default value = False
+        :type as_bytes: bool
+        :return: The encoded number strings. A Series with the same index is returned for a Series input (unless ``as_bytes``).
+        :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+        """
+        values = numbers.to_numpy() if isinstance(numbers, pd.Series) else numbers
+        values = np.asarray(values)
+        if values.dtype.kind in "iu":
+            positions = values.astype(np.int64) - self.vmin
+            in_table = (positions >= 0) & (positions < self.table.size)
+        else:
+            values = _to_float_array(numbers)
+            # round half to even, as round in encode_number
+            positions = np.rint(values) - self.vmin
+            in_table = (positions >= 0) & (positions < self.table.size)
+            # negative numbers rounded to zero keep their negative flag
+            in_table &= ~((values < 0) & (positions == -self.vmin))
+        encoded = self.table[np.where(in_table, positions, 0).astype(np.intp)]
+        if not in_table.all():
+            off_table = encode_numbers(
+                values[~in_table],
+                len_min=self.len_min,
+                is_latitude=self.is_latitude,
+                replacer=self.replacer,
+            )
+            encoded = _set_strings(encoded, ~in_table, off_table)
+        if as_bytes:
+            return _to_bytes_array(encoded)
+        return _wrap_like(encoded, numbers)
+
+    def decode(self, encoded_numbers):
+        """
+        Decodes an array of encoded number strings, as ``decode_numbers``.
+
+        :param encoded_numbers: The encoded number strings.
+        :type encoded_numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :return: The decoded numbers. A Series with the same index is returned for a Series input.
+        :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+        """
+        labels = _to_str_array(encoded_numbers)
+        shape = labels.shape
+        labels = labels.ravel()
+        if self._width <= PACK_WIDTH_MAX:
+            keys, is_packed = _pack_labels(labels, self._width)
+            positions = _probe_hash_table(self._slots, self._keys, keys)
+            in_table = is_packed & (positions >= 0)
+        else:
+            ranks = np.searchsorted(self._sorted, labels)
+            ranks = np.minimum(ranks, self._sorted.size - 1)
+            in_table = self._sorted[ranks] == labels
+            positions = self._order[ranks]
+        decoded = (positions + self.vmin).astype(np.float64)
+        if not in_table.all():
+            decoded[~in_table] = decode_numbers(labels[~in_table])
+        return _wrap_like(decoded.reshape(shape), encoded_numbers)
+
+    def encode_one(self, number):
+        """
+        Encodes a number, as ``encode_number`` with ``decimals=0``.
+
+        :param number: The number to encode.
+        :type number: float or int
+        :return: The encoded number string.
+        :rtype: str
+        """
+        if self.vmin <= number <= self.vmax and number == int(number):
+            return str(self.table[int(number) - self.vmin])
+        return encode_number(number, len_min=self.len_min, is_latitude=self.is_latitude)
+
+    def decode_one(self, encoded_number):
+        """
+        Decodes an encoded number string, as ``decode_number``.
+
+        :param encoded_number: The encoded number string.
+        :type encoded_number: str
+        :return: The decoded number.
+        :rtype: float
+        """
+        if self._lookup is None:
+            self._lookup = {
+                label: float(self.vmin + i)
+                for i, label in enumerate(self.table.tolist())
+            }
+        number = self._lookup.get(encoded_number)
+        if number is None:
+            return decode_number(encoded_number)
+        return number
+
+    def __len__(self):
+        return self.table.size
+
+
+class LabelStore:
+    """
+    A column of encoded numbers stored on disk and opened as memory maps.
+
+    The file holds a header, the labels as a fixed-width byte column (``S{n}``) and,
+    optionally, the decoded ``float64`` column. Opening a store only reads the header:
+    columns are ``numpy.memmap`` arrays, so pages are loaded on access and shared by
+    all processes through the OS cache, and no labels are decoded again.
+
+    File layout:
+
+     - magic ``FLARELBL`` and the header length (``uint32``, little-endian)
+     - the header in JSON: format ``version``, ``size``, ``width`` and column offsets
+     - the labels and values columns, each aligned to 64 bytes
+
+    **Examples**
+
+    .. code-block:: python
+
+        encoded = encode_numbers(values, decimals=2, len_min=3, as_bytes=True)
+        LabelStore.write("lat.flare", encoded)
+        # in each job or worker
+        with LabelStore("lat.flare") as store:
+            print(store.labels[:5], store.values[:5])
+
+    """
+
+    def __init__(self, path, mode="r"):
+        """
+        Open a store.
+
+        :param path: Path to the store file.
+        :type path: str or :class:`pathlib.Path`
+        :param mode: The ``numpy.memmap`` mode (``r`` read-only, ``r+`` writable, ``c`` copy-on-write). Default value = ``r``
+        :type mode: str
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            prefix = f.read(len(STORE_MAGIC) + 4)
+            if prefix[: len(STORE_MAGIC)] != STORE_MAGIC:
+                raise ValueError(f"not a label store: {str(self.path)!r}")
+            (n_header,) = struct.unpack("<I", prefix[len(STORE_MAGIC) :])
+            self.header = json.loads(f.read(n_header).decode("utf-8"))
+        if self.header["version"] > STORE_VERSION:
+            raise ValueError(f"unsupported store version: {self.header['version']}")
+        self.size = self.header["size"]
+        self.width = self.header["width"]
+        self.labels = self._map(f"S{self.width}", self.header["labels_offset"], mode)
+        self.values = None
+        if self.header["values_offset"] is not None:
+            self.values = self._map(np.float64, self.header["values_offset"], mode)
+
+    @classmethod
+    def write(cls, path, encoded_numbers, decode=True, chunk_size=CHUNK_SIZE):
+        """
+        Write a store from encoded numbers, in chunks, and open it.
+
+        :param path: Path to the store file (overwritten).
+        :type path: str or :class:`pathlib.Path`
+        :param encoded_numbers: The encoded number strings (unicode or byte arrays, Series or lists).
+        :type encoded_numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param decode: If True, also store the decoded values. Default value = True
+        :type decode: bool
+        :param chunk_size: The number of labels converted at once. Default value = 500000
+        :type chunk_size: int
+        :return: The opened store.
+        :rtype: :class:`LabelStore`
+        """
+        if (
+            isinstance(encoded_numbers, np.ndarray)
+            and encoded_numbers.dtype.kind == "S"
+        ):
+            labels = encoded_numbers.ravel()
+            width = labels.dtype.itemsize
+        else:
+            labels = _to_str_array(encoded_numbers).ravel()
+            width = labels.dtype.itemsize // 4
+        width = max(width, 1)
+        size = labels.size
+
+        # --------------- make header ---------------
+        # offsets are set from an upper bound of the header length (placeholders
+        # at least as long as any offset), then the gap is padded with zeros
+        placeholder = 2**63 - 1
+        header = dict(
+            version=STORE_VERSION,
+            size=size,
+            width=width,
+            labels_offset=placeholder,
+            values_offset=placeholder if decode else None,
+        )
+        n_prefix = len(STORE_MAGIC) + 4 + len(json.dumps(header).encode("utf-8"))
+        header["labels_offset"] = _align(n_prefix)
+        if decode:
+            header["values_offset"] = _align(header["labels_offset"] + size * width)
+        encoded_header = json.dumps(header).encode("utf-8")
+
+        # --------------- write columns ---------------
+        with open(path, "wb") as f:
+            f.write(STORE_MAGIC + struct.pack("<I", len(encoded_header)))
+            f.write(encoded_header)
+            f.write(bytes(header["labels_offset"] - f.tell()))
+            for start in range(0, size, chunk_size):
+                chunk = labels[start : start + chunk_size]
+                if chunk.dtype.kind == "U":
+                    chunk = _to_bytes_array(chunk)
+                f.write(chunk.astype(f"S{width}").tobytes())
+            if decode:
+                f.write(bytes(header["values_offset"] - f.tell()))
+                for start in range(0, size, chunk_size):
+                    chunk = labels[start : start + chunk_size]
+                    f.write(decode_numbers(chunk).astype(np.float64).tobytes())
+        return cls(path)
+
+    def decode(self, start=None, stop=None):
+        """
+        Get decoded values, from the stored column if any (else decoded on the fly).
+
+        :param start: The first position. If None, the column starts at 0.
+        :type start: int or None
+        :param stop: The position after the last one. If None, the column ends at the last label.
+        :type stop: int or None
+        :return: The decoded numbers.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self.values is not None:
+            return np.asarray(self.values[start:stop])
+        return decode_numbers(self.labels[start:stop])
+
+    def close(self):
+        """
+        Release the memory maps.
+        """
+        self.labels = None
+        self.values = None
+
+    def _map(self, dtype, offset, mode):
+        # memory map of a column (empty columns cannot be mapped)
+        if self.size == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(
+            self.path, dtype=dtype, mode=mode, offset=offset, shape=(self.size,)
+        )
+
+    def __len__(self):
+        return self.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
 # ... {develop}
 
 # CLASSES -- Module-level
@@ -0,0 +1,429 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Parallel batch codecs for Flare numbers, spreading the ``numflare`` bulk codecs
+over a pool of worker processes.
+
+Features
+--------
+ - Split large arrays into chunks and encode or decode them in worker processes
+ - Share input buffers with workers through shared memory (no pickling of inputs)
+ - Decode straight into a shared output buffer
+ - Reassemble outputs in the input order
+ - Tune the number of workers and the chunk size, or reuse an existing pool
+
+Overview
+--------
+
+Inputs are copied once into a :class:`multiprocessing.shared_memory.SharedMemory`
+block. Each task only receives the block name and its ``(start, stop)`` range, so
+task submission costs the same for any chunk size. Decoded floats are written by
+the workers into a shared output block. Encoded strings are sent back per chunk as
+fixed-width arrays and concatenated in order.
+
+Small inputs (a single chunk) and ``workers=1`` run in the current process. The
+number of workers defaults to the default size of a process pool (all CPUs); pass
+the size of a reused pool as ``workers`` to split inputs for that pool.
+
+Examples
+--------
+
+.. code-block:: python
+
+    import numpy as np
+
+    numbers = np.random.normal(loc=0, scale=100, size=10_000_000)
+
+    # encode over 8 processes, in chunks of 500k numbers
+    encoded = encode_numbers_parallel(numbers, decimals=2, workers=8, chunk_size=500_000)
+
+    # decode back
+    decoded = decode_numbers_parallel(encoded, workers=8)
+
+Reuse a pool across calls
+
+.. code-block:: python
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=8) as executor:
+        lat = encode_numbers_parallel(df["lat"], decimals=4, workers=8, executor=executor)
+        lon = encode_numbers_parallel(df["lon"], decimals=4, is_latitude=False, workers=8, executor=executor)
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import REPLACERS, encode_numbers, decode_numbers
+from flare.numflare import _to_float_array, _to_str_array, _wrap_like
+from flare.numflare import _to_bytes_array
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# smallest chunk scheduled by default
+CHUNK_SIZE_MIN = 50_000
+# default number of chunks per worker (for load balancing)
+CHUNKS_PER_WORKER = 4
+# largest process pool on Windows (as in ProcessPoolExecutor)
+WORKERS_MAX_WINDOWS = 61
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def encode_numbers_parallel(
+    numbers,
+    decimals=0,
+    len_min=1,
+    is_latitude=True,
+    collapse_magnitude=False,
+    replacer=REPLACERS["null"],
+    workers=None,
+    chunk_size=None,
+    executor=None,
+    as_bytes=False,
+):
+    """
+    Encodes an array of numbers in parallel, with the same results of ``numflare.encode_numbers``.
+
+    :param numbers: The numbers to encode.
+    :type numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param decimals: The number of decimal places to include. Default value = 0
+    :type decimals: int
+    :param len_min: The minimum length of the integer part. Default value = 1
+    :type len_min: int
+    :param is_latitude: If True, the numbers are treated as latitudes; otherwise, as longitudes. Default value = True
+    :type is_latitude: bool
+    :param collapse_magnitude: If True, collapse the numbers into a magnitude suffix (d, c, k, m, b)
+    :type collapse_magnitude: bool
+    :param replacer: The flag used for missing values. Default value = ``x``
+    :type replacer: str
+    :param workers: The number of worker processes (the size of ``executor``, if given). If None, all CPUs are used.
+    :type workers: int or None
+    :param chunk_size: The number of elements per task. If None, it is set from the size and the number of workers.
+    :type chunk_size: int or None
+    :param executor: An existing process pool to use instead of a new one.
+    :type executor: :class:`concurrent.futures.ProcessPoolExecutor` or None
+    :param as_bytes: If True, return a fixed-width byte array (``S{n}`` dtype). Default value = False
+    :type as_bytes: bool
+    :return: The encoded number strings. A Series with the same index is returned for a Series input (unless ``as_bytes``).
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+    """
+    values = np.ascontiguousarray(_to_float_array(numbers)).ravel()
+    options = dict(
+        decimals=decimals,
+        len_min=len_min,
+        is_latitude=is_latitude,
+        collapse_magnitude=collapse_magnitude,
+        replacer=replacer,
+    )
+    workers = get_workers(workers)
+    ls_ranges = split_ranges(values.size, workers=workers, chunk_size=chunk_size)
+
+    if workers <= 1 or len(ls_ranges) <= 1:
+        encoded = encode_numbers(values, **options)
+    else:
+        with SharedArray(values) as shared, _get_executor(workers, executor) as pool:
+            ls_futures = [
+                pool.submit(_encode_task, shared.spec, start, stop, options)
+                for start, stop in ls_ranges
+            ]
+            # gather in submission order
+            encoded = np.concatenate([f.result() for f in ls_futures])
+
+    encoded = encoded.reshape(np.shape(_to_float_array(numbers)))
+    if as_bytes:
+        return _to_bytes_array(encoded)
+    return _wrap_like(encoded, numbers)
+
+
+def decode_numbers_parallel(
+    encoded_numbers, workers=None, chunk_size=None, executor=None
+):
+    """
+    Decodes an array of encoded numbers in parallel, with the same results of ``numflare.decode_numbers``.
+
+    :param encoded_numbers: The encoded number strings.
+    :type encoded_numbers: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param workers: The number of worker processes (the size of ``executor``, if given). If None, all CPUs are used.
+    :type workers: int or None
+    :param chunk_size: The number of elements per task. If None, it is set from the size and the number of workers.
+    :type chunk_size: int or None
+    :param executor: An existing process pool to use instead of a new one.
+    :type executor: :class:`concurrent.futures.ProcessPoolExecutor` or None
+    :return: The decoded numbers. A Series with the same index is returned for a Series input.
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+    """
+    if isinstance(encoded_numbers, np.ndarray) and encoded_numbers.dtype.kind == "S":
+        # byte labels are shared as they are (1 byte per character)
+        labels = encoded_numbers
+    else:
+        labels = _to_str_array(encoded_numbers)
+    shape = labels.shape
+    labels = np.ascontiguousarray(labels).ravel()
+    workers = get_workers(workers)
+    ls_ranges = split_ranges(labels.size, workers=workers, chunk_size=chunk_size)
+
+    if workers <= 1 or len(ls_ranges) <= 1:
+        decoded = decode_numbers(labels)
+    else:
+        decoded = np.empty(labels.size, dtype=np.float64)
+        with SharedArray(labels) as shared_src, SharedArray(decoded) as shared_dst:
+            with _get_executor(workers, executor) as pool:
+                ls_futures = [
+                    pool.submit(
+                        _decode_task, shared_src.spec, shared_dst.spec, start, stop
+                    )
+                    for start, stop in ls_ranges
+                ]
+                for f in ls_futures:
+                    f.result()
+            decoded[:] = shared_dst.array
+
+    return _wrap_like(decoded.reshape(shape), encoded_numbers)
+
+
+def split_ranges(size, workers=1, chunk_size=None):
+    """
+    Splits a number of elements into contiguous ``(start, stop)`` ranges.
+
+    :param size: The number of elements.
+    :type size: int
+    :param workers: The number of workers. Default value = 1
+    :type workers: int
+    :param chunk_size: The number of elements per range. If None, ranges are sized to give a few chunks per worker.
+    :type chunk_size: int or None
+    :return: The list of ranges.
+    :rtype: list
+
+    **Examples**
+
+    >>> split_ranges(10, chunk_size=4)
+    [(0, 4), (4, 8), (8, 10)]
+
+    """
+    if chunk_size is None:
+        chunk_size = max(
+            math.ceil(size / (CHUNKS_PER_WORKER * max(workers, 1))), CHUNK_SIZE_MIN
+        )
+    chunk_size = max(int(chunk_size), 1)
+    return [(i, min(i + chunk_size, size)) for i in range(0, size, chunk_size)]
+
+
+def get_workers(workers=None):
+    """
+    Resolves the number of workers.
+
+    :param workers: The number of worker processes. If None, the default size of a process pool is used: all CPUs available to the process (at most 61 on Windows).
+    :type workers: int or None
+    :return: The number of workers.
+    :rtype: int
+
+    **Examples**
+
+    >>> get_workers(4)
+    4
+
+    """
+    if workers is not None:
+        return max(int(workers), 1)
+    # same default as ProcessPoolExecutor
+    if hasattr(os, "process_cpu_count"):
+        workers = os.process_cpu_count() or 1
+    else:
+        workers = os.cpu_count() or 1
+    if sys.platform == "win32":
+        workers = min(workers, WORKERS_MAX_WINDOWS)
+    return workers
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _get_executor(workers, executor):
+    # use the given pool (left open) or make a new one
+    if executor is not None:
+        return _ExistingExecutor(executor)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _encode_task(spec, start, stop, options):
+    # encode a range of a shared float array
+    with SharedArray.attach(spec) as shared:
+        encoded = encode_numbers(shared.array[start:stop], **options)
+    return encoded
+
+
+def _decode_task(spec_src, spec_dst, start, stop):
+    # decode a range of a shared labels array into a shared float array
+    with SharedArray.attach(spec_src) as shared_src:
+        with SharedArray.attach(spec_dst) as shared_dst:
+            shared_dst.array[start:stop] = decode_numbers(shared_src.array[start:stop])
+    return stop - start
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class SharedArray:
+    """
+    A NumPy array backed by a shared memory block.
+
+    The owner process creates the block from an array and unlinks it on exit.
+    Worker processes attach to it from its ``spec`` (name, shape and dtype).
+    """
+
+    def __init__(self, array=None, spec=None):
+        """
+        Initialize the shared array, either by copying an array or by attaching to a spec.
+
+        :param array: The array to copy into a new shared block.
+        :type array: :class:`numpy.ndarray` or None
+        :param spec: The ``(name, shape, dtype)`` of an existing shared block.
+        :type spec: tuple or None
+        """
+        if spec is None:
+            array = np.ascontiguousarray(array)
+            self.shm = shared_memory.SharedMemory(
+                create=True, size=max(array.nbytes, 1)
+            )
+            self.shape = array.shape
+            self.dtype = array.dtype
+            self.is_owner = True
+            self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+            self.array[...] = array
+        else:
+            name, self.shape, dtype = spec
+            self.dtype = np.dtype(dtype)
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.is_owner = False
+            self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    @classmethod
+    def attach(cls, spec):
+        """
+        Attach to an existing shared block.
+
+        :param spec: The ``(name, shape, dtype)`` of the shared block.
+        :type spec: tuple
+        :return: The shared array.
+        :rtype: :class:`SharedArray`
+        """
+        return cls(spec=spec)
+
+    @property
+    def spec(self):
+        """
+        The ``(name, shape, dtype)`` used by other processes to attach.
+
+        :return: The spec tuple.
+        :rtype: tuple
+        """
+        return (self.shm.name, self.shape, self.dtype.str)
+
+    def close(self):
+        """
+        Release the array and close the block (the owner also unlinks it).
+
+        :return: None
+        :rtype: None
+        """
+        # the buffer must not be referenced when closing
+        self.array = None
+        self.shm.close()
+        if self.is_owner:
+            self.shm.unlink()
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class _ExistingExecutor:
+    # context manager that leaves a given pool open on exit
+
+    def __init__(self, executor):
+        self.executor = executor
+
+    def __enter__(self):
+        return self.executor
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    numbers = np.random.normal(loc=0, scale=100, size=1_000_000)
+    encoded = encode_numbers_parallel(numbers, decimals=2, workers=2)
+    print(encoded[:5])
+    print(decode_numbers_parallel(encoded, workers=2)[:5])
+    # ... {develop}
@@ -0,0 +1,432 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Streaming relabeler that turns numeric columns of large tables into Flare-encoded
+labels, chunk by chunk and in constant memory.
+
+Features
+--------
+ - Stream ``csv`` and ``parquet`` files in bounded-memory chunks
+ - Encode selected columns with the ``numflare`` bulk codec
+ - Write output incrementally, keeping the chunk order
+ - Spread chunks over a pool of worker processes
+
+Overview
+--------
+
+Tables are read in chunks of ``chunk_size`` rows. Each chunk is encoded and
+written before more chunks are read, so at most a few chunks live in memory at
+once (two per worker). Columns that are not selected are copied as they are.
+Missing values are encoded with the null replacer (``x``).
+
+Parquet support requires the optional ``pyarrow`` dependency
+(``pip install flare[parquet]``).
+
+The relabeler is also available from the terminal via ``python -m flare encode``.
+
+Examples
+--------
+
+Encode latitude and longitude columns of a ``;``-separated file
+
+.. code-block:: python
+
+    encode_file(
+        src="stations.csv",
+        dst="stations_labels.csv",
+        columns=["lat", "lon"],
+        longitude_columns=["lon"],
+        decimals=2,
+        len_min=3,
+    )
+
+Same from the terminal
+
+.. code-block:: bash
+
+    python -m flare encode stations.csv stations_labels.csv -c lat lon --longitude lon --decimals 2 --len-min 3
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import encode_numbers
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+CHUNK_SIZE = 100_000
+SEPARATOR = ";"
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+# default missing value markers of pandas.read_csv
+NA_VALUES = (
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+)
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def encode_frame(
+    df,
+    columns,
+    decimals=0,
+    len_min=1,
+    longitude_columns=None,
+    collapse_magnitude=False,
+):
+    """
+    Encodes numeric columns of a DataFrame into Flare number labels.
+
+    Missing values and text markers of missing values (see ``NA_VALUES``) are encoded
+    with the null replacer (``x``).
+
+    :param df: The table to encode.
+    :type df: :class:`pandas.DataFrame`
+    :param columns: The names of the columns to encode.
+    :type columns: list
+    :param decimals: The number of decimal places to include. Default value = 0
+    :type decimals: int
+    :param len_min: The minimum length of the integer part. Default value = 1
+    :type len_min: int
+    :param longitude_columns: The names of columns encoded as longitudes (others are latitudes). Default value = None
+    :type longitude_columns: list or None
+    :param collapse_magnitude: If True, collapse numbers into a magnitude suffix (d, c, k, m, b)
+    :type collapse_magnitude: bool
+    :return: A copy of the table with encoded columns.
+    :rtype: :class:`pandas.DataFrame`
+
+    **Examples**
+
+    >>> df = pd.DataFrame({"id": ["a", "b"], "lat": ["-12.3", "4.56"]})
+    >>> encode_frame(df, columns=["lat"], decimals=1, len_min=2)["lat"].tolist()
+    ['s12p3', 'n04p6']
+
+    >>> df = pd.DataFrame({"lat": ["-12.3", "NA", "NaN", ""]})
+    >>> encode_frame(df, columns=["lat"], decimals=1)["lat"].tolist()
+    ['s12p3', 'x', 'x', 'x']
+
+    """
+    longitude_columns = set(longitude_columns or [])
+    df = df.copy()
+    for column in columns:
+        values = df[column]
+        if not pd.api.types.is_numeric_dtype(values):
+            # text markers of missing values are kept by csv reads, see read_chunks
+            values = values.mask(values.isin(NA_VALUES))
+        numbers = pd.to_numeric(values, errors="raise")
+        df[column] = encode_numbers(
+            numbers.to_numpy(dtype="float64", na_value=float("nan")),
+            decimals=decimals,
+            len_min=len_min,
+            is_latitude=column not in longitude_columns,
+            collapse_magnitude=collapse_magnitude,
+        )
+    return df
+
+
+def encode_file(
+    src,
+    dst,
+    columns,
+    decimals=0,
+    len_min=1,
+    longitude_columns=None,
+    collapse_magnitude=False,
+    sep=SEPARATOR,
+    chunk_size=CHUNK_SIZE,
+    workers=None,
+):
+    """
+    Encodes numeric columns of a table file into Flare number labels, in streaming mode.
+
+    :param src: Path to the input ``csv`` or ``parquet`` file.
+    :type src: str or :class:`pathlib.Path`
+    :param dst: Path to the output ``csv`` or ``parquet`` file.
+    :type dst: str or :class:`pathlib.Path`
+    :param columns: The names of the columns to encode.
+    :type columns: list
+    :param decimals: The number of decimal places to include. Default value = 0
+    :type decimals: int
+    :param len_min: The minimum length of the integer part. Default value = 1
+    :type len_min: int
+    :param longitude_columns: The names of columns encoded as longitudes (others are latitudes). Default value = None
+    :type longitude_columns: list or None
+    :param collapse_magnitude: If True, collapse numbers into a magnitude suffix (d, c, k, m, b)
+    :type collapse_magnitude: bool
+    :param sep: The ``csv`` field separator. Default value = ``;``
+    :type sep: str
+    :param chunk_size: The number of rows per chunk. Default value = 100000
+    :type chunk_size: int
+    :param workers: The number of worker processes. If None, all CPUs are used; if 1, chunks are encoded in the current process.
+    :type workers: int or None
+    :return: The number of rows written.
+    :rtype: int
+    """
+    options = dict(
+        columns=list(columns),
+        decimals=decimals,
+        len_min=len_min,
+        longitude_columns=list(longitude_columns or []),
+        collapse_magnitude=collapse_magnitude,
+    )
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    chunks = read_chunks(src=src, sep=sep, chunk_size=chunk_size)
+    n_rows = 0
+    with ChunkWriter(dst=dst, sep=sep) as writer:
+        if workers <= 1:
+            for df in chunks:
+                df_encoded = encode_frame(df, **options)
+                writer.write(df_encoded)
+                n_rows += len(df_encoded)
+            return n_rows
+
+        # keep at most two chunks per worker in flight to bound memory
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for df in chunks:
+                pending.append(executor.submit(encode_frame, df, **options))
+                if len(pending) >= 2 * workers:
+                    df_encoded = pending.popleft().result()
+                    writer.write(df_encoded)
+                    n_rows += len(df_encoded)
+            while pending:
+                df_encoded = pending.popleft().result()
+                writer.write(df_encoded)
+                n_rows += len(df_encoded)
+    return n_rows
+
+
+def read_chunks(src, sep=SEPARATOR, chunk_size=CHUNK_SIZE):
+    """
+    Reads a ``csv`` or ``parquet`` file in chunks of rows.
+
+    ``csv`` fields are read as text and ``parquet`` columns keep their Arrow types
+    (:class:`pandas.ArrowDtype`), so columns that are not encoded are written back unchanged.
+    Markers of missing values (see ``NA_VALUES``) are kept as text and handled by
+    :func:`encode_frame`.
+
+    :param src: Path to the input file.
+    :type src: str or :class:`pathlib.Path`
+    :param sep: The ``csv`` field separator. Default value = ``;``
+    :type sep: str
+    :param chunk_size: The number of rows per chunk. Default value = 100000
+    :type chunk_size: int
+    :return: Generator of table chunks.
+    :rtype: generator
+    """
+    if is_parquet(src):
+        pa = _import_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(src)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            # keep Arrow types, so columns with nulls in some batches only keep the
+            # type of the file (and the schema of the output)
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        reader = pd.read_csv(
+            src, sep=sep, dtype=str, keep_default_na=False, chunksize=chunk_size
+        )
+        with reader:
+            for df in reader:
+                yield df
+
+
+def is_parquet(path):
+    """
+    Checks if a file path has a ``parquet`` extension.
+
+    :param path: The file path.
+    :type path: str or :class:`pathlib.Path`
+    :return: True if the path is a ``parquet`` file.
+    :rtype: bool
+
+    **Examples**
+
+    >>> is_parquet("data/numbers.parquet")
+    True
+
+    >>> is_parquet("data/numbers.csv")
+    False
+
+    """
+    return Path(path).suffix.lower() in PARQUET_EXTENSIONS
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _import_pyarrow():
+    # import the optional parquet backend
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "parquet files require the optional 'pyarrow' dependency "
+            "(pip install flare[parquet])"
+        ) from e
+    return pyarrow
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class ChunkWriter:
+    """
+    Writes table chunks incrementally to a ``csv`` or ``parquet`` file.
+
+    The header (``csv``) or schema (``parquet``) is taken from the first chunk.
+    Use it as a context manager to close the file at the end.
+    """
+
+    def __init__(self, dst, sep=SEPARATOR):
+        """
+        Initialize the writer.
+
+        :param dst: Path to the output file.
+        :type dst: str or :class:`pathlib.Path`
+        :param sep: The ``csv`` field separator. Default value = ``;``
+        :type sep: str
+        """
+        self.dst = Path(dst)
+        self.sep = sep
+        self.is_parquet = is_parquet(dst)
+        self._file = None
+        self._writer = None
+
+    def write(self, df):
+        """
+        Write a table chunk.
+
+        :param df: The table chunk.
+        :type df: :class:`pandas.DataFrame`
+        :return: None
+        :rtype: None
+        """
+        if self.is_parquet:
+            self._write_parquet(df)
+        else:
+            self._write_csv(df)
+        return None
+
+    def close(self):
+        """
+        Close the output file.
+
+        :return: None
+        :rtype: None
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return None
+
+    def _write_csv(self, df):
+        header = self._file is None
+        if header:
+            self._file = open(self.dst, "w", newline="", encoding="utf-8")
+        df.to_csv(self._file, sep=self.sep, index=False, header=header)
+
+    def _write_parquet(self, df):
+        pa = _import_pyarrow()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._writer = pa.parquet.ParquetWriter(self.dst, table.schema)
+        self._writer.write_table(table)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    df = pd.DataFrame({"lat": ["-12.3", "4.56"], "lon": ["-51.2", ""]})
+    print(encode_frame(df, columns=["lat", "lon"], longitude_columns=["lon"]))
+    # ... {develop}
@@ -0,0 +1,452 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Composer of Flare labels from reusable templates, compiled once and rendered in bulk
+from columnar inputs.
+
+Features
+--------
+ - Compile templates with named slots, as in ``str.format``
+ - Typed slots encoded with the ``numflare`` and ``timeflare`` codecs
+ - Render columns of values (dictionaries of arrays or ``pandas.DataFrame``) at once
+ - Broadcast scalar values, replace missing values by the null replacer (``x``)
+ - Templates of the labeling schemes (``generic``, ``reference`` and ``dataset``)
+
+Overview
+--------
+
+Slots are written as ``{name}`` or ``{name:spec}``. The spec has an optional minimum
+length of the integer part (``03``), an optional number of decimals (``.2``) and a
+codec:
+
+.. list-table::
+   :header-rows: 1
+
+   * - Codec
+     - Values
+     - Example
+   * - ``text`` (default)
+     - Texts or integers, kept as they are
+     - ``{item}`` to ``GLO30``
+   * - ``lat`` and ``lon``
+     - Numbers, encoded with ``numflare.encode_numbers`` and latitude or longitude signs
+     - ``{ymin:02lat}`` to ``s30``
+   * - Timestamp variants (``ts``, ``tsh``, ``tsd``, ...)
+     - Timestamps, encoded with ``timeflare.encode_timestamps``
+     - ``{date:tsd}`` to ``20111008``
+
+Missing values and empty texts are replaced by the null replacer (``x``) and texts
+with the domain separator (``_``) are rejected, since they would shift the domains
+of labels.
+
+Templates are rendered in chunks: each slot is encoded at once into an array of
+strings, and the pieces of labels (slots and the literal text in between) are copied
+side by side into a matrix of code points. Rows are grouped by the lengths of their
+pieces, so each piece is copied into a block of columns per group (a single group
+when all the encoded values have the same length, as padded numbers and timestamps).
+
+Examples
+--------
+
+Render tile names
+
+.. code-block:: python
+
+    template = Template("COPERNICUS_COPDEM_{item}_DGTE_{lat:02lat}{lon:03lon}_{date:tsd}")
+    names = template.render(df)
+
+Render a single label
+
+.. code-block:: python
+
+    template.format(item="GLO30", lat=-30, lon=-51, date="2011-10-08")
+    # Output: 'COPERNICUS_COPDEM_GLO30_DGTE_s30w051_20111008'
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import functools
+import re
+import string
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import DOMAIN_SEPARATOR, SCHEMES
+from flare.numflare import REPLACERS, encode_numbers
+from flare.numflare import _to_bytes_array, _to_float_array, _to_str_array
+from flare.timeflare import VARIANTS, encode_timestamps
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# templates of the labeling schemes (all slots are texts)
+SCHEME_TEMPLATES = {
+    scheme: DOMAIN_SEPARATOR.join(f"{{{domain}}}" for domain in ls_domains)
+    for scheme, ls_domains in SCHEMES.items()
+}
+
+# codecs of slots: texts, numbers and timestamp variants
+CODECS = ("text", "lat", "lon") + tuple(VARIANTS)
+
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# number of labels rendered at once
+CHUNK_SIZE = 500_000
+# grammar of slot specs: minimum length, decimals and codec
+SPEC_PATTERN = re.compile(
+    r"(?:0?(?P<len_min>[1-9][0-9]*))?(?:\.(?P<decimals>[0-9]+))?(?P<codec>[a-z]*)"
+)
+# grammar of slot names
+NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+@functools.lru_cache(maxsize=256)
+def get_template(pattern):
+    """
+    Gets a compiled template, compiling each pattern on its first call only.
+
+    :param pattern: The template pattern or a labeling scheme (see ``SCHEME_TEMPLATES``).
+    :type pattern: str
+    :return: The shared template.
+    :rtype: :class:`Template`
+
+    **Examples**
+
+    >>> get_template("dataset") is get_template("dataset")
+    True
+
+    >>> get_template("reference").format(author="Smith", year=2021, item="a")
+    'Smith_2021_a'
+
+    """
+    return Template(SCHEME_TEMPLATES.get(pattern, pattern))
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _parse_spec(name, spec):
+    # parse the spec of a slot into a dictionary of options
+    match = SPEC_PATTERN.fullmatch(spec)
+    if match is None or (match["codec"] or "text") not in CODECS:
+        raise ValueError(f"invalid spec of slot {name!r}: {spec!r}")
+    slot = {
+        "name": name,
+        "codec": match["codec"] or "text",
+        "len_min": int(match["len_min"] or 1),
+        "decimals": int(match["decimals"] or 0),
+    }
+    if slot["codec"] == "text" and (match["len_min"] or match["decimals"]):
+        raise ValueError(f"text slots have no length or decimals: {name!r}")
+    if slot["codec"] in VARIANTS and match["len_min"]:
+        raise ValueError(f"timestamp slots have no length: {name!r}")
+    return slot
+
+
+def _encode_slot(slot, values):
+    # encode the values of a slot into a unicode array
+    if slot["codec"] in ("lat", "lon"):
+        return encode_numbers(
+            _to_float_array(values),
+            decimals=slot["decimals"],
+            len_min=slot["len_min"],
+            is_latitude=slot["codec"] == "lat",
+        )
+    if slot["codec"] in VARIANTS:
+        return encode_timestamps(
+            values,
+            variant=slot["codec"],
+            decimals=slot["decimals"],
+        )
+    if np.asarray(values).dtype.kind in "fcmM":
+        raise ValueError(
+            f"text slot {slot['name']!r} got numbers or timestamps (set a codec)"
+        )
+    texts = _to_str_array(values)
+    codes = _to_codes(texts)
+    if (codes == ord(DOMAIN_SEPARATOR)).any():
+        raise ValueError(
+            f"values of slot {slot['name']!r} have the domain separator "
+            f"{DOMAIN_SEPARATOR!r}"
+        )
+    is_empty = codes[:, 0] == 0
+    if is_empty.any():
+        texts = np.where(is_empty, REPLACERS["null"], texts)
+    return texts
+
+
+def _to_codes(texts):
+    # matrix of code points of a unicode array (one row per string)
+    if texts.dtype.itemsize == 0:
+        texts = texts.astype("<U1")
+    texts = np.ascontiguousarray(texts)
+    return texts.view(np.uint32).reshape(texts.size, -1)
+
+
+def _compose(pieces, size):
+    # concatenate pieces (arrays of one or size strings) side by side
+    ls_codes = []
+    ls_lengths = []
+    for piece in pieces:
+        lengths = np.strings.str_len(piece)
+        ls_codes.append(_to_codes(piece)[:, : int(lengths.max(initial=0))])
+        ls_lengths.append(lengths)
+
+    # --------------- group rows by lengths ---------------
+    # pieces of varying lengths split rows into groups with the same offsets
+    ls_varying = [
+        lengths
+        for lengths in ls_lengths
+        if lengths.size == size and (lengths != lengths[0]).any()
+    ]
+    if ls_varying:
+        matrix = np.stack(ls_varying, axis=1)
+        try:
+            keys = np.ravel_multi_index(matrix.T, matrix.max(axis=0) + 1)
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        except ValueError:
+            # too many combinations of lengths for a flat key
+            _, first, inverse = np.unique(
+                matrix, axis=0, return_index=True, return_inverse=True
+            )
+        order = np.argsort(inverse, kind="stable")
+        counts = np.bincount(inverse, minlength=first.size)
+        ls_groups = [
+            (order[stop - count : stop], row)
+            for stop, count, row in zip(np.cumsum(counts), counts, first)
+        ]
+    else:
+        ls_groups = [(slice(None), 0)]
+
+    # --------------- copy pieces ---------------
+    width = max(
+        sum(int(lengths[row if lengths.size == size else 0]) for lengths in ls_lengths)
+        for _, row in ls_groups
+    )
+    width = max(width, 1)
+    out = np.zeros((size, width), dtype=np.uint32)
+    for rows, row in ls_groups:
+        offset = 0
+        for codes, lengths in zip(ls_codes, ls_lengths):
+            is_column = lengths.size == size
+            n = int(lengths[row if is_column else 0])
+            if n == 0:
+                continue
+            if is_column:
+                out[rows, offset : offset + n] = codes[rows, :n]
+            else:
+                out[rows, offset : offset + n] = codes[0, :n]
+            offset += n
+    return out.view(f"<U{width}").reshape(size)
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class Template:
+    """
+    A label template with named slots, compiled once and rendered in bulk. Use
+    :func:`get_template` to share compiled templates.
+    """
+
+    def __init__(self, pattern):
+        """
+        Compile a template.
+
+        :param pattern: The template, with slots as ``{name}`` or ``{name:spec}`` (see the module overview).
+        :type pattern: str
+        """
+        self.pattern = pattern
+        # pieces: literal texts and slots, in order
+        self.pieces = []
+        self.slots = []
+        try:
+            ls_parsed = list(string.Formatter().parse(pattern))
+        except ValueError as error:
+            raise ValueError(f"invalid template {pattern!r}: {error}") from None
+        for literal, name, spec, conversion in ls_parsed:
+            if literal:
+                self.pieces.append(literal)
+            if name is None:
+                continue
+            if conversion or NAME_PATTERN.fullmatch(name) is None:
+                raise ValueError(f"invalid slot in template {pattern!r}: {name!r}")
+            slot = _parse_spec(name, spec)
+            self.pieces.append(slot)
+            self.slots.append(slot)
+
+    @property
+    def names(self):
+        """
+        The names of slots, in order of first appearance.
+
+        :return: The slot names.
+        :rtype: list
+        """
+        return list(dict.fromkeys(slot["name"] for slot in self.slots))
+
+    def render(self, data=None, as_bytes=False, **values):
+        """
+        Render labels from columns of values.
+
+        With ``as_bytes``, labels are returned as a fixed-width byte array (``S{n}`` dtype,
+        one byte per character), four times smaller than unicode arrays.
+
+        :param data: The values by slot name, as columns. Default value = None
+        :type data: dict or :class:`pandas.DataFrame`
+        :param as_bytes: If True, return a fixed-width byte array of ASCII labels. Default value = False
+        :type as_bytes: bool
+        :param values: More values by slot name, overriding ``data``. Scalars are broadcast to all labels.
+        :return: The labels. A Series with the same index is returned for a DataFrame or Series input (unless ``as_bytes``).
+        :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+
+        **Examples**
+
+        >>> template = Template("INMET_AUTO_{station}_x_{date:tsd}")
+        >>> template.render({"station": ["A001", "A002"], "date": ["2020-01-01", None]}).tolist()
+        ['INMET_AUTO_A001_x_20200101', 'INMET_AUTO_A002_x_x']
+
+        >>> df = pd.DataFrame({"lat": [-30, 4.5], "lon": [-51, 20]})
+        >>> Template("{lat:02.1lat}{lon:03lon}").render(df).tolist()
+        ['s30p0w051', 'n04p5e020']
+
+        """
+        dc_values = (
+            {} if data is None else {n: data[n] for n in self.names if n in data}
+        )
+        dc_values.update(values)
+        ls_missing = [name for name in self.names if name not in dc_values]
+        if ls_missing:
+            raise ValueError(f"missing values of slots: {ls_missing}")
+
+        # --------------- sizes and index ---------------
+        index = data.index if isinstance(data, pd.DataFrame) else None
+        sizes = set()
+        for value in dc_values.values():
+            if np.ndim(value) > 0:
+                sizes.add(len(value))
+                if index is None and isinstance(value, pd.Series):
+                    index = value.index
+        if len(sizes) > 1:
+            raise ValueError(f"values of slots have different lengths: {sorted(sizes)}")
+        size = sizes.pop() if sizes else 1
+        dc_columns = {}
+        for name, value in dc_values.items():
+            if isinstance(value, pd.Series):
+                value = value.to_numpy()
+            dc_columns[name] = (
+                np.asarray(value).reshape(-1) if np.ndim(value) else value
+            )
+
+        # --------------- render chunks ---------------
+        ls_chunks = []
+        for start in range(0, size, CHUNK_SIZE):
+            chunk = self._render_chunk(dc_columns, start, min(start + CHUNK_SIZE, size))
+            ls_chunks.append(_to_bytes_array(chunk) if as_bytes else chunk)
+        if not ls_chunks:
+            ls_chunks = [np.zeros(0, dtype="S1" if as_bytes else "<U1")]
+        labels = np.concatenate(ls_chunks)
+        if as_bytes:
+            return labels
+        if index is not None:
+            return pd.Series(labels, index=index)
+        return labels
+
+    def format(self, **values):
+        """
+        Render a single label (see ``render``).
+
+        :param values: The values by slot name.
+        :return: The label.
+        :rtype: str
+
+        **Examples**
+
+        >>> Template("{item}_{ymin:02lat}{xmin:03lon}").format(item="GLO30", ymin=-30, xmin=-51)
+        'GLO30_s30w051'
+
+        """
+        return str(self.render({name: [value] for name, value in values.items()})[0])
+
+    def _render_chunk(self, dc_columns, start, stop):
+        # encode the slots of a chunk and compose labels
+        size = stop - start
+        pieces = []
+        for piece in self.pieces:
+            if isinstance(piece, str):
+                pieces.append(np.array([piece]))
+                continue
+            value = dc_columns[piece["name"]]
+            if np.ndim(value):
+                pieces.append(_encode_slot(piece, value[start:stop]))
+            else:
+                # scalars are encoded once
+                pieces.append(_encode_slot(piece, np.array([value])))
+        return _compose(pieces, size)
+
+    def __repr__(self):
+        return f"Template({self.pattern!r})"
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    template = Template(
+        "COPERNICUS_COPDEM_{item}_DGTE_{lat:02lat}{lon:03lon}_{date:tsd}"
+    )
+    print(template.format(item="GLO30", lat=-30, lon=-51, date="2011-10-08"))
+    # ... {develop}
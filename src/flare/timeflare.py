@@ -0,0 +1,1208 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Core utilities for encoding and decoding timestamps in Flare labels, including dates,
+times, fractional seconds and timezone offsets.
+
+Features
+--------
+ - Encode timestamps in all variants (``ts``, ``tsh``, ``tsu``, ``tsuh``, ``tsd``, ``tsdh``, ``tsm``, ``tsmh``, ``tsy``)
+ - Decode any variant back into :class:`pandas.Timestamp`
+ - Fractional seconds with the decimal flag (``p``)
+ - Timezone offsets with the Flare number sign flags (``w/e`` or ``s/n``)
+ - Encode and decode whole arrays in bulk, straight from and to ``numpy.datetime64``
+ - Encode and decode epochs (``{start}u{stop}``, stop exclusive)
+ - Index epochs for fast overlap and coverage queries
+
+Overview
+--------
+
+A full timestamp is structured as ``{date}t{time}z{zone}``, where the date is
+``YYYYMMDD``, the time is ``hhmmss`` (optionally with decimals as in ``hhmmssp143``)
+and the zone is a signed ``hhmm`` offset from UTC. Shorter variants drop the zone,
+the time, the day and the month. In human-readable variants, components are
+separated by hyphens, as in ``2014-03-02-t124804-zw0300``.
+For full conceptual details, refer to the Flare documentation on **Date and Time**.
+
+Naive timestamps are taken as UTC. The ``zone`` offset (in minutes) sets the
+wall-clock time written in the label, so that decoding a zoned label gives back
+the same instant. Labels are decoded case-insensitively.
+
+An epoch joins a start and a stop timestamp with the ``u`` flag, as in
+``2000u2020``. The stop is exclusive, so the year 2020 is not part of that epoch.
+
+Examples
+--------
+
+Encoding a timestamp
+
+.. code-block:: python
+
+    # Encode a UTC instant at 3 hours west of UTC, with milliseconds
+    encoded = encode_timestamp("2014-03-02 15:48:04.143", decimals=3, zone=-180)
+    print(encoded)
+    # Output: '20140302t124804p143zw0300'
+
+Decoding a timestamp
+
+.. code-block:: python
+
+    decoded = decode_timestamp("2014-03-02-T124804")
+    print(decoded)
+    # Output: 2014-03-02 12:48:04
+
+Bulk encoding and decoding
+
+.. code-block:: python
+
+    import numpy as np
+
+    stamps = np.array(["2014-03-02T12:48:04", "NaT"], dtype="datetime64[s]")
+    encoded = encode_timestamps(stamps, variant="tsu")
+    print(encoded)
+    # Output: ['20140302t124804' 'x']
+
+    decoded = decode_timestamps(encoded)
+    print(decoded)
+    # Output: ['2014-03-02T12:48:04.000000000' 'NaT']
+
+Epochs and overlap queries
+
+.. code-block:: python
+
+    encoded = encode_epoch("2014-03-02", "2014-03-05")
+    print(encoded)
+    # Output: '20140302u20140305'
+
+    # index labeled assets by epoch and find those covering a date
+    index = EpochIndex.from_labels(["2000u2020", "20140302u20140305", "2021u2022"])
+    print(index.covers("20140304"))
+    # Output: [0 1]
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import re
+import datetime
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.flags import get_registry, lookup
+from flare.numflare import SIGN, DECIMAL, REPLACERS
+from flare.numflare import _to_str_array, _wrap_like
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# flags of datetimes (see flags.get_registry)
+TIME_FLAG = get_registry().datetime_flags["time"]
+ZONE_FLAG = get_registry().datetime_flags["zone"]
+HUMAN_SEPARATOR = get_registry().separators["subdomain"]
+EPOCH_FLAG = get_registry().datetime_flags["epoch"]
+
+# timestamp variants by alias
+VARIANTS = {
+    "ts": {
+        "name": "Full",
+        "signature": "YYYYMMDDthhmmsszshhmm",
+        "precision": "second",
+        "zoned": True,
+        "human": False,
+    },
+    "tsh": {
+        "name": "Full human",
+        "signature": "YYYY-MM-DD-thhmmss-zshhmm",
+        "precision": "second",
+        "zoned": True,
+        "human": True,
+    },
+    "tsu": {
+        "name": "Un-zoned",
+        "signature": "YYYYMMDDthhmmss",
+        "precision": "second",
+        "zoned": False,
+        "human": False,
+    },
+    "tsuh": {
+        "name": "Un-zoned human",
+        "signature": "YYYY-MM-DD-thhmmss",
+        "precision": "second",
+        "zoned": False,
+        "human": True,
+    },
+    "tsd": {
+        "name": "Daily",
+        "signature": "YYYYMMDD",
+        "precision": "day",
+        "zoned": False,
+        "human": False,
+    },
+    "tsdh": {
+        "name": "Daily human",
+        "signature": "YYYY-MM-DD",
+        "precision": "day",
+        "zoned": False,
+        "human": True,
+    },
+    "tsm": {
+        "name": "Monthly",
+        "signature": "YYYYMM",
+        "precision": "month",
+        "zoned": False,
+        "human": False,
+    },
+    "tsmh": {
+        "name": "Monthly human",
+        "signature": "YYYY-MM",
+        "precision": "month",
+        "zoned": False,
+        "human": True,
+    },
+    "tsy": {
+        "name": "Yearly",
+        "signature": "YYYY",
+        "precision": "year",
+        "zoned": False,
+        "human": False,
+    },
+}
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# largest number of decimals of seconds (nanoseconds)
+DECIMALS_LIMIT = 9
+# number of elements processed at once by the bulk codecs
+CHUNK_SIZE = 500_000
+# ticks per second of the supported datetime64 units
+UNITS = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+# positions of the components in ISO strings 'YYYY-MM-DDThh:mm:ss'
+ISO_POSITIONS = {
+    "year": [0, 1, 2, 3],
+    "month": [5, 6],
+    "day": [8, 9],
+    "time": [11, 12, 14, 15, 17, 18],
+}
+# largest absolute zone offset in minutes
+ZONE_LIMIT = 24 * 60
+INT64_MIN = int(np.iinfo(np.int64).min)
+
+_SIGNS = "".join(f for d in SIGN.values() for f in d.values())
+_SIGN_FACTORS = {
+    table[key]: factor
+    for table in SIGN.values()
+    for key, factor in (("positive", 1), ("negative", -1))
+}
+
+# precompiled grammar of timestamps (hyphens are optional between components)
+TIMESTAMP_PATTERN = re.compile(
+    "(?P<year>[0-9]{{4}})"
+    "(?:{h}?(?P<month>[0-9]{{2}})"
+    "(?:{h}?(?P<day>[0-9]{{2}})"
+    "(?:{h}?{t}(?P<hour>[0-9]{{2}})(?P<minute>[0-9]{{2}})(?P<second>[0-9]{{2}})"
+    "(?:{p}(?P<fraction>[0-9]+))?"
+    "(?:{h}?{z}(?P<sign>[{signs}])(?P<zone_hour>[0-9]{{2}})(?P<zone_minute>[0-9]{{2}}))?"
+    ")?)?)?".format(
+        h=re.escape(HUMAN_SEPARATOR),
+        t=re.escape(TIME_FLAG),
+        p=re.escape(DECIMAL),
+        z=re.escape(ZONE_FLAG),
+        signs=re.escape(_SIGNS),
+    ),
+    flags=re.IGNORECASE | re.ASCII,
+)
+# ... {develop}
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def encode_timestamp(timestamp, variant="ts", decimals=0, zone=None, is_latitude=False):
+    """
+    Encodes a timestamp into a Flare timestamp string.
+
+    Naive timestamps are taken as UTC. Aware timestamps keep their own offset unless ``zone`` is given.
+    Seconds are rounded (half up) to ``decimals`` in variants with time; dates are not rounded.
+
+    :param timestamp: The timestamp to encode.
+    :type timestamp: :class:`datetime.datetime`, :class:`pandas.Timestamp`, :class:`numpy.datetime64` or str
+    :param variant: The timestamp variant alias (see ``VARIANTS``). Default value = ``ts``
+    :type variant: str
+    :param decimals: The number of decimal places of seconds, up to 9. Default value = 0
+    :type decimals: int
+    :param zone: The zone offset from UTC in minutes. If None, the offset of the timestamp (or 0) is used.
+    :type zone: int or None
+    :param is_latitude: If True, the zone sign uses latitude flags (``s/n``); otherwise, longitude flags (``w/e``). Default value = False
+    :type is_latitude: bool
+    :return: The encoded timestamp string.
+    :rtype: str
+
+    **Examples**
+
+    >>> encode_timestamp("2014-03-02 15:48:04.143", decimals=3, zone=-180)
+    '20140302t124804p143zw0300'
+
+    >>> encode_timestamp("2014-03-02 12:48:04", variant="tsuh")
+    '2014-03-02-t124804'
+
+    >>> encode_timestamp("2014-03-02", variant="tsm")
+    '201403'
+
+    """
+    dc_variant = _get_variant_spec(variant)
+    _check_decimals(decimals)
+    ts = pd.Timestamp(timestamp)
+    if ts is pd.NaT:
+        raise ValueError("cannot encode a missing timestamp")
+    if ts.tzinfo is not None:
+        if zone is None:
+            zone = int(ts.utcoffset().total_seconds() // 60)
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    zone = 0 if zone is None else int(zone)
+    zone_text = encode_zone(zone, is_latitude=is_latitude)
+    ts = ts + pd.Timedelta(minutes=zone)
+
+    # round seconds to decimals
+    fraction = ts.microsecond * 1_000 + ts.nanosecond
+    if dc_variant["precision"] == "second":
+        q = 10 ** (DECIMALS_LIMIT - decimals)
+        rounded = (fraction + q // 2) // q * q
+        if rounded != fraction:
+            ts = ts + pd.Timedelta(rounded - fraction, unit="ns")
+            fraction = ts.microsecond * 1_000 + ts.nanosecond
+
+    if not 1 <= ts.year <= 9999:
+        raise ValueError(f"year out of the 4-digit range: {ts.year}")
+    iso = (
+        f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}"
+        f"T{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+    )
+    digits = f"{fraction:09d}"
+    ls_chars = []
+    for item in _make_template(variant, decimals, zone_text):
+        if isinstance(item, int):
+            ls_chars.append(iso[item])
+        elif isinstance(item, tuple):
+            ls_chars.append(digits[item[0]])
+        else:
+            ls_chars.append(item)
+    return "".join(ls_chars)
+
+
+def decode_timestamp(encoded_timestamp):
+    """
+    Decodes a Flare timestamp string of any variant into a timestamp.
+
+    Zoned timestamps are decoded as aware timestamps with a fixed offset; other variants as naive timestamps.
+    Decimals of seconds beyond nanoseconds (or microseconds, outside the ``datetime64[ns]`` range) are truncated.
+
+    :param encoded_timestamp: The encoded timestamp string.
+    :type encoded_timestamp: str
+    :return: The decoded timestamp.
+    :rtype: :class:`pandas.Timestamp`
+
+    **Examples**
+
+    >>> decode_timestamp("20140302t124804p143zw0300")
+    Timestamp('2014-03-02 12:48:04.143000-0300', tz='UTC-03:00')
+
+    >>> decode_timestamp("2014-03-02-T124804")
+    Timestamp('2014-03-02 12:48:04')
+
+    >>> decode_timestamp("2014-03")
+    Timestamp('2014-03-01 00:00:00')
+
+    """
+    dc = _match_timestamp(encoded_timestamp).groupdict()
+    tzinfo = None
+    if dc["sign"] is not None:
+        tzinfo = datetime.timezone(
+            datetime.timedelta(
+                minutes=decode_zone(dc["sign"] + dc["zone_hour"] + dc["zone_minute"])
+            )
+        )
+    fraction = int((dc["fraction"] or "")[:DECIMALS_LIMIT].ljust(DECIMALS_LIMIT, "0"))
+    ts = pd.Timestamp(
+        datetime.datetime(
+            year=int(dc["year"]),
+            month=int(dc["month"] or 1),
+            day=int(dc["day"] or 1),
+            hour=int(dc["hour"] or 0),
+            minute=int(dc["minute"] or 0),
+            second=int(dc["second"] or 0),
+            microsecond=fraction // 1_000,
+            tzinfo=tzinfo,
+        )
+    )
+    if fraction % 1_000:
+        try:
+            ts = ts + pd.Timedelta(fraction % 1_000, unit="ns")
+        except pd.errors.OutOfBoundsDatetime:
+            # nanoseconds only exist within the datetime64[ns] range
+            pass
+    return ts
+
+
+def get_variant(encoded_timestamp):
+    """
+    Gets the variant alias of an encoded timestamp.
+
+    :param encoded_timestamp: The encoded timestamp string.
+    :type encoded_timestamp: str
+    :return: The variant alias (see ``VARIANTS``).
+    :rtype: str
+
+    **Examples**
+
+    >>> get_variant("20140302t124804p143zw0300")
+    'ts'
+
+    >>> get_variant("2014-03-02")
+    'tsdh'
+
+    """
+    dc = _match_timestamp(encoded_timestamp).groupdict()
+    human = HUMAN_SEPARATOR in encoded_timestamp
+    if dc["hour"] is not None:
+        precision = "second"
+    elif dc["day"] is not None:
+        precision = "day"
+    elif dc["month"] is not None:
+        precision = "month"
+    else:
+        precision = "year"
+    for alias, dc_variant in VARIANTS.items():
+        if (
+            dc_variant["precision"] == precision
+            and dc_variant["zoned"] == (dc["sign"] is not None)
+            and dc_variant["human"] == (human and precision != "year")
+        ):
+            return alias
+    raise ValueError(f"unknown timestamp variant: {encoded_timestamp!r}")
+
+
+def encode_zone(offset, is_latitude=False):
+    """
+    Encodes a zone offset from UTC into a signed ``hhmm`` string.
+
+    :param offset: The offset from UTC in minutes.
+    :type offset: int
+    :param is_latitude: If True, the sign uses latitude flags (``s/n``); otherwise, longitude flags (``w/e``). Default value = False
+    :type is_latitude: bool
+    :return: The encoded zone.
+    :rtype: str
+
+    **Examples**
+
+    >>> encode_zone(-180)
+    'w0300'
+
+    >>> encode_zone(330, is_latitude=True)
+    'n0530'
+
+    """
+    offset = int(offset)
+    if abs(offset) >= ZONE_LIMIT:
+        raise ValueError(f"zone offset must be within 24 hours: {offset} minutes")
+    sign_table = SIGN["latitude"] if is_latitude else SIGN["longitude"]
+    sign_flag = sign_table["negative"] if offset < 0 else sign_table["positive"]
+    hours, minutes = divmod(abs(offset), 60)
+    return f"{sign_flag}{hours:02d}{minutes:02d}"
+
+
+def decode_zone(encoded_zone):
+    """
+    Decodes a signed ``hhmm`` zone string into an offset from UTC.
+
+    :param encoded_zone: The encoded zone, with or without the zone flag.
+    :type encoded_zone: str
+    :return: The offset from UTC in minutes.
+    :rtype: int
+
+    **Examples**
+
+    >>> decode_zone("w0300")
+    -180
+
+    >>> decode_zone("zE0530")
+    330
+
+    """
+    s = encoded_zone.lower()
+    if s.startswith(ZONE_FLAG):
+        s = s[len(ZONE_FLAG) :]
+    if len(s) != 5 or s[0] not in _SIGN_FACTORS or not s[1:].isdigit():
+        raise ValueError(f"invalid zone: {encoded_zone!r}")
+    hours, minutes = int(s[1:3]), int(s[3:5])
+    if minutes >= 60 or hours * 60 + minutes >= ZONE_LIMIT:
+        raise ValueError(f"invalid zone: {encoded_zone!r}")
+    return _SIGN_FACTORS[s[0]] * (hours * 60 + minutes)
+
+
+def encode_timestamps(
+    timestamps,
+    variant="ts",
+    decimals=0,
+    zone=None,
+    is_latitude=False,
+    replacer=REPLACERS["null"],
+):
+    """
+    Encodes an array of timestamps in bulk, following the same rules of ``encode_timestamp``.
+
+    Timestamps are read as ``numpy.datetime64`` (naive values are UTC) and missing values (``NaT``)
+    are encoded with the ``replacer`` flag. Aware timestamps keep their own offsets unless ``zone``
+    is given.
+
+    :param timestamps: The timestamps to encode.
+    :type timestamps: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param variant: The timestamp variant alias (see ``VARIANTS``). Default value = ``ts``
+    :type variant: str
+    :param decimals: The number of decimal places of seconds, up to 9. Default value = 0
+    :type decimals: int
+    :param zone: The zone offset from UTC in minutes. If None, the offset of each timestamp (or 0) is used.
+    :type zone: int or None
+    :param is_latitude: If True, the zone sign uses latitude flags (``s/n``); otherwise, longitude flags (``w/e``). Default value = False
+    :type is_latitude: bool
+    :param replacer: The flag used for missing values. Default value = ``x``
+    :type replacer: str
+    :return: The encoded timestamp strings. A Series with the same index is returned for a Series input.
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+
+    **Examples**
+
+    >>> stamps = np.array(["2014-03-02T15:48:04.143", "NaT"], dtype="datetime64[ms]")
+    >>> encode_timestamps(stamps, variant="tsh", decimals=3, zone=-180).tolist()
+    ['2014-03-02-t124804p143-zw0300', 'x']
+
+    >>> encode_timestamps(pd.Series(["2021-03-04 05:06:07-03:00"])).tolist()
+    ['20210304t050607zw0300']
+
+    """
+    _get_variant_spec(variant)
+    _check_decimals(decimals)
+    values, offsets = _to_datetime_array(timestamps, with_offsets=True)
+    encoded = _encode_array(
+        values,
+        offsets=offsets if zone is None else None,
+        variant=variant,
+        decimals=decimals,
+        zone=0 if zone is None else int(zone),
+        is_latitude=is_latitude,
+        replacer=replacer,
+    )
+    return _wrap_like(encoded, timestamps)
+
+
+def decode_timestamps(encoded_timestamps, unit="ns"):
+    """
+    Decodes an array of encoded timestamps in bulk, following the same rules of ``decode_timestamp``.
+
+    Zoned timestamps are converted to UTC; other variants are kept as they are.
+    Replacer flags (``x``, ``z``, ``na``, ``o``) and missing values are decoded to ``NaT``.
+
+    :param encoded_timestamps: The encoded timestamp strings.
+    :type encoded_timestamps: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param unit: The ``datetime64`` unit of the output (``s``, ``ms``, ``us`` or ``ns``). Default value = ``ns``
+    :type unit: str
+    :return: The decoded timestamps. A Series with the same index is returned for a Series input.
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+
+    **Examples**
+
+    >>> decode_timestamps(["20140302t124804zw0300", "2014-03", "x"], unit="s").tolist()
+    [datetime.datetime(2014, 3, 2, 15, 48, 4), datetime.datetime(2014, 3, 1, 0, 0), None]
+
+    """
+    if unit not in UNITS:
+        raise ValueError(f"unit must be one of {list(UNITS)}: {unit!r}")
+    labels = _to_str_array(encoded_timestamps)
+    shape = labels.shape
+    labels = np.ascontiguousarray(labels).ravel()
+    ls_chunks = [
+        _decode_chunk(labels=labels[i : i + CHUNK_SIZE], unit=unit)
+        for i in range(0, max(labels.size, 1), CHUNK_SIZE)
+    ]
+    decoded = np.concatenate(ls_chunks).reshape(shape)
+    return _wrap_like(decoded, encoded_timestamps)
+
+
+def encode_epoch(start, stop, variant="tsd", decimals=0, zone=None, is_latitude=False):
+    """
+    Encodes an epoch (time interval) into a Flare epoch string ``{timestamp_start}u{timestamp_stop}``.
+
+    Both timestamps are encoded with the same rules of ``encode_timestamp``. The stop is exclusive.
+
+    :param start: The start of the epoch (inclusive).
+    :type start: :class:`datetime.datetime`, :class:`pandas.Timestamp`, :class:`numpy.datetime64` or str
+    :param stop: The stop of the epoch (exclusive).
+    :type stop: :class:`datetime.datetime`, :class:`pandas.Timestamp`, :class:`numpy.datetime64` or str
+    :param variant: The timestamp variant alias (see ``VARIANTS``). Default value = ``tsd``
+    :type variant: str
+    :param decimals: The number of decimal places of seconds, up to 9. Default value = 0
+    :type decimals: int
+    :param zone: The zone offset from UTC in minutes. If None, the offset of each timestamp (or 0) is used.
+    :type zone: int or None
+    :param is_latitude: If True, the zone sign uses latitude flags (``s/n``); otherwise, longitude flags (``w/e``). Default value = False
+    :type is_latitude: bool
+    :return: The encoded epoch string.
+    :rtype: str
+
+    **Examples**
+
+    >>> encode_epoch("2014-03-02", "2014-03-05")
+    '20140302u20140305'
+
+    >>> encode_epoch("2000", "2020", variant="tsy")
+    '2000u2020'
+
+    """
+    options = dict(
+        variant=variant, decimals=decimals, zone=zone, is_latitude=is_latitude
+    )
+    return (
+        encode_timestamp(start, **options)
+        + EPOCH_FLAG
+        + encode_timestamp(stop, **options)
+    )
+
+
+def decode_epoch(encoded_epoch):
+    """
+    Decodes a Flare epoch string into its start (inclusive) and stop (exclusive) timestamps.
+
+    :param encoded_epoch: The encoded epoch string.
+    :type encoded_epoch: str
+    :return: The start and stop timestamps.
+    :rtype: tuple
+
+    **Examples**
+
+    >>> decode_epoch("2000U2020")
+    (Timestamp('2000-01-01 00:00:00'), Timestamp('2020-01-01 00:00:00'))
+
+    """
+    parts = None
+    if isinstance(encoded_epoch, str):
+        parts = encoded_epoch.lower().split(EPOCH_FLAG)
+    if parts is None or len(parts) != 2:
+        raise ValueError(f"invalid epoch: {encoded_epoch!r}")
+    return decode_timestamp(parts[0]), decode_timestamp(parts[1])
+
+
+def encode_epochs(
+    starts,
+    stops,
+    variant="tsd",
+    decimals=0,
+    zone=None,
+    is_latitude=False,
+    replacer=REPLACERS["null"],
+):
+    """
+    Encodes arrays of epoch starts and stops in bulk, following the same rules of ``encode_epoch``.
+
+    Epochs with a missing start or stop (``NaT``) are encoded with the ``replacer`` flag.
+
+    :param starts: The starts of the epochs (inclusive).
+    :type starts: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param stops: The stops of the epochs (exclusive).
+    :type stops: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param variant: The timestamp variant alias (see ``VARIANTS``). Default value = ``tsd``
+    :type variant: str
+    :param decimals: The number of decimal places of seconds, up to 9. Default value = 0
+    :type decimals: int
+    :param zone: The zone offset from UTC in minutes. If None, the offset of each timestamp (or 0) is used.
+    :type zone: int or None
+    :param is_latitude: If True, the zone sign uses latitude flags (``s/n``); otherwise, longitude flags (``w/e``). Default value = False
+    :type is_latitude: bool
+    :param replacer: The flag used for missing values. Default value = ``x``
+    :type replacer: str
+    :return: The encoded epoch strings. A Series with the same index is returned for a Series input of starts.
+    :rtype: :class:`numpy.ndarray` or :class:`pandas.Series`
+
+    **Examples**
+
+    >>> encode_epochs(["2014-03-02", "NaT"], ["2014-03-05", "2014-03-06"]).tolist()
+    ['20140302u20140305', 'x']
+
+    """
+    _get_variant_spec(variant)
+    _check_decimals(decimals)
+    options = dict(
+        variant=variant,
+        decimals=decimals,
+        zone=0 if zone is None else int(zone),
+        is_latitude=is_latitude,
+        replacer=replacer,
+    )
+    values_start, offsets_start = _to_datetime_array(starts, with_offsets=True)
+    values_stop, offsets_stop = _to_datetime_array(stops, with_offsets=True)
+    encoded_start = _encode_array(
+        values_start, offsets=offsets_start if zone is None else None, **options
+    )
+    encoded_stop = _encode_array(
+        values_stop, offsets=offsets_stop if zone is None else None, **options
+    )
+    encoded = np.char.add(np.char.add(encoded_start, EPOCH_FLAG), encoded_stop)
+    is_null = np.isnat(values_start) | np.isnat(values_stop)
+    if is_null.any():
+        encoded[is_null] = replacer
+    return _wrap_like(encoded, starts)
+
+
+def decode_epochs(encoded_epochs, unit="ns"):
+    """
+    Decodes an array of encoded epochs in bulk, following the same rules of ``decode_epoch``.
+
+    Zoned timestamps are converted to UTC, as in ``decode_timestamps``.
+    Replacer flags (``x``, ``z``, ``na``, ``o``) and missing values are decoded to ``NaT``.
+
+    :param encoded_epochs: The encoded epoch strings.
+    :type encoded_epochs: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param unit: The ``datetime64`` unit of the output (``s``, ``ms``, ``us`` or ``ns``). Default value = ``ns``
+    :type unit: str
+    :return: The starts and stops. Series with the same index are returned for a Series input.
+    :rtype: tuple
+
+    **Examples**
+
+    >>> starts, stops = decode_epochs(["2000U2020", "x"], unit="s")
+    >>> starts.tolist(), stops.tolist()
+    ([datetime.datetime(2000, 1, 1, 0, 0), None], [datetime.datetime(2020, 1, 1, 0, 0), None])
+
+    """
+    labels = _to_str_array(encoded_epochs)
+    lower = np.char.lower(labels)
+    n_flags = np.char.count(lower, EPOCH_FLAG)
+    is_null = np.isin(lower, [r.lower() for r in REPLACERS.values()])
+    is_invalid = ~is_null & (n_flags != 1)
+    if is_invalid.any():
+        raise ValueError(f"invalid epoch: {labels[is_invalid][0]!r}")
+    parts = np.char.partition(np.where(is_null, EPOCH_FLAG, lower), EPOCH_FLAG)
+    replacer = REPLACERS["null"]
+    starts = decode_timestamps(np.where(is_null, replacer, parts[..., 0]), unit=unit)
+    stops = decode_timestamps(np.where(is_null, replacer, parts[..., 2]), unit=unit)
+    return _wrap_like(starts, encoded_epochs), _wrap_like(stops, encoded_epochs)
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _get_variant_spec(variant):
+    # get the variant specification or raise
+    if variant not in VARIANTS:
+        raise ValueError(f"variant must be one of {list(VARIANTS)}: {variant!r}")
+    return VARIANTS[variant]
+
+
+def _check_decimals(decimals):
+    # check the number of decimals of seconds
+    if not 0 <= decimals <= DECIMALS_LIMIT:
+        raise ValueError(f"decimals must be between 0 and {DECIMALS_LIMIT}: {decimals}")
+
+
+def _match_timestamp(encoded_timestamp):
+    # match the timestamp grammar or raise
+    match = None
+    if isinstance(encoded_timestamp, str):
+        match = TIMESTAMP_PATTERN.fullmatch(encoded_timestamp)
+    if match is None:
+        raise ValueError(f"invalid timestamp: {encoded_timestamp!r}")
+    return match
+
+
+def _make_template(variant, decimals, zone_text):
+    # list the characters of a variant: ISO positions (int), fraction digits (tuple) or literals (str)
+    dc_variant = VARIANTS[variant]
+    sep = [HUMAN_SEPARATOR] if dc_variant["human"] else []
+    ls_levels = ["year", "month", "day", "second"]
+    depth = ls_levels.index(dc_variant["precision"])
+    template = list(ISO_POSITIONS["year"])
+    if depth >= 1:
+        template += sep + ISO_POSITIONS["month"]
+    if depth >= 2:
+        template += sep + ISO_POSITIONS["day"]
+    if depth >= 3:
+        template += sep + [TIME_FLAG] + ISO_POSITIONS["time"]
+        if decimals > 0:
+            template += [DECIMAL] + [(j,) for j in range(decimals)]
+        if dc_variant["zoned"]:
+            template += sep + [ZONE_FLAG] + list(zone_text)
+    return template
+
+
+def _to_datetime_array(timestamps, with_offsets=False):
+    # get a datetime64 array (naive UTC) from arrays, Series or sequences, and the
+    # offsets from UTC in minutes of aware timestamps (None if all are naive)
+    offsets = None
+    if isinstance(timestamps, pd.Series):
+        if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+            offsets = _get_offsets(pd.DatetimeIndex(timestamps))
+            timestamps = timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+        values = timestamps.to_numpy()
+        if values.dtype.kind != "M":
+            values, offsets = _to_datetime_array(values, with_offsets=True)
+    else:
+        values = np.asarray(timestamps)
+        if values.dtype.kind != "M":
+            index, offsets = _parse_datetimes(values.ravel())
+            if offsets is not None:
+                offsets = offsets.reshape(values.shape)
+            values = index.to_numpy().reshape(values.shape)
+    if np.datetime_data(values.dtype)[0] not in UNITS:
+        values = values.astype("datetime64[s]")
+    if with_offsets:
+        return values, offsets
+    return values
+
+
+def _parse_datetimes(values):
+    # parse a flat array of timestamps into a naive UTC DatetimeIndex and the offsets
+    # from UTC in minutes (None if all are naive); one format is inferred first, then
+    # mixed formats are parsed one by one, as in the scalar codec
+    for format in (None, "mixed"):
+        try:
+            index = pd.to_datetime(values, format=format)
+        except ValueError:
+            continue
+        if index.tz is None:
+            return index, None
+        return index.tz_convert("UTC").tz_localize(None), _get_offsets(index)
+    # mixed zones (or naive and aware timestamps) take one offset each
+    index = pd.to_datetime(values, format="mixed", utc=True)
+    offsets = np.array(
+        [_get_offset(value) for value in values.tolist()], dtype=np.int64
+    )
+    return index.tz_localize(None), offsets
+
+
+def _get_offsets(index):
+    # offsets from UTC in minutes of an aware DatetimeIndex (0 for NaT)
+    wall = index.tz_localize(None)
+    utc = index.tz_convert("UTC").tz_localize(None)
+    minutes = (wall - utc) // pd.Timedelta(minutes=1)
+    return np.nan_to_num(np.asarray(minutes, dtype=np.float64)).astype(np.int64)
+
+
+def _get_offset(value):
+    # offset from UTC in minutes of a single timestamp (0 for naive or missing ones)
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return 0
+    ts = pd.Timestamp(value)
+    if ts is pd.NaT or ts.tzinfo is None:
+        return 0
+    return int(ts.utcoffset().total_seconds() // 60)
+
+
+def _encode_array(values, offsets, variant, decimals, zone, is_latitude, replacer):
+    # encode a datetime64 array in chunks, with one zone or one offset per timestamp
+    shape = values.shape
+    values = values.ravel()
+    options = dict(variant=variant, decimals=decimals, replacer=replacer)
+    if offsets is None or offsets.size == 0:
+        ls_offsets = [zone]
+    else:
+        offsets = offsets.ravel()
+        ls_offsets = np.unique(offsets).tolist()
+    ls_parts = []
+    for offset in ls_offsets:
+        is_offset = None if len(ls_offsets) == 1 else offsets == offset
+        offset_values = values if is_offset is None else values[is_offset]
+        zone_text = encode_zone(offset, is_latitude=is_latitude)
+        ls_chunks = [
+            _encode_chunk(
+                values=offset_values[i : i + CHUNK_SIZE],
+                zone=int(offset),
+                zone_text=zone_text,
+                **options,
+            )
+            for i in range(0, max(offset_values.size, 1), CHUNK_SIZE)
+        ]
+        ls_parts.append((is_offset, np.concatenate(ls_chunks)))
+    if len(ls_parts) == 1:
+        return ls_parts[0][1].reshape(shape)
+    encoded = np.empty(values.size, dtype=np.result_type(*[p for _, p in ls_parts]))
+    for is_offset, part in ls_parts:
+        encoded[is_offset] = part
+    return encoded.reshape(shape)
+
+
+def _encode_chunk(values, variant, decimals, zone, zone_text, replacer):
+    # write the encoded characters straight into a matrix of unicode code points
+    size = values.size
+    per_second = UNITS[np.datetime_data(values.dtype)[0]]
+    is_null = np.isnat(values)
+    ticks = np.where(is_null, 0, values.view(np.int64)) + zone * 60 * per_second
+
+    # --------------- round seconds to decimals ---------------
+    if VARIANTS[variant]["precision"] == "second":
+        q = max(per_second // 10**decimals, 1)
+        ticks = (ticks + q // 2) // q * q
+    seconds = ticks // per_second
+    fractions = (ticks - seconds * per_second) * (UNITS["ns"] // per_second)
+
+    stamps = seconds.astype("datetime64[s]")
+    years = stamps.astype("datetime64[Y]").astype(np.int64) + 1970
+    is_out = ~is_null & ((years < 1) | (years > 9999))
+    if is_out.any():
+        raise ValueError(f"year out of the 4-digit range: {years[is_out][0]}")
+    iso = np.datetime_as_string(stamps, unit="s").astype("<U19")
+    iso_codes = iso.view(np.uint32).reshape(size, 19)
+
+    template = _make_template(variant, decimals, zone_text)
+    codes = np.empty((size, len(template)), dtype=np.uint32)
+    for j, item in enumerate(template):
+        if isinstance(item, int):
+            codes[:, j] = iso_codes[:, item]
+        elif isinstance(item, tuple):
+            digits = fractions // 10 ** (DECIMALS_LIMIT - 1 - item[0]) % 10
+            codes[:, j] = ord("0") + digits
+        else:
+            codes[:, j] = ord(item)
+    encoded = codes.view(f"<U{max(len(template), 1)}").reshape(size)
+
+    # --------------- handle missing values ---------------
+    if is_null.any():
+        if len(replacer) > len(template):
+            encoded = encoded.astype(f"<U{len(replacer)}")
+        encoded[is_null] = replacer
+    return encoded
+
+
+def _decode_chunk(labels, unit):
+    # parse the characters from a matrix of unicode code points
+    size = labels.size
+    width = max(labels.dtype.itemsize // 4, 1)
+    labels = labels.astype(f"<U{width}")
+    codes = labels.view(np.uint32).reshape(size, width)
+    lengths = np.char.str_len(labels)
+    rows = np.arange(size)
+
+    # --------------- handle replacers ---------------
+    is_null = np.zeros(size, dtype=bool)
+    for replacer in REPLACERS.values():
+        if len(replacer) > width:
+            continue
+        is_replacer = lengths == len(replacer)
+        for k, char in enumerate(replacer.lower()):
+            is_replacer &= _lower(codes[:, k]) == ord(char)
+        is_null |= is_replacer
+
+    # --------------- handle human separators ---------------
+    is_valid = np.ones(size, dtype=bool)
+    is_hyphen = codes == ord(HUMAN_SEPARATOR)
+    has_hyphen = is_hyphen.any()
+    if has_hyphen:
+        # compact position of each hyphen, then move hyphens to the end of rows
+        hyphen_index = np.arange(width) - (np.cumsum(is_hyphen, axis=1) - is_hyphen)
+        order = np.argsort(is_hyphen, axis=1, kind="stable")
+        codes = np.take_along_axis(codes, order, axis=1)
+        lengths = lengths - is_hyphen.sum(axis=1)
+    n_columns = max(width, 21)
+    if n_columns > width:
+        codes = np.pad(codes, ((0, 0), (0, n_columns - width)))
+    columns = np.arange(n_columns)
+
+    # --------------- handle layout ---------------
+    # {date}[t{hhmmss}[p{fraction}][z{sign}{hhmm}]] with the date of 4, 6 or 8 digits
+    has_time = lengths >= 15
+    zone_start = np.maximum(lengths - 6, 0)
+    has_zone = (
+        has_time & (lengths >= 21) & (_lower(codes[rows, zone_start]) == ord(ZONE_FLAG))
+    )
+    body_end = np.where(has_zone, zone_start, lengths)
+    has_fraction = has_time & (body_end > 15)
+    is_valid &= np.isin(lengths, [4, 6, 8]) | (has_time & (body_end != 16))
+    is_valid &= ~has_time | (_lower(codes[:, 8]) == ord(TIME_FLAG))
+    is_valid &= ~has_fraction | (_lower(codes[:, 15]) == ord(DECIMAL))
+    zone_signs = _lower(codes[rows, np.minimum(zone_start + 1, n_columns - 1)])
+    is_valid &= ~has_zone | (lookup(get_registry().sign_factors, zone_signs) != 0)
+    # all other characters are digits
+    is_other = (columns >= lengths[:, None]) | (codes - ord("0") <= 9)
+    is_other[:, 8] |= has_time
+    is_other[:, 15] |= has_fraction
+    is_other[rows[has_zone], zone_start[has_zone]] = True
+    is_other[rows[has_zone], zone_start[has_zone] + 1] = True
+    is_valid &= is_other.all(axis=1)
+    if has_hyphen:
+        # hyphens only before month, day, time and zone
+        allowed = (
+            (hyphen_index == 4)
+            | (hyphen_index == 6)
+            | ((hyphen_index == 8) & has_time[:, None])
+            | ((hyphen_index == zone_start[:, None]) & has_zone[:, None])
+        ) & (hyphen_index < lengths[:, None])
+        double = is_hyphen[:, 1:] & is_hyphen[:, :-1]
+        is_valid &= ~(is_hyphen & ~allowed).any(axis=1) & ~double.any(axis=1)
+
+    # --------------- handle components ---------------
+    def number(ls_columns):
+        value = np.zeros(size, dtype=np.int64)
+        for k in ls_columns:
+            value = 10 * value + (codes[:, k].astype(np.int64) - ord("0"))
+        return value
+
+    years = number(range(0, 4))
+    months = np.where(lengths >= 6, number(range(4, 6)), 1)
+    days = np.where(lengths >= 8, number(range(6, 8)), 1)
+    hours = np.where(has_time, number(range(9, 11)), 0)
+    minutes = np.where(has_time, number(range(11, 13)), 0)
+    seconds = np.where(has_time, number(range(13, 15)), 0)
+    fractions = np.zeros(size, dtype=np.int64)
+    for j, k in enumerate(range(16, min(16 + DECIMALS_LIMIT, n_columns))):
+        in_fraction = has_fraction & (k < body_end)
+        digits = codes[:, k].astype(np.int64) - ord("0")
+        fractions += np.where(in_fraction, digits, 0) * 10 ** (DECIMALS_LIMIT - 1 - j)
+    zone_codes = np.take_along_axis(
+        codes, np.minimum(zone_start[:, None] + np.arange(2, 6), n_columns - 1), axis=1
+    ).astype(np.int64) - ord("0")
+    zone_hours = zone_codes[:, 0] * 10 + zone_codes[:, 1]
+    zone_minutes = zone_codes[:, 2] * 10 + zone_codes[:, 3]
+    zone_factors = np.where(lookup(get_registry().sign_factors, zone_signs) < 0, -1, 1)
+    offsets = np.where(has_zone, zone_factors * (zone_hours * 60 + zone_minutes), 0)
+
+    # --------------- check ranges ---------------
+    is_valid &= (years >= 1) & (months >= 1) & (months <= 12)
+    month_starts = np.where(is_valid, (years - 1970) * 12 + (months - 1), 0).astype(
+        "datetime64[M]"
+    )
+    day_starts = month_starts.astype("datetime64[D]")
+    month_days = ((month_starts + 1).astype("datetime64[D]") - day_starts).astype(
+        np.int64
+    )
+    is_valid &= (days >= 1) & (days <= month_days)
+    is_valid &= (hours < 24) & (minutes < 60) & (seconds < 60)
+    is_valid &= ~has_zone | (
+        (zone_minutes < 60) & (zone_hours * 60 + zone_minutes < ZONE_LIMIT)
+    )
+    if unit == "ns":
+        # keep clear of the datetime64[ns] limits (years 1677 and 2262)
+        is_valid &= (years > 1677) & (years < 2262)
+
+    # --------------- assemble ---------------
+    per_second = UNITS[unit]
+    total_seconds = hours * 3600 + minutes * 60 + seconds - offsets * 60
+    ticks = (day_starts + np.where(is_valid, days - 1, 0)).astype(
+        f"datetime64[{unit}]"
+    ).view(np.int64) + np.where(
+        is_valid,
+        total_seconds * per_second + fractions // (UNITS["ns"] // per_second),
+        0,
+    )
+    decoded = ticks.view(f"datetime64[{unit}]")
+
+    # anything unusual falls back to the scalar decoder (same result or error)
+    fallback = ~(is_valid | is_null)
+    if fallback.any():
+        decoded[fallback] = [
+            _to_datetime64(decode_timestamp(s), unit) for s in labels[fallback]
+        ]
+    decoded[is_null] = np.datetime64("NaT")
+    return decoded
+
+
+def _lower(codes):
+    # lowercase ASCII code points
+    return codes + 32 * ((codes >= ord("A")) & (codes <= ord("Z")))
+
+
+def _to_datetime64(ts, unit):
+    # convert a timestamp to a naive UTC datetime64 of a given unit
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    if unit == "ns" and not pd.Timestamp.min <= ts <= pd.Timestamp.max:
+        raise ValueError(f"timestamp out of the datetime64[ns] range: {ts}")
+    return ts.to_datetime64().astype(f"datetime64[{unit}]")
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class EpochIndex:
+    """
+    A static index of epochs for fast overlap queries.
+
+    Epochs are binned by the order of magnitude of their durations and sorted by start
+    in each bin. A query only scans, in each bin, the epochs starting within the query
+    range widened by the longest duration of the bin, so queries run in logarithmic
+    time plus the number of hits. Epochs with missing or non-positive durations are
+    not indexed.
+
+    Queries return the sorted positions of the matching epochs in the input arrays.
+    """
+
+    def __init__(self, starts, stops, unit="ns"):
+        """
+        Initialize the index from arrays of epoch starts and stops.
+
+        :param starts: The starts of the epochs (inclusive).
+        :type starts: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param stops: The stops of the epochs (exclusive).
+        :type stops: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param unit: The ``datetime64`` unit of the index (``s``, ``ms``, ``us`` or ``ns``). Default value = ``ns``
+        :type unit: str
+        """
+        if unit not in UNITS:
+            raise ValueError(f"unit must be one of {list(UNITS)}: {unit!r}")
+        self.unit = unit
+        self.starts = _to_datetime_array(starts).ravel().astype(f"datetime64[{unit}]")
+        self.stops = _to_datetime_array(stops).ravel().astype(f"datetime64[{unit}]")
+        if self.starts.shape != self.stops.shape:
+            raise ValueError("starts and stops must have the same size")
+        self.size = self.starts.size
+
+        ticks_start = self.starts.view(np.int64)
+        ticks_stop = self.stops.view(np.int64)
+        is_valid = ~(np.isnat(self.starts) | np.isnat(self.stops))
+        is_valid &= ticks_stop > ticks_start
+        ids = np.flatnonzero(is_valid)
+        durations = ticks_stop[ids] - ticks_start[ids]
+        bins = np.floor(np.log2(durations)).astype(np.int64)
+
+        # --------------- build bins ---------------
+        self._bins = []
+        for b in np.unique(bins):
+            ids_bin = ids[bins == b]
+            order = np.argsort(ticks_start[ids_bin], kind="stable")
+            ids_bin = ids_bin[order]
+            self._bins.append(
+                (
+                    int((ticks_stop[ids_bin] - ticks_start[ids_bin]).max()),
+                    ticks_start[ids_bin],
+                    ticks_stop[ids_bin],
+                    ids_bin,
+                )
+            )
+
+    @classmethod
+    def from_labels(cls, encoded_epochs, unit="ns"):
+        """
+        Make an index from encoded epochs.
+
+        :param encoded_epochs: The encoded epoch strings.
+        :type encoded_epochs: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+        :param unit: The ``datetime64`` unit of the index (``s``, ``ms``, ``us`` or ``ns``). Default value = ``ns``
+        :type unit: str
+        :return: The epoch index.
+        :rtype: :class:`EpochIndex`
+
+        **Examples**
+
+        >>> index = EpochIndex.from_labels(["2000u2020", "20140302u20140305", "x"])
+        >>> index.covers("2014-03-04").tolist()
+        [0, 1]
+
+        >>> index.overlaps("2020", "2021").tolist()
+        []
+
+        """
+        starts, stops = decode_epochs(np.asarray(encoded_epochs), unit=unit)
+        return cls(starts, stops, unit=unit)
+
+    def overlaps(self, start, stop):
+        """
+        Find the epochs that overlap a time range.
+
+        :param start: The start of the range (inclusive). Flare timestamps are accepted.
+        :type start: :class:`datetime.datetime`, :class:`pandas.Timestamp`, :class:`numpy.datetime64` or str
+        :param stop: The stop of the range (exclusive). Flare timestamps are accepted.
+        :type stop: :class:`datetime.datetime`, :class:`pandas.Timestamp`, :class:`numpy.datetime64` or str
+        :return: The sorted positions of the overlapping epochs.
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._query(self._to_ticks(start), self._to_ticks(stop))
+
+    def covers(self, timestamp):
+        """
+        Find the epochs that cover a timestamp.
+
+        :param timestamp: The timestamp. Flare timestamps are accepted.
+        :type timestamp: :class:`datetime.datetime`, :class:`pandas.Timestamp`, :class:`numpy.datetime64` or str
+        :return: The sorted positions of the covering epochs.
+        :rtype: :class:`numpy.ndarray`
+        """
+        ticks = self._to_ticks(timestamp)
+        return self._query(ticks, ticks + 1)
+
+    def _query(self, ticks_start, ticks_stop):
+        # epochs with start < stop of the range and stop > start of the range
+        ls_hits = []
+        for max_duration, starts, stops, ids in self._bins:
+            # starts within (start - longest duration, stop)
+            lower = max(ticks_start - max_duration, INT64_MIN) + 1
+            i, j = starts.searchsorted([lower, ticks_stop])
+            if j > i:
+                ls_hits.append(ids[i:j][stops[i:j] > ticks_start])
+        if not ls_hits:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(ls_hits))
+
+    def _to_ticks(self, timestamp):
+        # get the integer ticks (naive UTC) of a timestamp
+        if isinstance(timestamp, str) and TIMESTAMP_PATTERN.fullmatch(timestamp):
+            ts = decode_timestamp(timestamp)
+        else:
+            ts = pd.Timestamp(timestamp)
+        return int(_to_datetime64(ts, self.unit).view(np.int64))
+
+    def __len__(self):
+        return self.size
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    s = encode_timestamp("2014-03-02 15:48:04.143", decimals=3, zone=-180)
+    print(s)
+    print(decode_timestamp(s))
+    # ... {develop}
@@ -0,0 +1,308 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Incremental tracker of the latest version of each group of Flare-labeled files,
+updated by file events instead of rescanning.
+
+Features
+--------
+ - Track the latest version of each ``{type}_{project}_{item}`` group
+ - Add and remove files in ``O(log n)`` per event
+ - Add many files at once with the bulk parsers
+ - Apply the changes of a polling ``crawler.Watcher``
+
+Overview
+--------
+
+Each group keeps a heap of its files ordered by ``versions.version_key``, so the
+latest file is on top. Removed files are only marked as gone and dropped when they
+reach the top (lazy deletion); a heap is rebuilt when more than half of its entries
+are gone, so memory stays bounded under long runs of events. Ties keep the file
+added last, as in ``versions.find_latest``.
+
+Files with invalid labels, invalid versions or replacers as versions are ignored.
+
+Examples
+--------
+
+Keep the latest version of each asset of a directory
+
+.. code-block:: python
+
+    tracker = VersionTracker()
+    watcher = Watcher("/archive", interval=5.0)
+    for changes in watcher.watch():
+        for group in tracker.apply(changes):
+            print(group, tracker.latest(group))
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import heapq
+import itertools
+import os
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import SCHEMES, parse, parse_many
+from flare.versions import version_key, version_keys
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# domains of the groups of versions
+GROUP_DOMAINS = ("type", "project", "item")
+# number of events parsed one by one (more are parsed in bulk)
+BULK_SIZE_MIN = 64
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class VersionTracker:
+    """
+    An incremental tracker of the latest version of each group of files.
+    """
+
+    def __init__(self, scheme="generic", group_domains=GROUP_DOMAINS):
+        """
+        Initialize an empty tracker.
+
+        :param scheme: The labeling scheme, with a ``version`` domain. Default value = ``generic``
+        :type scheme: str
+        :param group_domains: The domains of the groups. Default value = ``("type", "project", "item")``
+        :type group_domains: tuple
+        """
+        if "version" not in SCHEMES.get(scheme, []):
+            raise ValueError(f"scheme must have a version domain: {scheme!r}")
+        ls_missing = [d for d in group_domains if d not in SCHEMES[scheme]]
+        if ls_missing:
+            raise ValueError(f"unknown domains of the {scheme} scheme: {ls_missing}")
+        self.scheme = scheme
+        self.group_domains = tuple(group_domains)
+        # heap entries are (-kind, -value, -order, path), so the latest is on top
+        self._heaps = {}
+        self._n_gone = {}
+        self._entries = {}
+        self._order = itertools.count()
+
+    def add(self, path):
+        """
+        Add a file. Files already tracked and files without a valid version are ignored.
+
+        :param path: The file path.
+        :type path: str or :class:`pathlib.Path`
+        :return: True if the latest file of its group changed.
+        :rtype: bool
+        """
+        ls_parsed = self._parse([path])
+        if not ls_parsed:
+            return False
+        self._push_many(ls_parsed)
+        path, group, _ = ls_parsed[0]
+        return self.latest(group) == path
+
+    def add_many(self, paths):
+        """
+        Add many files at once, with the bulk parsers.
+
+        :param paths: The file paths.
+        :type paths: list
+        :return: The groups whose latest file changed.
+        :rtype: set
+        """
+        return self.apply({"added": paths})
+
+    def remove(self, path):
+        """
+        Remove a file. Files not tracked are ignored.
+
+        :param path: The file path.
+        :type path: str or :class:`pathlib.Path`
+        :return: True if the latest file of its group changed.
+        :rtype: bool
+        """
+        path = os.fspath(path)
+        group = self._entries.get(path, (None,))[0]
+        if group is None:
+            return False
+        latest = self.latest(group)
+        del self._entries[path]
+        self._n_gone[group] += 1
+        heap = self._heaps[group]
+        if 2 * self._n_gone[group] > len(heap):
+            # rebuild heaps with mostly gone entries
+            heap[:] = [e for e in heap if self._entries.get(e[3], (None,))[-1] is e]
+            heapq.heapify(heap)
+            self._n_gone[group] = 0
+        return latest == path
+
+    def apply(self, changes):
+        """
+        Apply the changes of a ``crawler.Watcher`` poll.
+
+        Updated files keep their labels, so only added and removed files change the versions.
+
+        :param changes: Lists of ``added`` and ``removed`` file paths (see ``crawler.Watcher.poll``).
+        :type changes: dict
+        :return: The groups whose latest file changed.
+        :rtype: set
+        """
+        ls_removed = [os.fspath(p) for p in changes.get("removed", [])]
+        ls_parsed = self._parse(changes.get("added", []))
+        set_groups = {self._entries[p][0] for p in ls_removed if p in self._entries}
+        set_groups.update(group for _, group, _ in ls_parsed)
+        dc_before = {group: self.latest(group) for group in set_groups}
+        for path in ls_removed:
+            self.remove(path)
+        self._push_many(ls_parsed)
+        return {
+            group for group, path in dc_before.items() if self.latest(group) != path
+        }
+
+    def latest(self, group):
+        """
+        Get the latest file of a group.
+
+        :param group: The texts of the group domains (``None`` for replacers).
+        :type group: tuple
+        :return: The path of the latest file, or None if the group has no files.
+        :rtype: str or None
+        """
+        heap = self._heaps.get(group)
+        if heap is None:
+            return None
+        # drop gone entries from the top
+        while heap and self._entries.get(heap[0][3], (None,))[-1] is not heap[0]:
+            heapq.heappop(heap)
+            self._n_gone[group] -= 1
+        if not heap:
+            del self._heaps[group], self._n_gone[group]
+            return None
+        return heap[0][3]
+
+    def latest_files(self):
+        """
+        Get the latest file of all groups.
+
+        :return: The path of the latest file by group.
+        :rtype: dict
+        """
+        dc_latest = {group: self.latest(group) for group in list(self._heaps)}
+        return {group: path for group, path in dc_latest.items() if path is not None}
+
+    def _parse(self, paths):
+        # parse paths into (path, group, key) tuples, skipping tracked and invalid files
+        ls_paths = list(dict.fromkeys(os.fspath(p) for p in paths))
+        ls_paths = [p for p in ls_paths if p not in self._entries]
+        if len(ls_paths) < BULK_SIZE_MIN:
+            ls_parsed = []
+            for path in ls_paths:
+                try:
+                    record = parse(path, scheme=self.scheme)
+                    key = version_key(record["version"] or "")
+                except ValueError:
+                    continue
+                group = tuple(record[d] for d in self.group_domains)
+                ls_parsed.append((path, group, key))
+            return ls_parsed
+        df = parse_many(ls_paths, scheme=self.scheme, errors="coerce", typed=False)
+        kinds, values = version_keys(df["version"])
+        rows = np.flatnonzero(kinds >= 0)
+        ls_columns = [
+            df[domain].to_numpy(dtype=object, na_value=None)[rows].tolist()
+            for domain in self.group_domains
+        ]
+        return list(
+            zip(
+                np.asarray(ls_paths)[rows].tolist(),
+                zip(*ls_columns),
+                zip(kinds[rows].tolist(), values[rows].tolist()),
+            )
+        )
+
+    def _push_many(self, ls_parsed):
+        # push files by group, heapifying groups with more new files than old ones
+        dc_entries = {}
+        for path, group, key in ls_parsed:
+            entry = (-key[0], -key[1], -next(self._order), path)
+            dc_entries.setdefault(group, []).append(entry)
+            self._entries[path] = (group, entry)
+        for group, ls_entries in dc_entries.items():
+            heap = self._heaps.setdefault(group, [])
+            self._n_gone.setdefault(group, 0)
+            if len(ls_entries) > len(heap):
+                heap.extend(ls_entries)
+                heapq.heapify(heap)
+            else:
+                for entry in ls_entries:
+                    heapq.heappush(heap, entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return os.fspath(path) in self._entries
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    tracker = VersionTracker()
+    tracker.add_many(["REPORT_A_B_V101_X.pdf", "REPORT_A_B_1.2.0_X.pdf"])
+    print(tracker.latest_files())
+    # ... {develop}
@@ -0,0 +1,515 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Validator of Flare labels of files, fields and layers, reporting the span and the
+rule of each error.
+
+Features
+--------
+ - Rules of each asset type compiled once into a deterministic finite automaton (DFA)
+ - Check separators, empty domains and subdomains, allowed characters and extensions
+ - Check the domains of file labeling schemes and their typed domains (years,
+   versions, extents and datetimes)
+ - Validate a single label or millions of labels at once
+ - Errors reported as ``(row, start, stop, error)`` records
+
+Overview
+--------
+
+The rules follow the Flare documentation on **Assets** and **Literal Flags**:
+
+.. list-table::
+   :header-rows: 1
+
+   * - Asset
+     - Characters
+     - Subdomains (``-``)
+     - Extensions (``.``)
+   * - ``file``
+     - letters (any alphabet) and digits
+     - yes
+     - yes
+   * - ``field``
+     - ASCII letters and digits
+     - no
+     - no
+   * - ``layer``
+     - ASCII letters and digits
+     - yes (discouraged)
+     - no
+
+Domains are separated by ``_`` and may not be empty; subdomains are separated by
+``-`` and may not be empty either. Other characters (spaces, punctuation) are
+replaced by literal flags in Flare labels, so they are errors.
+
+Each asset type has a DFA whose input symbols are character classes. The bulk
+validator maps a matrix of code points to classes with a lookup table and runs the
+DFA one column at a time for all labels at once, with one table lookup per column.
+Errors are sticky states of the DFA, so the first error of a label stops it and its
+position is the number of steps taken.
+
+For files, an optional scheme (see ``labels.SCHEMES``) adds the number of domains and
+typed domains: malformed years, versions, numeric extents and datetimes are reported
+with the span of their domain. Replacers are valid in any domain but years. The
+extension follows the first dot of the last domain: dots of earlier domains are
+left to schemes, which only allow them in versions (as in ``1.0.3``).
+
+Examples
+--------
+
+Validate a label
+
+.. code-block:: python
+
+    validate("temp-max_2020", asset="field")
+    # Output: [(4, 5, 'hyphen')]
+
+Validate a column of field names
+
+.. code-block:: python
+
+    df_errors = validate_many(df.columns, asset="field")
+    print(df_errors["error"].map(ERRORS))
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import re
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.extents import LATITUDE_SIGNS, LONGITUDE_SIGNS, decode_extents
+from flare.labels import DOMAIN_SEPARATOR, SUBDOMAIN_SEPARATOR, EXTENSION_SEPARATOR
+from flare.labels import SCHEMES, _decode_datetimes, _gather, _is_replacer
+from flare.numflare import _to_str_array
+from flare.versions import version_keys
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# rules of each asset type
+ASSETS = {
+    "file": {"ascii": False, "subdomains": True, "extension": True},
+    "field": {"ascii": True, "subdomains": False, "extension": False},
+    "layer": {"ascii": True, "subdomains": True, "extension": False},
+}
+# error codes and messages
+ERRORS = {
+    "empty_domain": "empty domain",
+    "empty_subdomain": "empty subdomain",
+    "empty_extension": "empty extension",
+    "character": "character not allowed",
+    "non_ascii": "non-ASCII character",
+    "hyphen": "subdomain separator not allowed",
+    "dot": "extension not allowed",
+    "domains": "wrong number of domains",
+    "year": "malformed year",
+    "version": "malformed version",
+    "extent": "malformed extent",
+    "datetime": "malformed datetime",
+}
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# number of labels processed at once by the bulk validator
+CHUNK_SIZE = 500_000
+
+# character classes (input symbols of the automata)
+CLASSES = ["end", "alnum", "domain", "subdomain", "extension", "other", "non_ascii"]
+# class of each code point (non-ASCII code points share the last entry)
+CLASS_TABLE = np.full(129, CLASSES.index("other"), dtype=np.uint8)
+CLASS_TABLE[0] = CLASSES.index("end")
+for _code in range(128):
+    if chr(_code).isalnum():
+        CLASS_TABLE[_code] = CLASSES.index("alnum")
+CLASS_TABLE[ord(DOMAIN_SEPARATOR)] = CLASSES.index("domain")
+CLASS_TABLE[ord(SUBDOMAIN_SEPARATOR)] = CLASSES.index("subdomain")
+CLASS_TABLE[ord(EXTENSION_SEPARATOR)] = CLASSES.index("extension")
+CLASS_TABLE[128] = CLASSES.index("non_ascii")
+
+# states of the automata: errors follow the accept state
+STATES = ["domain", "text", "subdomain", "extension", "extension_text", "accept"]
+ACCEPT = STATES.index("accept")
+# errors reported by the automata (the others come from schemes)
+DFA_ERRORS = [
+    "empty_domain",
+    "empty_subdomain",
+    "empty_extension",
+    "character",
+    "non_ascii",
+    "hyphen",
+    "dot",
+]
+# transition tables, compiled once per asset type
+TABLES = {}
+
+# extents that look like numbers (a sign followed by a digit)
+EXTENT_NUMBER_PATTERN = re.compile(
+    "[{}][0-9]".format(re.escape(LATITUDE_SIGNS + LONGITUDE_SIGNS)), re.IGNORECASE
+)
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def validate(label, asset="file", scheme=None):
+    """
+    Validates a label, following the same rules of ``validate_many``.
+
+    :param label: The label.
+    :type label: str
+    :param asset: The asset type (see ``ASSETS``). Default value = ``file``
+    :type asset: str
+    :param scheme: The labeling scheme of files (see ``labels.SCHEMES``). If None, domains are not checked.
+    :type scheme: str or None
+    :return: The errors, as ``(start, stop, error)`` tuples (see ``ERRORS``). Empty for valid labels.
+    :rtype: list
+
+    **Examples**
+
+    >>> validate("REPORT_A002_F005_V002_X.pdf", scheme="generic")
+    []
+
+    >>> validate("temp-max_2020", asset="field")
+    [(4, 5, 'hyphen')]
+
+    >>> validate("Smith_21_a.pdf", scheme="reference")
+    [(6, 8, 'year')]
+
+    """
+    table = _get_table(asset)
+    state = 0
+    for i, char in enumerate(label + "\0"):
+        state = int(table[state + CLASS_TABLE[min(ord(char), 128)]])
+        if state > ACCEPT * len(CLASSES):
+            # errors at the end of labels point to their last character
+            start = min(i, max(len(label) - 1, 0))
+            return [(start, min(start + 1, len(label)), _error(state))]
+    if scheme is None:
+        return []
+    df = validate_many([label], asset=asset, scheme=scheme)
+    return list(df[["start", "stop", "error"]].itertuples(index=False, name=None))
+
+
+def validate_many(labels, asset="file", scheme=None):
+    """
+    Validates many labels at once against the rules of an asset type.
+
+    Only the first error of the structure of a label (separators, characters, extensions)
+    is reported. Labels with a valid structure are checked against the scheme (if any),
+    with one error per malformed domain.
+
+    :param labels: The labels.
+    :type labels: :class:`numpy.ndarray`, :class:`pandas.Series`, :class:`pandas.Index` or list
+    :param asset: The asset type (see ``ASSETS``). Default value = ``file``
+    :type asset: str
+    :param scheme: The labeling scheme of files (see ``labels.SCHEMES``). If None, domains are not checked.
+    :type scheme: str or None
+    :return: The errors, one row per error with the ``row`` of the label, the ``start`` and ``stop`` of the span and the ``error`` code (see ``ERRORS``), sorted by row.
+    :rtype: :class:`pandas.DataFrame`
+
+    **Examples**
+
+    >>> df = validate_many(["temp_max", "temp__max", "temp max", "tmp.csv"], asset="field")
+    >>> df.to_numpy().tolist()
+    [[1, 5, 6, 'empty_domain'], [2, 4, 5, 'character'], [3, 3, 4, 'dot']]
+
+    """
+    table = _get_table(asset)
+    if scheme is not None:
+        if scheme not in SCHEMES:
+            raise ValueError(f"scheme must be one of {list(SCHEMES)}: {scheme!r}")
+        if asset != "file":
+            raise ValueError(f"schemes only apply to files: {asset!r}")
+    if isinstance(labels, pd.Index):
+        labels = labels.to_numpy(dtype=object)
+    labels = np.ascontiguousarray(_to_str_array(labels)).ravel()
+
+    ls_errors = []
+    for i in range(0, labels.size, CHUNK_SIZE):
+        chunk = labels[i : i + CHUNK_SIZE]
+        rows, starts, stops, codes, valid = _run_chunk(chunk, table)
+        ls_errors.append((rows + i, starts, stops, np.array(DFA_ERRORS)[codes]))
+        if scheme is not None and valid.any():
+            ls_errors.extend(
+                (rows + i, starts, stops, errors)
+                for rows, starts, stops, errors in _check_scheme(chunk, valid, scheme)
+            )
+
+    if not ls_errors:
+        return pd.DataFrame(
+            {
+                "row": np.zeros(0, dtype=np.int64),
+                "start": np.zeros(0, dtype=np.int64),
+                "stop": np.zeros(0, dtype=np.int64),
+                "error": np.zeros(0, dtype=str),
+            }
+        )
+    rows, starts, stops, errors = (np.concatenate(parts) for parts in zip(*ls_errors))
+    order = np.argsort(rows, kind="stable")
+    return pd.DataFrame(
+        {
+            "row": rows[order].astype(np.int64),
+            "start": starts[order].astype(np.int64),
+            "stop": stops[order].astype(np.int64),
+            "error": errors[order].astype(object),
+        }
+    )
+
+
+def is_valid(labels, asset="file", scheme=None):
+    """
+    Checks many labels at once, following the same rules of ``validate_many``.
+
+    :param labels: The labels.
+    :type labels: :class:`numpy.ndarray`, :class:`pandas.Series`, :class:`pandas.Index` or list
+    :param asset: The asset type (see ``ASSETS``). Default value = ``file``
+    :type asset: str
+    :param scheme: The labeling scheme of files (see ``labels.SCHEMES``). If None, domains are not checked.
+    :type scheme: str or None
+    :return: A mask of valid labels.
+    :rtype: :class:`numpy.ndarray`
+
+    **Examples**
+
+    >>> is_valid(["temp_max", "temp-max"], asset="field").tolist()
+    [True, False]
+
+    """
+    size = labels.size if isinstance(labels, np.ndarray) else len(labels)
+    mask = np.ones(size, dtype=bool)
+    mask[validate_many(labels, asset=asset, scheme=scheme)["row"].to_numpy()] = False
+    return mask
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _compile_table(asset):
+    # transition table of the automaton of an asset type, flattened by state and class
+    rules = ASSETS[asset]
+    n_states = len(STATES) + len(DFA_ERRORS)
+    state = {name: i for i, name in enumerate(STATES)}
+    error = {name: len(STATES) + i for i, name in enumerate(DFA_ERRORS)}
+    c = {name: i for i, name in enumerate(CLASSES)}
+    table = np.zeros((n_states, len(CLASSES)), dtype=np.uint8)
+
+    # defaults: text characters and errors
+    table[:, c["other"]] = error["character"]
+    table[:, c["non_ascii"]] = error["non_ascii"]
+    table[:, c["subdomain"]] = error["hyphen"]
+    table[:, c["extension"]] = error["dot"]
+    for name in ["domain", "text", "subdomain"]:
+        table[state[name], c["alnum"]] = state["text"]
+        if not rules["ascii"]:
+            table[state[name], c["non_ascii"]] = state["text"]
+    for name in ["extension", "extension_text"]:
+        table[state[name], c["alnum"]] = state["extension_text"]
+        table[state[name], [c["domain"], c["subdomain"]]] = error["character"]
+
+    # separators
+    table[state["domain"], [c["end"], c["domain"]]] = error["empty_domain"]
+    table[state["text"], c["domain"]] = state["domain"]
+    table[state["text"], c["end"]] = state["accept"]
+    ls_empty = [c["end"], c["domain"], c["subdomain"], c["extension"]]
+    if rules["subdomains"]:
+        table[state["domain"], c["subdomain"]] = error["empty_subdomain"]
+        table[state["text"], c["subdomain"]] = state["subdomain"]
+        table[state["subdomain"], ls_empty] = error["empty_subdomain"]
+    if rules["extension"]:
+        table[state["domain"], c["extension"]] = error["empty_domain"]
+        table[state["subdomain"], c["extension"]] = error["empty_subdomain"]
+        table[state["text"], c["extension"]] = state["extension"]
+        table[state["extension"], [c["end"], c["extension"]]] = error["empty_extension"]
+        table[state["extension_text"], c["extension"]] = state["extension"]
+        table[state["extension_text"], c["end"]] = state["accept"]
+        # only the last domain has the extension: dots of earlier domains (as in
+        # semantic versions) are left to the checks of schemes
+        table[state["extension_text"], c["domain"]] = state["domain"]
+
+    # accept and error states are sticky
+    for i in range(ACCEPT, n_states):
+        table[i, :] = i
+    # states premultiplied by the number of classes, so a step is one lookup
+    return (table.astype(np.uint16) * len(CLASSES)).ravel()
+
+
+def _get_table(asset):
+    # compiled transition table of an asset type
+    if asset not in ASSETS:
+        raise ValueError(f"asset must be one of {list(ASSETS)}: {asset!r}")
+    if asset not in TABLES:
+        TABLES[asset] = _compile_table(asset)
+    return TABLES[asset]
+
+
+def _error(state):
+    # error code of an error state
+    return DFA_ERRORS[int(state) // len(CLASSES) - len(STATES)]
+
+
+def _run_chunk(labels, table):
+    # run the automaton over a chunk of labels: errors and the mask of valid labels
+    size = labels.size
+    width = max(labels.dtype.itemsize // 4, 1)
+    codes = np.ascontiguousarray(labels, dtype=f"<U{width}").view(np.uint32)
+    codes = codes.reshape(size, width)
+    # one row of classes per column, plus the end of full-width labels
+    classes = np.zeros((width + 1, size), dtype=np.uint16)
+    classes[:width] = CLASS_TABLE[np.minimum(codes, 128)].T
+    state = _run_automaton(classes, table)
+
+    # positions of errors, counting the steps of failed labels only
+    rows = np.flatnonzero(state > ACCEPT * len(CLASSES))
+    steps = np.zeros(rows.size, dtype=np.int64)
+    _run_automaton(classes[:, rows], table, steps=steps)
+    lengths = (codes[rows] != 0).sum(axis=1)
+    starts = steps - 1
+    # errors at the end of labels point to their last character
+    starts = np.where(starts >= lengths, np.maximum(lengths - 1, 0), starts)
+    stops = np.minimum(starts + 1, lengths)
+    errors = state[rows] // len(CLASSES) - len(STATES)
+    return rows, starts, stops, errors, state == ACCEPT * len(CLASSES)
+
+
+def _run_automaton(classes, table, steps=None):
+    # final states of an automaton over rows of classes (counting steps before stops)
+    accept = ACCEPT * len(CLASSES)
+    state = np.zeros(classes.shape[1], dtype=np.uint16)
+    for column in classes:
+        if steps is not None:
+            steps += state < accept
+        state = np.take(table, state + column)
+    return state
+
+
+def _check_scheme(labels, valid, scheme):
+    # errors of domains of a scheme, as (rows, starts, stops, errors) tuples
+    ls_domains = SCHEMES[scheme]
+    rows = np.flatnonzero(valid)
+    names = labels[rows]
+    size = names.size
+    width = max(names.dtype.itemsize // 4, 1)
+    codes = np.ascontiguousarray(names, dtype=f"<U{width}").view(np.uint32)
+    codes = codes.reshape(size, width)
+    lengths = (codes != 0).sum(axis=1)
+
+    # --------------- count domains ---------------
+    is_sep = codes == ord(DOMAIN_SEPARATOR)
+    n_domains = is_sep.sum(axis=1) + 1
+    is_wrong = n_domains != len(ls_domains)
+    yield rows[is_wrong], np.zeros(is_wrong.sum()), lengths[is_wrong], np.full(
+        is_wrong.sum(), "domains", dtype=object
+    )
+    keep = ~is_wrong
+    rows, codes, lengths, is_sep = rows[keep], codes[keep], lengths[keep], is_sep[keep]
+    size = rows.size
+    if size == 0:
+        return
+
+    # --------------- find domains ---------------
+    n_sep = len(ls_domains) - 1
+    sep_positions = np.nonzero(is_sep)[1].reshape(size, n_sep)
+    starts = [np.zeros(size, dtype=np.int64)] + list(sep_positions.T + 1)
+    stops = list(sep_positions.T) + [lengths]
+    # the extension follows the first dot of the last domain
+    is_ext_dot = (codes == ord(EXTENSION_SEPARATOR)) & (
+        np.arange(width) >= starts[-1][:, None]
+    )
+    has_extension = is_ext_dot.any(axis=1)
+    stops[-1] = np.where(has_extension, is_ext_dot.argmax(axis=1), lengths)
+
+    # --------------- dots ---------------
+    # only versions have dots before the extension
+    positions = np.arange(width)
+    for domain, start, stop in zip(ls_domains[:-1], starts[:-1], stops[:-1]):
+        if domain == "version":
+            continue
+        is_dot = (codes == ord(EXTENSION_SEPARATOR)) & (
+            (positions >= start[:, None]) & (positions < stop[:, None])
+        )
+        has_dot = is_dot.any(axis=1)
+        first = is_dot.argmax(axis=1)[has_dot]
+        yield rows[has_dot], first, first + 1, np.full(
+            has_dot.sum(), "dot", dtype=object
+        )
+
+    # --------------- typed domains ---------------
+    for domain, start, stop in zip(ls_domains, starts, stops):
+        if domain not in ("year", "version", "extent", "datetime"):
+            continue
+        texts = _gather(codes, start, stop)
+        is_bad = ~_is_replacer(texts)
+        if domain == "year":
+            # years have no replacers, as in the grammar of labels
+            is_bad = ~((np.char.str_len(texts) == 4) & np.char.isdigit(texts))
+        elif domain == "version":
+            is_bad &= version_keys(texts)[0] < 0
+        elif domain == "extent":
+            is_bad &= np.isnan(decode_extents(texts)[0])
+            is_bad[is_bad] = [
+                EXTENT_NUMBER_PATTERN.match(t) is not None for t in texts[is_bad]
+            ]
+        elif domain == "datetime":
+            datetimes = pd.Series(texts.astype(object)).where(is_bad)
+            is_bad &= np.isnat(_decode_datetimes(datetimes, "coerce")[0])
+        yield rows[is_bad], start[is_bad], stop[is_bad], np.full(
+            is_bad.sum(), domain, dtype=object
+        )
+
+
+# ... {develop}
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    print(validate_many(["temp_max", "temp-max", "temp__max"], asset="field"))
+    # ... {develop}
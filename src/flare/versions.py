@@ -0,0 +1,354 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Codecs and a bulk sorter for version domains in the semantic (``1.0.3``),
+compact semantic (``v103``) and timestamp (``v20250314``) schemes.
+
+Features
+--------
+ - Decode versions into ``(major, minor, patch)`` tuples or timestamps
+ - Map versions to comparable keys ``(kind, value)``
+ - Map versions to keys in bulk, on NumPy arrays of kinds and values
+ - Find the latest version of each group of files in one pass
+
+Overview
+--------
+
+Version keys are pairs of integers ``(kind, value)``:
+
+.. list-table::
+   :header-rows: 1
+
+   * - Scheme
+     - Kind
+     - Value
+   * - semantic and compact semantic
+     - ``0``
+     - ``major``, ``minor`` and ``patch`` packed in 21 bits each
+   * - timestamp
+     - ``1``
+     - microseconds since the Unix epoch (UTC)
+
+Keys sort as versions: semantic versions by their components and timestamp
+versions chronologically. Timestamp versions are newer than semantic versions
+when a group mixes both schemes. Invalid versions have the kind ``-1`` in bulk.
+
+The bulk codec factorizes versions, so each distinct version is decoded once:
+compact versions are decoded on matrices of code points, timestamp versions with
+``timeflare.decode_timestamps`` and semantic versions with the scalar codec.
+:func:`find_latest` sorts the keys within groups with a single ``lexsort``.
+
+Examples
+--------
+
+Compare versions
+
+.. code-block:: python
+
+    version_key("1.10.0") > version_key("v103")  # True
+
+Find the latest files of each ``{type}_{project}_{item}`` group
+
+.. code-block:: python
+
+    df = parse_many(filenames, scheme="generic")
+    positions = find_latest(df["version"], df[["type", "project", "item"]])
+    df_latest = df.iloc[positions]
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import re
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.flags import get_registry
+from flare.numflare import _to_str_array
+from flare.timeflare import decode_timestamp, decode_timestamps, get_variant
+from flare.timeflare import _to_datetime64
+
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+VERSION_FLAG = get_registry().version
+
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# grammar of versions: semantic, compact semantic or timestamp
+VERSION_PATTERN = re.compile(
+    "{v}?(?P<major>[0-9]+)\\.(?P<minor>[0-9]+)\\.(?P<patch>[0-9]+)"
+    "|{v}(?P<compact>[0-9]{{3}})"
+    "|{v}(?P<timestamp>.+)".format(v=re.escape(VERSION_FLAG)),
+    flags=re.IGNORECASE | re.ASCII,
+)
+# timestamp variants too coarse for versions (at least day-level resolution)
+VERSION_VARIANTS_EXCLUDED = ("tsy", "tsm", "tsmh")
+# digits of the shortest timestamp version (year, month and day)
+TIMESTAMP_DIGITS_MIN = 8
+
+# kinds of version keys
+KINDS = {"invalid": -1, "semantic": 0, "timestamp": 1}
+# bits of each component of packed semantic versions
+COMPONENT_BITS = 21
+# time unit of timestamp keys
+KEY_UNIT = "us"
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+def decode_version(encoded_version):
+    """
+    Decodes a version (semantic, compact semantic or timestamp).
+
+    :param encoded_version: The encoded version.
+    :type encoded_version: str
+    :return: A tuple ``(major, minor, patch)`` for semantic versions or a timestamp for timestamp versions.
+    :rtype: tuple or :class:`pandas.Timestamp`
+
+    **Examples**
+
+    >>> decode_version("1.0.3")
+    (1, 0, 3)
+
+    >>> decode_version("V103")
+    (1, 0, 3)
+
+    >>> decode_version("v20250314")
+    Timestamp('2025-03-14 00:00:00')
+
+    """
+    match = VERSION_PATTERN.fullmatch(encoded_version)
+    if match is None:
+        raise ValueError(f"invalid version: {encoded_version!r}")
+    dc = match.groupdict()
+    if dc["major"] is not None:
+        return int(dc["major"]), int(dc["minor"]), int(dc["patch"])
+    if dc["compact"] is not None:
+        return tuple(int(c) for c in dc["compact"])
+    if get_variant(dc["timestamp"]) in VERSION_VARIANTS_EXCLUDED:
+        raise ValueError(f"timestamp versions need at least days: {encoded_version!r}")
+    return decode_timestamp(dc["timestamp"])
+
+
+def version_key(encoded_version):
+    """
+    Gets a comparable key of a version (see ``KINDS``).
+
+    Semantic versions pack their components in the value and timestamp versions
+    use microseconds since the Unix epoch (zoned timestamps are converted to UTC).
+
+    :param encoded_version: The encoded version.
+    :type encoded_version: str
+    :return: A tuple ``(kind, value)``.
+    :rtype: tuple
+
+    **Examples**
+
+    >>> version_key("1.10.0") > version_key("v103")
+    True
+
+    >>> version_key("v20250314")
+    (1, 1741910400000000)
+
+    """
+    version = decode_version(encoded_version)
+    if isinstance(version, tuple):
+        return KINDS["semantic"], _pack_components(version, encoded_version)
+    value = _to_datetime64(version, KEY_UNIT).astype(np.int64)
+    return KINDS["timestamp"], int(value)
+
+
+def version_keys(encoded_versions):
+    """
+    Gets comparable keys of an array of versions in bulk, following the same rules of ``version_key``.
+
+    Invalid versions, replacers and missing values have the kind ``-1`` and the value ``0``.
+
+    :param encoded_versions: The encoded versions.
+    :type encoded_versions: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :return: Arrays of kinds (``int8``) and values (``int64``).
+    :rtype: tuple
+
+    **Examples**
+
+    >>> kinds, values = version_keys(["v103", "1.0.3", "v20250314", "x"])
+    >>> kinds.tolist()
+    [0, 0, 1, -1]
+    >>> values[:2].tolist()
+    [4398046511107, 4398046511107]
+
+    """
+    labels = np.ascontiguousarray(_to_str_array(encoded_versions)).ravel()
+    codes, uniques = pd.factorize(labels)
+    uniques = np.asarray(uniques, dtype=str)
+    kinds = np.full(uniques.size, KINDS["invalid"], dtype=np.int8)
+    values = np.zeros(uniques.size, dtype=np.int64)
+    if uniques.size == 0:
+        return kinds, values
+
+    width = max(uniques.dtype.itemsize // 4, 1)
+    matrix = np.ascontiguousarray(uniques, dtype=f"U{width}").view(np.uint32)
+    matrix = matrix.reshape(uniques.size, width)
+    lengths = (matrix != 0).sum(axis=1)
+    is_digit = (matrix >= ord("0")) & (matrix <= ord("9"))
+    n_digits = is_digit.sum(axis=1)
+    has_flag = (matrix[:, 0] | 32) == ord(VERSION_FLAG)
+    has_dot = (matrix == ord(".")).any(axis=1)
+
+    # compact versions: the flag and three digits
+    compact = has_flag & (lengths == 4) & (n_digits == 3) & is_digit[:, 1:4].all(axis=1)
+    if compact.any():
+        digits = matrix[compact, 1:4].astype(np.int64) - ord("0")
+        kinds[compact] = KINDS["semantic"]
+        values[compact] = _pack_arrays(digits[:, 0], digits[:, 1], digits[:, 2])
+
+    # timestamp versions: the flag and at least a day
+    timestamp = has_flag & ~compact & ~has_dot & (n_digits >= TIMESTAMP_DIGITS_MIN)
+    ls_positions = np.flatnonzero(timestamp)
+    if ls_positions.size:
+        texts = np.ascontiguousarray(matrix[ls_positions, 1:]).view(f"U{width - 1}")
+        try:
+            ticks = decode_timestamps(texts.ravel(), unit=KEY_UNIT).view(np.int64)
+        except ValueError:
+            # texts that are not timestamps are keyed one by one
+            for i in ls_positions:
+                _set_key(i, uniques, kinds, values)
+        else:
+            kinds[ls_positions] = KINDS["timestamp"]
+            values[ls_positions] = ticks
+
+    # semantic versions (and any other text) with the scalar codec
+    for i in np.flatnonzero(has_dot & (lengths > 0)):
+        _set_key(i, uniques, kinds, values)
+
+    return kinds[codes], values[codes]
+
+
+def find_latest(encoded_versions, groups):
+    """
+    Finds the latest version of each group of files, given by one or more keys.
+
+    Files with invalid or missing versions are ignored. Ties keep the last file of the group.
+
+    :param encoded_versions: The encoded versions.
+    :type encoded_versions: :class:`numpy.ndarray`, :class:`pandas.Series` or list
+    :param groups: The group keys: an array, a list of arrays or a :class:`pandas.DataFrame` (one column per key).
+    :type groups: :class:`numpy.ndarray`, :class:`pandas.Series`, list or :class:`pandas.DataFrame`
+    :return: Sorted positions of the latest file of each group.
+    :rtype: :class:`numpy.ndarray`
+
+    **Examples**
+
+    >>> find_latest(["v101", "1.2.0", "v20250314", "v103"], ["a", "a", "b", "b"]).tolist()
+    [1, 2]
+
+    """
+    kinds, values = version_keys(encoded_versions)
+    group_codes = _group_codes(groups, size=kinds.size)
+    valid = np.flatnonzero(kinds >= 0)
+    group_codes = group_codes[valid]
+    order = np.lexsort((values[valid], kinds[valid], group_codes))
+    sorted_codes = group_codes[order]
+    is_last = np.ones(order.size, dtype=bool)
+    is_last[:-1] = sorted_codes[1:] != sorted_codes[:-1]
+    return np.sort(valid[order[is_last]])
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _pack_components(components, encoded_version):
+    # pack semantic components in a single integer
+    if max(components) >= 1 << COMPONENT_BITS:
+        raise ValueError(f"version components are too large: {encoded_version!r}")
+    return _pack_arrays(*components)
+
+
+def _pack_arrays(major, minor, patch):
+    # pack arrays of semantic components
+    return (major << 2 * COMPONENT_BITS) | (minor << COMPONENT_BITS) | patch
+
+
+def _set_key(i, uniques, kinds, values):
+    # set the key of a single unique version (invalid versions are kept)
+    try:
+        kinds[i], values[i] = version_key(str(uniques[i]))
+    except ValueError:
+        pass
+
+
+def _group_codes(groups, size):
+    # integer codes of groups of one or more keys
+    if isinstance(groups, pd.DataFrame):
+        ls_keys = [groups[column] for column in groups.columns]
+    elif isinstance(groups, (list, tuple)) and len(groups) and np.ndim(groups[0]):
+        ls_keys = list(groups)
+    else:
+        ls_keys = [groups]
+    group_codes = np.zeros(size, dtype=np.int64)
+    for key in ls_keys:
+        key_codes, key_uniques = pd.factorize(np.asarray(key), use_na_sentinel=False)
+        if key_codes.size != size:
+            raise ValueError(f"groups must have {size} elements: {key_codes.size}")
+        group_codes, _ = pd.factorize(group_codes * len(key_uniques) + key_codes)
+    return group_codes
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    print(find_latest(["v101", "1.2.0", "v20250314", "v103"], ["a", "a", "b", "b"]))
+    # ... {develop}
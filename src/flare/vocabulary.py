@@ -0,0 +1,432 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Vocabulary of Flare standard names, loaded once from the catalog shipped with the
+package (``flare/data/names.csv``), with exact and fuzzy lookups of raw headers.
+
+Features
+--------
+ - Load the catalog of standard names lazily, once per process
+ - Get the attributes of a standard name (``title``, ``alias``, ``abstract``, ...)
+ - Resolve headers by name, alias or title, ignoring case, accents and punctuation
+ - Suggest standard names for misspelled headers with a trigram index
+ - Resolve large batches of headers at once
+
+Overview
+--------
+
+Headers are normalized into keys: accents are stripped, letters are lowercased and
+any character other than ASCII letters and digits is dropped, so ``"Time Stamp"``,
+``"time_stamp"`` and ``"TIMESTAMP"`` share the key ``timestamp``. Keys of names,
+aliases and titles go to a hash map, with names taking precedence over aliases and
+aliases over titles (e.g. ``p50`` is the name ``p50``, not the alias of ``median``).
+
+Headers without an exact match are resolved by similarity: keys of names and titles
+are split into trigrams (padded with ``^`` and ``$``) in an inverted index, and the
+candidates sharing trigrams with a header are scored with the Dice coefficient
+``2 |A & B| / (|A| + |B|)``. The best candidate above ``cutoff`` wins.
+
+The batch resolver works on the distinct headers only: keys are normalized with
+vectorized string methods and matched with a single map. The distinct headers left
+over are scored all at once: their trigrams are expanded into postings and counted
+into a matrix of shared trigrams by header and key with ``numpy.bincount``.
+
+Examples
+--------
+
+Resolve headers
+
+.. code-block:: python
+
+    vocabulary = get_vocabulary()
+    vocabulary.resolve("Std. Deviation")
+    # Output: 'sd'
+    vocabulary.suggest("averge")
+    # Output: [('average', 0.615...)]
+
+Resolve the columns of a table
+
+.. code-block:: python
+
+    df_names = vocabulary.resolve_many(df.columns)
+    df = df.rename(columns=dict(zip(df.columns, df_names["name"].fillna(""))))
+
+
+"""
+
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import functools
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+# import {module}
+# ... {develop}
+
+
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# catalog of standard names shipped with the package
+NAMES_FILE = Path(__file__).parent / "data" / "names.csv"
+
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SEPARATOR = ";"
+# kinds of matches, by precedence of exact matches
+MATCHES = ("name", "alias", "title", "fuzzy")
+# smallest similarity of fuzzy matches
+FUZZY_CUTOFF = 0.6
+# default number of suggestions
+SUGGESTIONS = 5
+# number of distinct keys kept by the cache of suggestions
+CACHE_SIZE = 65_536
+# number of distinct headers scored at once by the batch resolver
+CHUNK_SIZE = 10_000
+# characters dropped from keys
+KEY_PATTERN = re.compile("[^0-9a-z]+")
+
+
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+
+
+@functools.cache
+def get_vocabulary():
+    """
+    Gets the vocabulary of standard names, loading the catalog on the first call only.
+
+    :return: The shared vocabulary.
+    :rtype: :class:`Vocabulary`
+
+    **Examples**
+
+    >>> get_vocabulary() is get_vocabulary()
+    True
+
+    >>> get_vocabulary().resolve("Time Stamp")
+    'timestamp'
+
+    """
+    return Vocabulary(NAMES_FILE)
+
+
+def normalize_key(header):
+    """
+    Normalizes a header into a lookup key: ASCII letters (lowercase) and digits only.
+
+    Missing headers (``None``, ``NaN``) give an empty key, which matches no name.
+
+    :param header: The raw header.
+    :type header: str
+    :return: The key.
+    :rtype: str
+
+    **Examples**
+
+    >>> normalize_key("Média_Anual (mm)")
+    'mediaanualmm'
+
+    >>> normalize_key(float("nan"))
+    ''
+
+    """
+    if pd.api.types.is_scalar(header) and pd.isna(header):
+        return ""
+    text = unicodedata.normalize("NFKD", str(header))
+    text = text.encode("ascii", "ignore").decode("ascii")
+    return KEY_PATTERN.sub("", text.lower())
+
+
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def _normalize_keys(headers):
+    # vectorized counterpart of normalize_key
+    series = pd.Series(headers, dtype=object)
+    series = series.where(series.notna(), "").astype(str)
+    if not series.map(str.isascii).all():
+        series = series.str.normalize("NFKD").str.encode("ascii", "ignore")
+        series = series.str.decode("ascii")
+    return series.str.lower().str.replace(KEY_PATTERN, "", regex=True).to_numpy()
+
+
+def _trigrams(key):
+    # padded trigrams of a key
+    padded = f"^{key}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+# ... {develop}
+
+
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class Vocabulary:
+    """
+    The catalog of standard names with exact and fuzzy lookups. Use
+    :func:`get_vocabulary` to share a single vocabulary.
+    """
+
+    def __init__(self, file_path=NAMES_FILE):
+        """
+        Load a catalog of standard names.
+
+        :param file_path: The ``;``-separated catalog, with ``name``, ``alias`` and ``title`` columns. Default value = ``NAMES_FILE``
+        :type file_path: str or :class:`pathlib.Path`
+        """
+        self.file_path = Path(file_path)
+        # aliases such as "nan" are texts, not missing values
+        self.df = pd.read_csv(
+            self.file_path, sep=SEPARATOR, dtype=str, keep_default_na=False
+        )
+        ls_missing = [c for c in ("name", "alias", "title") if c not in self.df]
+        if ls_missing:
+            raise ValueError(f"missing columns in the catalog of names: {ls_missing}")
+        self.df = self.df.set_index("name", drop=False)
+        if not self.df.index.is_unique:
+            raise ValueError("names of the catalog must be unique")
+
+        # exact keys, by precedence: names, aliases and titles
+        self._exact = {}
+        for match in MATCHES[:-1]:
+            for key, name in zip(_normalize_keys(self.df[match]), self.df["name"]):
+                if key:
+                    self._exact.setdefault(key, (name, match))
+
+        # inverted index of trigrams of names and titles (keys sorted by name, so
+        # ties of the batch resolver keep the first name, as in suggestions)
+        set_keys = set()
+        for match in ("name", "title"):
+            keys = _normalize_keys(self.df[match])
+            set_keys.update((name, key) for name, key in zip(self.df["name"], keys))
+        ls_keys = sorted((name, key) for name, key in set_keys if key)
+        self._key_names = np.array([name for name, _ in ls_keys], dtype=object)
+        self._key_sizes = np.array([len(_trigrams(key)) for _, key in ls_keys])
+        self._grams = {}
+        for k, (_, key) in enumerate(ls_keys):
+            for gram in sorted(_trigrams(key)):
+                self._grams.setdefault(gram, []).append(k)
+        # the same index as arrays: postings of gram i in indices[indptr[i]:indptr[i + 1]]
+        self._gram_ids = {gram: i for i, gram in enumerate(self._grams)}
+        ls_postings = list(self._grams.values())
+        self._indptr = np.cumsum([0] + [len(ls) for ls in ls_postings])
+        self._indices = np.array([k for ls in ls_postings for k in ls], dtype=np.int64)
+        self._suggest_key = functools.lru_cache(maxsize=CACHE_SIZE)(self._score_key)
+
+    def get(self, name):
+        """
+        Get the attributes of a standard name.
+
+        :param name: The standard name.
+        :type name: str
+        :return: The attributes of the catalog.
+        :rtype: dict
+        """
+        if name not in self.df.index:
+            raise KeyError(f"unknown standard name: {name!r}")
+        return self.df.loc[name].to_dict()
+
+    def resolve(self, header, fuzzy=True, cutoff=FUZZY_CUTOFF):
+        """
+        Resolve a header into a standard name.
+
+        :param header: The raw header.
+        :type header: str
+        :param fuzzy: If True, fall back to the most similar name. Default value = True
+        :type fuzzy: bool
+        :param cutoff: The smallest similarity of fuzzy matches. Default value = ``FUZZY_CUTOFF``
+        :type cutoff: float
+        :return: The standard name, or None if the header has no match.
+        :rtype: str or None
+        """
+        key = normalize_key(header)
+        if key in self._exact:
+            return self._exact[key][0]
+        if fuzzy:
+            ls_suggestions = self._suggest_key(key, cutoff, 1)
+            if ls_suggestions:
+                return ls_suggestions[0][0]
+        return None
+
+    def suggest(self, header, limit=SUGGESTIONS, cutoff=FUZZY_CUTOFF):
+        """
+        Suggest standard names similar to a header.
+
+        :param header: The raw header.
+        :type header: str
+        :param limit: The largest number of suggestions. Default value = ``SUGGESTIONS``
+        :type limit: int
+        :param cutoff: The smallest similarity. Default value = ``FUZZY_CUTOFF``
+        :type cutoff: float
+        :return: Pairs ``(name, similarity)``, from the most similar.
+        :rtype: list
+        """
+        return list(self._suggest_key(normalize_key(header), cutoff, limit))
+
+    def resolve_many(self, headers, fuzzy=True, cutoff=FUZZY_CUTOFF):
+        """
+        Resolve many headers into standard names at once.
+
+        :param headers: The raw headers.
+        :type headers: list, :class:`numpy.ndarray`, :class:`pandas.Index` or :class:`pandas.Series`
+        :param fuzzy: If True, fall back to the most similar names. Default value = True
+        :type fuzzy: bool
+        :param cutoff: The smallest similarity of fuzzy matches. Default value = ``FUZZY_CUTOFF``
+        :type cutoff: float
+        :return: Columns ``header``, ``name``, ``match`` (see ``MATCHES``) and ``score`` (``1`` for exact matches), missing for headers without a match (including missing headers).
+        :rtype: :class:`pandas.DataFrame`
+        """
+        headers = np.asarray(headers, dtype=object)
+        codes, uniques = pd.factorize(headers, use_na_sentinel=False)
+        keys = _normalize_keys(uniques)
+        names = np.empty(keys.size, dtype=object)
+        matches = np.empty(keys.size, dtype=object)
+        scores = np.full(keys.size, np.nan)
+        ls_left = []
+        for i, key in enumerate(keys.tolist()):
+            if not key:
+                # missing or empty headers have no match
+                continue
+            hit = self._exact.get(key)
+            if hit is None:
+                ls_left.append(i)
+            else:
+                names[i], matches[i] = hit
+                scores[i] = 1.0
+        if fuzzy and ls_left:
+            for start in range(0, len(ls_left), CHUNK_SIZE):
+                rows = np.array(ls_left[start : start + CHUNK_SIZE])
+                best, best_scores = self._score_many(keys[rows].tolist())
+                is_match = best_scores >= cutoff
+                rows, best = rows[is_match], best[is_match]
+                names[rows] = self._key_names[best]
+                matches[rows] = MATCHES[-1]
+                scores[rows] = best_scores[is_match]
+        return pd.DataFrame(
+            {
+                "header": headers,
+                "name": names[codes],
+                "match": matches[codes],
+                "score": scores[codes],
+            }
+        )
+
+    def _score_key(self, key, cutoff, limit):
+        # best names by the Dice coefficient of trigrams (cached by key)
+        if not key:
+            return ()
+        grams = _trigrams(key)
+        counter = Counter()
+        for gram in grams:
+            counter.update(self._grams.get(gram, ()))
+        if not counter:
+            return ()
+        dc_scores = {}
+        for k, n_shared in counter.items():
+            score = 2 * n_shared / (len(grams) + self._key_sizes[k])
+            name = self._key_names[k]
+            if score >= cutoff and score > dc_scores.get(name, 0.0):
+                dc_scores[name] = score
+        ls_scores = sorted(dc_scores.items(), key=lambda item: (-item[1], item[0]))
+        return tuple(ls_scores[:limit])
+
+    def _score_many(self, keys):
+        # best key of many keys by the Dice coefficient of trigrams, on a dense
+        # matrix of shared trigrams counted from the postings of each key
+        ls_sizes, ls_gram_ids = [], []
+        for key in keys:
+            grams = _trigrams(key) if key else set()
+            ls_sizes.append(len(grams))
+            ls_gram_ids.append(
+                [self._gram_ids[g] for g in grams if g in self._gram_ids]
+            )
+        gram_ids = np.array([i for ls in ls_gram_ids for i in ls], dtype=np.int64)
+        queries = np.repeat(np.arange(len(keys)), [len(ls) for ls in ls_gram_ids])
+        # expand each gram into its postings
+        starts = self._indptr[gram_ids]
+        lengths = self._indptr[gram_ids + 1] - starts
+        offsets = np.arange(lengths.sum()) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        postings = self._indices[np.repeat(starts, lengths) + offsets]
+        n_keys = self._key_names.size
+        shared = np.bincount(
+            np.repeat(queries, lengths) * n_keys + postings,
+            minlength=len(keys) * n_keys,
+        ).reshape(len(keys), n_keys)
+        scores = 2 * shared / (np.array(ls_sizes)[:, None] + self._key_sizes)
+        best = scores.argmax(axis=1)
+        return best, scores[np.arange(len(keys)), best]
+
+    @property
+    def names(self):
+        """
+        The standard names, in the order of the catalog.
+        """
+        return self.df["name"].tolist()
+
+    def __len__(self):
+        return len(self.df)
+
+    def __contains__(self, name):
+        return name in self.df.index
+
+    def __repr__(self):
+        return f"Vocabulary({str(self.file_path)!r}, {len(self)} names)"
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    vocabulary = get_vocabulary()
+    print(vocabulary)
+    print(vocabulary.resolve_many(["Time Stamp", "Std. Deviation", "averge", "foo"]))
+    # ... {develop}
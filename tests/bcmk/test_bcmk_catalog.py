@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.catalog`` SQLite catalog.
+
+Overview
+--------
+The benchmarks time bulk inserts of parsed labels and indexed queries by source,
+bounding box and time range, compared with a full scan of the same table in
+pandas. They are skipped unless the ``RUN_BENCHMARKS`` environment variable is set
+to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_catalog
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.catalog import Catalog
+from flare.labels import parse_many
+from tests.bcmk.test_bcmk_labels import make_filenames
+from tests.conftest import RUN_BENCHMARKS, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 500_000
+# number of queries timed
+N_QUERIES = 50
+# minimal speedup of indexed queries over a pandas scan
+SPEEDUP_MIN = 1.5
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkCatalog(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        cls.tmp = tempfile.TemporaryDirectory()
+        filenames = make_filenames(SIZE)
+        cls.df = parse_many(filenames)
+        cls.df.insert(0, "path", [f"/archive/{i}/{f}" for i, f in enumerate(filenames)])
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_insert_query(self):
+        """
+        Time bulk inserts and ensure indexed queries are faster than a scan.
+        """
+        with Catalog(Path(self.tmp.name) / "catalog.db") as catalog:
+            elapsed = time.perf_counter()
+            catalog.insert(self.df)
+            elapsed_insert = time.perf_counter() - elapsed
+
+            rng = np.random.default_rng(1)
+            ls_queries = [
+                dict(
+                    bbox=(lat, lon, lat + 2, lon + 2),
+                    start=f"{year}",
+                    stop=f"{year + 1}",
+                )
+                for lat, lon, year in zip(
+                    rng.integers(-90, 88, N_QUERIES),
+                    rng.integers(-180, 178, N_QUERIES),
+                    rng.integers(1970, 2019, N_QUERIES),
+                )
+            ]
+            elapsed = time.perf_counter()
+            ls_results = [catalog.query(source="COPERNICUS", **q) for q in ls_queries]
+            elapsed_query = (time.perf_counter() - elapsed) / N_QUERIES
+
+        elapsed = time.perf_counter()
+        ls_scans = [self.scan(**q) for q in ls_queries]
+        elapsed_scan = (time.perf_counter() - elapsed) / N_QUERIES
+
+        for df, paths in zip(ls_results, ls_scans):
+            self.assertEqual(df["path"].tolist(), paths)
+        speedup = elapsed_scan / elapsed_query
+        testprint(
+            f"Catalog: {SIZE} inserts in {elapsed_insert:.2f} s "
+            f"({SIZE / elapsed_insert:.0f} rows/s), {elapsed_query * 1e3:.2f} ms per query "
+            f"(scan {elapsed_scan * 1e3:.1f} ms, speedup {speedup:.1f}x)"
+        )
+        self.assertGreater(speedup, SPEEDUP_MIN)
+
+    def scan(self, bbox, start, stop):
+        # reference: boolean masks over the whole table
+        df = self.df
+        ymin, xmin, ymax, xmax = bbox
+        is_match = (df["source"] == "COPERNICUS").to_numpy().copy()
+        is_match &= (df["extent_ymin"] <= ymax).to_numpy()
+        is_match &= (df["extent_ymax"] >= ymin).to_numpy()
+        is_match &= (df["extent_xmin"] <= xmax).to_numpy()
+        is_match &= (df["extent_xmax"] >= xmin).to_numpy()
+        is_match &= (df["datetime_start"] >= pd.Timestamp(start)).to_numpy()
+        is_match &= (df["datetime_start"] < pd.Timestamp(stop)).to_numpy()
+        return sorted(df["path"].to_numpy()[is_match].tolist())
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Runs once after all tests in this class.
+        """
+        cls.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.crawler`` filesystem crawler.
+
+Overview
+--------
+The benchmarks crawl a temporary tree of empty labeled files and compare it with
+``os.walk`` followed by ``stat`` and the scalar label parser on each file. They are
+skipped unless the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_crawler
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.crawler import crawl
+from flare.labels import parse
+from tests.bcmk.test_bcmk_labels import make_filenames
+from tests.conftest import RUN_BENCHMARKS, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 100_000
+N_DIRECTORIES = 200
+# minimal speedup of the crawler over a walk with per-file parsing
+SPEEDUP_MIN = 1.5
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkCrawler(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        cls.tmp = tempfile.TemporaryDirectory()
+        root = Path(cls.tmp.name)
+        for i, name in enumerate(make_filenames(SIZE).tolist()):
+            folder = (
+                root / f"{i % N_DIRECTORIES // 10:02d}" / f"{i % N_DIRECTORIES:03d}"
+            )
+            folder.mkdir(parents=True, exist_ok=True)
+            # labels may repeat, so make them unique with the item domain
+            (folder / name.replace("GLO30", f"G{i}")).touch()
+        cls.root = root
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def walk(self):
+        # reference: walk, stat and parse each file
+        ls_records = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                record = parse(name)
+                record["path"] = path
+                record["size"] = os.stat(path).st_size
+                ls_records.append(record)
+        return pd.DataFrame(ls_records)
+
+    def test_crawl(self):
+        """
+        Ensure crawling is much faster than walking and parsing file by file.
+        """
+        elapsed = time.perf_counter()
+        df = pd.concat(crawl(self.root, scheme="dataset"), ignore_index=True)
+        elapsed_crawl = time.perf_counter() - elapsed
+
+        elapsed = time.perf_counter()
+        df_walk = self.walk()
+        elapsed_walk = time.perf_counter() - elapsed
+
+        self.assertEqual(len(df), SIZE)
+        self.assertEqual(sorted(df["path"]), sorted(df_walk["path"]))
+        speedup = elapsed_walk / elapsed_crawl
+        testprint(
+            f"crawl: {SIZE} files in {elapsed_crawl:.2f} s "
+            f"(walk {elapsed_walk:.2f} s, speedup {speedup:.1f}x)"
+        )
+        self.assertGreater(speedup, SPEEDUP_MIN)
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Runs once after all tests in this class.
+        """
+        cls.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.extents`` bulk decoder and spatial index.
+
+Overview
+--------
+The benchmarks time bounding-box queries of :class:`ExtentIndex` over a million
+tiles against a linear scan, and ``decode_extents`` against the scalar decoder.
+They are skipped unless the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_extents
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.extents import ExtentIndex, decode_extent, decode_extents
+from flare.numflare import encode_numbers
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 1_000_000
+SIZE_XXL = 5_000_000
+# number of extents decoded by the scalar decoder
+SIZE_SCALAR = 50_000
+# number of queries
+N_QUERIES = 200
+# minimal speedups over the scalar decoder and the linear scan
+SPEEDUP_DECODE_MIN = 3.0
+SPEEDUP_QUERY_MIN = 10.0
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_extents(size, seed=0):
+    """
+    Make extents of 1-degree tiles, given by the corner of each tile.
+
+    :param size: number of extents
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: array of extents
+    :rtype: :class:`numpy.ndarray`
+    """
+    rng = np.random.default_rng(seed)
+    lat = encode_numbers(rng.integers(-90, 90, size=size), len_min=3)
+    lon = encode_numbers(
+        rng.integers(-180, 180, size=size), len_min=3, is_latitude=False
+    )
+    return np.char.upper(np.char.add(lat, lon))
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkExtents(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare_decode(self, extents):
+        # time the bulk decoder against the scalar decoder on a sample
+        elapsed = time.perf_counter()
+        bounds = decode_extents(extents)
+        elapsed_bulk = (time.perf_counter() - elapsed) / len(extents)
+
+        sample = extents[:SIZE_SCALAR].tolist()
+        elapsed = time.perf_counter()
+        ls_bounds = [decode_extent(extent) for extent in sample]
+        elapsed_scalar = (time.perf_counter() - elapsed) / len(sample)
+
+        np.testing.assert_array_equal(
+            np.array(bounds)[:, : len(sample)], np.array(ls_bounds).T
+        )
+        speedup = elapsed_scalar / elapsed_bulk
+        testprint(
+            f"decode_extents: {len(extents)} extents in {elapsed_bulk * len(extents):.2f} s "
+            f"(scalar {elapsed_scalar * 1e6:.1f} us per extent, speedup {speedup:.1f}x)"
+        )
+        return speedup, bounds
+
+    def compare_query(self, bounds):
+        # time index queries against a linear scan
+        ymin, xmin, ymax, xmax = bounds
+        elapsed = time.perf_counter()
+        index = ExtentIndex(ymin, xmin, ymax, xmax)
+        elapsed_build = time.perf_counter() - elapsed
+
+        rng = np.random.default_rng(42)
+        corners = np.column_stack(
+            [rng.uniform(-90, 85, N_QUERIES), rng.uniform(-180, 175, N_QUERIES)]
+        )
+        ls_bboxes = [(y, x, y + 5, x + 5) for y, x in corners]
+        elapsed = time.perf_counter()
+        ls_index = [index.intersects(bbox) for bbox in ls_bboxes]
+        elapsed_index = (time.perf_counter() - elapsed) / N_QUERIES
+
+        elapsed = time.perf_counter()
+        ls_scan = [
+            np.flatnonzero(
+                (ymin <= b[2]) & (ymax >= b[0]) & (xmin <= b[3]) & (xmax >= b[1])
+            )
+            for b in ls_bboxes
+        ]
+        elapsed_scan = (time.perf_counter() - elapsed) / N_QUERIES
+
+        for hits_index, hits_scan in zip(ls_index, ls_scan):
+            np.testing.assert_array_equal(hits_index, hits_scan)
+        speedup = elapsed_scan / elapsed_index
+        testprint(
+            f"ExtentIndex: {len(index)} boxes built in {elapsed_build:.2f} s, "
+            f"query {elapsed_index * 1e3:.2f} ms "
+            f"(scan {elapsed_scan * 1e3:.2f} ms, speedup {speedup:.1f}x)"
+        )
+        return speedup
+
+    def test_extents(self):
+        """
+        Ensure bulk decoding and index queries are much faster than scalar loops and scans.
+        """
+        speedup_decode, bounds = self.compare_decode(make_extents(SIZE))
+        speedup_query = self.compare_query(bounds)
+        self.assertGreater(speedup_decode, SPEEDUP_DECODE_MIN)
+        self.assertGreater(speedup_query, SPEEDUP_QUERY_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_extents_xxl(self):
+        """
+        Ensure bulk decoding and index queries are much faster on large inputs.
+        """
+        speedup_decode, bounds = self.compare_decode(make_extents(SIZE_XXL, seed=1))
+        speedup_query = self.compare_query(bounds)
+        self.assertGreater(speedup_decode, SPEEDUP_DECODE_MIN)
+        self.assertGreater(speedup_query, SPEEDUP_QUERY_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.labels`` bulk parser.
+
+Overview
+--------
+The benchmarks time ``parse_many`` on a million filenames against the scalar
+parser on a sample. They are skipped unless the ``RUN_BENCHMARKS`` environment
+variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_labels
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import parse, parse_many
+from flare.numflare import encode_numbers
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 1_000_000
+SIZE_XXL = 5_000_000
+# number of filenames parsed by the scalar parser
+SIZE_SCALAR = 50_000
+# minimal speedup of the bulk parser over the scalar parser
+SPEEDUP_MIN = 3.0
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_filenames(size, seed=0):
+    """
+    Make dataset filenames of 1-degree tiles with hourly timestamps.
+
+    :param size: number of filenames
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: array of filenames
+    :rtype: :class:`numpy.ndarray`
+    """
+    rng = np.random.default_rng(seed)
+    lat = encode_numbers(rng.integers(-90, 90, size=size), len_min=3)
+    lon = encode_numbers(
+        rng.integers(-180, 180, size=size), len_min=3, is_latitude=False
+    )
+    hours = rng.integers(0, 50 * 365 * 24, size=size).astype("datetime64[h]")
+    stamps = pd.DatetimeIndex(hours).strftime("%Y%m%dT%H%M%S").to_numpy(dtype=str)
+    prefix = np.array(["COPERNICUS_COPDEM_GLO30_DGTE_"])
+    filenames = np.char.add(prefix, np.char.upper(np.char.add(lat, lon)))
+    return np.char.add(np.char.add(filenames, "_"), np.char.add(stamps, ".tif"))
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkLabels(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare(self, filenames):
+        # time the bulk parser against the scalar parser on a sample
+        elapsed = time.perf_counter()
+        df = parse_many(filenames)
+        elapsed_bulk = (time.perf_counter() - elapsed) / len(filenames)
+
+        sample = filenames[:SIZE_SCALAR]
+        elapsed = time.perf_counter()
+        ls_records = [parse(filename) for filename in sample]
+        elapsed_scalar = (time.perf_counter() - elapsed) / len(sample)
+
+        df_scalar = pd.DataFrame(ls_records)
+        for field in ["item", "extent_ymin", "extent_xmax", "datetime_start"]:
+            self.assertTrue(df[field].iloc[: len(sample)].equals(df_scalar[field]))
+        speedup = elapsed_scalar / elapsed_bulk
+        testprint(
+            f"parse_many: {len(filenames)} filenames in {elapsed_bulk * len(filenames):.2f} s "
+            f"(scalar {elapsed_scalar * 1e6:.1f} us per filename, speedup {speedup:.1f}x)"
+        )
+        return speedup
+
+    def test_parse_many(self):
+        """
+        Ensure bulk parsing is much faster than the scalar parser.
+        """
+        speedup = self.compare(make_filenames(SIZE))
+        self.assertGreater(speedup, SPEEDUP_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_parse_many_xxl(self):
+        """
+        Ensure bulk parsing is much faster than the scalar parser on large inputs.
+        """
+        speedup = self.compare(make_filenames(SIZE_XXL, seed=1))
+        self.assertGreater(speedup, SPEEDUP_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -4,35 +4,57 @@
 # See pyproject.toml for authors/maintainers.
 # See LICENSE for license details.
 """
-{Short module description (1-3 sentences)}
-todo docstring
-
-Features
---------
-todo docstring
-
- - {feature 1}
- - {feature 2}
- - {feature 3}
- - {etc}
+Benchmark suite of the ``flare`` codecs, with a history of results and regression
+checks against a stored baseline.
 
 Overview
 --------
-todo docstring
-{Overview description}
+The suite times the bulk codecs on inputs built from ``conftest.make_data``:
+
+.. list-table::
+   :header-rows: 1
+
+   * - Case
+     - Operation
+   * - ``encode_numbers`` and ``decode_numbers``
+     - ``numflare`` numbers with three decimals
+   * - ``encode_timestamps`` and ``decode_timestamps``
+     - ``timeflare`` timestamps of the ``ts`` variant
+   * - ``parse_many``
+     - ``labels`` parsing of ``dataset`` filenames, with typed fields
+   * - ``render``
+     - ``templates`` composition of ``dataset`` filenames
+
+Each case runs at scales from ``1e3`` to ``1e6`` operations (``1e7`` and ``1e8`` for
+the long benchmarks). Scales above ``BATCH_SIZE`` repeat a batch of inputs, so memory
+is bounded by a batch. The throughput (operations per second) and the peak memory
+of a batch (traced with ``tracemalloc``) of each case and scale are appended to the
+history file (``conftest.BENCHMARKS_HISTORY_FILE``).
+
+The baseline (``conftest.BENCHMARKS_BASELINE_FILE``, tracked in ``tests/data``) stores
+the throughput of each case and scale per machine. It is only written when
+``UPDATE_BENCHMARKS_BASELINE`` is set to ``1``; otherwise, benchmarks fail when the
+throughput drops by more than ``BENCHMARKS_REGRESSION_MAX`` (``0.3`` by default) of the
+baseline of the same machine. Machines (or cases and scales) missing from the
+baseline are not compared.
+
+The benchmarks are skipped unless the ``RUN_BENCHMARKS`` environment variable is set
+to ``1``.
 
 Examples
 --------
-todo docstring
-{Examples in rST}
 
-Print a message
+From the terminal, run:
+
+.. code-block:: bash
 
-.. code-block:: python
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_module
 
-    # print message
-    print("Hello world!")
-    # [Output] >> 'Hello world!'
+Store a new baseline of the machine, then commit ``tests/data/benchmarks_baseline.json``
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 UPDATE_BENCHMARKS_BASELINE=1 python -m unittest tests.bcmk.test_bcmk_module
 
 
 """
@@ -44,8 +66,14 @@ Print a message
 
 # Native imports
 # =======================================================================
+import json
+import math
+import os
+import platform
+import time
+import tracemalloc
 import unittest
-from time import sleep
+from datetime import datetime, timezone
 
 # ... {develop}
 
@@ -58,6 +86,10 @@ import pandas as pd
 
 # Project-level imports
 # =======================================================================
+from flare.labels import parse_many
+from flare.numflare import decode_numbers, encode_numbers
+from flare.templates import Template
+from flare.timeflare import decode_timestamps, encode_timestamps
 from tests import conftest
 from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
 
@@ -69,46 +101,270 @@ from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
 # ***********************************************************************
 # define constants in uppercase
 
-# CONSTANTS -- Project-level
-# =======================================================================
-# ... {develop}
-
-# Subsubsection example
-# -----------------------------------------------------------------------
-HELLO = "Hello World!"  # example
-# ... {develop}
-
-
 # CONSTANTS -- Module-level
 # =======================================================================
-# ... {develop}
+SCALES = (10**3, 10**4, 10**5, 10**6)
+SCALES_XXL = (10**7, 10**8)
+# largest number of inputs held in memory (larger scales repeat a batch)
+BATCH_SIZE = 10**6
+# number of repeats for timing scales up to a batch (best is taken)
+REPEATS = 3
+# cases of the suite
+CASES = (
+    "encode_numbers",
+    "decode_numbers",
+    "encode_timestamps",
+    "decode_timestamps",
+    "parse_many",
+    "render",
+)
+# template of dataset filenames
+PATTERN = "INMET_AUTO_{station}_{specs}_{lat:02.2lat}{lon:03.2lon}_{date:ts}.csv"
 
 
 # ***********************************************************************
 # FUNCTIONS
 # ***********************************************************************
 
-# FUNCTIONS -- Project-level
+# FUNCTIONS -- Module-level
 # =======================================================================
-# ... {develop}
 
 
-# FUNCTIONS -- Module-level
-# =======================================================================
-def emulate_simulation(data_path, output_path):
-    # todo docstring
-    data_file_path = f"{data_path}/numbers.csv"
-    df = pd.read_csv(data_file_path, sep=";")
-    sim_v = np.zeros(shape=len(df))
-    sim_r = np.random.normal(loc=100, scale=2, size=len(df))
-    testprint("running simulation")
-    for i in range(5000):
-        sim_v[i] = df["v3"].values[i] * sim_r[i]
-        sleep(0.0002)
-        print(f"step >> {i}")
-    df_o = pd.DataFrame({"v3": df["v3"].values, "sim": sim_v})
-    df_o.to_csv(output_path / "simulation.csv", sep=";", index=False)
-    return 0
+def make_inputs(size, seed=0):
+    """
+    Make the inputs of all cases from the test data.
+
+    :param size: number of inputs
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: inputs by name (numbers, timestamps, labels, filenames, ...)
+    :rtype: dict
+    """
+    conftest.make_data()
+    df = conftest.load_data()
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(df), size=size)
+    v1 = df["v1"].to_numpy()[rows]
+    v2 = df["v2"].to_numpy()[rows]
+    v3 = df["v3"].to_numpy()[rows]
+    signs = np.where(rng.random(size) < 0.5, -1.0, 1.0)
+
+    numbers = signs * v3 * v1
+    minutes = (v1 * v2 * rng.integers(1, 1_000, size=size)).astype("timedelta64[m]")
+    timestamps = np.datetime64("2000-01-01T00:00:00", "s") + minutes
+    frame = pd.DataFrame(
+        {
+            "station": np.char.add("A", (v1 * v2).astype(str)),
+            "specs": np.where(v3 > 1, "T0", "T0-M"),
+            "lat": signs * v3 * 10,
+            "lon": -v1 - v3,
+            "date": timestamps,
+        }
+    )
+    return {
+        "numbers": numbers,
+        "number_labels": encode_numbers(numbers, decimals=3, len_min=3),
+        "timestamps": timestamps,
+        "timestamp_labels": encode_timestamps(timestamps, variant="ts"),
+        "frame": frame,
+        "filenames": Template(PATTERN).render(frame, as_bytes=True).astype(str),
+    }
+
+
+def run_case(case, inputs):
+    """
+    Run a case of the suite once.
+
+    :param case: case name (see ``CASES``)
+    :type case: str
+    :param inputs: inputs of ``make_inputs``
+    :type inputs: dict
+    :return: output of the case
+    :rtype: object
+    """
+    if case == "encode_numbers":
+        return encode_numbers(inputs["numbers"], decimals=3, len_min=3)
+    if case == "decode_numbers":
+        return decode_numbers(inputs["number_labels"])
+    if case == "encode_timestamps":
+        return encode_timestamps(inputs["timestamps"], variant="ts")
+    if case == "decode_timestamps":
+        return decode_timestamps(inputs["timestamp_labels"])
+    if case == "parse_many":
+        return parse_many(inputs["filenames"], scheme="dataset")
+    if case == "render":
+        return Template(PATTERN).render(inputs["frame"], as_bytes=True)
+    raise ValueError(f"unknown case: {case!r}")
+
+
+def time_case(case, inputs, size):
+    """
+    Time a case at a scale, repeating batches of inputs beyond their size.
+
+    :param case: case name (see ``CASES``)
+    :type case: str
+    :param inputs: inputs of ``make_inputs``, of at most ``size`` operations
+    :type inputs: dict
+    :param size: number of operations
+    :type size: int
+    :return: result with the case, size, throughput and peak memory
+    :rtype: dict
+    """
+    batch = len(inputs["numbers"])
+    n_batches = math.ceil(size / batch)
+    elapsed = np.inf
+    for _ in range(REPEATS if n_batches == 1 else 1):
+        start = time.perf_counter()
+        for _ in range(n_batches):
+            run_case(case, inputs)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    # peak memory of a batch (traced apart, since tracing slows allocations)
+    tracemalloc.start()
+    try:
+        run_case(case, inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "case": case,
+        "size": n_batches * batch,
+        "ops_per_s": n_batches * batch / elapsed,
+        "elapsed": elapsed,
+        "peak_mb": peak / 2**20,
+    }
+
+
+def run_suite(scales, seed=0):
+    """
+    Run all cases at all scales.
+
+    :param scales: numbers of operations
+    :type scales: tuple
+    :param seed: random seed
+    :type seed: int
+    :return: one result per case and scale
+    :rtype: list
+    """
+    ls_results = []
+    for size in scales:
+        inputs = make_inputs(min(size, BATCH_SIZE), seed=seed)
+        for case in CASES:
+            result = time_case(case, inputs, size)
+            testprint(
+                f"{case}: {result['size']:.0e} ops, {result['ops_per_s']:.3g} ops/s, "
+                f"peak {result['peak_mb']:.1f} MB"
+            )
+            ls_results.append(result)
+    return ls_results
+
+
+def get_machine():
+    """
+    Get the baseline key of the machine running the benchmarks.
+
+    :return: key as ``{node}/{machine}/{cpus}``
+    :rtype: str
+    """
+    return f"{platform.node()}/{platform.machine()}/{os.cpu_count()}"
+
+
+def get_key(result):
+    """
+    Get the baseline key of a result.
+
+    :param result: result of ``time_case``
+    :type result: dict
+    :return: key as ``{case}@{size}``
+    :rtype: str
+    """
+    return f"{result['case']}@{result['size']}"
+
+
+def read_json(file_path, default):
+    """
+    Read a JSON file, or a default value if the file does not exist.
+
+    :param file_path: path to the file
+    :type file_path: :class:`pathlib.Path`
+    :param default: value of missing files
+    :type default: object
+    :return: contents
+    :rtype: object
+    """
+    if not file_path.is_file():
+        return default
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(file_path, data):
+    """
+    Write a JSON file, creating its folder if needed.
+
+    :param file_path: path to the file
+    :type file_path: :class:`pathlib.Path`
+    :param data: contents
+    :type data: object
+    :return: None
+    :rtype: None
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    return None
+
+
+def record_run(ls_results):
+    """
+    Append a run to the history and get the regressions against the baseline.
+
+    The baseline of the machine is updated with the results of the run if
+    ``UPDATE_BENCHMARKS_BASELINE`` is set; otherwise, it is only read, and results
+    missing from it are not compared.
+
+    :param ls_results: results of ``run_suite``
+    :type ls_results: list
+    :return: messages of results slower than the baseline beyond the threshold
+    :rtype: list
+    """
+    machine = get_machine()
+    history = read_json(conftest.BENCHMARKS_HISTORY_FILE, default=[])
+    history.append(
+        {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": machine,
+            "results": ls_results,
+        }
+    )
+    write_json(conftest.BENCHMARKS_HISTORY_FILE, history)
+
+    baselines = read_json(conftest.BENCHMARKS_BASELINE_FILE, default={})
+    if conftest.UPDATE_BENCHMARKS_BASELINE:
+        baseline = baselines.setdefault(machine, {})
+        baseline.update({get_key(r): r["ops_per_s"] for r in ls_results})
+        write_json(conftest.BENCHMARKS_BASELINE_FILE, baselines)
+        return []
+    baseline = baselines.get(machine, {})
+    if not baseline:
+        testprint(f"no baseline of {machine}: regressions are not checked")
+    ls_regressions = []
+    for result in ls_results:
+        key = get_key(result)
+        if key not in baseline:
+            continue
+        ratio = result["ops_per_s"] / baseline[key]
+        if ratio < 1 - conftest.BENCHMARKS_REGRESSION_MAX:
+            ls_regressions.append(
+                f"{key}: {result['ops_per_s']:.3g} ops/s "
+                f"({ratio:.0%} of the baseline {baseline[key]:.3g} ops/s)"
+            )
+    return ls_regressions
 
 
 # ... {develop}
@@ -118,102 +374,52 @@ def emulate_simulation(data_path, output_path):
 # CLASSES
 # ***********************************************************************
 
-# CLASSES -- Project-level
-# =======================================================================
-# ... {develop}
-
 # CLASSES -- Module-level
 # =======================================================================
 
 
 @unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
-class BenchmarkTemplateTests(unittest.TestCase):
-
-    # Setup methods
-    # -------------------------------------------------------------------
-    @classmethod
-    def setUpClass(cls):
-        """
-        Prepare large datasets and output folders
-        """
-        # download data if needed
-        tpl = conftest.retrieve_dataset(name="numbers")
-        cls.data_path = tpl[0]
-        cls.output_path = tpl[1]
-
-    def setUp(self):
-        """
-        Runs before each test method
-        """
-        # ... {develop}
-        return None
+class BenchmarkCodecs(unittest.TestCase):
 
     # Testing methods
     # -------------------------------------------------------------------
 
-    def test_without_error(self):
-        """
-        Ensure the simulation runs without crashing.
-
-        Other info
-        """
-        try:
-            results = emulate_simulation(
-                data_path=self.data_path, output_path=self.output_path
-            )
-        except Exception as e:
-            self.fail(f"simulation crashed with error: {e}")
-
-    def test_model_performance(self):
-        """
-        Measure execution time or performance.
-        """
-        import time
-
-        start = time.time()
-        # run
-        emulate_simulation(data_path=self.data_path, output_path=self.output_path)
-
-        elapsed = time.time() - start
-
-        # Simple performance check (optional)
-        testprint(f"model ran in {elapsed:.2f} seconds")
-        # e.g., test fails if > 10 minutes
-        self.assertLess(elapsed, 600)
+    def check_suite(self, scales):
+        # run the suite, record it and check regressions
+        ls_results = run_suite(scales)
+        self.assertEqual(len(ls_results), len(scales) * len(CASES))
+        ls_regressions = record_run(ls_results)
+        self.assertEqual(ls_regressions, [], "\n".join(ls_regressions))
 
-    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
-    def test_full_model_run(self):
+    def test_inputs(self):
         """
-        Run the full simulation and check outputs
+        Ensure the inputs of the suite round trip through the codecs.
         """
-        # Run simulation
-        results = emulate_simulation(
-            data_path=self.data_path, output_path=self.output_path
+        inputs = make_inputs(1_000)
+        np.testing.assert_allclose(
+            run_case("decode_numbers", inputs), inputs["numbers"], atol=5e-4
+        )
+        np.testing.assert_array_equal(
+            run_case("decode_timestamps", inputs), inputs["timestamps"]
+        )
+        df = run_case("parse_many", inputs)
+        self.assertEqual(df["item"].tolist(), inputs["frame"]["station"].tolist())
+        np.testing.assert_array_equal(
+            df["datetime_start"].to_numpy(), inputs["timestamps"]
         )
 
-        # Example assertions: basic validation of output
-        self.assertIsNotNone(results)
-        self.assertTrue((self.output_path / "summary.csv").exists())
-
-    # Tear down methods
-    # -------------------------------------------------------------------
-    def tearDown(self):
+    def test_suite(self):
         """
-        Runs after each test method
+        Ensure the throughput of the codecs does not regress, up to a million operations.
         """
-        # ... {develop}
-        return None
+        self.check_suite(SCALES)
 
-    @classmethod
-    def tearDownClass(cls):
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_suite_xxl(self):
         """
-        Runs once after all tests
+        Ensure the throughput of the codecs does not regress, up to a hundred million operations.
         """
-        # ... {develop}
-        return None
-
-
-# ... {develop}
+        self.check_suite(SCALES_XXL)
 
 
 # ***********************************************************************
@@ -221,15 +427,8 @@ class BenchmarkTemplateTests(unittest.TestCase):
 # ***********************************************************************
 # standalone behaviour as a script
 if __name__ == "__main__":
-    from tests.conftest import RUN_BENCHMARKS
-
-    RUN_BENCHMARKS = True
 
     # Script section
     # ===================================================================
     unittest.main()
     # ... {develop}
-
-    # Script subsection
-    # -------------------------------------------------------------------
-    # ... {develop}
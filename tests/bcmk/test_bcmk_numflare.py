@@ -0,0 +1,499 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.numflare`` codecs.
+
+Overview
+--------
+The benchmarks compare the current codecs against reference implementations
+and check that the outputs are identical. They are skipped unless
+the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_numflare
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import sys
+import tempfile
+import unittest
+import time
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import SIGN, DECIMAL, MAGNITUDES
+from flare.numflare import decode_number, encode_numbers, CachedCodec
+from flare.numflare import encode_number, decode_numbers, IntegerTable, LabelStore
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 200_000
+SIZE_XXL = 2_000_000
+# minimal speedup of decode_number over the reference implementation
+# for numbers with a decimal part (the recursive path of the reference),
+# as the median of paired runs (measured 2.1x to 2.4x)
+SPEEDUP_MIN = 2.0
+# number of repeats for timing (best is taken)
+REPEATS = 5
+# minimal speedup of cached decoding for repetitive labels (1-degree grid)
+SPEEDUP_CACHE_MIN = 3.0
+# minimal speedups of integer tables over the scalar and bulk encoders
+SPEEDUP_TABLE_MIN = 50.0
+SPEEDUP_TABLE_BULK_MIN = 5.0
+# number of integers encoded by the scalar encoder
+SIZE_SCALAR = 100_000
+# minimal memory saving of byte arrays over lists of Python strings
+MEMORY_RATIO_MIN = 5.0
+# minimal speedup of opening a label store over reading and decoding a csv column
+SPEEDUP_STORE_MIN = 20.0
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+# ... {develop}
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def decode_number_reference(encoded_number):
+    """
+    Reference (recursive) implementation of ``decode_number`` from version 0.0.1.
+
+    :param encoded_number: The encoded number string.
+    :type encoded_number: str
+    :return: The decoded number.
+    :rtype: float
+    """
+    encoded_number_lower = encoded_number.lower()
+    magnitude_multiplier = 1
+    if encoded_number_lower[-1] in MAGNITUDES:
+        magnitude_multiplier = MAGNITUDES[encoded_number_lower[-1]]
+        encoded_number_lower = encoded_number_lower[:-1]
+    sign = 1
+    tp_neg = (SIGN["longitude"]["negative"], SIGN["latitude"]["negative"])
+    tp_pos = (SIGN["longitude"]["positive"], SIGN["latitude"]["positive"])
+    if encoded_number_lower.startswith(tp_neg):
+        sign = -1
+        encoded_number_lower = encoded_number_lower[1:]
+    elif encoded_number_lower.startswith(tp_pos):
+        encoded_number_lower = encoded_number_lower[1:]
+    if DECIMAL in encoded_number_lower:
+        _ls = encoded_number_lower.split(DECIMAL)
+        integer_part = str(int(decode_number_reference(encoded_number=_ls[0])))
+        rational_part = _ls[1]
+        encoded_number_lower = integer_part + "." + rational_part
+    return sign * float(encoded_number_lower) * magnitude_multiplier
+
+
+def make_labels(size, seed=0, ls_decimals=(1, 2, 3)):
+    """
+    Make a list of encoded numbers with mixed decimals, signs and magnitudes.
+
+    :param size: number of labels
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :param ls_decimals: number of decimals used for encoding
+    :type ls_decimals: tuple
+    :return: encoded numbers
+    :rtype: list
+    """
+    rng = np.random.default_rng(seed)
+    numbers = rng.normal(loc=0, scale=1000, size=size)
+    n = len(ls_decimals)
+    ls_labels = []
+    for i, decimals in enumerate(ls_decimals):
+        for collapse_magnitude in [False, True]:
+            encoded = encode_numbers(
+                numbers[i::n],
+                decimals=decimals,
+                len_min=3,
+                is_latitude=bool(i % 2),
+                collapse_magnitude=collapse_magnitude,
+            )
+            ls_labels.extend(encoded[::2].tolist())
+    return ls_labels
+
+
+def time_function(func, ls_labels):
+    """
+    Time a scalar decoder over a list of labels (best of ``REPEATS``).
+
+    :param func: decoder function
+    :type func: callable
+    :param ls_labels: encoded numbers
+    :type ls_labels: list
+    :return: tuple of elapsed seconds and decoded values
+    :rtype: tuple
+    """
+    elapsed = np.inf
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        ls_decoded = [func(s) for s in ls_labels]
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed, ls_decoded
+
+
+def time_speedup(func_ref, func_new, ls_labels):
+    """
+    Time two scalar decoders in alternation over a list of labels (``REPEATS`` pairs).
+
+    Runs alternate so that both decoders see the same load; the speedup is the median
+    of the ratios of paired runs, which is steadier than a ratio of best times.
+
+    :param func_ref: reference decoder function
+    :type func_ref: callable
+    :param func_new: new decoder function
+    :type func_new: callable
+    :param ls_labels: encoded numbers
+    :type ls_labels: list
+    :return: tuple of the speedup, best elapsed seconds of both decoders and their decoded values
+    :rtype: tuple
+    """
+    ls_ref, ls_new = [], []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        ls_decoded_ref = [func_ref(s) for s in ls_labels]
+        ls_ref.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        ls_decoded_new = [func_new(s) for s in ls_labels]
+        ls_new.append(time.perf_counter() - start)
+    speedup = float(np.median(np.array(ls_ref) / np.array(ls_new)))
+    return speedup, min(ls_ref), min(ls_new), ls_decoded_ref, ls_decoded_new
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkDecodeNumber(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Prepare the encoded labels
+        """
+        cls.labels = make_labels(size=SIZE)
+        cls.labels_mixed = make_labels(size=SIZE, ls_decimals=(0, 1, 2, 3))
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare(self, ls_labels):
+        # time both decoders and check outputs
+        speedup, elapsed_ref, elapsed_new, ls_ref, ls_new = time_speedup(
+            decode_number_reference, decode_number, ls_labels
+        )
+        self.assertEqual(ls_new, ls_ref)
+        testprint(
+            f"decode_number: {len(ls_labels)} labels in {elapsed_new:.3f} s "
+            f"(reference {elapsed_ref:.3f} s, speedup {speedup:.1f}x)"
+        )
+        return speedup
+
+    def test_decode_number_speedup(self):
+        """
+        Ensure decode_number is faster than the reference implementation.
+        """
+        speedup = self.compare(self.labels)
+        self.assertGreater(speedup, SPEEDUP_MIN)
+
+    def test_decode_number_mixed(self):
+        """
+        Ensure decode_number is not slower than the reference for mixed integer and real numbers.
+        """
+        speedup = self.compare(self.labels_mixed)
+        self.assertGreater(speedup, 1.0)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_decode_number_speedup_xxl(self):
+        """
+        Ensure decode_number is faster than the reference implementation on large inputs.
+        """
+        speedup = self.compare(make_labels(size=SIZE_XXL, seed=1))
+        self.assertGreater(speedup, SPEEDUP_MIN)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkCachedCodec(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare(self, size):
+        # time cached decoding of grid coordinates against decode_number
+        rng = np.random.default_rng(0)
+        ls_labels = encode_numbers(
+            rng.integers(-180, 180, size=size) / 4, decimals=2, len_min=3
+        ).tolist()
+        elapsed_scalar, ls_scalar = time_function(decode_number, ls_labels)
+        codec = CachedCodec()
+        elapsed_cached, ls_cached = time_function(codec.decode, ls_labels)
+        self.assertEqual(ls_cached, ls_scalar)
+        stats = codec.stats()["decode"]
+        speedup = elapsed_scalar / elapsed_cached
+        testprint(
+            f"CachedCodec.decode: {size} labels in {elapsed_cached:.3f} s "
+            f"(decode_number {elapsed_scalar:.3f} s, speedup {speedup:.1f}x, "
+            f"hit rate {stats['hit_rate']:.3f})"
+        )
+        return speedup
+
+    def test_cached_decode_speedup(self):
+        """
+        Ensure cached decoding is faster than decode_number for repetitive labels.
+        """
+        self.assertGreater(self.compare(SIZE), SPEEDUP_CACHE_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_cached_decode_speedup_xxl(self):
+        """
+        Ensure cached decoding is faster than decode_number on large inputs.
+        """
+        self.assertGreater(self.compare(SIZE_XXL), SPEEDUP_CACHE_MIN)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkIntegerTable(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare(self, size):
+        # time integer tables against the scalar and bulk codecs
+        rng = np.random.default_rng(0)
+        integers = rng.integers(-500, 500, size=size)
+        table = IntegerTable(-500, 500, len_min=3, is_latitude=False)
+        kwargs = dict(len_min=3, is_latitude=False)
+
+        elapsed = time.perf_counter()
+        encoded = table.encode(integers)
+        elapsed_table = (time.perf_counter() - elapsed) / size
+        elapsed = time.perf_counter()
+        encoded_bulk = encode_numbers(integers, **kwargs)
+        elapsed_bulk = (time.perf_counter() - elapsed) / size
+        sample = integers[:SIZE_SCALAR].tolist()
+        elapsed = time.perf_counter()
+        ls_encoded = [encode_number(n, **kwargs) for n in sample]
+        elapsed_scalar = (time.perf_counter() - elapsed) / len(sample)
+        np.testing.assert_array_equal(encoded, encoded_bulk)
+        self.assertEqual(encoded[: len(sample)].tolist(), ls_encoded)
+
+        elapsed = time.perf_counter()
+        decoded = table.decode(encoded)
+        elapsed_decode = time.perf_counter() - elapsed
+        elapsed = time.perf_counter()
+        decoded_bulk = decode_numbers(encoded)
+        elapsed_decode_bulk = time.perf_counter() - elapsed
+        np.testing.assert_array_equal(decoded, decoded_bulk)
+
+        speedup = elapsed_scalar / elapsed_table
+        speedup_bulk = elapsed_bulk / elapsed_table
+        testprint(
+            f"IntegerTable: {size} integers encoded in {elapsed_table * size:.3f} s "
+            f"(speedup {speedup:.0f}x over encode_number, {speedup_bulk:.1f}x over "
+            f"encode_numbers), decoded in {elapsed_decode:.3f} s "
+            f"(decode_numbers {elapsed_decode_bulk:.3f} s)"
+        )
+        return speedup, speedup_bulk
+
+    def test_table_speedup(self):
+        """
+        Ensure table encoding is much faster than the scalar and bulk encoders.
+        """
+        speedup, speedup_bulk = self.compare(SIZE * 5)
+        self.assertGreater(speedup, SPEEDUP_TABLE_MIN)
+        self.assertGreater(speedup_bulk, SPEEDUP_TABLE_BULK_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_table_speedup_xxl(self):
+        """
+        Ensure table encoding is much faster on large inputs.
+        """
+        speedup, speedup_bulk = self.compare(SIZE_XXL * 5)
+        self.assertGreater(speedup, SPEEDUP_TABLE_MIN)
+        self.assertGreater(speedup_bulk, SPEEDUP_TABLE_BULK_MIN)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkBytes(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare(self, size):
+        # memory and decoding time of byte arrays against lists of Python strings
+        rng = np.random.default_rng(0)
+        numbers = rng.normal(loc=0, scale=1000, size=size)
+        encoded = encode_numbers(numbers, decimals=2, len_min=3, as_bytes=True)
+        ls_labels = encoded.astype(str).tolist()
+        memory_list = sys.getsizeof(ls_labels) + sum(map(sys.getsizeof, ls_labels))
+        memory_ratio = memory_list / encoded.nbytes
+
+        elapsed = time.perf_counter()
+        decoded = decode_numbers(encoded)
+        elapsed_bytes = time.perf_counter() - elapsed
+        elapsed = time.perf_counter()
+        decoded_list = decode_numbers(ls_labels)
+        elapsed_list = time.perf_counter() - elapsed
+        np.testing.assert_array_equal(decoded, decoded_list)
+        testprint(
+            f"bytes: {size} labels in {encoded.nbytes / 1e6:.1f} MB "
+            f"(str list {memory_list / 1e6:.1f} MB, {memory_ratio:.1f}x), "
+            f"decoded in {elapsed_bytes:.3f} s (str list {elapsed_list:.3f} s)"
+        )
+        return memory_ratio, elapsed_list / elapsed_bytes
+
+    def test_bytes(self):
+        """
+        Ensure byte arrays are much smaller than string lists and decode as fast.
+        """
+        memory_ratio, speedup = self.compare(SIZE * 5)
+        self.assertGreater(memory_ratio, MEMORY_RATIO_MIN)
+        self.assertGreater(speedup, 1.0)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_bytes_xxl(self):
+        """
+        Ensure byte arrays are much smaller than string lists on large inputs.
+        """
+        memory_ratio, speedup = self.compare(SIZE_XXL * 5)
+        self.assertGreater(memory_ratio, MEMORY_RATIO_MIN)
+        self.assertGreater(speedup, 1.0)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkLabelStore(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare(self, size):
+        # time opening a store against reading and decoding a csv column
+        rng = np.random.default_rng(0)
+        numbers = rng.normal(loc=0, scale=1000, size=size)
+        encoded = encode_numbers(numbers, decimals=2, len_min=3, as_bytes=True)
+        path_csv = self.folder / "labels.csv"
+        pd.DataFrame({"lat": encoded.astype(str)}).to_csv(path_csv, index=False)
+        elapsed = time.perf_counter()
+        LabelStore.write(self.folder / "labels.flare", encoded).close()
+        elapsed_write = time.perf_counter() - elapsed
+
+        elapsed = time.perf_counter()
+        values_csv = decode_numbers(pd.read_csv(path_csv)["lat"])
+        elapsed_csv = time.perf_counter() - elapsed
+        elapsed = time.perf_counter()
+        store = LabelStore(self.folder / "labels.flare")
+        elapsed_open = time.perf_counter() - elapsed
+        np.testing.assert_array_equal(store.values, values_csv.to_numpy())
+        store.close()
+
+        speedup = elapsed_csv / elapsed_open
+        testprint(
+            f"LabelStore: {size} labels written in {elapsed_write:.2f} s, "
+            f"opened in {elapsed_open * 1e3:.2f} ms "
+            f"(csv and decode {elapsed_csv:.2f} s, speedup {speedup:.0f}x)"
+        )
+        return speedup
+
+    def test_store(self):
+        """
+        Ensure opening a store is much faster than reading and decoding a csv column.
+        """
+        self.assertGreater(self.compare(SIZE * 5), SPEEDUP_STORE_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_store_xxl(self):
+        """
+        Ensure opening a store is much faster on large inputs.
+        """
+        self.assertGreater(self.compare(SIZE_XXL * 5), SPEEDUP_STORE_MIN)
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
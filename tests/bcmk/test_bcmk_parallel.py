@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.parallel`` codecs.
+
+Overview
+--------
+The benchmarks time the parallel codecs for an increasing number of workers
+and check the scaling against the single-process bulk codecs. Worker counts
+above the number of available CPUs are skipped. They are skipped unless
+the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_parallel
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import encode_numbers, decode_numbers
+from flare.parallel import encode_numbers_parallel, decode_numbers_parallel
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 4_000_000
+SIZE_XXL = 20_000_000
+WORKERS = (1, 2, 4, 8)
+CPU_COUNT = os.cpu_count() or 1
+# minimal parallel efficiency (speedup / workers) for near-linear scaling
+EFFICIENCY_MIN = 0.6
+# number of repeats for timing (best is taken)
+REPEATS = 3
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def time_function(func, *args, **kwargs):
+    """
+    Time a function call (best of ``REPEATS``).
+
+    :param func: function to time
+    :type func: callable
+    :return: tuple of elapsed seconds and function output
+    :rtype: tuple
+    """
+    elapsed = np.inf
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        output = func(*args, **kwargs)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed, output
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkParallel(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Prepare the numbers
+        """
+        rng = np.random.default_rng(0)
+        cls.numbers = rng.normal(loc=0, scale=1000, size=SIZE)
+        cls.options = dict(decimals=3, len_min=4)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def scaling(self, name, func, func_serial, data, **kwargs):
+        # time the serial codec and the parallel codec per number of workers
+        elapsed_serial, expected = time_function(func_serial, data, **kwargs)
+        ls_workers = [w for w in WORKERS if w <= CPU_COUNT]
+        dc_speedup = {}
+        for workers in ls_workers:
+            # pool start-up is not timed
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                func(data[:workers], workers=workers, executor=executor, **kwargs)
+                elapsed, output = time_function(
+                    func, data, workers=workers, executor=executor, **kwargs
+                )
+            equal_nan = output.dtype.kind == "f"
+            self.assertTrue(np.array_equal(output, expected, equal_nan=equal_nan))
+            dc_speedup[workers] = elapsed_serial / elapsed
+            testprint(
+                f"{name}: {len(data)} values, {workers} workers in {elapsed:.3f} s "
+                f"(serial {elapsed_serial:.3f} s, speedup {dc_speedup[workers]:.2f}x)"
+            )
+        return dc_speedup
+
+    def check_scaling(self, dc_speedup):
+        # near-linear scaling where enough CPUs are available
+        if CPU_COUNT < 2:
+            self.skipTest("scaling needs at least 2 CPUs")
+        for workers, speedup in dc_speedup.items():
+            if workers > 1:
+                self.assertGreater(speedup / workers, EFFICIENCY_MIN)
+
+    def test_encode_scaling(self):
+        """
+        Ensure encode_numbers_parallel scales with the number of workers.
+        """
+        dc_speedup = self.scaling(
+            "encode_numbers_parallel",
+            encode_numbers_parallel,
+            encode_numbers,
+            self.numbers,
+            **self.options,
+        )
+        self.check_scaling(dc_speedup)
+
+    def test_decode_scaling(self):
+        """
+        Ensure decode_numbers_parallel scales with the number of workers.
+        """
+        labels = encode_numbers(self.numbers, **self.options)
+        dc_speedup = self.scaling(
+            "decode_numbers_parallel", decode_numbers_parallel, decode_numbers, labels
+        )
+        self.check_scaling(dc_speedup)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_encode_scaling_xxl(self):
+        """
+        Ensure encode_numbers_parallel scales on large inputs.
+        """
+        numbers = np.random.default_rng(1).normal(loc=0, scale=1000, size=SIZE_XXL)
+        dc_speedup = self.scaling(
+            "encode_numbers_parallel",
+            encode_numbers_parallel,
+            encode_numbers,
+            numbers,
+            **self.options,
+        )
+        self.check_scaling(dc_speedup)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Round-trip fidelity harness and throughput benchmark for the ``flare.numflare`` codecs.
+
+Overview
+--------
+The harness sweeps all combinations of ``decimals``, ``len_min``, ``is_latitude``
+and ``collapse_magnitude`` (see ``CONFIGS``). Each configuration encodes and decodes
+a batch of adversarial values in bulk: numbers over many orders of magnitude, ties
+of rounding (``k + 0.5`` units of the last decimal) and their float neighbours,
+values around the factors of ``MAGNITUDES``, integers, zeros and missing values.
+
+For each configuration, the harness reports the largest absolute and relative errors
+of ``decode_numbers(encode_numbers(x))`` against ``x`` (relative errors only for
+values of at least one unit of the last decimal) and counts the values beyond the
+tolerance: half a unit of the last decimal, scaled by the collapsed magnitude,
+plus a few units in the last place of ``x``. A sample is also encoded and decoded
+with the scalar codecs, which must give the same labels and values. Timings give the
+throughput of the bulk encoder and decoder.
+
+The benchmarks are skipped unless the ``RUN_BENCHMARKS`` environment variable is set
+to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_roundtrip
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import itertools
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import MAGNITUDES, decode_number, decode_numbers
+from flare.numflare import encode_number, encode_numbers
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# number of values per configuration
+SIZE = 100_000
+SIZE_XXL = 1_000_000
+# number of values per configuration checked against the scalar codecs
+SIZE_SCALAR = 2_000
+# configurations of the encoder
+CONFIGS = [
+    dict(
+        decimals=decimals,
+        len_min=len_min,
+        is_latitude=is_latitude,
+        collapse_magnitude=collapse_magnitude,
+    )
+    for decimals, len_min, is_latitude, collapse_magnitude in itertools.product(
+        (0, 1, 2, 3, 6, 12), (1, 3), (True, False), (False, True)
+    )
+]
+# largest magnitude of the sweep (up to 1e12)
+EXPONENT_MAX = 12
+# units in the last place of values allowed on top of the rounding error
+ULPS_MAX = 4
+# minimal throughput of the bulk encoder and decoder (values per second)
+THROUGHPUT_MIN = 200_000
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_values(size, decimals, seed=0):
+    """
+    Make adversarial values for a number of decimals, with random signs.
+
+    :param size: number of values
+    :type size: int
+    :param decimals: number of decimals of the encoder
+    :type decimals: int
+    :param seed: random seed
+    :type seed: int
+    :return: values, including ties, magnitude boundaries, zeros and NaN
+    :rtype: :class:`numpy.ndarray`
+    """
+    rng = np.random.default_rng(seed)
+    unit = 10.0**-decimals
+    n = size // 8
+    # log-uniform values over many orders of magnitude
+    spread = 10 ** rng.uniform(-decimals - 2, EXPONENT_MAX, size=size - 6 * n)
+    # ties of rounding and their float neighbours
+    ties = (rng.integers(0, 10**6, size=n) + 0.5) * unit
+    ties_prev = np.nextafter(ties, 0)
+    ties_next = np.nextafter(ties, np.inf)
+    # values around the magnitude factors
+    factors = rng.choice(list(MAGNITUDES.values()), size=n).astype(np.float64)
+    offsets = rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0], size=n) * unit
+    boundaries = np.where(
+        rng.random(n) < 0.5, factors + offsets, factors * 10 * (1 + offsets)
+    )
+    # integers and special values
+    integers = rng.integers(0, 10**6, size=n).astype(np.float64)
+    special = np.resize([0.0, -0.0, np.nan, 0.5, 1.0, 9.5, 10.0, 99.95], n)
+    values = np.concatenate(
+        [spread, ties, ties_prev, ties_next, boundaries, integers, special]
+    )
+    signs = np.where(rng.random(values.size) < 0.5, -1.0, 1.0)
+    return rng.permutation(values * signs)
+
+
+def get_tolerances(values, decimals, collapse_magnitude):
+    """
+    Get the largest error allowed for each value.
+
+    :param values: values
+    :type values: :class:`numpy.ndarray`
+    :param decimals: number of decimals of the encoder
+    :type decimals: int
+    :param collapse_magnitude: if the encoder collapses magnitudes
+    :type collapse_magnitude: bool
+    :return: tolerances
+    :rtype: :class:`numpy.ndarray`
+    """
+    abs_values = np.abs(values)
+    factors = np.ones(values.size)
+    if collapse_magnitude:
+        # the first factor reached wins, as in encode_number
+        pending = np.ones(values.size, dtype=bool)
+        for factor in MAGNITUDES.values():
+            hit = pending & (abs_values >= factor)
+            factors[hit] = factor
+            pending &= ~hit
+    return 0.5 * 10.0**-decimals * factors + ULPS_MAX * np.spacing(abs_values)
+
+
+def round_trip(values, **options):
+    """
+    Encode and decode values in bulk and measure the errors.
+
+    :param values: values
+    :type values: :class:`numpy.ndarray`
+    :param options: options of ``encode_numbers``
+    :return: report of errors and throughput
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    labels = encode_numbers(values, **options)
+    elapsed_encode = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = decode_numbers(labels)
+    elapsed_decode = time.perf_counter() - start
+
+    is_null = np.isnan(values)
+    errors = np.where(is_null, 0.0, np.abs(decoded - values))
+    # relative errors of values of at least one unit of the last decimal
+    abs_values = np.abs(values)
+    relative = np.divide(
+        errors,
+        abs_values,
+        out=np.zeros(values.size),
+        where=abs_values >= 10.0 ** -options["decimals"],
+    )
+    tolerances = get_tolerances(
+        values, options["decimals"], options["collapse_magnitude"]
+    )
+    is_over = (errors > tolerances) | (np.isnan(decoded) != is_null)
+    worst = int(np.argmax(errors))
+
+    # the scalar codecs give the same labels and values
+    sample = values[:SIZE_SCALAR]
+    ls_labels = [
+        "x" if np.isnan(v) else encode_number(float(v), **options) for v in sample
+    ]
+    ls_decoded = [
+        np.nan if label == "x" else decode_number(label) for label in ls_labels
+    ]
+    is_scalar_equal = ls_labels == labels[:SIZE_SCALAR].tolist() and np.array_equal(
+        ls_decoded, decoded[:SIZE_SCALAR], equal_nan=True
+    )
+    return {
+        **options,
+        "size": values.size,
+        "max_abs_error": float(errors.max()),
+        "max_rel_error": float(relative.max()),
+        "n_over": int(is_over.sum()),
+        "worst_value": float(values[worst]),
+        "worst_label": str(labels[worst]),
+        "scalar_equal": is_scalar_equal,
+        "encode_per_s": values.size / elapsed_encode,
+        "decode_per_s": values.size / elapsed_decode,
+    }
+
+
+def sweep(size, seed=0):
+    """
+    Run the round trip of all configurations.
+
+    :param size: number of values per configuration
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: one report per configuration
+    :rtype: :class:`pandas.DataFrame`
+    """
+    ls_reports = []
+    for i, options in enumerate(CONFIGS):
+        values = make_values(size, options["decimals"], seed=seed + i)
+        ls_reports.append(round_trip(values, **options))
+    return pd.DataFrame(ls_reports)
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkRoundTrip(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def check_sweep(self, size, seed=0):
+        # run the sweep, print the report and check fidelity and throughput
+        elapsed = time.perf_counter()
+        df = sweep(size, seed=seed)
+        elapsed = time.perf_counter() - elapsed
+        columns = [
+            "decimals",
+            "len_min",
+            "is_latitude",
+            "collapse_magnitude",
+            "max_abs_error",
+            "max_rel_error",
+            "n_over",
+            "worst_label",
+            "encode_per_s",
+            "decode_per_s",
+        ]
+        with pd.option_context("display.width", 200, "display.max_rows", None):
+            print(df[columns].to_string(index=False, float_format="{:.3g}".format))
+        testprint(
+            f"round trip: {len(CONFIGS)} configurations of {size} values in "
+            f"{elapsed:.1f} s (encode {df['encode_per_s'].median():.3g} values/s, "
+            f"decode {df['decode_per_s'].median():.3g} values/s)"
+        )
+        self.assertEqual(df["n_over"].sum(), 0, df[df["n_over"] > 0].to_string())
+        self.assertTrue(df["scalar_equal"].all())
+        self.assertGreater(df["encode_per_s"].median(), THROUGHPUT_MIN)
+        self.assertGreater(df["decode_per_s"].median(), THROUGHPUT_MIN)
+
+    def test_round_trip(self):
+        """
+        Ensure round-trip errors are within the tolerance of all configurations.
+        """
+        self.check_sweep(SIZE)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_round_trip_xxl(self):
+        """
+        Ensure round-trip errors are within the tolerance over millions of values.
+        """
+        self.check_sweep(SIZE_XXL, seed=100)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,189 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.templates`` label composer.
+
+Overview
+--------
+The benchmarks time ``Template.render`` over a million tile names (ten million for
+the long benchmark, as bytes) against a loop formatting each name with the scalar
+codecs. They are skipped unless the ``RUN_BENCHMARKS`` environment variable is set
+to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_templates
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import encode_number
+from flare.templates import Template
+from flare.timeflare import encode_timestamp
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 1_000_000
+SIZE_XXL = 10_000_000
+# number of names formatted by the scalar loop
+SIZE_SCALAR = 20_000
+# maximal time to render ten million names (seconds)
+ELAPSED_XXL_MAX = 60.0
+# minimal speedup over the scalar loop
+SPEEDUP_RENDER_MIN = 5.0
+# template of tile names
+PATTERN = "COPERNICUS_COPDEM_{item}_DGTE_{lat:02lat}{lon:03lon}_{date:tsd}"
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_tiles(size, seed=0):
+    """
+    Make the columns of tile names.
+
+    :param size: number of tiles
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: tiles, with item, lat, lon and date columns
+    :rtype: :class:`pandas.DataFrame`
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "item": rng.choice(["GLO30", "GLO90", "EEA10"], size=size),
+            "lat": rng.integers(-89, 90, size=size),
+            "lon": rng.integers(-179, 180, size=size),
+            "date": np.datetime64("2011-10-08")
+            + rng.integers(0, 3650, size=size).astype("timedelta64[D]"),
+        }
+    )
+
+
+def render_loop(df):
+    """
+    Render tile names with a loop of scalar codecs.
+
+    :param df: tiles
+    :type df: :class:`pandas.DataFrame`
+    :return: tile names
+    :rtype: list
+    """
+    return [
+        "COPERNICUS_COPDEM_{}_DGTE_{}{}_{}".format(
+            item,
+            encode_number(lat, len_min=2),
+            encode_number(lon, len_min=3, is_latitude=False),
+            encode_timestamp(pd.Timestamp(date), variant="tsd"),
+        )
+        for item, lat, lon, date in df.itertuples(index=False)
+    ]
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkTemplate(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare_render(self, df, as_bytes=False):
+        # time the bulk renderer against the scalar loop on a sample
+        template = Template(PATTERN)
+        elapsed = time.perf_counter()
+        labels = template.render(df, as_bytes=as_bytes)
+        elapsed_bulk = time.perf_counter() - elapsed
+
+        sample = df.iloc[:SIZE_SCALAR]
+        elapsed = time.perf_counter()
+        ls_labels = render_loop(sample)
+        elapsed_scalar = (time.perf_counter() - elapsed) / len(sample)
+
+        labels = np.asarray(labels[:SIZE_SCALAR])
+        if as_bytes:
+            labels = np.char.decode(labels)
+        self.assertEqual(labels.tolist(), ls_labels)
+        speedup = elapsed_scalar * len(df) / elapsed_bulk
+        testprint(
+            f"Template.render: {len(df)} tile names in {elapsed_bulk:.2f} s "
+            f"(loop {elapsed_scalar * 1e6:.2f} us per name, speedup {speedup:.1f}x)"
+        )
+        return elapsed_bulk, speedup
+
+    def test_render(self):
+        """
+        Ensure rendering tile names is faster than a loop of scalar codecs.
+        """
+        _, speedup = self.compare_render(make_tiles(SIZE))
+        self.assertGreater(speedup, SPEEDUP_RENDER_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_render_xxl(self):
+        """
+        Ensure rendering ten million tile names is a bulk operation.
+        """
+        elapsed, speedup = self.compare_render(make_tiles(SIZE_XXL, seed=1), True)
+        self.assertLess(elapsed, ELAPSED_XXL_MAX)
+        self.assertGreater(speedup, SPEEDUP_RENDER_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
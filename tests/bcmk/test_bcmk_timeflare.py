@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.timeflare`` epoch index.
+
+Overview
+--------
+The benchmarks time overlap queries of the epoch index against a linear scan
+over the same epochs and check that the outputs are identical. They are skipped
+unless the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_timeflare
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.timeflare import EpochIndex, encode_epochs
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 1_000_000
+SIZE_XXL = 10_000_000
+# number of queries timed
+N_QUERIES = 200
+# minimal speedup of index queries over a linear scan
+SPEEDUP_MIN = 10.0
+# largest mean time of a query in seconds
+QUERY_TIME_MAX = 1e-3
+SECONDS_PER_DAY = 86_400
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_epochs(size, seed=0):
+    """
+    Make epochs over 50 years, lasting from minutes to a few months.
+
+    :param size: number of epochs
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: tuple of starts and stops (``datetime64[s]``)
+    :rtype: tuple
+    """
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, 50 * 365 * SECONDS_PER_DAY, size=size)
+    durations = (10 ** rng.uniform(2, 7, size=size)).astype(np.int64)
+    return starts.astype("datetime64[s]"), (starts + durations).astype("datetime64[s]")
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkEpochIndex(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare(self, starts, stops):
+        # time index queries against a linear scan of daily ranges
+        elapsed = time.perf_counter()
+        index = EpochIndex(starts, stops, unit="s")
+        elapsed_build = time.perf_counter() - elapsed
+        rng = np.random.default_rng(1)
+        ls_queries = rng.integers(0, 50 * 365 * SECONDS_PER_DAY, size=N_QUERIES)
+        ls_queries = ls_queries.astype("datetime64[s]")
+        day = np.timedelta64(1, "D")
+
+        elapsed = time.perf_counter()
+        ls_index = [index.overlaps(q, q + day) for q in ls_queries]
+        elapsed_index = (time.perf_counter() - elapsed) / N_QUERIES
+
+        elapsed = time.perf_counter()
+        ls_scan = [np.flatnonzero((starts < q + day) & (stops > q)) for q in ls_queries]
+        elapsed_scan = (time.perf_counter() - elapsed) / N_QUERIES
+
+        for hits_index, hits_scan in zip(ls_index, ls_scan):
+            self.assertTrue(np.array_equal(hits_index, hits_scan))
+        speedup = elapsed_scan / elapsed_index
+        n_hits = np.mean([len(hits) for hits in ls_index])
+        testprint(
+            f"EpochIndex: {len(starts)} epochs built in {elapsed_build:.3f} s, "
+            f"{elapsed_index * 1e6:.0f} us per query ({n_hits:.0f} hits) "
+            f"(scan {elapsed_scan * 1e6:.0f} us, speedup {speedup:.1f}x)"
+        )
+        return elapsed_index, speedup
+
+    def test_overlaps(self):
+        """
+        Ensure overlap queries are much faster than a linear scan.
+        """
+        elapsed, speedup = self.compare(*make_epochs(SIZE))
+        self.assertGreater(speedup, SPEEDUP_MIN)
+        self.assertLess(elapsed, QUERY_TIME_MAX)
+
+    def test_from_labels(self):
+        """
+        Time decoding of epoch labels into an index.
+        """
+        starts, stops = make_epochs(SIZE, seed=2)
+        labels = encode_epochs(starts, stops, variant="tsu")
+        elapsed = time.perf_counter()
+        index = EpochIndex.from_labels(labels, unit="s")
+        elapsed = time.perf_counter() - elapsed
+        testprint(f"EpochIndex.from_labels: {len(labels)} labels in {elapsed:.3f} s")
+        self.assertEqual(len(index), SIZE)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_overlaps_xxl(self):
+        """
+        Ensure overlap queries are much faster than a linear scan on large inputs.
+        """
+        elapsed, speedup = self.compare(*make_epochs(SIZE_XXL, seed=3))
+        self.assertGreater(speedup, SPEEDUP_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.tracker`` incremental version tracker.
+
+Overview
+--------
+The benchmarks time add and remove events of :class:`VersionTracker` over a million
+files against finding the latest versions again with ``versions.find_latest``.
+They are skipped unless the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_tracker
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.tracker import VersionTracker
+from flare.versions import find_latest
+from tests.bcmk.test_bcmk_versions import make_files
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 1_000_000
+SIZE_XXL = 5_000_000
+# number of add and remove events
+N_EVENTS = 20_000
+# minimal speedup of an event over finding the latest versions again
+SPEEDUP_EVENT_MIN = 1_000.0
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkVersionTracker(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare_events(self, size):
+        # time events of the tracker against a full pass of the bulk sorter
+        df = make_files(size)
+        # one file per version of each group (no duplicated paths)
+        df = df.drop_duplicates(["type", "project", "item", "version"])
+        paths = (
+            df["type"] + "_" + df["project"] + "_" + df["item"] + "_" + df["version"]
+        ).to_numpy(dtype=str)
+        paths = np.char.add(paths, "_s.tif")
+
+        tracker = VersionTracker()
+        elapsed = time.perf_counter()
+        tracker.add_many(paths)
+        elapsed_build = time.perf_counter() - elapsed
+
+        groups = df[["type", "project", "item"]]
+        elapsed = time.perf_counter()
+        find_latest(df["version"], groups)
+        elapsed_pass = time.perf_counter() - elapsed
+
+        rng = np.random.default_rng(42)
+        ls_paths = paths[rng.integers(0, paths.size, size=N_EVENTS)].tolist()
+        elapsed = time.perf_counter()
+        for path in ls_paths:
+            if not tracker.remove(path):
+                tracker.add(path)
+        elapsed_event = (time.perf_counter() - elapsed) / N_EVENTS
+
+        # the tracker agrees with the bulk sorter after the events
+        ls_present = [p for p in paths.tolist() if p in tracker]
+        ls_expected = np.asarray(ls_present)[
+            find_latest(
+                [p.split("_")[3] for p in ls_present],
+                [p.rsplit("_", 2)[0] for p in ls_present],
+            )
+        ]
+        self.assertEqual(
+            sorted(tracker.latest_files().values()), sorted(ls_expected.tolist())
+        )
+        speedup = elapsed_pass / elapsed_event
+        testprint(
+            f"VersionTracker: {len(tracker)} files built in {elapsed_build:.2f} s, "
+            f"event {elapsed_event * 1e6:.1f} us "
+            f"(find_latest {elapsed_pass:.2f} s, speedup {speedup:.0f}x)"
+        )
+        return speedup
+
+    def test_events(self):
+        """
+        Ensure events are much faster than finding the latest versions again.
+        """
+        self.assertGreater(self.compare_events(SIZE), SPEEDUP_EVENT_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_events_xxl(self):
+        """
+        Ensure events are much faster on large inputs.
+        """
+        self.assertGreater(self.compare_events(SIZE_XXL), SPEEDUP_EVENT_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.validator`` bulk validator.
+
+Overview
+--------
+The benchmarks time ``validate_many`` over a million field names (ten million for
+the long benchmark) against a loop matching each name with a compiled regex.
+They are skipped unless the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_validator
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import re
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.validator import validate_many
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 1_000_000
+SIZE_XXL = 10_000_000
+# number of names matched by the regex loop
+SIZE_SCALAR = 200_000
+# maximal time to validate ten million names (seconds)
+ELAPSED_XXL_MAX = 10.0
+# minimal speedup over the regex loop
+SPEEDUP_FIELDS_MIN = 1.5
+# grammar of field names
+FIELD_PATTERN = re.compile(r"[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*")
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_fields(size, seed=0):
+    """
+    Make field names, with a small share of hyphens, spaces and empty domains.
+
+    :param size: number of names
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: field names
+    :rtype: :class:`numpy.ndarray`
+    """
+    rng = np.random.default_rng(seed)
+    variables = rng.choice(["temp", "precip", "wind", "rh", "swe"], size=size)
+    stats = rng.choice(["mean", "max", "min", "p90"], size=size)
+    separators = rng.choice(
+        ["_", "-", " ", "__"], size=size, p=[0.97, 0.01, 0.01, 0.01]
+    )
+    names = np.char.add(np.char.add(variables, separators), stats)
+    names = np.char.add(np.char.add(names, "_"), rng.integers(0, 100, size).astype(str))
+    return names
+
+
+def validate_loop(names):
+    """
+    Find invalid field names with a regex loop.
+
+    :param names: field names
+    :type names: :class:`numpy.ndarray`
+    :return: positions of invalid names
+    :rtype: list
+    """
+    fullmatch = FIELD_PATTERN.fullmatch
+    return [i for i, name in enumerate(names.tolist()) if fullmatch(name) is None]
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkValidator(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare_fields(self, names):
+        # time the bulk validator against the regex loop on a sample
+        elapsed = time.perf_counter()
+        df_errors = validate_many(names, asset="field")
+        elapsed_bulk = time.perf_counter() - elapsed
+
+        sample = names[:SIZE_SCALAR]
+        elapsed = time.perf_counter()
+        ls_rows = validate_loop(sample)
+        elapsed_scalar = (time.perf_counter() - elapsed) / sample.size
+
+        self.assertEqual(
+            df_errors["row"][df_errors["row"] < SIZE_SCALAR].tolist(), ls_rows
+        )
+        speedup = elapsed_scalar * names.size / elapsed_bulk
+        testprint(
+            f"validate_many: {names.size} field names, {len(df_errors)} errors in "
+            f"{elapsed_bulk:.2f} s (regex {elapsed_scalar * 1e6:.2f} us per name, "
+            f"speedup {speedup:.1f}x)"
+        )
+        return elapsed_bulk, speedup
+
+    def test_fields(self):
+        """
+        Ensure validating field names is faster than a regex loop.
+        """
+        _, speedup = self.compare_fields(make_fields(SIZE))
+        self.assertGreater(speedup, SPEEDUP_FIELDS_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_fields_xxl(self):
+        """
+        Ensure validating ten million field names takes seconds.
+        """
+        elapsed, speedup = self.compare_fields(make_fields(SIZE_XXL, seed=1))
+        self.assertLess(elapsed, ELAPSED_XXL_MAX)
+        self.assertGreater(speedup, SPEEDUP_FIELDS_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
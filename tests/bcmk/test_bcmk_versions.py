@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.versions`` bulk sorter.
+
+Overview
+--------
+The benchmarks time ``find_latest`` over a million files of the ``generic`` scheme
+against a loop keeping the latest version of each group with ``version_key``.
+They are skipped unless the ``RUN_BENCHMARKS`` environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_versions
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.versions import find_latest, version_key
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 1_000_000
+SIZE_XXL = 5_000_000
+# number of files sorted by the scalar loop
+SIZE_SCALAR = 100_000
+# number of items of each project
+N_ITEMS = 5_000
+# minimal speedup over the scalar loop
+SPEEDUP_LATEST_MIN = 5.0
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_files(size, seed=0):
+    """
+    Make domains of files of the ``generic`` scheme with all version schemes.
+
+    :param size: number of files
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: domains ``type``, ``project``, ``item`` and ``version``
+    :rtype: :class:`pandas.DataFrame`
+    """
+    rng = np.random.default_rng(seed)
+    compact = rng.integers(0, 1_000, size=size).astype(str)
+    compact = np.char.add("v", np.char.zfill(compact, 3))
+    semantic = rng.integers(0, 20, size=(3, size)).astype(str)
+    semantic = np.char.add(np.char.add(semantic[0], "."), semantic[1])
+    semantic = np.char.add(
+        np.char.add(semantic, "."), rng.integers(0, 20, size).astype(str)
+    )
+    days = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+        rng.integers(0, 2_000 * 86_400, size=size), unit="s"
+    )
+    timestamp = np.char.add("v", days.strftime("%Y%m%dT%H%M%S").to_numpy(dtype=str))
+    schemes = rng.integers(0, 3, size=size)
+    versions = np.where(
+        schemes == 0, compact, np.where(schemes == 1, semantic, timestamp)
+    )
+    return pd.DataFrame(
+        {
+            "type": rng.choice(["raster", "vector", "table"], size=size),
+            "project": rng.choice(["alpha", "beta", "gamma", "delta"], size=size),
+            "item": np.char.add(
+                "item", rng.integers(0, N_ITEMS, size=size).astype(str)
+            ),
+            "version": versions,
+        }
+    )
+
+
+def find_latest_loop(df):
+    """
+    Find the latest version of each group with a loop over files.
+
+    :param df: domains of files
+    :type df: :class:`pandas.DataFrame`
+    :return: sorted positions of the latest file of each group
+    :rtype: list
+    """
+    dc_latest = {}
+    for i, row in enumerate(zip(df["type"], df["project"], df["item"], df["version"])):
+        key = version_key(row[3])
+        latest = dc_latest.get(row[:3])
+        if latest is None or key >= latest[0]:
+            dc_latest[row[:3]] = (key, i)
+    return sorted(i for _, i in dc_latest.values())
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkVersions(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare_latest(self, df):
+        # time the bulk sorter against the scalar loop on a sample
+        groups = df[["type", "project", "item"]]
+        elapsed = time.perf_counter()
+        positions = find_latest(df["version"], groups)
+        elapsed_bulk = (time.perf_counter() - elapsed) / len(df)
+
+        df_sample = df.iloc[:SIZE_SCALAR]
+        elapsed = time.perf_counter()
+        ls_positions = find_latest_loop(df_sample)
+        elapsed_scalar = (time.perf_counter() - elapsed) / len(df_sample)
+
+        self.assertEqual(
+            find_latest(df_sample["version"], groups.iloc[:SIZE_SCALAR]).tolist(),
+            ls_positions,
+        )
+        speedup = elapsed_scalar / elapsed_bulk
+        testprint(
+            f"find_latest: {len(df)} files, {positions.size} groups in "
+            f"{elapsed_bulk * len(df):.2f} s "
+            f"(scalar {elapsed_scalar * 1e6:.1f} us per file, speedup {speedup:.1f}x)"
+        )
+        return speedup
+
+    def test_latest(self):
+        """
+        Ensure finding the latest versions is much faster than a scalar loop.
+        """
+        self.assertGreater(self.compare_latest(make_files(SIZE)), SPEEDUP_LATEST_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_latest_xxl(self):
+        """
+        Ensure finding the latest versions is much faster on large inputs.
+        """
+        speedup = self.compare_latest(make_files(SIZE_XXL, seed=1))
+        self.assertGreater(speedup, SPEEDUP_LATEST_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``flare.vocabulary`` batch resolver.
+
+Overview
+--------
+The benchmarks time ``Vocabulary.resolve_many`` over a hundred thousand raw headers
+(names, aliases and titles in mixed styles, with numeric suffixes and typos) against
+a loop of ``Vocabulary.resolve``. They are skipped unless the ``RUN_BENCHMARKS``
+environment variable is set to ``1``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_vocabulary
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import time
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.vocabulary import Vocabulary
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+SIZE = 100_000
+SIZE_XXL = 1_000_000
+# number of headers resolved by the scalar loop
+SIZE_SCALAR = 20_000
+# share of misspelled headers
+TYPO_RATE = 0.1
+# maximal time to resolve SIZE headers (seconds)
+ELAPSED_MAX = 1.0
+# minimal speedup over the scalar loop
+SPEEDUP_RESOLVE_MIN = 2.0
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def make_headers(size, seed=0):
+    """
+    Make raw headers from the names, aliases and titles of the vocabulary.
+
+    :param size: number of headers
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: raw headers
+    :rtype: :class:`numpy.ndarray`
+    """
+    rng = np.random.default_rng(seed)
+    df = Vocabulary().df
+    words = np.concatenate([df["name"], df["alias"], df["title"]]).astype(str)
+    headers = rng.choice(words, size=size)
+    styles = rng.integers(0, 3, size=size)
+    headers = np.where(styles == 1, np.char.upper(headers), headers)
+    # numbers of repeated columns (e.g. "Mean_12")
+    suffixes = np.char.add("_", rng.integers(0, 200, size=size).astype(str))
+    headers = np.where(styles == 2, np.char.add(headers, suffixes), headers)
+    # drop a character of some headers
+    is_typo = (rng.random(size) < TYPO_RATE) & (np.char.str_len(headers) > 4)
+    headers = headers.astype(object)
+    headers[is_typo] = [h[:2] + h[3:] for h in headers[is_typo]]
+    return headers
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkVocabulary(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def compare_resolve(self, headers):
+        # time the batch resolver against the scalar loop, on fresh vocabularies
+        vocabulary = Vocabulary()
+        elapsed = time.perf_counter()
+        df = vocabulary.resolve_many(headers)
+        elapsed_bulk = time.perf_counter() - elapsed
+
+        vocabulary = Vocabulary()
+        sample = headers[:SIZE_SCALAR]
+        elapsed = time.perf_counter()
+        ls_names = [vocabulary.resolve(h) for h in sample]
+        elapsed_scalar = (time.perf_counter() - elapsed) / sample.size
+
+        ls_expected = [
+            n if isinstance(n, str) else None for n in df["name"][: sample.size]
+        ]
+        self.assertEqual(ls_names, ls_expected)
+        speedup = elapsed_scalar * headers.size / elapsed_bulk
+        testprint(
+            f"resolve_many: {headers.size} headers ({len(set(headers))} distinct), "
+            f"{df['name'].notna().mean():.1%} resolved in {elapsed_bulk:.2f} s "
+            f"(scalar {elapsed_scalar * 1e6:.1f} us per header, speedup {speedup:.1f}x)"
+        )
+        return elapsed_bulk, speedup
+
+    def test_resolve(self):
+        """
+        Ensure resolving a hundred thousand headers takes well under a second.
+        """
+        elapsed, speedup = self.compare_resolve(make_headers(SIZE))
+        self.assertLess(elapsed, ELAPSED_MAX)
+        self.assertGreater(speedup, SPEEDUP_RESOLVE_MIN)
+
+    @unittest.skipUnless(RUN_BENCHMARKS_XXL, "skipping long benchmarks")
+    def test_resolve_xxl(self):
+        """
+        Ensure resolving a million headers is much faster than a scalar loop.
+        """
+        _, speedup = self.compare_resolve(make_headers(SIZE_XXL, seed=1))
+        self.assertGreater(speedup, SPEEDUP_RESOLVE_MIN)
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -80,6 +80,10 @@ OUTPUT_DIR = BASE_DIR / "outputs"
 DATA_FILE = DATA_DIR / "test_data.csv"
 DATASETS_FILE = DATA_DIR / "datasets.csv"
 DATA_NUMBERS_FILE = DATA_DIR / "test_numbers.csv"
+# history of benchmark runs (local) and baseline of throughput per machine (tracked)
+# -- see tests/bcmk/test_bcmk_module.py
+BENCHMARKS_HISTORY_FILE = OUTPUT_DIR / "benchmarks_history.json"
+BENCHMARKS_BASELINE_FILE = DATA_DIR / "benchmarks_baseline.json"
 
 # Other
 # -----------------------------------------------------------------------
@@ -99,6 +103,10 @@ REPO_NAME = os.path.basename(Path(BASE_DIR).parent)
 RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS", "0") == "1"
 # large benchmark tests disabled -- default to "0" (false)
 RUN_BENCHMARKS_XXL = os.getenv("RUN_BENCHMARKS_XXL", "0") == "1"
+# store benchmark results as the new baseline -- default to "0" (false)
+UPDATE_BENCHMARKS_BASELINE = os.getenv("UPDATE_BENCHMARKS_BASELINE", "0") == "1"
+# largest loss of throughput against the baseline -- default to "0.3" (30%)
+BENCHMARKS_REGRESSION_MAX = float(os.getenv("BENCHMARKS_REGRESSION_MAX", "0.3"))
 # ... {develop}
 
 # Module-level
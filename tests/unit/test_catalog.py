@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the SQLite catalog ``flare.catalog``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_catalog
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+import tempfile
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.catalog import Catalog, COLUMNS
+from flare.labels import parse_many
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+FILENAMES = [
+    "copdem/COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.tif",
+    "copdem/COPERNICUS_COPDEM_GLO30_DGTE_S031W051_20120108T000000.tif",
+    "copdem/COPERNICUS_COPDEM_GLO30_DGTE_N010E020_20111231T235959.tif",
+    "inmet/INMET_AUTO_A001_T0-M_0_2000U2020.txt",
+    "inmet/INMET_AUTO_A002_T0-M_s30w50n20w40_2011U2011-02.txt",
+    "docs/Smith_2021_a.pdf",
+    "docs/REPORT_A002_F005_V002_X.pdf",
+    "README.md",
+]
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestCatalog(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        self.root = self.folder / "archive"
+        for filename in FILENAMES:
+            path = self.root / filename
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("data")
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_insert_query(self):
+        """
+        Test inserts and queries by domains, bounding box and time range.
+        """
+        print(conftest.testprint("catalog query"))
+        df = parse_many([Path(f).name for f in FILENAMES], errors="coerce")
+        df.insert(0, "path", FILENAMES)
+        with Catalog() as catalog:
+            self.assertEqual(catalog.insert(df), len(FILENAMES))
+            self.assertEqual(catalog.insert(df), len(FILENAMES))
+            self.assertEqual(len(catalog), len(FILENAMES))
+
+            df_all = catalog.query()
+            self.assertEqual(list(df_all.columns), COLUMNS)
+            self.assertEqual(df_all["year"].dropna().tolist(), [2021])
+            self.assertEqual(df_all["extent_ymin"].dtype, "float64")
+
+            df_query = catalog.query(
+                source="COPERNICUS",
+                bbox=(-35, -55, -25, -45),
+                start="2011",
+                stop="2012",
+            )
+            self.assertEqual(df_query["path"].tolist(), FILENAMES[:1])
+            self.assertEqual(
+                df_query["datetime_start"].iloc[0], pd.Timestamp("2011-10-08 18:23:25")
+            )
+            # epochs and extents overlapping the query
+            df_query = catalog.query(bbox=(-35, -55, -25, -45), start="2011-01-15")
+            self.assertEqual(df_query["path"].tolist(), FILENAMES[:2] + FILENAMES[4:5])
+            df_query = catalog.query(item=["A001", "A002"], scheme="dataset")
+            self.assertEqual(len(df_query), 2)
+            self.assertEqual(len(catalog.query(year=2021, scheme="reference")), 1)
+            # numpy scalars are converted to native values
+            df_query = catalog.query(year=np.int64(2021), bbox=np.array([0, 0, 20, 30]))
+            self.assertEqual(len(df_query), 0)
+            self.assertEqual(len(catalog.query(bbox=np.array([0, 0, 20, 30]))), 1)
+            with self.assertRaises(ValueError):
+                catalog.query(color="red")
+            with self.assertRaises(ValueError):
+                catalog.insert(df.drop(columns="path"))
+
+            plan = " ".join(catalog.explain(source="COPERNICUS", start="2011"))
+            self.assertIn("USING INDEX", plan)
+
+    def test_sync(self):
+        """
+        Test incremental sync of a directory tree and persistence.
+        """
+        print(conftest.testprint("catalog sync"))
+        path_db = self.folder / "catalog.db"
+        with Catalog(path_db) as catalog:
+            counts = catalog.sync(self.root, workers=2, batch_size=3)
+            self.assertEqual(counts["added"], len(FILENAMES))
+            counts = catalog.sync(self.root)
+            self.assertEqual(counts["unchanged"], len(FILENAMES))
+            self.assertEqual(counts["added"] + counts["updated"], 0)
+
+        # change, remove and add files
+        (self.root / FILENAMES[0]).write_text("more data")
+        (self.root / FILENAMES[-1]).unlink()
+        (self.root / "docs" / "Jones_2019_b.pdf").write_text("data")
+        with Catalog(path_db) as catalog:
+            counts = catalog.sync(self.root, extensions=["tif", "pdf", "txt"])
+            # the removed README.md is filtered out of the sync
+            expected = dict(added=1, updated=1, removed=0, unchanged=6)
+            self.assertEqual(counts, expected)
+            df = catalog.query(source="COPERNICUS")
+            self.assertEqual(df["size"].tolist()[1], len("more data"))
+            self.assertEqual(len(catalog.query(author="Jones")), 1)
+            # files outside the synced root are kept
+            df = parse_many(["Smith_2021_a.pdf"]).assign(
+                path="elsewhere/Smith_2021_a.pdf"
+            )
+            catalog.insert(df)
+            counts = catalog.sync(self.root)
+            self.assertEqual(counts["removed"], 1)
+            self.assertEqual(len(catalog.query(author="Smith")), 2)
+
+        # filtered syncs keep records of files with other extensions
+        with Catalog(path_db) as catalog:
+            n_records = len(catalog)
+            counts = catalog.sync(self.root, extensions=["tif"])
+            self.assertEqual(counts["removed"], 0)
+            self.assertEqual(len(catalog), n_records)
+            (self.root / "docs" / "Jones_2019_b.pdf").unlink()
+            counts = catalog.sync(self.root, extensions=["TIF"])
+            self.assertEqual(counts["removed"], 0)
+            counts = catalog.sync(self.root, extensions=["pdf"])
+            self.assertEqual(counts["removed"], 1)
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the filesystem crawler ``flare.crawler``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_crawler
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import unittest
+import tempfile
+import importlib.util
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.crawler import Watcher, crawl, crawl_file, scan
+from flare.__main__ import main
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+FILENAMES = {
+    "": ["README.md", "Smith_2021_a.pdf"],
+    "copdem": [
+        "COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.tif",
+        "COPERNICUS_COPDEM_GLO30_DGTE_S031W051_20111008T182325.TIF",
+    ],
+    "copdem/aux": ["COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.xml"],
+    "inmet/2020": ["INMET_AUTO_A001_T0-M_0_2000U2020.txt"],
+    "empty": [],
+}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestCrawler(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        for directory, ls_names in FILENAMES.items():
+            (self.folder / directory).mkdir(parents=True, exist_ok=True)
+            for name in ls_names:
+                (self.folder / directory / name).write_text(name)
+        self.n_files = sum(len(ls_names) for ls_names in FILENAMES.values())
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_scan(self):
+        """
+        Test that all files are scanned once, with sizes and extension filters.
+        """
+        print(conftest.testprint("crawler scan"))
+        ls_files = [f for entries in scan(self.folder, workers=3) for f in entries]
+        self.assertEqual(len(ls_files), self.n_files)
+        for path, name, size, mtime in ls_files:
+            self.assertEqual(Path(path).name, name)
+            self.assertEqual(size, len(name))
+            self.assertGreater(mtime, 0)
+        ls_files = [f for e in scan(self.folder, extensions=["tif", ".PDF"]) for f in e]
+        names = sorted(f[1] for f in ls_files)
+        self.assertEqual(len(names), 3)
+        self.assertEqual(names[-1], "Smith_2021_a.pdf")
+        with self.assertRaises(NotADirectoryError):
+            next(scan(self.folder / "README.md"))
+
+    def test_crawl(self):
+        """
+        Test parsing of crawled files in small batches.
+        """
+        print(conftest.testprint("crawler crawl"))
+        ls_batches = list(crawl(self.folder, batch_size=2, workers=2))
+        self.assertEqual([len(df) for df in ls_batches], [2, 2, 2])
+        df = pd.concat(ls_batches, ignore_index=True).sort_values("path")
+        self.assertEqual(df.columns[0], "path")
+        self.assertEqual(list(df.columns[-2:]), ["size", "mtime"])
+        self.assertEqual(df["scheme"].isna().sum(), 1)
+        df = df.set_index(df["path"].map(lambda p: Path(p).name))
+        self.assertEqual(df.loc["Smith_2021_a.pdf", "year"], 2021)
+        self.assertEqual(
+            df.loc["INMET_AUTO_A001_T0-M_0_2000U2020.txt", "specs"], "T0-M"
+        )
+
+        df = pd.concat(crawl(self.folder, scheme="dataset", stat=False))
+        self.assertEqual(df["scheme"].notna().sum(), 4)
+        self.assertNotIn("size", df.columns)
+        with self.assertRaises(ValueError):
+            list(crawl(self.folder, errors="raise"))
+
+    def test_crawl_file(self):
+        """
+        Test writing of a catalog file, from the function and the command line.
+        """
+        print(conftest.testprint("crawler file"))
+        dst = self.folder / "catalog.csv"
+        n_files = crawl_file(self.folder / "copdem", dst, extensions=["tif"])
+        self.assertEqual(n_files, 2)
+        df = pd.read_csv(dst, sep=";")
+        self.assertEqual(sorted(df["extent_ymin"]), [-31.0, -30.0])
+
+        argv = ["crawl", str(self.folder), str(dst), "--scheme", "dataset"]
+        argv += ["--extensions", "tif", "txt", "--batch-size", "1"]
+        self.assertEqual(main(argv), 0)
+        df = pd.read_csv(dst, sep=";")
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df["datetime_stop"].notna().sum(), 1)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_crawl_file_parquet(self):
+        """
+        Test writing of a catalog file of mixed schemes and invalid names to parquet.
+        """
+        print(conftest.testprint("crawler parquet"))
+        dst = self.folder / "catalog.parquet"
+        n_files = crawl_file(self.folder, dst, batch_size=1, workers=1)
+        self.assertEqual(n_files, self.n_files)
+        df = pd.read_parquet(dst).sort_values("path")
+        self.assertEqual(len(df), self.n_files)
+        self.assertEqual(df["scheme"].isna().sum(), 1)
+        self.assertEqual(
+            df["scheme"].value_counts().to_dict(), {"dataset": 4, "reference": 1}
+        )
+        self.assertEqual(sorted(df["extent_ymin"].dropna()), [-31.0, -30.0, -30.0])
+
+    def test_watcher(self):
+        """
+        Test that polls report added, updated and removed files.
+        """
+        print(conftest.testprint("crawler watcher"))
+        watcher = Watcher(self.folder, extensions=["tif", "txt"], interval=0.0)
+        changes = watcher.poll()
+        self.assertEqual(len(changes["added"]), 3)
+        self.assertEqual(changes["updated"] + changes["removed"], [])
+        self.assertEqual(len(watcher), 3)
+        self.assertEqual(watcher.poll(), dict(added=[], updated=[], removed=[]))
+
+        path_new = self.folder / "copdem" / "new.tif"
+        path_new.write_text("new")
+        path_updated = self.folder / "copdem" / FILENAMES["copdem"][0]
+        path_updated.write_text("updated")
+        st = path_updated.stat()
+        os.utime(path_updated, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        (self.folder / "inmet" / "2020" / FILENAMES["inmet/2020"][0]).unlink()
+        changes = watcher.poll()
+        self.assertEqual(changes["added"], [str(path_new)])
+        self.assertEqual(changes["updated"], [str(path_updated)])
+        self.assertEqual(len(changes["removed"]), 1)
+
+        # only polls with changes are yielded, from a previous snapshot
+        watcher = Watcher(
+            self.folder, ["tif", "txt"], snapshot=watcher.snapshot, interval=0.0
+        )
+        self.assertEqual(list(watcher.watch(max_polls=2)), [])
+        path_new.unlink()
+        ls_changes = list(watcher.watch(max_polls=2))
+        self.assertEqual(
+            ls_changes, [dict(added=[], updated=[], removed=[str(path_new)])]
+        )
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the extent codecs and index ``flare.extents``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_extents
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.extents import ExtentIndex, decode_extent, decode_extents
+from flare.numflare import encode_numbers
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+EXTENTS = [
+    "S030W051",
+    "n10p5e20s5w3",
+    "s30w51n20w40",
+    "N001E002k",
+    "n1p25e2",
+    "S030",
+    "S030W",
+    "brazil",
+    "n10e",
+    "w10n10",
+    "s1p2p3e4",
+    "x",
+    "",
+    "Sao",
+]
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestFlareExtents(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        # random boxes with a few points and missing bounds
+        rng = np.random.default_rng(0)
+        size = 2_000
+        self.ymin = rng.uniform(-90, 80, size=size)
+        self.xmin = rng.uniform(-180, 170, size=size)
+        self.ymax = self.ymin + rng.uniform(0, 10, size=size)
+        self.xmax = self.xmin + rng.uniform(0, 10, size=size)
+        self.ymax[::7] = self.ymin[::7]
+        self.xmax[::7] = self.xmin[::7]
+        self.ymin[::11] = np.nan
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_bulk_matches_scalar(self):
+        """
+        Test the bulk decoder against the scalar decoder.
+        """
+        print(conftest.testprint("extents bulk"))
+        rng = np.random.default_rng(1)
+        lat = encode_numbers(rng.uniform(-90, 90, size=200).round(2), len_min=3)
+        lon = encode_numbers(
+            rng.uniform(-180, 180, size=200).round(2), len_min=3, is_latitude=False
+        )
+        extents = EXTENTS + np.char.add(lat, lon).tolist()
+        extents += np.char.add(np.char.upper(lon), lat).tolist()
+        # random texts with the extent alphabet
+        chars = list("nsewNSEW0123p5kmx")
+        extents += ["".join(rng.choice(chars, size=8)) for _ in range(2_000)]
+        bounds = np.array(decode_extents(extents))
+        self.assertEqual(bounds.shape, (4, len(extents)))
+        for i, extent in enumerate(extents):
+            try:
+                expected = decode_extent(extent)
+            except ValueError:
+                self.assertTrue(np.isnan(bounds[:, i]).all(), msg=extent)
+                continue
+            np.testing.assert_array_equal(bounds[:, i], expected, err_msg=extent)
+
+        # missing values and series
+        series = pd.Series(["S030W051", None, np.nan], dtype=object)
+        ymin, _, _, xmax = decode_extents(series)
+        self.assertEqual(ymin[0], -30.0)
+        self.assertEqual(xmax[0], -51.0)
+        self.assertTrue(np.isnan(ymin[1:]).all())
+        self.assertEqual(decode_extents([])[0].size, 0)
+
+    def test_index_matches_scan(self):
+        """
+        Test index queries against a linear scan.
+        """
+        print(conftest.testprint("extents index"))
+        for node_size in [2, 4, 16]:
+            index = ExtentIndex(
+                self.ymin, self.xmin, self.ymax, self.xmax, node_size=node_size
+            )
+            self.assertEqual(len(index), self.ymin.size)
+            rng = np.random.default_rng(node_size)
+            for _ in range(50):
+                y, x = rng.uniform(-90, 90), rng.uniform(-180, 180)
+                bbox = (y, x, y + rng.uniform(0, 30), x + rng.uniform(0, 30))
+                expected = np.flatnonzero(
+                    (self.ymin <= bbox[2])
+                    & (self.ymax >= bbox[0])
+                    & (self.xmin <= bbox[3])
+                    & (self.xmax >= bbox[1])
+                )
+                np.testing.assert_array_equal(index.intersects(bbox), expected)
+            # boxes touching the query and points
+            i = 7
+            hits = index.covers(self.ymax[i], self.xmax[i])
+            self.assertIn(i, hits)
+            self.assertNotIn(11, index.intersects((-90, -180, 90, 180)))
+
+    def test_index_edges(self):
+        """
+        Test empty indexes, invalid boxes and labels.
+        """
+        print(conftest.testprint("extents index edges"))
+        index = ExtentIndex([], [], [], [])
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.intersects((-90, -180, 90, 180)).size, 0)
+        # inverted boxes are not indexed
+        index = ExtentIndex([1, 0], [0, 0], [0, 1], [1, 1])
+        self.assertEqual(index.covers(0.5, 0.5).tolist(), [1])
+        with self.assertRaises(ValueError):
+            ExtentIndex([0], [0], [1], [1], node_size=1)
+
+        index = ExtentIndex.from_labels(["S030W051", "brazil", "n10e20s5w3"])
+        self.assertEqual(index.intersects((-40, -60, 0, 0)).tolist(), [0, 2])
+        self.assertEqual(index.covers(-30, -51).tolist(), [0])
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the normalizer of headers ``flare.fields``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_fields
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.fields import normalize_columns, normalize_frame
+from flare.numflare import decode_number
+from flare.validator import is_valid
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+HEADERS = {
+    "Temp (°C)": "temp_c",
+    "maxTemp": "max_temp",
+    "HTTPServer": "http_server",
+    "pH": "ph",
+    "Précip. [µm]": "precip_um",
+    "Straße": "strasse",
+    "Flow-Rate": "flow_rate",
+    "  leading__and  trailing  ": "leading_and_trailing",
+    "Depth -2.5": "depth_s2p5",
+    "depth 02.50": "depth_02p50",
+    "2020-2021": "2020_2021",
+    "Rate %": "rate_percent",
+    "Standard Deviation": "sd",
+    "TimeStamp": "timestamp",
+    "Unnamed: 0": "unnamed_0",
+    "": "x",
+}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestFields(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_normalize(self):
+        """
+        Test the steps of the normalizer.
+        """
+        print(conftest.testprint("fields normalize"))
+        columns = normalize_columns(pd.Index(list(HEADERS)))
+        self.assertIsInstance(columns, pd.Index)
+        self.assertEqual(columns.tolist(), list(HEADERS.values()))
+        self.assertEqual(decode_number(columns[8].split("_")[1]), -2.5)
+        self.assertEqual(normalize_columns([]).tolist(), [])
+
+        # missing headers get the null replacer, never another label
+        self.assertEqual(normalize_columns([np.nan, "a"]).tolist(), ["x", "a"])
+        self.assertEqual(
+            normalize_columns([1, 2.5, None]).tolist(), ["1p0", "2p5", "x"]
+        )
+        self.assertEqual(
+            normalize_columns(["nan", None, "", "x"]).tolist(),
+            ["nan", "x", "x_1", "x_2"],
+        )
+
+        # standard names
+        self.assertEqual(
+            normalize_columns(["Standard Deviation"], standard_names=False).tolist(),
+            ["standard_deviation"],
+        )
+        self.assertEqual(normalize_columns(["sz"]).tolist(), ["sz"])
+        self.assertEqual(
+            normalize_columns(["sz"], matches=("alias",)).tolist(), ["size"]
+        )
+        self.assertEqual(normalize_columns(["averge"]).tolist(), ["averge"])
+        self.assertEqual(
+            normalize_columns(["averge"], cutoff=0.6).tolist(), ["average"]
+        )
+
+        # collisions keep the first label and skip labels already taken
+        self.assertEqual(
+            normalize_columns(["a", "A", "a_1", "a ", "b"]).tolist(),
+            ["a", "a_2", "a_1", "a_3", "b"],
+        )
+        self.assertEqual(
+            normalize_columns(["c"] * 11).tolist(),
+            ["c"] + [f"c_{i:02d}" for i in range(1, 11)],
+        )
+
+    def test_fields_are_valid(self):
+        """
+        Test that random headers become unique and valid field labels.
+        """
+        print(conftest.testprint("fields valid"))
+        rng = np.random.default_rng(0)
+        chars = list("aZç9_- .,%&#()[]-ßøÆ°µ") + ["–", "\t", "日"]
+        headers = [
+            "".join(rng.choice(chars, size=rng.integers(0, 10))) for _ in range(3_000)
+        ]
+        columns = normalize_columns(headers)
+        self.assertEqual(len(columns), len(headers))
+        self.assertTrue(columns.is_unique)
+        self.assertTrue(is_valid(columns.to_numpy(dtype=str), asset="field").all())
+        # normalized labels are stable
+        self.assertEqual(normalize_columns(columns).tolist(), columns.tolist())
+
+        # tables keep their data
+        df = pd.DataFrame(rng.random((2, 4)), columns=["A b", "A-B", "a.b", "Média"])
+        df_normal = normalize_frame(df)
+        self.assertEqual(df_normal.columns.tolist(), ["a_b", "a_b_1", "a_b_2", "media"])
+        np.testing.assert_array_equal(df_normal.to_numpy(), df.to_numpy())
+        self.assertEqual(df.columns.tolist(), ["A b", "A-B", "a.b", "Média"])
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the registry of flags ``flare.flags``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_flags
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import csv
+import unittest
+import tempfile
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare import numflare, timeflare, versions
+from flare.flags import CLASSES, FLAGS_FILE, FlagRegistry, get_registry, lookup
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestFlagRegistry(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_catalog(self):
+        """
+        Test the registry against the catalog file and the codecs.
+        """
+        print(conftest.testprint("flags catalog"))
+        registry = get_registry()
+        self.assertIs(registry, get_registry())
+        with open(FLAGS_FILE, newline="", encoding="utf-8") as f:
+            ls_rows = list(csv.DictReader(f, delimiter=";"))
+        self.assertEqual(
+            [(r["flag"], r["domain"], r["key"]) for r in registry.records],
+            [(r["flag"], r["domain"], r["key"]) for r in ls_rows],
+        )
+        self.assertEqual(numflare.SIGN["latitude"], {"positive": "n", "negative": "s"})
+        self.assertEqual(numflare.SIGN["longitude"], {"positive": "e", "negative": "w"})
+        self.assertEqual(
+            list(numflare.MAGNITUDES.values()), [10, 100, 1000, 10**6, 10**9]
+        )
+        self.assertEqual(numflare.REPLACERS["not_apply"], "na")
+        self.assertEqual(numflare.DECIMAL, "p")
+        self.assertEqual(timeflare.ZONE_FLAG, "z")
+        self.assertEqual(versions.VERSION_FLAG, "v")
+
+    def test_tables(self):
+        """
+        Test the lookup tables against the flags.
+        """
+        print(conftest.testprint("flags tables"))
+        registry = get_registry()
+        for table in (
+            registry.classes,
+            registry.sign_factors,
+            registry.magnitude_factors,
+        ):
+            self.assertEqual(table.size, 129)
+            self.assertFalse(table.flags.writeable)
+        codes = np.array([ord(c) for c in "nNsSeEwW"])
+        self.assertEqual(
+            lookup(registry.sign_factors, codes).tolist(), [1, 1, -1, -1, 1, 1, -1, -1]
+        )
+        self.assertEqual(
+            lookup(registry.classes, codes[::2]).tolist(),
+            [
+                CLASSES.index(c)
+                for c in ("latitude", "latitude", "longitude", "longitude")
+            ],
+        )
+        for flag, factor in registry.magnitudes.items():
+            self.assertEqual(registry.magnitude_factors[ord(flag.upper())], factor)
+        # other characters, including non-ASCII, are not flags
+        codes = np.array(
+            [[ord("_"), ord("ç"), 0x1F600], [ord("5"), ord("P"), ord("a")]]
+        )
+        self.assertEqual(
+            lookup(registry.classes, codes).tolist(),
+            [[0, 0, 0], [CLASSES.index("digit"), CLASSES.index("decimal"), 0]],
+        )
+
+        # custom catalogs
+        file_path = self.folder / "flags.csv"
+        ls_lines = FLAGS_FILE.read_text(encoding="utf-8").splitlines()
+        file_path.write_text(
+            "\n".join(
+                ls_lines + ["q;Number;Magnitude;quadrillions;1000000000000000;x"]
+            ),
+            encoding="utf-8",
+        )
+        registry = FlagRegistry(file_path)
+        self.assertEqual(len(registry), len(ls_lines))
+        self.assertEqual(registry.magnitude_factors[ord("Q")], 10**15)
+        file_path.write_text("flag;domain\n_;Separator\n", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            FlagRegistry(file_path)
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
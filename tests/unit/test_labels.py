@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the label parser ``flare.labels``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_labels
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import SCHEMES, parse, parse_many, get_scheme
+from flare.labels import decode_version, decode_extent
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# examples of the documentation on Files
+DOC_EXAMPLES = {
+    "REPORT_A002_F005_V002_X.pdf": "generic",
+    "CONTRACT_A002_F002_V20250314_signed.pdf": "generic",
+    "Smith_2021_a.pdf": "reference",
+    "COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.tif": "dataset",
+    "INMET_AUTO_A001_T0-M_0_2000U2020.txt": "dataset",
+}
+INVALID = [
+    "REPORT_A002",
+    "REPORT_A002__V002_X.pdf",
+    "REPORT_A002_F005_V002_X.pdf.",
+    "REPORT_A002_F005_V002_X..pdf",
+    "REPORT_A002_F0.05_V002_X.pdf",
+    "REPORT A002_F005_V002_X.pdf",
+    "Smith_21_a.pdf",
+    "Smith_20a1_a.pdf",
+]
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestFlareLabels(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_doc_examples(self):
+        """
+        Test parsing of the documented examples.
+        """
+        print(conftest.testprint("label examples"))
+        for filename, scheme in DOC_EXAMPLES.items():
+            record = parse(filename)
+            self.assertEqual(record["scheme"], scheme)
+            self.assertEqual(get_scheme(filename), scheme)
+            for domain in SCHEMES[scheme]:
+                self.assertIn(domain, record)
+
+        record = parse(
+            "/data/COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.tif"
+        )
+        self.assertEqual(record["collection"], "COPDEM")
+        self.assertEqual(record["extension"], "tif")
+        self.assertEqual(record["extent_ymin"], -30.0)
+        self.assertEqual(record["extent_xmax"], -51.0)
+        self.assertEqual(record["datetime_start"], pd.Timestamp("2011-10-08 18:23:25"))
+        self.assertIs(record["datetime_stop"], pd.NaT)
+
+        record = parse("CONTRACT_A002_F002_V20250314_signed.pdf")
+        self.assertEqual(record["version_timestamp"], pd.Timestamp("2025-03-14"))
+        self.assertIsNone(record["version_major"])
+
+    def test_replacers(self):
+        """
+        Test replacers in domains and labels without extension.
+        """
+        print(conftest.testprint("label replacers"))
+        record = parse("DOC_x_Z_v1.0.0_na")
+        self.assertIsNone(record["project"])
+        self.assertIsNone(record["item"])
+        self.assertIsNone(record["suffix"])
+        self.assertIsNone(record["extension"])
+        self.assertEqual(record["version_minor"], 0)
+        record = parse("src_col_it_o_x_x.tar.gz")
+        self.assertIsNone(record["specs"])
+        self.assertTrue(np.isnan(record["extent_ymin"]))
+        self.assertEqual(record["extension"], "tar.gz")
+
+    def test_typed_domains(self):
+        """
+        Test decoding of versions and extents.
+        """
+        print(conftest.testprint("label typed domains"))
+        self.assertEqual(decode_version("v1.2.30"), (1, 2, 30))
+        self.assertEqual(decode_version("V002"), (0, 0, 2))
+        self.assertEqual(
+            decode_version("v2025-03-14T103000"), pd.Timestamp("2025-03-14 10:30")
+        )
+        for version in ["v2025", "v2025-03", "v12", "1.2", "vx"]:
+            with self.assertRaises(ValueError):
+                decode_version(version)
+        self.assertEqual(decode_extent("n10p5e20s5w3"), (-5.0, -3.0, 10.5, 20.0))
+        for extent in ["S030", "S030W", "brazil"]:
+            with self.assertRaises(ValueError):
+                decode_extent(extent)
+        # extents that are not numbers have no bounds
+        self.assertTrue(np.isnan(parse("a_b_c_d_brazil_2020")["extent_xmin"]))
+
+    def test_invalid(self):
+        """
+        Test errors on invalid labels.
+        """
+        print(conftest.testprint("label invalid"))
+        for filename in INVALID:
+            with self.assertRaises(ValueError):
+                parse(filename)
+            with self.assertRaises(ValueError):
+                parse_many([filename])
+        with self.assertRaises(ValueError):
+            parse("REPORT_A002_F005_V002_X.pdf", scheme="dataset")
+        with self.assertRaises(ValueError):
+            parse("REPORT_A002_F005_V20_X.pdf")
+
+    def test_bulk_matches_scalar(self):
+        """
+        Test the bulk parser against the scalar parser.
+        """
+        print(conftest.testprint("label bulk"))
+        filenames = list(DOC_EXAMPLES) + [
+            "DOC_x_Z_v1.0.0_na",
+            "REPORT_A002_F005_1.2.3_X.tar.gz",
+            "src_col_it_sp_n10e20s5w3_2020-01-01t000000u2021",
+            "src_col_it_sp_brazil_20200101t000000zw0300",
+            "Müller_2020_b.pdf",
+        ]
+        series = pd.Series(filenames, index=np.arange(len(filenames)) * 2)
+        df = parse_many(series)
+        self.assertTrue(df.index.equals(series.index))
+        for (_, row), filename in zip(df.iterrows(), filenames):
+            for field, value in parse(filename).items():
+                if value is None or pd.isna(value):
+                    self.assertTrue(pd.isna(row[field]), msg=(filename, field))
+                else:
+                    self.assertEqual(row[field], value, msg=(filename, field))
+
+        df = parse_many(
+            ["Smith_2021_a.pdf", "bad", "Smith_2021_a..pdf"], errors="coerce"
+        )
+        self.assertEqual(df["scheme"].isna().tolist(), [False, True, True])
+        df = parse_many(["REPORT_A002_F005_V20_X.pdf"], errors="coerce")
+        self.assertTrue(pd.isna(df["version_major"].iloc[0]))
+        df = parse_many(["REPORT_A002_F005_V002_X.pdf"], scheme="generic")
+        self.assertEqual(
+            list(df.columns[:7]), ["scheme"] + SCHEMES["generic"] + ["extension"]
+        )
+        # domains only, even with invalid typed domains
+        df = parse_many(["REPORT_A002_F005_V20_X.pdf"], scheme="generic", typed=False)
+        self.assertEqual(
+            list(df.columns), ["scheme"] + SCHEMES["generic"] + ["extension"]
+        )
+        self.assertEqual(df["version"].iloc[0], "V20")
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -36,6 +36,7 @@ Print a message
 
 
 """
+
 # IMPORTS
 # ***********************************************************************
 # import modules from other libs
@@ -44,17 +45,28 @@ Print a message
 # =======================================================================
 import unittest
 import time
+from concurrent.futures import ProcessPoolExecutor
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # ... {develop}
 
 # External imports
 # =======================================================================
-# import {module}
+import numpy as np
+import pandas as pd
+
 # ... {develop}
 
 # Project-level imports
 # =======================================================================
 from flare.numflare import encode_number, decode_number
+from flare.numflare import encode_numbers, decode_numbers
+from flare.numflare import make_encoder, make_decoder
+from flare.numflare import CachedCodec, IntegerTable, LabelStore
+from flare.numflare import sort_key, sort_keys
+from flare.numflare import MAGNITUDES
 from tests import conftest
 
 # ... {develop}
@@ -80,8 +92,26 @@ from tests import conftest
 # =======================================================================
 # ... {develop}
 
+
 # FUNCTIONS -- Module-level
 # =======================================================================
+def sum_store(path, start, stop):
+    """
+    Sum a range of the values of a label store (run in worker processes).
+
+    :param path: path to the store
+    :type path: str
+    :param start: first position
+    :type start: int
+    :param stop: position after the last one
+    :type stop: int
+    :return: sum of the values
+    :rtype: float
+    """
+    with LabelStore(path) as store:
+        return float(np.nansum(store.values[start:stop]))
+
+
 # ... {develop}
 
 
@@ -163,6 +193,582 @@ class TestFlareNumbers(unittest.TestCase):
             decoded = decode_number(encoded)
             self.assertAlmostEqual(decoded, expected)
 
+    def test_non_canonical_values(self):
+        """
+        Test decoding of strings outside the canonical grammar.
+        """
+        print(conftest.testprint("decoding non-canonical"))
+        known_pairs = [
+            ("5p", 5.0),
+            ("0p5b", 500_000_000.0),
+            ("nn12p5", 12.5),
+            ("12kp5", 12000.5),
+            ("1e5", 100_000.0),
+            ("12345678901234567890p5", 12345678901234567168.5),
+        ]
+        for encoded, expected in known_pairs:
+            self.assertEqual(decode_number(encoded), expected)
+        with self.assertRaises(IndexError):
+            decode_number("")
+        with self.assertRaises(ValueError):
+            decode_number("n1a2")
+        with self.assertRaises(AttributeError):
+            decode_number(12)
+
+
+class TestFlareNumbersBulk(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        cls.data = conftest.load_numbers_data()
+        rng = np.random.default_rng(42)
+        cls.numbers = np.concatenate(
+            [
+                rng.normal(loc=0, scale=100, size=2000),
+                rng.normal(loc=0, scale=1e7, size=500),
+                rng.integers(low=-1000, high=1000, size=500) / 8,
+                [0.0, -0.0, 0.5, 1.5, 2.5, 0.125, 2.675, 1.005, 9.999, 1e17, -3e20],
+            ]
+        )
+        return None
+
+    def test_encode_matches_scalar(self):
+        """
+        Test bulk encoding against the scalar encoder for all parameter combinations.
+        """
+        print(conftest.testprint("bulk encoding"))
+        for decimals in [0, 1, 2, 4]:
+            for len_min in [1, 3]:
+                for is_latitude in [True, False]:
+                    for collapse_magnitude in [False, True]:
+                        kwargs = dict(
+                            decimals=decimals,
+                            len_min=len_min,
+                            is_latitude=is_latitude,
+                            collapse_magnitude=collapse_magnitude,
+                        )
+                        encoded = encode_numbers(self.numbers, **kwargs)
+                        expected = [encode_number(n, **kwargs) for n in self.numbers]
+                        self.assertEqual(encoded.tolist(), expected)
+
+    def test_decode_matches_scalar(self):
+        """
+        Test bulk decoding against the scalar decoder.
+        """
+        print(conftest.testprint("bulk decoding"))
+        for decimals in [0, 2]:
+            for collapse_magnitude in [False, True]:
+                encoded = [
+                    encode_number(
+                        n, decimals=decimals, collapse_magnitude=collapse_magnitude
+                    )
+                    for n in self.numbers
+                ]
+                decoded = decode_numbers(encoded)
+                expected = [decode_number(e) for e in encoded]
+                self.assertEqual(decoded.tolist(), expected)
+
+    def test_roundtrip_data(self):
+        """
+        Test bulk round trip over the numbers data.
+        """
+        print(conftest.testprint("bulk round trip"))
+        numbers = self.data["v3"].round(2).values
+        decoded = decode_numbers(encode_numbers(numbers, decimals=2))
+        np.testing.assert_allclose(decoded, numbers)
+
+    def test_roundtrip_tolerance(self):
+        """
+        Test bulk round trip errors of ties and magnitude boundaries.
+        """
+        print(conftest.testprint("bulk round trip tolerance"))
+        ties = np.arange(2000) + 0.5
+        boundaries = np.array([f + o for f in MAGNITUDES.values() for o in (-1, 0, 1)])
+        numbers = np.concatenate([self.numbers[:-2], ties, ties / 1000, boundaries])
+        numbers = np.concatenate([numbers, -numbers])
+        for decimals in [0, 1, 3]:
+            for collapse_magnitude in [False, True]:
+                encoded = encode_numbers(
+                    numbers, decimals=decimals, collapse_magnitude=collapse_magnitude
+                )
+                factors = np.ones(numbers.size)
+                if collapse_magnitude:
+                    # the first factor reached wins (see encode_number)
+                    for factor in list(MAGNITUDES.values())[::-1]:
+                        factors[np.abs(numbers) >= factor] = factor
+                tolerances = 0.5 * 10.0**-decimals * factors
+                tolerances += 4 * np.spacing(np.abs(numbers))
+                errors = np.abs(decode_numbers(encoded) - numbers)
+                self.assertTrue((errors <= tolerances).all())
+
+    def test_known_encoded_values(self):
+        """
+        Test bulk decoding of specific known encoded strings.
+        """
+        print(conftest.testprint("bulk decoding known values"))
+        encoded = ["n002p3", "s023p4", "w05p0m", "23p44c", "00002", "W05P0M"]
+        expected = [2.3, -23.4, -5_000_000.0, 2344.0, 2.0, -5_000_000.0]
+        np.testing.assert_allclose(decode_numbers(encoded), expected)
+
+    def test_replacers(self):
+        """
+        Test that missing values are encoded as replacers and decoded as NaN.
+        """
+        print(conftest.testprint("bulk replacers"))
+        encoded = encode_numbers([1.0, np.nan, -2.0])
+        self.assertEqual(encoded.tolist(), ["n1", "x", "s2"])
+        encoded = encode_numbers([np.nan], replacer="na")
+        self.assertEqual(encoded.tolist(), ["na"])
+        decoded = decode_numbers(["x", "Z", "na", "o", None, "n1"])
+        self.assertTrue(np.isnan(decoded[:5]).all())
+        self.assertEqual(decoded[5], 1.0)
+
+    def test_series(self):
+        """
+        Test that pandas Series are returned for Series inputs.
+        """
+        print(conftest.testprint("bulk series"))
+        numbers = pd.Series([1.5, -3.25], index=[10, 20], name="v")
+        encoded = encode_numbers(numbers, decimals=2)
+        self.assertIsInstance(encoded, pd.Series)
+        self.assertEqual(list(encoded.index), [10, 20])
+        self.assertEqual(encoded.tolist(), ["n1p50", "s3p25"])
+        decoded = decode_numbers(encoded)
+        self.assertIsInstance(decoded, pd.Series)
+        self.assertEqual(decoded.tolist(), [1.5, -3.25])
+
+    def test_invalid(self):
+        """
+        Test that invalid strings raise the same errors as the scalar decoder.
+        """
+        print(conftest.testprint("bulk invalid"))
+        for label in ["n1a2", "", "k"]:
+            with self.assertRaises((ValueError, IndexError)):
+                decode_number(label)
+            with self.assertRaises((ValueError, IndexError)):
+                decode_numbers([label])
+
+
+class TestFlareNumbersFactory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        rng = np.random.default_rng(7)
+        cls.numbers = list(
+            np.concatenate(
+                [
+                    rng.normal(loc=0, scale=100, size=500),
+                    rng.normal(loc=0, scale=1e7, size=200),
+                    [0.0, -0.0, 0.5, 2.5, 0.125, 2.675, 9.999, 99.5, 1e17],
+                ]
+            )
+        )
+        cls.numbers += [7, -3, 2500, 10**30]
+        return None
+
+    def test_encoder_matches_scalar(self):
+        """
+        Test specialized encoders against the scalar encoder.
+        """
+        print(conftest.testprint("specialized encoders"))
+        for decimals in [0, 1, 3]:
+            for len_min in [1, 4]:
+                for is_latitude in [True, False]:
+                    for collapse_magnitude in [False, True]:
+                        kwargs = dict(
+                            decimals=decimals,
+                            len_min=len_min,
+                            is_latitude=is_latitude,
+                            collapse_magnitude=collapse_magnitude,
+                        )
+                        encoder = make_encoder(**kwargs)
+                        decoder = make_decoder(**kwargs)
+                        for n in self.numbers:
+                            encoded = encode_number(n, **kwargs)
+                            self.assertEqual(encoder(n), encoded)
+                            self.assertEqual(decoder(encoded), decode_number(encoded))
+
+    def test_missing_values(self):
+        """
+        Test the handling of missing and infinite values.
+        """
+        print(conftest.testprint("specialized missing values"))
+        encoder = make_encoder(decimals=2)
+        self.assertEqual(encoder(np.nan), "x")
+        self.assertEqual(make_encoder(replacer="z")(np.nan), "z")
+        with self.assertRaises(ValueError):
+            make_encoder(replacer=None)(np.nan)
+        with self.assertRaises(OverflowError):
+            make_encoder()(np.inf)
+        decoder = make_decoder(decimals=2)
+        for label in ["x", "NA", None, np.nan]:
+            self.assertTrue(np.isnan(decoder(label)))
+
+    def test_series_map(self):
+        """
+        Test that specialized codecs plug into pandas Series.map.
+        """
+        print(conftest.testprint("specialized series map"))
+        kwargs = dict(decimals=1, len_min=3, is_latitude=False)
+        numbers = pd.Series([-12.34, 4.5, np.nan])
+        encoded = numbers.map(make_encoder(**kwargs))
+        self.assertEqual(encoded.tolist(), ["w012p3", "e004p5", "x"])
+        decoded = encoded.map(make_decoder(**kwargs))
+        self.assertEqual(decoded[:2].tolist(), [-12.3, 4.5])
+        self.assertTrue(np.isnan(decoded[2]))
+
+
+class TestFlareNumbersCache(unittest.TestCase):
+
+    def test_codec_matches_scalar(self):
+        """
+        Test that cached codecs return the same results as the scalar codecs.
+        """
+        print(conftest.testprint("cached codecs"))
+        rng = np.random.default_rng(3)
+        numbers = rng.integers(-90, 90, size=2_000) / 4
+        kwargs = dict(decimals=2, len_min=3, is_latitude=False)
+        codec = CachedCodec(max_size=100, **kwargs)
+        for n in numbers.tolist():
+            encoded = encode_number(n, **kwargs)
+            self.assertEqual(codec.encode(n), encoded)
+            self.assertEqual(codec.decode(encoded), decode_number(encoded))
+            self.assertEqual(codec.decode(encoded.upper()), decode_number(encoded))
+        stats = codec.stats()
+        self.assertEqual(stats["encode"]["size"], 100)
+        self.assertGreater(stats["decode"]["hits"], 0)
+        self.assertGreater(stats["decode"]["evictions"], 0)
+        # errors are raised and not cached
+        with self.assertRaises((ValueError, IndexError)):
+            codec.encode(np.nan)
+        with self.assertRaises(ValueError):
+            codec.decode("s0q")
+        self.assertEqual(codec.stats()["decode"]["size"], 100)
+        codec.clear()
+        stats = codec.stats()
+        self.assertEqual(stats["decode"]["size"], 0)
+        self.assertEqual(stats["decode"]["hits"], 0)
+        self.assertTrue(np.isnan(stats["decode"]["hit_rate"]))
+
+    def test_lru_eviction(self):
+        """
+        Test the least-recently-used eviction order and counters.
+        """
+        print(conftest.testprint("cached codecs eviction"))
+        codec = CachedCodec(max_size=2)
+        for label in ["n1", "n2", "n1", "n3", "n1", "n2"]:
+            codec.decode(label)
+        # n2 is evicted by n3 (n1 used more recently), then n3 by n2
+        stats = codec.stats()["decode"]
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 4))
+        self.assertEqual((stats["evictions"], stats["size"]), (2, 2))
+        self.assertEqual(stats["hit_rate"], 2 / 6)
+        with self.assertRaises(ValueError):
+            CachedCodec(max_size=0)
+
+        # failed calls are misses, not evictions
+        codec = CachedCodec(max_size=10)
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                codec.decode("s0q")
+        stats = codec.stats()["decode"]
+        self.assertEqual(
+            (stats["misses"], stats["evictions"], stats["size"]), (3, 0, 0)
+        )
+        codec = CachedCodec(max_size=2)
+        for label in ["n1", "n2", "s0q", "n3"]:
+            try:
+                codec.decode(label)
+            except ValueError:
+                pass
+        self.assertEqual(codec.stats()["decode"]["evictions"], 1)
+        codec.clear()
+        self.assertEqual(codec.stats()["decode"]["evictions"], 0)
+
+    def test_threads(self):
+        """
+        Test concurrent lookups from several threads.
+        """
+        print(conftest.testprint("cached codecs threads"))
+        labels = encode_numbers(np.arange(-500, 500), len_min=3).tolist() * 20
+        codec = CachedCodec(max_size=300)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            decoded = list(executor.map(codec.decode, labels))
+        self.assertEqual(decoded, [decode_number(s) for s in labels])
+        stats = codec.stats()["decode"]
+        self.assertEqual(stats["hits"] + stats["misses"], len(labels))
+        self.assertLessEqual(stats["size"], 300)
+
+
+class TestFlareNumbersTable(unittest.TestCase):
+
+    def test_table_matches_bulk(self):
+        """
+        Test integer tables against the bulk codecs, on and off the table.
+        """
+        print(conftest.testprint("integer tables"))
+        rng = np.random.default_rng(5)
+        for vmin, vmax, len_min, is_latitude in [
+            (-500, 500, 3, False),
+            (0, 99_999, 1, True),
+            (10**12, 10**12 + 50, 1, True),
+        ]:
+            table = IntegerTable(vmin, vmax, len_min=len_min, is_latitude=is_latitude)
+            self.assertEqual(len(table), vmax - vmin + 1)
+            kwargs = dict(len_min=len_min, is_latitude=is_latitude)
+            numbers = np.concatenate(
+                [
+                    rng.integers(vmin - 100, vmax + 100, size=5_000),
+                    [-0.4, -0.5, 0.5, 1.5, -1.5, 2.5, np.nan],
+                ]
+            )
+            encoded = encode_numbers(numbers, **kwargs)
+            np.testing.assert_array_equal(table.encode(numbers), encoded)
+            integers = numbers[:-7].astype(np.int64)
+            np.testing.assert_array_equal(
+                table.encode(integers), encode_numbers(integers, **kwargs)
+            )
+            labels = np.concatenate([encoded, np.char.upper(encoded[:50]), ["n5k"]])
+            np.testing.assert_array_equal(table.decode(labels), decode_numbers(labels))
+            np.testing.assert_array_equal(
+                table.decode(labels[:4000].reshape(-1, 4)),
+                decode_numbers(labels[:4000].reshape(-1, 4)),
+            )
+            for n in [vmin, vmax, vmin - 1, 0, -2.5]:
+                label = encode_number(n, **kwargs)
+                self.assertEqual(table.encode_one(n), label)
+                self.assertEqual(table.decode_one(label), decode_number(label))
+
+    def test_table_edges(self):
+        """
+        Test series, empty inputs and invalid ranges.
+        """
+        print(conftest.testprint("integer tables edges"))
+        table = IntegerTable(-90, 90, len_min=2)
+        series = pd.Series([-30, 5], index=[3, 4])
+        encoded = table.encode(series)
+        self.assertEqual(encoded.tolist(), ["s30", "n05"])
+        self.assertTrue(encoded.index.equals(series.index))
+        self.assertEqual(table.decode(encoded).tolist(), [-30.0, 5.0])
+        self.assertEqual(table.encode([]).size, 0)
+        self.assertEqual(table.decode([]).size, 0)
+        with self.assertRaises(ValueError):
+            table.decode(["s0q"])
+        with self.assertRaises(ValueError):
+            IntegerTable(1, 0)
+
+
+class TestFlareNumbersBytes(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        rng = np.random.default_rng(11)
+        self.numbers = rng.normal(loc=0, scale=1e4, size=5_000)
+        self.numbers[::17] = np.nan
+        return None
+
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+    def test_bytes_roundtrip(self):
+        """
+        Test that byte arrays match the unicode arrays of the bulk codecs.
+        """
+        print(conftest.testprint("bytes roundtrip"))
+        kwargs = dict(decimals=2, len_min=3, collapse_magnitude=True)
+        encoded = encode_numbers(self.numbers, **kwargs)
+        encoded_bytes = encode_numbers(self.numbers, as_bytes=True, **kwargs)
+        self.assertEqual(
+            encoded_bytes.dtype, np.dtype(f"S{encoded.dtype.itemsize // 4}")
+        )
+        self.assertEqual(encoded_bytes.astype(str).tolist(), encoded.tolist())
+        np.testing.assert_array_equal(
+            decode_numbers(encoded_bytes), decode_numbers(encoded)
+        )
+        # shapes, series and empty arrays
+        grid = encode_numbers(self.numbers[:100].reshape(10, 10), as_bytes=True)
+        self.assertEqual(grid.shape, (10, 10))
+        self.assertEqual(decode_numbers(grid).shape, (10, 10))
+        series = pd.Series(self.numbers[:10])
+        self.assertIsInstance(encode_numbers(series, as_bytes=True), np.ndarray)
+        self.assertEqual(encode_numbers([], as_bytes=True).size, 0)
+        self.assertEqual(decode_numbers(np.array([], dtype="S3")).size, 0)
+        with self.assertRaises(ValueError):
+            encode_numbers([np.nan], replacer="ø", as_bytes=True)
+
+    def test_bytes_memmap(self):
+        """
+        Test decoding byte labels written to disk and memory-mapped.
+        """
+        print(conftest.testprint("bytes memmap"))
+        encoded = encode_numbers(self.numbers, decimals=1, len_min=5, as_bytes=True)
+        path = self.folder / "labels.bin"
+        encoded.tofile(path)
+        labels = np.memmap(path, dtype=encoded.dtype, mode="r")
+        expected = decode_numbers(encoded.astype(str))
+        np.testing.assert_array_equal(decode_numbers(labels), expected)
+        del labels
+
+        table = IntegerTable(-50, 50, len_min=3)
+        integers = np.arange(-60, 60)
+        encoded = table.encode(integers, as_bytes=True)
+        self.assertEqual(encoded.dtype.kind, "S")
+        self.assertEqual(
+            encoded.astype(str).tolist(), encode_numbers(integers, len_min=3).tolist()
+        )
+        np.testing.assert_array_equal(table.decode(encoded), integers)
+
+
+class TestFlareNumbersStore(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        rng = np.random.default_rng(13)
+        numbers = rng.normal(loc=0, scale=1e4, size=5_000)
+        numbers[::17] = np.nan
+        self.encoded = encode_numbers(numbers, decimals=2, len_min=3)
+        return None
+
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+    def test_store_roundtrip(self):
+        """
+        Test writing and opening stores with and without decoded values.
+        """
+        print(conftest.testprint("label store"))
+        expected = decode_numbers(self.encoded)
+        path = self.folder / "labels.flare"
+        with LabelStore.write(path, self.encoded, chunk_size=999) as store:
+            self.assertEqual(len(store), self.encoded.size)
+            self.assertIsInstance(store.labels, np.memmap)
+            self.assertEqual(store.labels.astype(str).tolist(), self.encoded.tolist())
+            np.testing.assert_array_equal(store.values, expected)
+            self.assertEqual(store.header["labels_offset"] % 64, 0)
+            self.assertEqual(store.header["values_offset"] % 64, 0)
+        store = LabelStore(path)
+        np.testing.assert_array_equal(store.decode(10, 20), expected[10:20])
+        store.close()
+
+        # byte labels, no decoded values
+        path = self.folder / "bytes.flare"
+        store = LabelStore.write(path, self.encoded.astype("S"), decode=False)
+        self.assertIsNone(store.values)
+        np.testing.assert_array_equal(store.decode(), expected)
+        store.close()
+
+        store = LabelStore.write(self.folder / "empty.flare", [])
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.decode().size, 0)
+
+    def test_store_errors(self):
+        """
+        Test opening files that are not stores.
+        """
+        print(conftest.testprint("label store errors"))
+        path = self.folder / "other.bin"
+        path.write_bytes(b"not a store")
+        with self.assertRaises(ValueError):
+            LabelStore(path)
+        with self.assertRaises(ValueError):
+            LabelStore.write(self.folder / "bad.flare", ["n1", "ø"])
+
+    def test_store_workers(self):
+        """
+        Test reading a store from worker processes.
+        """
+        print(conftest.testprint("label store workers"))
+        path = self.folder / "labels.flare"
+        LabelStore.write(path, self.encoded).close()
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            ls_sums = list(
+                executor.map(
+                    sum_store, [str(path)] * 2, [0, 2_500], [2_500, self.encoded.size]
+                )
+            )
+        self.assertAlmostEqual(sum(ls_sums), np.nansum(decode_numbers(self.encoded)))
+
+
+class TestFlareNumbersSortKeys(unittest.TestCase):
+
+    def test_order(self):
+        """
+        Test that keys sort as the decoded numbers.
+        """
+        print(conftest.testprint("sort keys"))
+        rng = np.random.default_rng(17)
+        numbers = np.concatenate(
+            [rng.normal(scale=1e6, size=3_000), [0.0, -0.0, 1e-3, -1e-3]]
+        )
+        ls_labels = []
+        for decimals, collapse_magnitude in [(0, False), (3, True), (1, False)]:
+            encoded = encode_numbers(
+                numbers,
+                decimals=decimals,
+                len_min=4,
+                is_latitude=decimals != 1,
+                collapse_magnitude=collapse_magnitude,
+            )
+            ls_labels += encoded.tolist()
+        labels = np.array(ls_labels + ["x", "NA", "W05P0M"])
+        decoded = decode_numbers(labels)
+        keys = sort_keys(labels)
+        self.assertEqual(keys.dtype, np.uint64)
+        # same order (and ties) as the decoded numbers, missing values last
+        order = np.argsort(keys, kind="stable")
+        expected = np.argsort(decoded, kind="stable")
+        np.testing.assert_array_equal(decoded[order], decoded[expected])
+        for i in range(len(keys) - 1):
+            a, b = order[i], order[i + 1]
+            if not np.isnan(decoded[b]):
+                self.assertEqual(keys[a] == keys[b], decoded[a] == decoded[b])
+        # scalar keys and bytes
+        self.assertEqual([sort_key(s) for s in labels], keys.tolist())
+        keys_bytes = sort_keys(labels, as_bytes=True)
+        self.assertEqual(keys_bytes.dtype, np.dtype("S8"))
+        np.testing.assert_array_equal(np.argsort(keys_bytes, kind="stable"), order)
+        ls_bytes = [sort_key(s, as_bytes=True) for s in labels[:50]]
+        np.testing.assert_array_equal(np.array(ls_bytes, dtype="S8"), keys_bytes[:50])
+
+    def test_range_scan(self):
+        """
+        Test range scans on keys with bounds from scalar keys.
+        """
+        print(conftest.testprint("sort keys range"))
+        labels = encode_numbers(np.arange(-1000, 1000), len_min=2)
+        keys = np.sort(sort_keys(labels))
+        start = np.searchsorted(keys, sort_key("s010"))
+        stop = np.searchsorted(keys, sort_key("n1p5d"), side="right")
+        self.assertEqual(stop - start, 26)
+        self.assertEqual(sort_key("s0"), sort_key("n0"))
+        self.assertEqual(sort_key(None), sort_key("z"))
+        series = pd.Series(["n1", "s1"], index=[5, 6])
+        self.assertTrue(sort_keys(series).index.equals(series.index))
+        with self.assertRaises(ValueError):
+            sort_keys(["n1q"])
+
 
 # ... {develop}
 
@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the parallel codecs ``flare.parallel``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_parallel
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import encode_numbers, decode_numbers
+from flare.parallel import (
+    SharedArray,
+    decode_numbers_parallel,
+    encode_numbers_parallel,
+    get_workers,
+    split_ranges,
+)
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestParallel(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        rng = np.random.default_rng(0)
+        cls.numbers = rng.normal(loc=0, scale=1000, size=10_000)
+        cls.numbers[::13] = np.nan
+        cls.options = dict(decimals=2, len_min=3, is_latitude=False)
+        cls.expected = encode_numbers(cls.numbers, **cls.options)
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_split_ranges(self):
+        """
+        Test that ranges cover all elements in order.
+        """
+        print(conftest.testprint("parallel ranges"))
+        self.assertEqual(split_ranges(10, chunk_size=4), [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual(split_ranges(0, chunk_size=4), [])
+        ls_ranges = split_ranges(1_000_001, workers=3)
+        self.assertEqual(ls_ranges[0][0], 0)
+        self.assertEqual(ls_ranges[-1][1], 1_000_001)
+        self.assertEqual(len(ls_ranges), 12)
+
+        # workers default to the size of a default process pool
+        self.assertEqual(get_workers(3), 3)
+        self.assertEqual(get_workers(0), 1)
+        with ProcessPoolExecutor() as executor:
+            self.assertEqual(get_workers(), executor._max_workers)
+
+    def test_shared_array(self):
+        """
+        Test copying into and attaching to a shared block.
+        """
+        print(conftest.testprint("parallel shared array"))
+        with SharedArray(self.numbers) as shared:
+            with SharedArray.attach(shared.spec) as attached:
+                attached.array[0] = 1.5
+                self.assertTrue(
+                    np.array_equal(attached.array[1:], self.numbers[1:], equal_nan=True)
+                )
+            self.assertEqual(shared.array[0], 1.5)
+
+    def test_encode_numbers_parallel(self):
+        """
+        Test that parallel encoding matches the bulk encoder, in order.
+        """
+        print(conftest.testprint("parallel encode"))
+        encoded = encode_numbers_parallel(
+            self.numbers, workers=2, chunk_size=999, **self.options
+        )
+        self.assertTrue(np.array_equal(encoded, self.expected))
+        # serial path
+        encoded = encode_numbers_parallel(self.numbers, workers=1, **self.options)
+        self.assertTrue(np.array_equal(encoded, self.expected))
+
+    def test_decode_numbers_parallel(self):
+        """
+        Test that parallel decoding matches the bulk decoder, in order.
+        """
+        print(conftest.testprint("parallel decode"))
+        decoded = decode_numbers_parallel(self.expected, workers=3, chunk_size=777)
+        expected = decode_numbers(self.expected)
+        self.assertTrue(np.array_equal(decoded, expected, equal_nan=True))
+
+    def test_bytes(self):
+        """
+        Test that byte labels are emitted and consumed in parallel.
+        """
+        print(conftest.testprint("parallel bytes"))
+        encoded = encode_numbers_parallel(
+            self.numbers, workers=2, chunk_size=999, as_bytes=True, **self.options
+        )
+        self.assertEqual(encoded.dtype.kind, "S")
+        self.assertTrue(np.array_equal(encoded.astype(str), self.expected))
+        decoded = decode_numbers_parallel(encoded, workers=2, chunk_size=777)
+        expected = decode_numbers(self.expected)
+        self.assertTrue(np.array_equal(decoded, expected, equal_nan=True))
+
+    def test_series_executor(self):
+        """
+        Test Series input and reuse of an existing pool.
+        """
+        print(conftest.testprint("parallel series"))
+        series = pd.Series(self.numbers, index=np.arange(len(self.numbers)) + 10)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            encoded = encode_numbers_parallel(
+                series, workers=2, executor=executor, chunk_size=1000, **self.options
+            )
+            decoded = decode_numbers_parallel(
+                encoded, workers=2, executor=executor, chunk_size=1000
+            )
+        self.assertIsInstance(encoded, pd.Series)
+        self.assertTrue(encoded.index.equals(series.index))
+        self.assertEqual(encoded.tolist(), self.expected.tolist())
+        self.assertTrue(decoded.index.equals(series.index))
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the streaming relabeler ``flare.relabel`` and its command line interface.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_relabel
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+import tempfile
+import importlib.util
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.numflare import encode_numbers
+from flare.relabel import encode_file, encode_frame
+from flare.__main__ import main
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestRelabel(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        cls.data = conftest.load_numbers_data()
+        cls.options = dict(columns=["v1", "v3"], decimals=2, len_min=3)
+        cls.expected = pd.DataFrame(
+            {
+                "v1": encode_numbers(cls.data["v1"], decimals=2, len_min=3),
+                "v2": cls.data["v2"].astype(str),
+                "v3": encode_numbers(cls.data["v3"], decimals=2, len_min=3),
+            }
+        )
+        return None
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def read_output(self, path):
+        # read an output csv as text
+        return pd.read_csv(path, sep=";", dtype=str, keep_default_na=False)
+
+    def test_encode_frame(self):
+        """
+        Test encoding of selected columns, including missing values and longitudes.
+        """
+        print(conftest.testprint("relabel frame"))
+        df = pd.DataFrame({"lat": ["-12.3", ""], "lon": ["-51.25", "10"]})
+        df_encoded = encode_frame(
+            df, columns=["lat", "lon"], decimals=1, longitude_columns=["lon"]
+        )
+        self.assertEqual(df_encoded["lat"].tolist(), ["s12p3", "x"])
+        self.assertEqual(df_encoded["lon"].tolist(), ["w51p2", "e10p0"])
+        # source is untouched
+        self.assertEqual(df["lat"].tolist(), ["-12.3", ""])
+
+    def test_encode_file_csv(self):
+        """
+        Test streaming of a csv file in small chunks.
+        """
+        print(conftest.testprint("relabel csv"))
+        dst = self.folder / "labels.csv"
+        n_rows = encode_file(
+            conftest.DATA_NUMBERS_FILE, dst, chunk_size=7, workers=1, **self.options
+        )
+        self.assertEqual(n_rows, len(self.data))
+        pd.testing.assert_frame_equal(self.read_output(dst), self.expected)
+
+    def test_encode_file_missing(self):
+        """
+        Test that markers of missing values in a csv file encode to the null replacer.
+        """
+        print(conftest.testprint("relabel missing"))
+        src = self.folder / "missing.csv"
+        src.write_text("id;lat;lon\na;NA;1.5\nb;;NaN\nNA;-2;null\n")
+        dst = self.folder / "labels.csv"
+        n_rows = encode_file(src, dst, columns=["lat", "lon"], workers=1)
+        self.assertEqual(n_rows, 3)
+        df = self.read_output(dst)
+        self.assertEqual(df["lat"].tolist(), ["x", "x", "s2"])
+        self.assertEqual(df["lon"].tolist(), ["n2", "x", "x"])
+        # columns that are not encoded are written back unchanged
+        self.assertEqual(df["id"].tolist(), ["a", "b", "NA"])
+
+    def test_encode_file_workers(self):
+        """
+        Test that the worker pool keeps the chunk order.
+        """
+        print(conftest.testprint("relabel workers"))
+        dst = self.folder / "labels.csv"
+        encode_file(
+            conftest.DATA_NUMBERS_FILE, dst, chunk_size=5, workers=2, **self.options
+        )
+        pd.testing.assert_frame_equal(self.read_output(dst), self.expected)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_encode_file_parquet(self):
+        """
+        Test streaming from and to parquet files.
+        """
+        print(conftest.testprint("relabel parquet"))
+        src = self.folder / "numbers.parquet"
+        dst = self.folder / "labels.parquet"
+        self.data.to_parquet(src)
+        encode_file(src, dst, chunk_size=8, workers=1, **self.options)
+        df = pd.read_parquet(dst)
+        self.assertEqual(df["v3"].tolist(), self.expected["v3"].tolist())
+        self.assertTrue(np.array_equal(df["v2"], self.data["v2"]))
+
+        # nulls in later batches only keep the types of columns copied as they are
+        df = pd.DataFrame(
+            {
+                "id": pd.array([1, 2, 3, None, 5], dtype="Int64"),
+                "lat": [1.5, -2.0, None, 3.0, "NA"],
+                "name": ["a", "b", "c", None, "e"],
+            }
+        )
+        df["lat"] = df["lat"].astype(str)
+        # written by another tool (no pandas metadata), so nulls of the first
+        # batches are only known from the Arrow types
+        import pyarrow
+        import pyarrow.parquet
+
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        pyarrow.parquet.write_table(table.replace_schema_metadata(None), src)
+        encode_file(src, dst, columns=["lat"], chunk_size=2, workers=1)
+        df_encoded = pd.read_parquet(dst, dtype_backend="numpy_nullable")
+        self.assertEqual(str(df_encoded["id"].dtype), "Int64")
+        self.assertEqual(df_encoded["id"].tolist(), [1, 2, 3, pd.NA, 5])
+        self.assertEqual(df_encoded["lat"].tolist(), ["n2", "s2", "x", "n3", "x"])
+        self.assertEqual(df_encoded["name"].isna().tolist(), [0, 0, 0, 1, 0])
+
+    def test_cli(self):
+        """
+        Test the encode command of the command line interface.
+        """
+        print(conftest.testprint("relabel cli"))
+        dst = self.folder / "labels.csv"
+        argv = ["encode", str(conftest.DATA_NUMBERS_FILE), str(dst)]
+        argv += ["-c", "v1", "v3", "--decimals", "2", "--len-min", "3"]
+        argv += ["--chunk-size", "10", "--workers", "1"]
+        self.assertEqual(main(argv), 0)
+        pd.testing.assert_frame_equal(self.read_output(dst), self.expected)
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the label templates ``flare.templates``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_templates
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import parse_many
+from flare.numflare import encode_number
+from flare.templates import SCHEME_TEMPLATES, Template, get_template
+from flare.timeflare import encode_timestamp
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestTemplate(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        rng = np.random.default_rng(0)
+        size = 1_000
+        self.df = pd.DataFrame(
+            {
+                "item": rng.choice(["GLO30", "GLO90", "A", "EEA10m"], size=size),
+                "lat": rng.uniform(-90, 90, size=size).round(2),
+                "lon": rng.uniform(-180, 180, size=size).round(2),
+                "date": pd.Timestamp("2011-10-08")
+                + pd.to_timedelta(rng.integers(0, 10**8, size=size), unit="s"),
+            },
+            index=np.arange(size) * 2,
+        )
+        self.df.loc[[4, 10], "lat"] = np.nan
+        self.df.loc[[6], "date"] = pd.NaT
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_render(self):
+        """
+        Test rendering against the scalar codecs.
+        """
+        print(conftest.testprint("template render"))
+        template = Template("SRC_{item}_{lat:02.2lat}{lon:03.1lon}_{date:tsh}")
+        self.assertEqual(template.names, ["item", "lat", "lon", "date"])
+        labels = template.render(self.df)
+        self.assertIsInstance(labels, pd.Series)
+        self.assertTrue(labels.index.equals(self.df.index))
+        ls_expected = []
+        for item, lat, lon, date in self.df.itertuples(index=False):
+            lat = "x" if np.isnan(lat) else encode_number(lat, decimals=2, len_min=2)
+            lon = encode_number(lon, decimals=1, len_min=3, is_latitude=False)
+            date = "x" if pd.isna(date) else encode_timestamp(date, variant="tsh")
+            ls_expected.append(f"SRC_{item}_{lat}{lon}_{date}")
+        self.assertEqual(labels.tolist(), ls_expected)
+        self.assertEqual(template.format(**self.df.iloc[0].to_dict()), ls_expected[0])
+
+        # arrays, scalars and bytes
+        labels = template.render(
+            {"item": self.df["item"].to_numpy(), "lat": 10, "lon": -5.25},
+            date=self.df["date"].to_numpy(),
+        )
+        self.assertIsInstance(labels, np.ndarray)
+        self.assertTrue(all(label.count("_n10p00w005p2_") for label in labels))
+        as_bytes = template.render(self.df, as_bytes=True)
+        self.assertEqual(as_bytes.dtype.kind, "S")
+        self.assertEqual(np.char.decode(as_bytes).tolist(), ls_expected)
+        self.assertEqual(template.render(self.df.iloc[:0]).tolist(), [])
+
+        # aware timestamps keep their own offsets
+        dates = self.df["date"].dt.tz_localize("UTC").dt.tz_convert("America/Sao_Paulo")
+        labels = Template("{date:ts}").render(date=dates)
+        ls_expected = ["x" if pd.isna(d) else encode_timestamp(d) for d in dates]
+        self.assertEqual(labels.tolist(), ls_expected)
+        date = pd.Timestamp("2021-03-04 05:06:07", tz="UTC-03:00")
+        self.assertEqual(
+            Template("{date:ts}").format(date=date), encode_timestamp(date)
+        )
+
+        # timestamps of mixed formats
+        dates = ["2021-03-04", "2021-03-04T05:06", "2021-03-04T05:06:07-03:00"]
+        labels = Template("{date:tsh}").render(date=dates)
+        ls_expected = [encode_timestamp(d, variant="tsh") for d in dates]
+        self.assertEqual(labels.tolist(), ls_expected)
+
+        # missing and empty texts
+        labels = Template("{a}-{b}").render(a=["x1", None, ""], b=[1, 2, 3])
+        self.assertEqual(labels.tolist(), ["x1-1", "x-2", "x-3"])
+
+    def test_schemes(self):
+        """
+        Test templates of the labeling schemes against the parser.
+        """
+        print(conftest.testprint("template schemes"))
+        self.assertIs(get_template("dataset"), get_template("dataset"))
+        self.assertEqual(get_template("dataset").pattern, SCHEME_TEMPLATES["dataset"])
+        template = Template(
+            "COPERNICUS_COPDEM_{item}_DGTE_{lat:02lat}{lon:03lon}_{date:tsd}"
+        )
+        labels = template.render(self.df.fillna({"lat": 0}))
+        df = parse_many(pd.Series(labels.to_numpy()) + ".tif")
+        self.assertTrue((df["scheme"] == "dataset").all())
+        self.assertEqual(df["item"].tolist(), self.df["item"].tolist())
+        self.assertTrue(
+            np.allclose(df["extent_ymin"], self.df["lat"].fillna(0).round(), atol=0.5)
+        )
+
+    def test_errors(self):
+        """
+        Test invalid templates and values.
+        """
+        print(conftest.testprint("template errors"))
+        for pattern in ("{a:lat", "{a:xyz}", "{a:2.1}", "{a:03tsd}", "{a!r}", "{0}"):
+            with self.assertRaises(ValueError):
+                Template(pattern)
+        template = Template("{a}_{b:lat}")
+        with self.assertRaises(ValueError):
+            template.render(a=["a_b"], b=[1])
+        with self.assertRaises(ValueError):
+            template.render(a=[1.5], b=[1])
+        with self.assertRaises(ValueError):
+            template.render(a=["a", "b"], b=[1])
+        with self.assertRaises(ValueError):
+            template.render(a=["a"])
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,399 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the timestamp codecs ``flare.timeflare``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_timeflare
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.timeflare import VARIANTS
+from flare.timeflare import encode_timestamp, decode_timestamp, get_variant
+from flare.timeflare import encode_timestamps, decode_timestamps
+from flare.timeflare import encode_zone, decode_zone
+from flare.timeflare import encode_epoch, decode_epoch, encode_epochs, decode_epochs
+from flare.timeflare import EpochIndex
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# examples of the documentation on Date and Time
+DOC_EXAMPLES = {
+    "20140302t124804p143zw0300": "2014-03-02 12:48:04.143-03:00",
+    "20140302t124804": "2014-03-02 12:48:04",
+    "2014-03-02-T124804": "2014-03-02 12:48:04",
+    "20140302": "2014-03-02",
+    "2014-03": "2014-03-01",
+    "2014": "2014-01-01",
+}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestFlareTimestamps(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        rng = np.random.default_rng(0)
+        seconds = rng.integers(-2_000_000_000, 4_000_000_000, size=2_000)
+        nanoseconds = rng.integers(0, 1_000_000_000, size=2_000)
+        cls.stamps = (seconds * 1_000_000_000 + nanoseconds).astype("datetime64[ns]")
+        cls.stamps[::11] = np.datetime64("NaT")
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_doc_examples(self):
+        """
+        Test decoding of the documented examples.
+        """
+        print(conftest.testprint("timestamp examples"))
+        for encoded, expected in DOC_EXAMPLES.items():
+            self.assertEqual(decode_timestamp(encoded), pd.Timestamp(expected))
+
+    def test_variants(self):
+        """
+        Test encoding in all variants and detection of the variant.
+        """
+        print(conftest.testprint("timestamp variants"))
+        ts = pd.Timestamp("2014-03-02 12:48:04", tz="UTC-03:00")
+        expected = {
+            "ts": "20140302t124804zw0300",
+            "tsh": "2014-03-02-t124804-zw0300",
+            "tsu": "20140302t124804",
+            "tsuh": "2014-03-02-t124804",
+            "tsd": "20140302",
+            "tsdh": "2014-03-02",
+            "tsm": "201403",
+            "tsmh": "2014-03",
+            "tsy": "2014",
+        }
+        self.assertEqual(set(expected), set(VARIANTS))
+        for variant, encoded in expected.items():
+            self.assertEqual(encode_timestamp(ts, variant=variant), encoded)
+            self.assertEqual(get_variant(encoded), variant)
+            self.assertEqual(get_variant(encoded.upper()), variant)
+
+    def test_round_trip(self):
+        """
+        Test that zoned timestamps with nanoseconds decode to the same instant.
+        """
+        print(conftest.testprint("timestamp round trip"))
+        for ts in self.stamps[:200]:
+            if np.isnat(ts):
+                continue
+            ts = pd.Timestamp(ts)
+            for zone in [0, -180, 330]:
+                encoded = encode_timestamp(ts, decimals=9, zone=zone)
+                decoded = decode_timestamp(encoded)
+                self.assertEqual(decoded.tz_convert("UTC").tz_localize(None), ts)
+                self.assertEqual(decoded.utcoffset(), pd.Timedelta(minutes=zone))
+
+    def test_rounding(self):
+        """
+        Test rounding of seconds, including carry over into the date.
+        """
+        print(conftest.testprint("timestamp rounding"))
+        ts = pd.Timestamp("2014-12-31 23:59:59.9996")
+        self.assertEqual(
+            encode_timestamp(ts, variant="tsu", decimals=3), "20150101t000000p000"
+        )
+        self.assertEqual(encode_timestamp(ts, variant="tsd"), "20141231")
+
+    def test_zones(self):
+        """
+        Test encoding and decoding of zone offsets.
+        """
+        print(conftest.testprint("timestamp zones"))
+        self.assertEqual(encode_zone(0), "e0000")
+        self.assertEqual(encode_zone(-570, is_latitude=True), "s0930")
+        self.assertEqual(decode_zone("zS0930"), -570)
+        with self.assertRaises(ValueError):
+            encode_zone(24 * 60)
+        with self.assertRaises(ValueError):
+            decode_zone("w0360")
+
+    def test_invalid(self):
+        """
+        Test that invalid timestamps raise errors in scalar and bulk decoding.
+        """
+        print(conftest.testprint("timestamp invalid"))
+        for encoded in ["2014-", "20140230", "2014--03", "20140302t2500", "0000"]:
+            with self.assertRaises(ValueError):
+                decode_timestamp(encoded)
+            with self.assertRaises(ValueError):
+                decode_timestamps([encoded])
+        with self.assertRaises(ValueError):
+            encode_timestamp("2014-03-02", variant="tsx")
+
+    def test_bulk_matches_scalar(self):
+        """
+        Test that bulk codecs match scalar codecs in all variants.
+        """
+        print(conftest.testprint("timestamp bulk"))
+        for variant in VARIANTS:
+            for decimals, zone in [(0, 0), (3, -180), (9, 345)]:
+                encoded = encode_timestamps(
+                    self.stamps, variant=variant, decimals=decimals, zone=zone
+                )
+                decoded = decode_timestamps(encoded)
+                for i in range(0, len(self.stamps), 37):
+                    if np.isnat(self.stamps[i]):
+                        self.assertEqual(encoded[i], "x")
+                        self.assertTrue(np.isnat(decoded[i]))
+                        continue
+                    expected = encode_timestamp(
+                        pd.Timestamp(self.stamps[i]),
+                        variant=variant,
+                        decimals=decimals,
+                        zone=zone,
+                    )
+                    self.assertEqual(encoded[i], expected)
+                    ts = decode_timestamp(expected)
+                    if ts.tzinfo is not None:
+                        ts = ts.tz_convert("UTC").tz_localize(None)
+                    self.assertEqual(decoded[i], ts.to_datetime64())
+
+    def test_bulk_aware(self):
+        """
+        Test that aware timestamps keep their own offsets, as in the scalar codec.
+        """
+        print(conftest.testprint("timestamp bulk aware"))
+        stamps = pd.Series(self.stamps[:200]).dt.tz_localize("UTC")
+        ls_inputs = [
+            stamps.dt.tz_convert("Etc/GMT+3"),
+            # offsets change with daylight saving time
+            stamps.dt.tz_convert("America/New_York"),
+            # mixed zones in a sequence
+            [
+                ts.tz_convert("Asia/Kolkata") if i % 2 else ts
+                for i, ts in enumerate(stamps)
+            ],
+            ["2021-03-04T05:06:07-03:00", "2021-03-04T05:06:07+01:00", None],
+        ]
+        for timestamps in ls_inputs:
+            encoded = encode_timestamps(timestamps, variant="tsh", decimals=3)
+            ls_expected = [
+                "x" if pd.isna(ts) else encode_timestamp(ts, variant="tsh", decimals=3)
+                for ts in timestamps
+            ]
+            self.assertEqual(list(encoded), ls_expected)
+        # a given zone overrides the offsets
+        encoded = encode_timestamps(ls_inputs[-1], zone=60)
+        self.assertEqual(
+            encoded[:2].tolist(), ["20210304t090607ze0100", "20210304t050607ze0100"]
+        )
+        encoded = encode_epochs(ls_inputs[0], ls_inputs[0], variant="ts")
+        is_null = ls_inputs[0].isna()
+        self.assertTrue((encoded[is_null] == "x").all())
+        self.assertTrue((encoded[~is_null].str.count("zw0300") == 2).all())
+
+    def test_bulk_formats(self):
+        """
+        Test that sequences of mixed formats are parsed as in the scalar codec.
+        """
+        print(conftest.testprint("timestamp bulk formats"))
+        ls_inputs = [
+            ["2020-01-01", "2020-01-01T10:00", "2020-01-01 10:00:05.25"],
+            ["2020-01-01", "2020-01-02T10:00+03:00", None],
+            ["2020-01-01T10:00-03:00", "20200102T100000", "2020-01-03T10:00Z"],
+        ]
+        for timestamps in ls_inputs:
+            encoded = encode_timestamps(timestamps, variant="tsh", decimals=2)
+            ls_expected = [
+                "x" if ts is None else encode_timestamp(ts, variant="tsh", decimals=2)
+                for ts in timestamps
+            ]
+            self.assertEqual(list(encoded), ls_expected)
+        # naive timestamps of mixed formats still take a given zone
+        encoded = encode_timestamps(ls_inputs[0][:2], zone=60)
+        self.assertEqual(
+            encoded.tolist(), [encode_timestamp(ts, zone=60) for ts in ls_inputs[0][:2]]
+        )
+        with self.assertRaises(ValueError):
+            encode_timestamps(["2020-01-01", "not a date"])
+
+    def test_bulk_round_trip(self):
+        """
+        Test bulk round trip of zoned timestamps, Series and output units.
+        """
+        print(conftest.testprint("timestamp bulk round trip"))
+        encoded = encode_timestamps(self.stamps, variant="tsh", decimals=9, zone=-180)
+        decoded = decode_timestamps(np.char.upper(encoded))
+        self.assertTrue(np.array_equal(decoded, self.stamps, equal_nan=True))
+        stamps = self.stamps.astype("datetime64[us]")
+        series = pd.Series(stamps, index=np.arange(len(stamps)) + 10)
+        encoded = encode_timestamps(series, variant="ts", decimals=6)
+        self.assertTrue(encoded.index.equals(series.index))
+        decoded = decode_timestamps(encoded, unit="us")
+        self.assertEqual(decoded.dtype, np.dtype("datetime64[us]"))
+        self.assertTrue(np.array_equal(decoded.to_numpy(), stamps, equal_nan=True))
+
+
+class TestFlareEpochs(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        rng = np.random.default_rng(1)
+        day = 86_400 * 1_000_000_000
+        starts = rng.integers(0, 10_000, size=5_000) * day
+        durations = (10 ** rng.uniform(-3, 4, size=5_000) * day).astype(np.int64)
+        cls.starts = starts.astype("datetime64[ns]")
+        cls.stops = (starts + durations).astype("datetime64[ns]")
+        cls.starts[::97] = np.datetime64("NaT")
+        # a few empty and reversed epochs
+        cls.stops[5:10] = cls.starts[5:10]
+        cls.stops[10:15] = cls.starts[10:15] - day
+        cls.index = EpochIndex(cls.starts, cls.stops)
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def overlaps_scan(self, start, stop):
+        # reference linear scan
+        is_valid = ~(np.isnat(self.starts) | np.isnat(self.stops))
+        is_valid &= self.stops > self.starts
+        return np.flatnonzero(is_valid & (self.starts < stop) & (self.stops > start))
+
+    def test_doc_examples(self):
+        """
+        Test encoding and decoding of the documented examples.
+        """
+        print(conftest.testprint("epoch examples"))
+        start, stop = decode_epoch("20140302t124804p143zw0300u20140302t134804zw0300")
+        self.assertEqual(stop - start, pd.Timedelta(minutes=59, seconds=59.857))
+        self.assertEqual(
+            decode_epoch("2014U2015"),
+            (pd.Timestamp("2014-01-01"), pd.Timestamp("2015-01-01")),
+        )
+        self.assertEqual(
+            encode_epoch("2014-03", "2014-04", variant="tsmh"), "2014-03u2014-04"
+        )
+        with self.assertRaises(ValueError):
+            decode_epoch("2014u2015u2016")
+
+    def test_bulk(self):
+        """
+        Test bulk encoding and decoding of epochs.
+        """
+        print(conftest.testprint("epoch bulk"))
+        encoded = encode_epochs(self.starts, self.stops, variant="tsh", decimals=9)
+        for i in range(0, len(encoded), 101):
+            if np.isnat(self.starts[i]):
+                self.assertEqual(encoded[i], "x")
+                continue
+            expected = encode_epoch(
+                pd.Timestamp(self.starts[i]),
+                pd.Timestamp(self.stops[i]),
+                variant="tsh",
+                decimals=9,
+            )
+            self.assertEqual(encoded[i], expected)
+        starts, stops = decode_epochs(np.char.upper(encoded))
+        self.assertTrue(np.array_equal(starts, self.starts, equal_nan=True))
+        is_null = np.isnat(self.starts)
+        self.assertTrue(np.array_equal(stops[~is_null], self.stops[~is_null]))
+        with self.assertRaises(ValueError):
+            decode_epochs(["2014u2015", "2014"])
+
+    def test_index_overlaps(self):
+        """
+        Test that overlap queries match a linear scan.
+        """
+        print(conftest.testprint("epoch index overlaps"))
+        rng = np.random.default_rng(2)
+        day = np.timedelta64(1, "D")
+        for start in rng.integers(-100, 10_100, size=100):
+            start = np.datetime64(int(start), "D").astype("datetime64[ns]")
+            stop = start + int(rng.integers(1, 300)) * day
+            self.assertTrue(
+                np.array_equal(
+                    self.index.overlaps(start, stop), self.overlaps_scan(start, stop)
+                )
+            )
+            self.assertTrue(
+                np.array_equal(
+                    self.index.covers(start),
+                    self.overlaps_scan(start, start + np.timedelta64(1, "ns")),
+                )
+            )
+
+    def test_index_labels(self):
+        """
+        Test an index made from labels, with Flare and ISO timestamps in queries.
+        """
+        print(conftest.testprint("epoch index labels"))
+        labels = ["2000U2020", "20140302u20140305", "x", "2014-03u2014-04"]
+        index = EpochIndex.from_labels(labels, unit="s")
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.covers("20140305").tolist(), [0, 3])
+        self.assertEqual(index.covers("2014-03-04 23:59:59").tolist(), [0, 1, 3])
+        self.assertEqual(index.overlaps("2020", "2021").tolist(), [])
+        self.assertEqual(index.overlaps("2019", "2021").tolist(), [0])
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
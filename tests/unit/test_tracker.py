@@ -0,0 +1,189 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the latest version tracker ``flare.tracker``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_tracker
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+import tempfile
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.crawler import Watcher
+from flare.labels import parse_many
+from flare.tracker import VersionTracker
+from flare.versions import find_latest
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+VERSIONS = ["v100", "v101", "1.2.0", "1.10.0", "v20250314", "v20250315t101010", "x"]
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+def expected_latest(paths):
+    # latest files of each group, with the bulk sorter
+    df = parse_many(paths, scheme="generic", errors="coerce")
+    groups = df[["type", "project", "item"]].fillna("")
+    positions = find_latest(df["version"], groups)
+    return sorted(np.asarray(paths)[positions].tolist())
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestVersionTracker(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_events(self):
+        """
+        Test random add and remove events against the bulk sorter.
+        """
+        print(conftest.testprint("tracker events"))
+        rng = np.random.default_rng(0)
+        ls_all = [
+            f"data/{t}_P_{i}_{v}_s{k}.txt"
+            for t in ["RASTER", "x"]
+            for i in ["A", "B", "C"]
+            for v in VERSIONS
+            for k in range(3)
+        ]
+        ls_all += ["data/README.md", "data/A_B_C_v2025_s.txt"]
+        tracker = VersionTracker()
+        dc_present = {}
+        for step in range(2_000):
+            path = ls_all[rng.integers(len(ls_all))]
+            if path in dc_present:
+                changed = tracker.remove(path)
+                del dc_present[path]
+            else:
+                changed = tracker.add(path)
+                dc_present[path] = step
+            self.assertIsInstance(changed, bool)
+            if step % 50 == 0:
+                # ties keep the file added last
+                ls_present = list(dc_present)
+                self.assertEqual(
+                    sorted(tracker.latest_files().values()),
+                    expected_latest(ls_present) if ls_present else [],
+                )
+        # the heaps stay bounded by the files present
+        n_entries = sum(len(heap) for heap in tracker._heaps.values())
+        self.assertLessEqual(n_entries, 2 * len(tracker) + len(tracker._heaps))
+
+    def test_apply(self):
+        """
+        Test bulk additions and watcher changes.
+        """
+        print(conftest.testprint("tracker apply"))
+        tracker = VersionTracker()
+        ls_paths = [f"T_P_I{i % 7}_v{i % 1000:03d}_s.txt" for i in range(300)]
+        groups = tracker.add_many(ls_paths)
+        self.assertEqual(len(groups), 7)
+        self.assertEqual(len(tracker), 300)
+        self.assertEqual(tracker.latest(("T", "P", "I3")), "T_P_I3_v297_s.txt")
+        self.assertFalse(tracker.add("T_P_I3_v297_s.txt"))
+        self.assertFalse(tracker.remove("T_P_I3_v001_s.txt"))
+        self.assertTrue(tracker.remove("T_P_I3_v297_s.txt"))
+        self.assertEqual(tracker.latest(("T", "P", "I3")), "T_P_I3_v290_s.txt")
+        self.assertIsNone(tracker.latest(("T", "P", "I9")))
+        self.assertIn("T_P_I0_v000_s.txt", tracker)
+
+        # changes of a watcher
+        tracker = VersionTracker()
+        watcher = Watcher(self.folder, interval=0.0)
+        for name in ["A_P_I_v101_s.txt", "A_P_I_v102_s.txt", "A_P_J_1.0.0_s.txt"]:
+            (self.folder / name).write_text(name)
+        groups = tracker.apply(watcher.poll())
+        self.assertEqual(groups, {("A", "P", "I"), ("A", "P", "J")})
+        (self.folder / "A_P_I_v102_s.txt").unlink()
+        (self.folder / "A_P_J_1.1.0_s.txt").write_text("new")
+        (self.folder / "A_P_K_x_s.txt").write_text("new")
+        groups = tracker.apply(watcher.poll())
+        self.assertEqual(groups, {("A", "P", "I"), ("A", "P", "J")})
+        self.assertEqual(
+            tracker.latest(("A", "P", "J")), str(self.folder / "A_P_J_1.1.0_s.txt")
+        )
+        with self.assertRaises(ValueError):
+            VersionTracker(scheme="dataset")
+        with self.assertRaises(ValueError):
+            VersionTracker(group_domains=("type", "source"))
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
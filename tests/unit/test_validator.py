@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the label validator ``flare.validator``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_validator
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import re
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.labels import parse
+from flare.validator import ASSETS, ERRORS, is_valid, validate, validate_many
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+# reference grammars of each asset type
+PATTERNS = {
+    # dots of domains before the last one are left to schemes (as in versions)
+    "file": re.compile(
+        r"[^\W_]+(?:-[^\W_]+)*(?:\.[A-Za-z0-9]+)*"
+        r"(?:_[^\W_]+(?:-[^\W_]+)*(?:\.[A-Za-z0-9]+)*)*"
+    ),
+    "field": re.compile(r"[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*"),
+    "layer": re.compile(
+        r"[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*(?:_[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*)*"
+    ),
+}
+LABELS = [
+    "REPORT_A002_F005_V002_X.pdf",
+    "Smith_2021_a.pdf",
+    "Smith_21_a.pdf",
+    "Smith_x_a",
+    "COPERNICUS_COPDEM_GLO30_DGTE_S030W051_20111008T182325.tif",
+    "COPERNICUS_COPDEM_GLO30_DGTE_S030W05k1_2011100T182325.tif",
+    "INMET_AUTO_A001_T0-M_brazil_2000U2020.txt",
+    "INMET_AUTO_A001_T0-M_0_2000U20201.txt",
+    "REPORT_A002_F005_V20_X.pdf",
+    "REPORT_A002_F005_x_X.tar.gz",
+    "Müller_2020_b.pdf",
+    "temp_max",
+    "temp-max_2020",
+    "temp max",
+    "",
+]
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestValidator(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_rules(self):
+        """
+        Test the automata against reference grammars, in bulk and one by one.
+        """
+        print(conftest.testprint("validator rules"))
+        rng = np.random.default_rng(0)
+        chars = list("aZ09_-. ü")
+        labels = LABELS + [
+            "".join(rng.choice(chars, size=rng.integers(0, 9))) for _ in range(3_000)
+        ]
+        for asset in ASSETS:
+            df = validate_many(labels, asset=asset)
+            self.assertEqual(list(df.columns), ["row", "start", "stop", "error"])
+            self.assertTrue(df["error"].isin(list(ERRORS)).all())
+            self.assertEqual(df["row"].is_unique, True)
+            dc_errors = {row: tuple(e) for row, *e in df.to_numpy().tolist()}
+            for i, label in enumerate(labels):
+                expected = PATTERNS[asset].fullmatch(label) is not None
+                errors = validate(label, asset=asset)
+                self.assertEqual(errors == [], expected, msg=(asset, label))
+                self.assertEqual(
+                    [dc_errors[i]] if i in dc_errors else [], errors, msg=label
+                )
+                for start, stop, _ in errors:
+                    self.assertTrue(0 <= start <= stop <= len(label))
+            mask = is_valid(pd.Series(labels), asset=asset)
+            self.assertEqual(mask.sum(), len(labels) - len(df))
+
+        # spans of the first error
+        self.assertEqual(validate("temp__max", asset="field"), [(5, 6, "empty_domain")])
+        self.assertEqual(validate("temp_", asset="field"), [(4, 5, "empty_domain")])
+        self.assertEqual(validate("a-_b", asset="layer"), [(2, 3, "empty_subdomain")])
+        self.assertEqual(validate("a.tar..gz"), [(6, 7, "empty_extension")])
+        self.assertEqual(validate("a.b", asset="layer"), [(1, 2, "dot")])
+        self.assertEqual(validate(""), [(0, 0, "empty_domain")])
+        self.assertEqual(len(validate_many([])), 0)
+        with self.assertRaises(ValueError):
+            validate("a", asset="table")
+
+    def test_schemes(self):
+        """
+        Test the domains of labeling schemes against the parser.
+        """
+        print(conftest.testprint("validator schemes"))
+        for scheme in ["generic", "reference", "dataset"]:
+            df = validate_many(LABELS, scheme=scheme)
+            for i, label in enumerate(LABELS):
+                errors = validate(label, scheme=scheme)
+                self.assertEqual(
+                    list(
+                        df.loc[df["row"] == i, ["start", "stop", "error"]].itertuples(
+                            index=False, name=None
+                        )
+                    ),
+                    errors,
+                )
+                if not errors:
+                    parse(label, scheme=scheme)
+        self.assertEqual(
+            validate("Smith_21_a.pdf", scheme="reference"), [(6, 8, "year")]
+        )
+        self.assertEqual(validate("Smith_x_a", scheme="reference"), [(6, 7, "year")])
+        self.assertEqual(
+            validate(LABELS[5], scheme="dataset"),
+            [(29, 38, "extent"), (39, 53, "datetime")],
+        )
+        self.assertEqual(validate(LABELS[6], scheme="dataset"), [])
+        self.assertEqual(validate(LABELS[7], scheme="dataset"), [(23, 33, "datetime")])
+        self.assertEqual(validate(LABELS[8], scheme="generic"), [(17, 20, "version")])
+        self.assertEqual(validate(LABELS[9], scheme="generic"), [])
+        self.assertEqual(validate("A_B.pdf", scheme="generic"), [(0, 7, "domains")])
+
+        # semantic versions have dots before the extension
+        for version in ["1.0.3", "v1.0.3"]:
+            label = f"REPORT_A002_F005_{version}_X.pdf"
+            self.assertEqual(validate(label), [])
+            self.assertEqual(validate(label, scheme="generic"), [])
+            self.assertEqual(parse(label, scheme="generic")["version_patch"], 3)
+        self.assertEqual(
+            validate("REPORT_A002_F005_1.0.x_X.pdf", scheme="generic"),
+            [(17, 22, "version")],
+        )
+        self.assertEqual(
+            validate("REP.ORT_A002_F005_1.0.3_X.pdf", scheme="generic"),
+            [(3, 4, "dot")],
+        )
+        self.assertEqual(validate("a._b.pdf"), [(2, 3, "character")])
+        with self.assertRaises(ValueError):
+            validate_many(["temp_max"], asset="field", scheme="generic")
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
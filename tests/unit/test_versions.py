@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the version codecs and sorter ``flare.versions``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_versions
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.versions import KINDS, find_latest, version_key, version_keys
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+VERSIONS = [
+    "1.0.3",
+    "v1.10.0",
+    "V103",
+    "v099",
+    "v20250314",
+    "V2025-03-14",
+    "v20250314T101010",
+    "v20250314t101010p5zw0300",
+    "v2025-03-14-T101010",
+    "v30000101",
+    "v2025",
+    "v2025-03",
+    "v1234567",
+    "v20251314",
+    "vabcdefghij",
+    "v10",
+    "103",
+    "1.0",
+    "x",
+    "",
+]
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestFlareVersions(unittest.TestCase):
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_version_key(self):
+        """
+        Test the order of version keys.
+        """
+        print(conftest.testprint("versions key"))
+        ls_ordered = ["v001", "0.1.0", "v100", "1.0.3", "v1.2.0", "1.10.0", "10.0.0"]
+        ls_keys = [version_key(version) for version in ls_ordered]
+        self.assertEqual(ls_keys, sorted(ls_keys))
+        self.assertEqual(version_key("1.0.3"), version_key("V103"))
+        # timestamps are newer than semantic versions and sorted in UTC
+        self.assertGreater(version_key("v20250314"), version_key("999.0.0"))
+        self.assertLess(
+            version_key("v20250314t101010zw0300"), version_key("v20250314t131011")
+        )
+        self.assertEqual(version_key("v30000101")[0], KINDS["timestamp"])
+        for version in ["v2025", "v2025-03", "1.0", "x", "1.2097152.0"]:
+            with self.assertRaises(ValueError):
+                version_key(version)
+
+    def test_bulk_matches_scalar(self):
+        """
+        Test the bulk keys against the scalar keys.
+        """
+        print(conftest.testprint("versions bulk"))
+        rng = np.random.default_rng(0)
+        versions = VERSIONS + [
+            "v{}{}{}".format(*rng.integers(0, 10, size=3)) for _ in range(200)
+        ]
+        versions += [
+            "{}.{}.{}".format(*rng.integers(0, 30, size=3)) for _ in range(200)
+        ]
+        versions += [f"v{d:%Y%m%dt%H%M%S}" for d in pd.date_range("2020", periods=50)]
+        kinds, values = version_keys(versions)
+        self.assertEqual(kinds.dtype, np.int8)
+        self.assertEqual(values.dtype, np.int64)
+        for version, kind, value in zip(versions, kinds, values):
+            try:
+                expected = version_key(version)
+            except ValueError:
+                expected = (KINDS["invalid"], 0)
+            self.assertEqual((kind, value), expected, msg=version)
+
+        # missing values and series
+        kinds, _ = version_keys(pd.Series(["v103", None, np.nan], dtype=object))
+        self.assertEqual(kinds.tolist(), [0, -1, -1])
+        self.assertEqual(version_keys([])[0].size, 0)
+
+    def test_find_latest(self):
+        """
+        Test the latest version of groups against a sort by keys.
+        """
+        print(conftest.testprint("versions latest"))
+        rng = np.random.default_rng(1)
+        size = 3_000
+        df = pd.DataFrame(
+            {
+                "type": rng.choice(["raster", "table"], size=size),
+                "project": rng.choice(["a", "b", "c"], size=size),
+                "item": rng.choice([f"i{i}" for i in range(20)], size=size),
+                "version": rng.choice(VERSIONS[:12], size=size),
+            }
+        )
+        positions = find_latest(df["version"], df[["type", "project", "item"]])
+        self.assertTrue((np.diff(positions) > 0).all())
+
+        expected = {}
+        for i, row in enumerate(df.itertuples()):
+            try:
+                key = version_key(row.version)
+            except ValueError:
+                continue
+            group = (row.type, row.project, row.item)
+            if group not in expected or key >= expected[group][0]:
+                expected[group] = (key, i)
+        self.assertEqual(positions.tolist(), sorted(i for _, i in expected.values()))
+
+        # single keys, lists of keys and groups without valid versions
+        versions = ["v101", "1.2.0", "v20250314", "v103", "x"]
+        self.assertEqual(find_latest(versions, list("aabbc")).tolist(), [1, 2])
+        self.assertEqual(
+            find_latest(versions, [list("aabbc"), [1, 2, 1, 1, 1]]).tolist(),
+            [0, 1, 2],
+        )
+        # ties keep the last file
+        self.assertEqual(find_latest(["v103", "1.0.3"], ["a", "a"]).tolist(), [1])
+        with self.assertRaises(ValueError):
+            find_latest(versions, ["a", "b"])
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the vocabulary of standard names ``flare.vocabulary``.
+
+Examples
+--------
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python -m unittest tests.unit.test_vocabulary
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import unittest
+import tempfile
+from pathlib import Path
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from flare.vocabulary import MATCHES, Vocabulary, get_vocabulary, normalize_key
+from tests import conftest
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+HEADERS = {
+    "Time Stamp": ("timestamp", "name"),
+    "TIMESTAMP": ("timestamp", "name"),
+    "p50": ("p50", "name"),
+    "nan": ("nodata", "alias"),
+    "SD": ("sd", "name"),
+    "Standard-Deviation": ("sd", "title"),
+    "Nash Sutcliffe Efficiency": ("nse", "title"),
+    "Nash–Sutcliffe Efficiency (-)": ("nse", "title"),
+    "Médian": ("median", "name"),
+    "averge": ("average", "fuzzy"),
+    "interquartile rang": ("iqr", "fuzzy"),
+    "foo": (None, None),
+    "": (None, None),
+}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+class TestVocabulary(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_resolve(self):
+        """
+        Test exact and fuzzy matches of headers.
+        """
+        print(conftest.testprint("vocabulary resolve"))
+        vocabulary = get_vocabulary()
+        self.assertIs(vocabulary, get_vocabulary())
+        self.assertIn("median", vocabulary)
+        self.assertEqual(vocabulary.get("median")["alias"], "p50")
+        self.assertEqual(vocabulary.get("nodata")["alias"], "nan")
+        with self.assertRaises(KeyError):
+            vocabulary.get("foo")
+        self.assertEqual(normalize_key(" Média_Anual (mm) "), "mediaanualmm")
+
+        df = vocabulary.resolve_many(list(HEADERS) * 2)
+        self.assertEqual(list(df.columns), ["header", "name", "match", "score"])
+        self.assertEqual(len(df), 2 * len(HEADERS))
+        for header, name, match, score in df.itertuples(index=False):
+            expected_name, expected_match = HEADERS[header]
+            self.assertEqual(vocabulary.resolve(header), expected_name, msg=header)
+            if expected_name is None:
+                self.assertTrue(pd.isna(name) and pd.isna(match) and np.isnan(score))
+                continue
+            self.assertEqual((name, match), (expected_name, expected_match))
+            self.assertEqual(score == 1.0, match != MATCHES[-1], msg=header)
+        self.assertIsNone(vocabulary.resolve("averge", fuzzy=False))
+        self.assertTrue(
+            vocabulary.resolve_many(["averge"], fuzzy=False)["name"].isna().all()
+        )
+
+        # missing headers have no match (the text "nan" is an alias of nodata)
+        for header in (None, np.nan, pd.NA):
+            self.assertEqual(normalize_key(header), "")
+            self.assertIsNone(vocabulary.resolve(header))
+            self.assertEqual(vocabulary.suggest(header), [])
+        self.assertEqual(vocabulary.resolve("nan"), "nodata")
+        df = vocabulary.resolve_many(["Time Stamp", None, np.nan, "nan"])
+        self.assertEqual(df["name"].iloc[[0, 3]].tolist(), ["timestamp", "nodata"])
+        self.assertTrue(df["name"].iloc[1:3].isna().all())
+        self.assertTrue(df["score"].iloc[1:3].isna().all())
+
+        # suggestions
+        ls_suggestions = vocabulary.suggest("p9", cutoff=0.3)
+        self.assertLessEqual(len(ls_suggestions), 5)
+        ls_scores = [score for _, score in ls_suggestions]
+        self.assertEqual(ls_scores, sorted(ls_scores, reverse=True))
+        self.assertEqual(vocabulary.suggest("foo"), [])
+
+    def test_batch_matches_scalar(self):
+        """
+        Test the batch resolver against the scalar resolver on misspelled headers.
+        """
+        print(conftest.testprint("vocabulary batch"))
+        vocabulary = Vocabulary()
+        rng = np.random.default_rng(0)
+        ls_words = vocabulary.names + vocabulary.df["title"].tolist()
+        ls_headers = []
+        for word in rng.choice(ls_words, size=2_000):
+            chars = list(word)
+            for _ in range(rng.integers(0, 3)):
+                i = rng.integers(len(chars))
+                chars[i] = rng.choice(list("aeiou_ 1"))
+            ls_headers.append("".join(chars))
+        for cutoff in (0.3, 0.6):
+            df = vocabulary.resolve_many(ls_headers, cutoff=cutoff)
+            for header, name, score in zip(ls_headers, df["name"], df["score"]):
+                ls_suggestions = vocabulary.suggest(header, limit=1, cutoff=cutoff)
+                if vocabulary.resolve(header, fuzzy=False) is not None:
+                    self.assertEqual(score, 1.0)
+                elif ls_suggestions:
+                    self.assertEqual((name, score), ls_suggestions[0], msg=header)
+                else:
+                    self.assertTrue(pd.isna(name), msg=header)
+
+    def test_catalog(self):
+        """
+        Test custom catalogs.
+        """
+        print(conftest.testprint("vocabulary catalog"))
+        file_path = self.folder / "names.csv"
+        file_path.write_text(
+            "name;title;alias\nrunoff;Surface Runoff;roff\nrain;Rainfall;nan\n",
+            encoding="utf-8",
+        )
+        vocabulary = Vocabulary(file_path)
+        self.assertEqual(len(vocabulary), 2)
+        self.assertEqual(vocabulary.resolve("surface_runoff"), "runoff")
+        self.assertEqual(vocabulary.resolve("NaN"), "rain")
+        self.assertEqual(vocabulary.resolve("runof"), "runoff")
+        file_path.write_text("name;title\nrain;Rainfall\n", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            Vocabulary(file_path)
+        file_path.write_text("name;title;alias\nrain;A;a\nrain;B;b\n", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            Vocabulary(file_path)
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+    unittest.main()